@@ -0,0 +1,323 @@
+"""
+Partition climate_data by date (yearly) and source_api, with BRIN indexes.
+
+Revision ID: 003_partition_climate_data
+Revises: 002_regional_coverage
+Create Date: 2026-10-18
+
+Esta migration converte climate_data em tabela particionada:
+
+1. RANGE (date) com uma partição por ano (climate_data_yYYYY), criada
+   para os anos com dados, o atual e o próximo
+2. Cada ano subdividido por LIST (source_api), uma partição por API
+   (+ partição _other para fontes novas)
+3. Partição DEFAULT (climate_data_default) para datas sem partição
+4. Índice BRIN em date (substitui B-trees em date e source_api+date,
+   que passam a ser cobertos por partition pruning)
+5. Funções SQL para criação/remoção automática de partições:
+   - climate_data_ensure_year_partition(ano)
+   - climate_data_drop_year_partition(ano)
+
+Benefícios:
+- Partition pruning mantém rápidas as queries por local/período
+  (get_climate_data)
+- Índices menores (BRIN) → menos bloat e VACUUM mais barato
+- Retenção vira DETACH + DROP de uma partição anual
+
+Os dados existentes são copiados para a nova estrutura e a sequência de
+IDs é preservada.
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = "003_partition_climate_data"
+down_revision = "002_regional_coverage"
+branch_labels = None
+depends_on = None
+
+# Fontes com sub-partição LIST dedicada (mesmas 6 APIs da migration 001)
+CLIMATE_SOURCES = (
+    "nasa_power",
+    "openmeteo_archive",
+    "openmeteo_forecast",
+    "met_norway",
+    "nws_forecast",
+    "nws_stations",
+)
+
+CLIMATE_DATA_COLUMNS = (
+    "id, source_api, latitude, longitude, elevation, timezone, date, "
+    "raw_data, harmonized_data, eto_mm_day, eto_method, quality_flags, "
+    "processing_metadata, created_at, updated_at"
+)
+
+
+def _sources_array() -> str:
+    """Literal ARRAY[...] com as fontes para uso no PL/pgSQL."""
+    return "ARRAY[" + ", ".join(f"'{s}'" for s in CLIMATE_SOURCES) + "]"
+
+
+def upgrade() -> None:
+    """Converte climate_data em tabela particionada por ano e fonte."""
+
+    print("\n" + "=" * 80)
+    print("🗂️  PARTICIONANDO climate_data (ano → fonte, BRIN em date)")
+    print("=" * 80)
+
+    # ========================================
+    # 1. TABELA ANTIGA → climate_data_legacy
+    # ========================================
+    print("\n📦 Renomeando tabela atual para climate_data_legacy...")
+
+    op.execute("ALTER TABLE climate_data RENAME TO climate_data_legacy")
+    op.execute(
+        "ALTER TABLE climate_data_legacy "
+        "RENAME CONSTRAINT climate_data_pkey TO climate_data_legacy_pkey"
+    )
+    op.execute(
+        "ALTER TABLE climate_data_legacy "
+        "RENAME CONSTRAINT uq_climate_data_location_date "
+        "TO uq_climate_data_legacy_location_date"
+    )
+    for index_name in (
+        "idx_climate_data_source",
+        "idx_climate_data_location",
+        "idx_climate_data_date",
+        "idx_climate_data_source_date",
+    ):
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+    # Sequência de IDs é reaproveitada pela nova tabela
+    op.execute("ALTER SEQUENCE climate_data_id_seq OWNED BY NONE")
+
+    # ========================================
+    # 2. TABELA PARTICIONADA
+    # ========================================
+    print("\n🌡️  Criando climate_data particionada (RANGE date)...")
+
+    # PK e UNIQUE precisam conter as chaves de partição (date, source_api)
+    op.execute(
+        """
+        CREATE TABLE climate_data (
+            id INTEGER NOT NULL DEFAULT nextval('climate_data_id_seq'),
+            source_api VARCHAR(50) NOT NULL,
+            latitude DOUBLE PRECISION NOT NULL,
+            longitude DOUBLE PRECISION NOT NULL,
+            elevation DOUBLE PRECISION,
+            timezone VARCHAR(50),
+            date DATE NOT NULL,
+            raw_data JSONB NOT NULL,
+            harmonized_data JSONB,
+            eto_mm_day DOUBLE PRECISION,
+            eto_method VARCHAR(50),
+            quality_flags JSONB,
+            processing_metadata JSONB,
+            created_at TIMESTAMP NOT NULL DEFAULT now(),
+            updated_at TIMESTAMP DEFAULT now(),
+            CONSTRAINT climate_data_pkey
+                PRIMARY KEY (id, date, source_api),
+            CONSTRAINT uq_climate_data_location_date
+                UNIQUE (source_api, latitude, longitude, date)
+        ) PARTITION BY RANGE (date)
+        """
+    )
+    op.execute(
+        "COMMENT ON TABLE climate_data IS "
+        "'Dados climáticos multi-API, particionados por ano (date) "
+        "e fonte (source_api)'"
+    )
+    op.execute("ALTER SEQUENCE climate_data_id_seq OWNED BY climate_data.id")
+
+    # Índices no pai são propagados para todas as partições
+    op.execute(
+        "CREATE INDEX idx_climate_data_location "
+        "ON climate_data (latitude, longitude, date)"
+    )
+    op.execute(
+        "CREATE INDEX idx_climate_data_date_brin "
+        "ON climate_data USING brin (date) WITH (pages_per_range = 32)"
+    )
+
+    # Partição DEFAULT: inserts nunca falham por falta de partição
+    op.execute(
+        "CREATE TABLE climate_data_default PARTITION OF climate_data DEFAULT"
+    )
+
+    # ========================================
+    # 3. FUNÇÕES DE MANUTENÇÃO DE PARTIÇÕES
+    # ========================================
+    print("\n⚙️  Criando funções de manutenção de partições...")
+
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION climate_data_ensure_year_partition(
+            p_year INTEGER
+        )
+        RETURNS BOOLEAN AS $$
+        DECLARE
+            v_parent TEXT := format('climate_data_y%s', p_year);
+            v_from DATE := make_date(p_year, 1, 1);
+            v_to DATE := make_date(p_year + 1, 1, 1);
+            v_source TEXT;
+        BEGIN
+            IF to_regclass(v_parent) IS NOT NULL THEN
+                RETURN FALSE;
+            END IF;
+
+            -- Partição anual, subdividida por fonte
+            EXECUTE format(
+                'CREATE TABLE %I (LIKE climate_data INCLUDING DEFAULTS) '
+                'PARTITION BY LIST (source_api)',
+                v_parent
+            );
+            FOREACH v_source IN ARRAY {_sources_array()} LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF %I FOR VALUES IN (%L)',
+                    v_parent || '_' || v_source, v_parent, v_source
+                );
+            END LOOP;
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF %I DEFAULT',
+                v_parent || '_other', v_parent
+            );
+
+            -- Move linhas do ano que caíram na partição DEFAULT
+            EXECUTE format(
+                'INSERT INTO %I SELECT * FROM climate_data_default '
+                'WHERE date >= %L AND date < %L',
+                v_parent, v_from, v_to
+            );
+            EXECUTE format(
+                'DELETE FROM climate_data_default '
+                'WHERE date >= %L AND date < %L',
+                v_from, v_to
+            );
+
+            -- ATTACH cria os índices do pai na nova partição
+            EXECUTE format(
+                'ALTER TABLE climate_data ATTACH PARTITION %I '
+                'FOR VALUES FROM (%L) TO (%L)',
+                v_parent, v_from, v_to
+            );
+            RETURN TRUE;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION climate_data_drop_year_partition(
+            p_year INTEGER
+        )
+        RETURNS BOOLEAN AS $$
+        DECLARE
+            v_parent TEXT := format('climate_data_y%s', p_year);
+        BEGIN
+            IF to_regclass(v_parent) IS NULL THEN
+                RETURN FALSE;
+            END IF;
+
+            EXECUTE format(
+                'ALTER TABLE climate_data DETACH PARTITION %I', v_parent
+            );
+            EXECUTE format('DROP TABLE %I', v_parent);
+            RETURN TRUE;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+
+    # ========================================
+    # 4. PARTIÇÕES INICIAIS + CÓPIA DOS DADOS
+    # ========================================
+    # Só anos com dados + ano atual e próximo; os demais são criados
+    # sob demanda (maintain_climate_partitions move o que cair na DEFAULT)
+    print("\n📅 Criando partições anuais (anos com dados + atual + 1)...")
+
+    op.execute(
+        """
+        SELECT climate_data_ensure_year_partition(y)
+        FROM (
+            SELECT DISTINCT EXTRACT(YEAR FROM date)::INTEGER AS y
+            FROM climate_data_legacy
+            UNION
+            SELECT EXTRACT(YEAR FROM now())::INTEGER + n
+            FROM generate_series(0, 1) AS n
+        ) AS years
+        ORDER BY y
+        """
+    )
+
+    print("\n🚚 Copiando dados de climate_data_legacy...")
+    op.execute(
+        f"INSERT INTO climate_data ({CLIMATE_DATA_COLUMNS}) "
+        f"SELECT {CLIMATE_DATA_COLUMNS} FROM climate_data_legacy"
+    )
+    op.execute("DROP TABLE climate_data_legacy")
+
+    print("✅ climate_data particionada (ano → fonte, BRIN em date)")
+
+
+def downgrade() -> None:
+    """Volta climate_data para tabela única (layout da migration 001)."""
+
+    op.execute("ALTER TABLE climate_data RENAME TO climate_data_partitioned")
+    op.execute(
+        "ALTER TABLE climate_data_partitioned "
+        "RENAME CONSTRAINT climate_data_pkey "
+        "TO climate_data_partitioned_pkey"
+    )
+    op.execute(
+        "ALTER TABLE climate_data_partitioned "
+        "RENAME CONSTRAINT uq_climate_data_location_date "
+        "TO uq_climate_data_partitioned_location_date"
+    )
+    op.execute("DROP INDEX IF EXISTS idx_climate_data_location")
+    op.execute("DROP INDEX IF EXISTS idx_climate_data_date_brin")
+    op.execute("ALTER SEQUENCE climate_data_id_seq OWNED BY NONE")
+
+    op.execute(
+        """
+        CREATE TABLE climate_data (
+            id INTEGER NOT NULL DEFAULT nextval('climate_data_id_seq'),
+            source_api VARCHAR(50) NOT NULL,
+            latitude DOUBLE PRECISION NOT NULL,
+            longitude DOUBLE PRECISION NOT NULL,
+            elevation DOUBLE PRECISION,
+            timezone VARCHAR(50),
+            date DATE NOT NULL,
+            raw_data JSONB NOT NULL,
+            harmonized_data JSONB,
+            eto_mm_day DOUBLE PRECISION,
+            eto_method VARCHAR(50),
+            quality_flags JSONB,
+            processing_metadata JSONB,
+            created_at TIMESTAMP NOT NULL DEFAULT now(),
+            updated_at TIMESTAMP DEFAULT now(),
+            CONSTRAINT climate_data_pkey PRIMARY KEY (id),
+            CONSTRAINT uq_climate_data_location_date
+                UNIQUE (source_api, latitude, longitude, date)
+        )
+        """
+    )
+    op.execute("ALTER SEQUENCE climate_data_id_seq OWNED BY climate_data.id")
+
+    op.execute(
+        f"INSERT INTO climate_data ({CLIMATE_DATA_COLUMNS}) "
+        f"SELECT {CLIMATE_DATA_COLUMNS} FROM climate_data_partitioned"
+    )
+    op.execute("DROP TABLE climate_data_partitioned CASCADE")
+
+    op.execute("DROP FUNCTION IF EXISTS climate_data_ensure_year_partition")
+    op.execute("DROP FUNCTION IF EXISTS climate_data_drop_year_partition")
+
+    op.create_index("idx_climate_data_source", "climate_data", ["source_api"])
+    op.create_index(
+        "idx_climate_data_location", "climate_data", ["latitude", "longitude"]
+    )
+    op.create_index("idx_climate_data_date", "climate_data", ["date"])
+    op.create_index(
+        "idx_climate_data_source_date", "climate_data", ["source_api", "date"]
+    )
@@ -0,0 +1,85 @@
+"""
+Add typed hot columns (real) to climate_data.
+
+Revision ID: 004_climate_data_hot_columns
+Revises: 003_partition_climate_data
+Create Date: 2026-10-18
+
+Esta migration adiciona colunas tipadas com as variáveis que o pipeline
+ETo e as exportações sempre leem, hoje disponíveis apenas dentro dos
+JSONB raw_data/harmonized_data:
+
+- temp_max_c, temp_min_c, temp_mean_c (°C)
+- humidity_percent (%)
+- wind_speed_2m_ms (u2, m/s)
+- solar_radiation_mjm2 (Rs, MJ/m²/dia)
+- precipitation_mm (mm/dia)
+
+As colunas são preenchidas pela aplicação na gravação
+(data_storage.extract_hot_columns). Linhas existentes são preenchidas
+aqui a partir do JSONB, com a mesma ordem de prioridade de nomes.
+
+Índice de cobertura em (latitude, longitude, date) INCLUDE (...) permite
+que queries de intervalo sejam atendidas por index-only scan.
+"""
+
+from alembic import op
+
+# Mesma tabela de aliases usada na gravação (data_storage) e no índice
+from backend.database.models.climate_data import HOT_COLUMN_ALIASES
+
+# revision identifiers
+revision = "004_climate_data_hot_columns"
+down_revision = "003_partition_climate_data"
+branch_labels = None
+depends_on = None
+
+
+def _backfill_expression(aliases: tuple) -> str:
+    """COALESCE sobre harmonized_data e depois raw_data (só numéricos)."""
+    candidates = [
+        f"CASE WHEN jsonb_typeof({col} -> '{alias}') = 'number' "
+        f"THEN ({col} ->> '{alias}')::REAL END"
+        for col in ("harmonized_data", "raw_data")
+        for alias in aliases
+    ]
+    return "COALESCE(" + ", ".join(candidates) + ")"
+
+
+def upgrade() -> None:
+    """Adiciona e preenche as colunas tipadas de climate_data."""
+
+    print("\n🌡️  Adicionando colunas tipadas em climate_data...")
+
+    # ALTER no pai particionado propaga para todas as partições
+    for column in HOT_COLUMN_ALIASES:
+        op.execute(f"ALTER TABLE climate_data ADD COLUMN {column} REAL")
+
+    print("🔄 Preenchendo colunas a partir do JSONB...")
+    assignments = ",\n            ".join(
+        f"{column} = {_backfill_expression(aliases)}"
+        for column, aliases in HOT_COLUMN_ALIASES.items()
+    )
+    op.execute(f"UPDATE climate_data SET\n            {assignments}")
+
+    op.execute(
+        "CREATE INDEX idx_climate_data_location_hot "
+        "ON climate_data (latitude, longitude, date) "
+        f"INCLUDE (source_api, eto_mm_day, {', '.join(HOT_COLUMN_ALIASES)})"
+    )
+    op.execute("DROP INDEX IF EXISTS idx_climate_data_location")
+
+    print("✅ Colunas tipadas criadas e preenchidas")
+
+
+def downgrade() -> None:
+    """Remove as colunas tipadas (dados continuam no JSONB)."""
+
+    op.execute(
+        "CREATE INDEX idx_climate_data_location "
+        "ON climate_data (latitude, longitude, date)"
+    )
+    op.execute("DROP INDEX IF EXISTS idx_climate_data_location_hot")
+
+    for column in HOT_COLUMN_ALIASES:
+        op.execute(f"ALTER TABLE climate_data DROP COLUMN {column}")
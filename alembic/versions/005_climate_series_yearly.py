@@ -0,0 +1,93 @@
+"""
+Add climate_series_yearly (compact yearly array storage).
+
+Revision ID: 005_climate_series_yearly
+Revises: 004_climate_data_hot_columns
+Create Date: 2026-10-18
+
+Esta migration cria a tabela climate_series_yearly para séries diárias
+longas: uma linha por (fonte, localização, ano) com um array real[] por
+variável (posição = dia do ano).
+
+Casos de uso:
+- Séries de validação 1991-2020 por cidade (30 linhas em vez de ~11 mil)
+- Exportações históricas (historical_email) lidas direto como NumPy
+  (backend.database.series_storage.load_series)
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = "005_climate_series_yearly"
+down_revision = "004_climate_data_hot_columns"
+branch_labels = None
+depends_on = None
+
+SERIES_VARIABLES = (
+    ("eto_mm_day", "ETo (mm/dia)"),
+    ("temp_max_c", "Tmax (°C)"),
+    ("temp_min_c", "Tmin (°C)"),
+    ("temp_mean_c", "Tmean (°C)"),
+    ("humidity_percent", "Umidade relativa (%)"),
+    ("wind_speed_2m_ms", "Vento a 2m - u2 (m/s)"),
+    ("solar_radiation_mjm2", "Radiação solar (MJ/m²/dia)"),
+    ("precipitation_mm", "Precipitação (mm/dia)"),
+)
+
+
+def upgrade() -> None:
+    """Cria climate_series_yearly."""
+
+    print("\n📦 Criando tabela climate_series_yearly...")
+
+    op.create_table(
+        "climate_series_yearly",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("source_api", sa.String(50), nullable=False),
+        sa.Column("latitude", sa.Float, nullable=False),
+        sa.Column("longitude", sa.Float, nullable=False),
+        sa.Column("year", sa.SmallInteger, nullable=False),
+        sa.Column(
+            "n_days",
+            sa.SmallInteger,
+            nullable=False,
+            comment="Dias no ano (365/366)",
+        ),
+        *(
+            sa.Column(
+                name,
+                postgresql.ARRAY(sa.REAL),
+                nullable=True,
+                comment=comment,
+            )
+            for name, comment in SERIES_VARIABLES
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime,
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.UniqueConstraint(
+            "source_api",
+            "latitude",
+            "longitude",
+            "year",
+            name="uq_climate_series_yearly_location_year",
+        ),
+    )
+    op.create_index(
+        "idx_climate_series_yearly_year", "climate_series_yearly", ["year"]
+    )
+
+    print("✅ climate_series_yearly criada")
+
+
+def downgrade() -> None:
+    """Remove climate_series_yearly."""
+    op.drop_index(
+        "idx_climate_series_yearly_year", table_name="climate_series_yearly"
+    )
+    op.drop_table("climate_series_yearly")
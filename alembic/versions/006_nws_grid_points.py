@@ -0,0 +1,62 @@
+"""
+Add nws_grid_points (persistent NWS point → grid cache).
+
+Revision ID: 006_nws_grid_points
+Revises: 005_climate_series_yearly
+Create Date: 2026-10-18
+
+Esta migration cria a tabela nws_grid_points, segundo nível do cache de
+metadados NWS (o primeiro é Redis):
+
+- gridId/gridX/gridY e URLs de forecast de /points/{lat},{lon}
+- Lista de estações próximas de /points/{lat},{lon}/stations
+
+Chave: coordenadas quantizadas (NWSGridCache.quantize).
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = "006_nws_grid_points"
+down_revision = "005_climate_series_yearly"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Cria nws_grid_points."""
+
+    print("\n📦 Criando tabela nws_grid_points...")
+
+    op.create_table(
+        "nws_grid_points",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("latitude", sa.Float, nullable=False),
+        sa.Column("longitude", sa.Float, nullable=False),
+        sa.Column("grid_id", sa.String(10), nullable=True),
+        sa.Column("grid_x", sa.Integer, nullable=True),
+        sa.Column("grid_y", sa.Integer, nullable=True),
+        sa.Column("forecast_url", sa.Text, nullable=True),
+        sa.Column("forecast_hourly_url", sa.Text, nullable=True),
+        sa.Column("grid_updated_at", sa.DateTime, nullable=True),
+        sa.Column("stations", postgresql.JSONB, nullable=True),
+        sa.Column("stations_updated_at", sa.DateTime, nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime,
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.UniqueConstraint(
+            "latitude", "longitude", name="uq_nws_grid_points_location"
+        ),
+    )
+
+    print("✅ nws_grid_points criada")
+
+
+def downgrade() -> None:
+    """Remove nws_grid_points."""
+    op.drop_table("nws_grid_points")
@@ -3,5 +3,6 @@ Middlewares da aplicação FastAPI.
 """
 
 from backend.api.middleware.prometheus import PrometheusMiddleware
+from backend.api.middleware.tracing import TracingMiddleware
 
-__all__ = ["PrometheusMiddleware"]
+__all__ = ["PrometheusMiddleware", "TracingMiddleware"]
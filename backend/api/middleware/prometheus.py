@@ -1,45 +1,136 @@
 """
-Middleware para monitoramento de requisições.
+Middleware ASGI de métricas Prometheus por template de rota.
 """
 
+import os
 import time
-from collections.abc import Callable
+from typing import Any, Dict, Tuple
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    generate_latest,
+)
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from backend.api.middleware.prometheus_metrics import (
-    API_ACTIVE_REQUESTS,
-    API_REQUEST_DURATION,
-    API_REQUESTS,
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    HTTP_REQUESTS_IN_PROGRESS,
 )
 
+HTTP_METHODS = frozenset(
+    {"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"}
+)
+UNMATCHED = "none"
 
-class PrometheusMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        method = request.method
-        path = request.url.path
 
-        # Incrementar contador de requisições ativas
-        API_ACTIVE_REQUESTS.labels(method=method, endpoint=path).inc()
+class PrometheusMiddleware:
+    """
+    Contagem, duração e requisições em andamento por rota, em ASGI puro.
 
-        # Medir tempo de resposta
-        start_time = time.time()
+    As métricas usam o template da rota (/ws/task_status/{task_id}), não
+    o path concreto, então IDs não criam séries novas. Métodos fora de
+    HTTP_METHODS viram "OTHER" e o status é agrupado ("2xx"). WebSockets
+    entram só no gauge de em andamento (conexões abertas).
 
-        try:
-            response = await call_next(request)
+    A rota é resolvida antes da chamada (o gauge precisa dela na
+    entrada); rotas sem parâmetros ficam em cache por path.
+    """
 
-            # Registrar métricas
-            API_REQUESTS.labels(
-                method=method, endpoint=path, status_code=response.status_code
-            ).inc()
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._static_routes: Dict[Tuple[str, str, str], str] = {}
+        self._children: Dict[Tuple[Any, ...], Any] = {}
 
-            API_REQUEST_DURATION.labels(method=method, endpoint=path).observe(
-                time.time() - start_time
-            )
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
 
-            return response
+        method = scope.get("method", "WS")
+        if scope["type"] == "http" and method not in HTTP_METHODS:
+            method = "OTHER"
+        handler = self._route_template(scope)
 
+        in_progress = self._child(HTTP_REQUESTS_IN_PROGRESS, method, handler)
+        in_progress.inc()
+        if scope["type"] == "websocket":
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                in_progress.dec()
+            return
+
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
         finally:
-            # Decrementar contador de requisições ativas
-            API_ACTIVE_REQUESTS.labels(method=method, endpoint=path).dec()
+            duration = time.perf_counter() - start
+            in_progress.dec()
+            self._child(HTTP_REQUEST_DURATION, method, handler).observe(
+                duration
+            )
+            self._child(
+                HTTP_REQUESTS, method, handler, f"{status_code // 100}xx"
+            ).inc()
+
+    def _route_template(self, scope: Scope) -> str:
+        """Template da rota que atende ``scope`` (``"none"`` se nenhuma)."""
+        key = (scope["type"], scope.get("method", ""), scope["path"])
+        template = self._static_routes.get(key)
+        if template is not None:
+            return template
+
+        # app.router.routes já traz as rotas de include_router com o
+        # prefixo completo (mesmo template de scope["route"].path)
+        router = getattr(scope.get("app"), "router", None)
+        partial = None
+        for route in getattr(router, "routes", ()):
+            path = getattr(route, "path", None)
+            if path is None:
+                continue
+            match, _ = route.matches(scope)
+            if match is Match.FULL:
+                if "{" not in path and path == scope["path"]:
+                    self._static_routes[key] = path
+                return path
+            if match is Match.PARTIAL and partial is None:
+                partial = path  # Método não permitido (405)
+        return partial or UNMATCHED
+
+    def _child(self, metric: Any, *labels: str) -> Any:
+        """metric.labels(*labels), reaproveitando o filho já criado."""
+        key = (metric, *labels)
+        child = self._children.get(key)
+        if child is None:
+            child = self._children[key] = metric.labels(*labels)
+        return child
+
+
+def metrics_endpoint(request: Request) -> Response:
+    """
+    Exposição /metrics (formato texto do Prometheus).
+
+    Com PROMETHEUS_MULTIPROC_DIR definido (vários workers), agrega as
+    métricas de todos os processos.
+    """
+    registry = REGISTRY
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
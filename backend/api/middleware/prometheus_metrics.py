@@ -9,22 +9,28 @@ from prometheus_client import Counter, Gauge, Histogram
 # MÉTRICAS DA API
 # ============================================================================
 
-API_REQUESTS = Counter(
-    "api_requests_total",
-    "Total API requests",
-    ["method", "endpoint", "status_code"],
+# Labels: method (GET, POST, ... ou OTHER), handler (template da rota,
+# "none" sem rota) e status agrupado ("2xx"): cardinalidade limitada.
+# Nomes compatíveis com os dashboards (antes do Instrumentator).
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "Total HTTP requests by route template",
+    ["method", "handler", "status"],
 )
 
-API_REQUEST_DURATION = Histogram(
-    "api_request_duration_seconds",
-    "API request duration in seconds",
-    ["method", "endpoint"],
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request duration in seconds by route template",
+    ["method", "handler"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
 )
 
-API_ACTIVE_REQUESTS = Gauge(
-    "api_active_requests",
-    "Number of currently active requests",
-    ["method", "endpoint"],
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests (and open WebSockets) in progress by route template",
+    ["method", "handler"],
+    multiprocess_mode="livesum",
 )
 
 # ============================================================================
@@ -64,3 +70,98 @@ CELERY_TASKS_TOTAL = Counter(
     "Total de tarefas executadas",
     ["task_name", "status"],
 )
+
+# Memória por task (worker_memory): o crescimento acumulado de RSS por
+# task aponta quem vaza; o gauge por processo (pid) mostra o footprint
+
+_MB = 1024 * 1024
+
+CELERY_TASK_RSS_GROWTH = Counter(
+    "celery_task_rss_growth_bytes_total",
+    "Crescimento de RSS do processo do pool durante a task (só positivos)",
+    ["task_name"],
+)
+
+CELERY_TASK_MEMORY_PEAK = Histogram(
+    "celery_task_memory_peak_bytes",
+    "Pico de alocações Python na task (tracemalloc, tasks amostradas)",
+    ["task_name"],
+    buckets=tuple(mb * _MB for mb in (1, 5, 10, 25, 50, 100, 250, 500, 1000)),
+)
+
+CELERY_WORKER_RSS = Gauge(
+    "celery_worker_rss_bytes",
+    "RSS do processo do pool ao fim da última task",
+    multiprocess_mode="liveall",
+)
+
+CELERY_WORKER_RECYCLES = Counter(
+    "celery_worker_recycles_total",
+    "Processos do pool reciclados pela política de memória",
+    ["reason"],
+)
+
+# ============================================================================
+# MÉTRICAS DAS APIs CLIMÁTICAS
+# ============================================================================
+
+CIRCUIT_BREAKER_TRIPS = Counter(
+    "climate_circuit_breaker_trips_total",
+    "Aberturas de circuit breaker por fonte",
+    ["source"],
+)
+
+CIRCUIT_BREAKER_REJECTED = Counter(
+    "climate_circuit_breaker_rejected_total",
+    "Chamadas rejeitadas com circuito aberto",
+    ["source"],
+)
+
+HEDGED_REQUESTS = Counter(
+    "climate_hedged_requests_total",
+    "GETs duplicados após o p95 de latência, por requisição vencedora",
+    ["source", "winner"],
+)
+
+# Quota diária (api_usage_tracker): atualizados a cada gravação em lote,
+# com valores lidos do Redis (iguais em todos os processos)
+
+CLIMATE_API_BURN_RATE = Gauge(
+    "climate_api_quota_burn_rate",
+    "Chamadas por minuto à fonte (média dos últimos 15 minutos)",
+    ["source"],
+    multiprocess_mode="mostrecent",
+)
+
+CLIMATE_API_EXHAUSTION_SECONDS = Gauge(
+    "climate_api_quota_exhaustion_seconds",
+    "Projeção de esgotamento da quota diária no ritmo atual (+Inf: não "
+    "esgota antes da virada do dia)",
+    ["source"],
+    multiprocess_mode="mostrecent",
+)
+
+CLIMATE_API_QUOTA_USED = Gauge(
+    "climate_api_quota_used_ratio",
+    "Fração da quota diária já consumida",
+    ["source"],
+    multiprocess_mode="mostrecent",
+)
+
+# ============================================================================
+# MÉTRICAS DO PIPELINE ETo
+# ============================================================================
+
+PIPELINE_STAGE_DURATION = Histogram(
+    "eto_pipeline_stage_duration_seconds",
+    "Duração das etapas do pipeline ETo (spans de tracing)",
+    ["stage", "source", "status"],
+    buckets=(0.005, 0.025, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120),
+)
+
+PIPELINE_FRAME_BYTES = Histogram(
+    "eto_pipeline_frame_bytes",
+    "Tamanho em memória dos DataFrames ao fim de cada etapa",
+    ["stage"],
+    buckets=tuple(kb * 1024 for kb in (16, 64, 256, 1024, 4096, 16384, 65536)),
+)
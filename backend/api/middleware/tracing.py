@@ -0,0 +1,66 @@
+"""
+Middleware ASGI que abre o span raiz de cada requisição HTTP.
+"""
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.infrastructure import tracing
+
+
+class TracingMiddleware:
+    """
+    Continua o trace do header traceparent (ou inicia um novo).
+
+    Os spans do pipeline ETo e as tasks Celery publicadas durante a
+    requisição ficam como filhos deste span. O nome final usa o template
+    da rota (GET /api/v1/eto/{task_id}), não o path concreto. A resposta
+    traz o trace id no header X-Trace-Id.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = {
+            key.decode("latin-1"): value.decode("latin-1")
+            for key, value in scope.get("headers", [])
+        }
+        method = scope["method"]
+        status_code = 500
+
+        with tracing.span(
+            f"HTTP {method}",
+            parent=tracing.extract(headers),
+            kind="server",
+            metric=False,
+            attributes={"http.method": method, "http.target": scope["path"]},
+        ) as request_span:
+
+            async def send_wrapper(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    message.setdefault("headers", [])
+                    message["headers"] = [
+                        *message["headers"],
+                        (
+                            b"x-trace-id",
+                            request_span.context.trace_id.encode(),
+                        ),
+                    ]
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = scope.get("route")
+                if route is not None and hasattr(route, "path"):
+                    request_span.name = f"{method} {route.path}"
+                    request_span.set_attribute("http.route", route.path)
+                request_span.set_attribute("http.status_code", status_code)
+                if status_code >= 500:
+                    request_span.set_status("error")
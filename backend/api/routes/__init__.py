@@ -1,5 +1,6 @@
 from fastapi import APIRouter
 
+from backend.api.routes.admin_routes import router as admin_router
 from backend.api.routes.climate_sources import router as climate_sources_router
 from backend.api.routes.eto_routes import eto_router
 from backend.api.routes.health import router as health_router
@@ -27,3 +28,6 @@ api_router.include_router(geolocation_router)
 
 # Visitor counter (4 endpoints)
 api_router.include_router(visitor_router)
+
+# Admin: profiles sob demanda (2 endpoints)
+api_router.include_router(admin_router)
@@ -0,0 +1,99 @@
+"""
+Rotas administrativas: profiles de execução sob demanda
+"""
+
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import FileResponse
+from loguru import logger
+from sqlalchemy.orm import Session
+
+from backend.database.connection import get_db
+from backend.database.models.admin_user import AdminUser
+from backend.infrastructure import profiling
+from config.settings.app_config import get_settings
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+# Roles com acesso a profiles (DEVELOPER fica só com logs/health)
+PROFILING_ROLES = ("SUPER_ADMIN", "ADMIN")
+
+
+def require_admin(
+    x_admin_token: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+) -> AdminUser:
+    """
+    Dependency: admin ativo identificado pelo header X-Admin-Token.
+
+    Raises:
+        HTTPException 403: Token ausente, inválido ou sem permissão
+    """
+    admin = None
+    if x_admin_token:
+        admin = (
+            db.query(AdminUser)
+            .filter(
+                AdminUser.api_token == x_admin_token,
+                AdminUser.is_active.is_(True),
+            )
+            .first()
+        )
+    if admin is None or admin.role not in PROFILING_ROLES:
+        raise HTTPException(status_code=403, detail="Acesso restrito a admins")
+    return admin
+
+
+def profiling_requested(
+    x_profile: Optional[str] = Header(None),
+    x_admin_token: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+) -> bool:
+    """
+    Dependency: True se a requisição pediu profiling (X-Profile: 1).
+
+    Só admins podem pedir; sem o header, nenhuma consulta é feita.
+
+    Raises:
+        HTTPException 403: Profiling desabilitado ou token sem permissão
+    """
+    if (x_profile or "").lower() not in ("1", "true", "yes"):
+        return False
+    if not get_settings().profiling.ENABLED:
+        raise HTTPException(
+            status_code=403, detail="Profiling desabilitado (PROFILING_*)"
+        )
+    admin = require_admin(x_admin_token, db)
+    logger.info(f"🔬 Profiling pedido por {admin.username}")
+    return True
+
+
+@router.get("/profiles")
+async def list_profiles(
+    limit: int = 50, admin: AdminUser = Depends(require_admin)
+) -> List[Dict[str, Any]]:
+    """
+    🔬 Profiles gravados, do mais recente ao mais antigo.
+
+    Cada item traz profile_id, label, kind ("http"/"celery"), duração,
+    pico de memória e os nomes dos artefatos para download.
+    """
+    return profiling.get_profile_store().recent(limit=limit)
+
+
+@router.get("/profiles/{profile_id}/{artifact}")
+async def download_profile_artifact(
+    profile_id: str,
+    artifact: str,
+    admin: AdminUser = Depends(require_admin),
+) -> FileResponse:
+    """
+    🔬 Download de um artefato (profile.html, profile.prof, memory.txt...).
+    """
+    path = profiling.get_profile_store().artifact_path(profile_id, artifact)
+    if path is None:
+        raise HTTPException(
+            status_code=404, detail="Profile ou artefato não encontrado"
+        )
+    return FileResponse(path, filename=f"{profile_id}-{artifact}")
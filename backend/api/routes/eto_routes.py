@@ -19,6 +19,9 @@ from backend.api.services.climate_source_availability import (
     OperationMode,
 )
 from backend.api.services.climate_source_manager import ClimateSourceManager
+from backend.api.services.climate_factory import get_eto_result_cache
+from backend.api.routes.admin_routes import profiling_requested
+from backend.infrastructure import profiling
 
 # Importar task Celery para cálculos assíncronos
 from backend.infrastructure.celery.tasks.eto_calculation import (
@@ -80,7 +83,9 @@ class FavoriteRequest(BaseModel):
 
 @eto_router.post("/calculate")
 async def calculate_eto(
-    request: EToCalculationRequest, db: Session = Depends(get_db)
+    request: EToCalculationRequest,
+    db: Session = Depends(get_db),
+    profile: bool = Depends(profiling_requested),
 ) -> Dict[str, Any]:
     """
     🚀 Cálculo ETo assíncrono com progresso em tempo real.
@@ -109,7 +114,43 @@ async def calculate_eto(
     }
 
     Monitore progresso: WebSocket /ws/task_status/{task_id}
+
+    dashboard_forecast com resultado em cache responde direto com
+    status "completed" e "data"; "refreshing": true indica que o
+    resultado passou do TTL (dentro da janela de graça) e está sendo
+    recalculado em background (refresh_task_id).
+
+    Admins podem perfilar a execução com os headers X-Profile: 1 e
+    X-Admin-Token: a resposta traz "profile_ids" ("request" e "task"),
+    baixáveis em /admin/profiles.
     """
+    if not profile:
+        return await _calculate_eto(request)
+
+    task_profile_id = profiling.new_profile_id()
+    with profiling.profile_execution(
+        "POST /internal/eto/calculate",
+        attributes={
+            "lat": request.lat,
+            "lng": request.lng,
+            "sources": request.sources,
+            "period_type": request.period_type,
+        },
+        async_mode="enabled",
+    ) as run:
+        response = await _calculate_eto(request, task_profile_id)
+
+    response["profile_ids"] = {
+        "request": run.profile_id,
+        "task": task_profile_id if response.get("task_id") else None,
+    }
+    return response
+
+
+async def _calculate_eto(
+    request: EToCalculationRequest, task_profile_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """Valida, seleciona a fonte e dispara (ou serve do cache) o cálculo."""
     try:
         # 0. Normalizar period_type para OperationMode
         period_type_str = (request.period_type or "dashboard_current").lower()
@@ -202,17 +243,64 @@ async def calculate_eto(
                 f"será obtida via API"
             )
 
-        # 5. Iniciar cálculo ETo assíncrono (Celery task)
+        task_kwargs = {
+            "lat": request.lat,
+            "lon": request.lng,
+            "start_date": request.start_date,
+            "end_date": request.end_date,
+            "sources": [selected_source],  # Lista de fontes
+            "elevation": elevation,
+            "mode": operation_mode.value,  # String do modo
+        }
+
+        # 5. dashboard_forecast: stale-while-revalidate do resultado.
+        # Resultado em cache (mesmo expirado, dentro da janela de graça
+        # da fonte) volta na hora; se stale, um refresh vai para o Celery
+        if operation_mode == OperationMode.DASHBOARD_FORECAST:
+            result_cache = get_eto_result_cache()
+            cache_args = (
+                selected_source,
+                request.lat,
+                request.lng,
+                start_dt,
+                end_dt,
+            )
+            cached, is_stale = await result_cache.get_with_freshness(
+                *cache_args
+            )
+            if cached is not None:
+                refresh_task_id = None
+                if is_stale and await result_cache.try_lock_refresh(
+                    *cache_args
+                ):
+                    refresh_task_id = calculate_eto_task.delay(
+                        **task_kwargs
+                    ).id
+                    logger.info(
+                        f"🔄 Forecast stale servido; refresh em background: "
+                        f"{refresh_task_id}"
+                    )
+                return {
+                    "status": "completed",
+                    "data": cached,
+                    "cached": True,
+                    "refreshing": is_stale,
+                    "refresh_task_id": refresh_task_id,
+                    "source": selected_source,
+                    "source_info": source_info,
+                    "operation_mode": operation_mode.value,
+                    "location": {
+                        "lat": request.lat,
+                        "lng": request.lng,
+                        "elevation_m": elevation,
+                    },
+                }
+
+        # 6. Iniciar cálculo ETo assíncrono (Celery task)
         # Em vez de processar sincronamente, delegar para worker
-        task = calculate_eto_task.delay(
-            lat=request.lat,
-            lon=request.lng,
-            start_date=request.start_date,
-            end_date=request.end_date,
-            sources=[selected_source],  # Lista de fontes
-            elevation=elevation,
-            mode=operation_mode.value,  # String do modo
-        )
+        if task_profile_id:
+            task_kwargs["profile"] = task_profile_id
+        task = calculate_eto_task.delay(**task_kwargs)
 
         task_id = task.id
         logger.info(
@@ -220,7 +308,7 @@ async def calculate_eto(
             f"({request.lat}, {request.lng}) - Fonte: {selected_source}"
         )
 
-        # 6. Retornar task_id para monitoramento via WebSocket
+        # 7. Retornar task_id para monitoramento via WebSocket
         return {
             "status": "accepted",
             "task_id": task_id,
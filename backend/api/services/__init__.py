@@ -62,6 +62,7 @@ __all__ = [
     "ClimateSourceManager",
     "ClimateSourceSelector",
     "ClimateValidationService",
+    "ClimateColumns",
     # NASA POWER
     "NASAPowerClient",
     "NASAPowerSyncAdapter",
@@ -110,6 +111,7 @@ def __getattr__(name: str) -> Any:
             ".climate_validation",
             "ClimateValidationService",
         ),
+        "ClimateColumns": (".climate_columns", "ClimateColumns"),
         # NASA POWER
         "NASAPowerClient": (
             ".nasa_power.nasa_power_client",
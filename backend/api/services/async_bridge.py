@@ -0,0 +1,120 @@
+"""
+Ponte síncrono → assíncrono com event loop persistente.
+
+Sync adapters e Celery tasks executam coroutines em um único event loop
+de longa duração, rodando em uma thread daemon por processo. Evita criar
+e destruir um loop (e às vezes um ThreadPoolExecutor) a cada chamada, e
+permite que clientes HTTP assíncronos mantenham o pool de conexões
+entre chamadas.
+
+Funciona com ou sem loop rodando na thread chamadora (FastAPI, Celery,
+scripts). Após fork (Celery prefork) o loop é recriado no processo
+filho na primeira chamada.
+
+Usage:
+    >>> from backend.api.services.async_bridge import run_sync
+    >>> data = run_sync(client.get_daily_data(lat, lon, start, end))
+"""
+
+import asyncio
+import atexit
+import os
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+
+_lock = threading.Lock()
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_thread: Optional[threading.Thread] = None
+_pid: Optional[int] = None
+
+
+def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Corpo da thread do loop."""
+    asyncio.set_event_loop(loop)
+    loop.run_forever()
+
+
+def get_bridge_loop() -> asyncio.AbstractEventLoop:
+    """
+    Retorna o event loop compartilhado, criando-o se necessário.
+
+    Returns:
+        Event loop rodando em thread daemon própria
+    """
+    global _loop, _thread, _pid
+
+    with _lock:
+        alive = _thread is not None and _thread.is_alive()
+        if _loop is None or _pid != os.getpid() or not alive:
+            _loop = asyncio.new_event_loop()
+            _thread = threading.Thread(
+                target=_run_loop,
+                args=(_loop,),
+                name="async-bridge",
+                daemon=True,
+            )
+            _thread.start()
+            _pid = os.getpid()
+            logger.debug(f"🔁 Async bridge iniciado (pid={_pid})")
+        return _loop
+
+
+def run_sync(
+    coro: Coroutine[Any, Any, T], timeout: Optional[float] = None
+) -> T:
+    """
+    Executa uma coroutine no loop compartilhado e aguarda o resultado.
+
+    Args:
+        coro: Coroutine a executar
+        timeout: Tempo máximo em segundos (None = sem limite)
+
+    Returns:
+        Resultado da coroutine (exceções são propagadas)
+
+    Raises:
+        RuntimeError: Se chamado de dentro do próprio loop da ponte
+            (causaria deadlock)
+        concurrent.futures.TimeoutError: Se ``timeout`` estourar
+    """
+    loop = get_bridge_loop()
+    if threading.current_thread() is _thread:
+        coro.close()
+        msg = "run_sync chamado dentro do loop da ponte; use await"
+        raise RuntimeError(msg)
+
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    try:
+        return future.result(timeout)
+    except BaseException:
+        future.cancel()
+        raise
+
+
+def shutdown_bridge(timeout: float = 5.0) -> None:
+    """
+    Para o loop compartilhado (chamado automaticamente no exit).
+
+    Args:
+        timeout: Tempo máximo para a thread encerrar
+    """
+    global _loop, _thread, _pid
+
+    with _lock:
+        loop, thread = _loop, _thread
+        _loop, _thread, _pid = None, None, None
+
+    if loop is None or thread is None or not thread.is_alive():
+        return
+
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout)
+    if not thread.is_alive():
+        loop.close()
+
+
+atexit.register(shutdown_bridge)
@@ -0,0 +1,210 @@
+"""
+Modelo colunar para respostas das APIs climáticas.
+
+ClimateColumns guarda uma série diária como um array de datas e um array
+float64 por variável, mais metadados da fonte. Os clientes montam o
+objeto direto do payload da API (JSON ou FlatBuffers), e a conversão
+para DataFrame não passa por objetos Python por dia.
+
+Usage:
+    >>> columns = await nasa_client.get_daily_columns(lat, lon, start, end)
+    >>> df = columns.to_dataframe()  # índice 'date', uma coluna por var
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class ClimateColumns:
+    """
+    Série diária colunar de uma fonte climática.
+
+    Attributes:
+        source: Nome da fonte ('nasa_power', 'openmeteo_archive', ...)
+        dates: Datas (datetime64[D]), uma por dia
+        variables: {variável: array float64}, mesmo tamanho de ``dates``;
+            valores ausentes são NaN
+        metadata: Metadados da fonte (localização, elevação, etc.)
+    """
+
+    source: str
+    dates: np.ndarray
+    variables: Dict[str, np.ndarray] = field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self):
+        self.dates = np.asarray(self.dates, dtype="datetime64[D]")
+        for name, values in self.variables.items():
+            values = np.asarray(values, dtype=np.float64)
+            if values.shape != self.dates.shape:
+                msg = (
+                    f"{self.source}: variável '{name}' com "
+                    f"{values.size} valores para {self.dates.size} datas"
+                )
+                raise ValueError(msg)
+            self.variables[name] = values
+
+    def __len__(self) -> int:
+        return int(self.dates.size)
+
+    def to_dataframe(
+        self, aliases: Optional[Mapping[str, str]] = None
+    ) -> pd.DataFrame:
+        """
+        Converte para DataFrame indexado por data.
+
+        Args:
+            aliases: {variável: nome extra}; cada variável presente ganha
+                também uma coluna com o nome extra (ex.: harmonização
+                Open-Meteo → NASA em data_download)
+
+        Returns:
+            DataFrame com índice 'date' e uma coluna por variável
+        """
+        data = dict(self.variables)
+        for name, target in (aliases or {}).items():
+            if name in self.variables:
+                data[target] = self.variables[name]
+        index = pd.DatetimeIndex(self.dates, name="date")
+        return pd.DataFrame(data, index=index, copy=False)
+
+    def to_lists(self) -> Dict[str, List[Any]]:
+        """
+        Formato legado {'dates': [datetime], variável: [float | None]}.
+
+        Usado apenas para manter a API de dicts dos clientes existentes.
+        """
+        result: Dict[str, List[Any]] = {
+            "dates": self.dates.astype("datetime64[s]").tolist()
+        }
+        for name, values in self.variables.items():
+            result[name] = [
+                None if np.isnan(v) else v for v in values.tolist()
+            ]
+        return result
+
+    def select(self, names: Iterable[str]) -> "ClimateColumns":
+        """Retorna uma cópia rasa só com as variáveis pedidas."""
+        return ClimateColumns(
+            source=self.source,
+            dates=self.dates,
+            variables={
+                n: self.variables[n] for n in names if n in self.variables
+            },
+            metadata=self.metadata,
+        )
+
+    @classmethod
+    def from_openmeteo(
+        cls, source: str, response: Any, variables: Sequence[str]
+    ) -> "ClimateColumns":
+        """
+        Monta colunas a partir de uma resposta Open-Meteo (FlatBuffers).
+
+        Os arrays de ``ValuesAsNumpy()`` são usados diretamente. As datas
+        vêm de ``Daily().Time()/TimeEnd()/Interval()`` (epoch UTC); com
+        ``timezone=auto`` o offset local converte para a data civil.
+        Quando há vento a 10m, adiciona ``wind_speed_2m_mean`` (FAO-56).
+
+        Args:
+            source: Nome da fonte
+            response: WeatherApiResponse de openmeteo_requests
+            variables: Variáveis pedidas em ``daily`` (mesma ordem)
+
+        Returns:
+            ClimateColumns com metadados de localização em
+            ``metadata['location']``
+
+        Raises:
+            ValueError: Variável com tamanho diferente do eixo de datas
+                (resposta malformada)
+        """
+        location = {
+            "latitude": response.Latitude(),
+            "longitude": response.Longitude(),
+            "elevation": response.Elevation(),
+            "timezone": response.Timezone(),
+            "timezone_abbreviation": response.TimezoneAbbreviation(),
+            "utc_offset_seconds": response.UtcOffsetSeconds(),
+        }
+
+        daily = response.Daily()
+        start = int(daily.Time())
+        step = int(daily.Interval()) or 86400
+        end = max(int(daily.TimeEnd()), start + step)
+        seconds = np.arange(start, end, step, dtype=np.int64)
+        dates = (seconds + location["utc_offset_seconds"]).astype(
+            "datetime64[s]"
+        )
+
+        values: Dict[str, np.ndarray] = {}
+        for i, name in enumerate(variables):
+            array = np.atleast_1d(
+                np.asarray(daily.Variables(i).ValuesAsNumpy(), np.float64)
+            )
+            values[name] = array
+
+        if "wind_speed_10m_mean" in values:
+            # FAO-56 Eq. 47: u2 = u10 × 0.748
+            values["wind_speed_2m_mean"] = (
+                values["wind_speed_10m_mean"] * 0.748
+            )
+
+        return cls(
+            source=source,
+            dates=dates,
+            variables=values,
+            metadata={"location": location},
+        )
+
+    @classmethod
+    def from_records(
+        cls,
+        source: str,
+        records: Sequence[Any],
+        fields: Mapping[str, str],
+        date_attr: str = "date",
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> "ClimateColumns":
+        """
+        Monta colunas a partir de objetos por dia (pydantic ou similar).
+
+        Lê cada atributo uma vez por coluna, sem criar dicts por registro.
+        Útil para clientes que ainda devolvem objetos (NWS) ou dicts por
+        dia (MET Norway).
+
+        Args:
+            source: Nome da fonte
+            records: Objetos ou dicts com data e valores numéricos
+            fields: {atributo/chave do registro: nome da variável}
+            date_attr: Nome do atributo de data
+            metadata: Metadados da fonte
+
+        Returns:
+            ClimateColumns com uma coluna por item de ``fields``
+        """
+
+        def value(record: Any, attr: str) -> Any:
+            if isinstance(record, Mapping):
+                return record.get(attr)
+            return getattr(record, attr, None)
+
+        # str()[:10] aceita date, datetime (com ou sem tz) e ISO
+        dates = np.array(
+            [str(value(r, date_attr))[:10] for r in records],
+            dtype="datetime64[D]",
+        )
+        variables = {
+            name: np.array([value(r, attr) for r in records], dtype=np.float64)
+            for attr, name in fields.items()
+        }
+        return cls(
+            source=source,
+            dates=dates,
+            variables=variables,
+            metadata=metadata or {},
+        )
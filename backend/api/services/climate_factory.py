@@ -23,6 +23,9 @@ if TYPE_CHECKING:
     from backend.infrastructure.cache.climate_cache import (
         ClimateCacheService,
     )
+    from backend.infrastructure.cache.http_cache import HTTPResponseCache
+    from backend.infrastructure.cache.nws_grid_cache import NWSGridCache
+    from backend.infrastructure.circuit_breaker import CircuitBreaker
 
 
 @lru_cache(maxsize=1)
@@ -42,6 +45,75 @@ def get_climate_cache_service() -> ClimateCacheService:
     return service
 
 
+@lru_cache(maxsize=1)
+def get_eto_result_cache() -> ClimateCacheService:
+    """
+    Singleton lazy do cache de resultados ETo (dashboard_forecast).
+
+    Mesmo ClimateCacheService, com prefixo próprio: a chave usa a fonte
+    selecionada, e a janela de graça stale-while-revalidate é a da fonte.
+    """
+    from backend.infrastructure.cache.climate_cache import (
+        ClimateCacheService,
+    )
+
+    service = ClimateCacheService(prefix="eto")
+    logger.info("ClimateCacheService (resultados ETo) singleton criado")
+    return service
+
+
+@lru_cache(maxsize=1)
+def get_nws_grid_cache() -> NWSGridCache:
+    """
+    Singleton lazy do cache de metadados NWS (Redis + PostgreSQL).
+
+    Compartilhado por NWSForecastClient (ponto → grid) e
+    NWSStationsClient (estações próximas).
+    """
+    from backend.infrastructure.cache.nws_grid_cache import NWSGridCache
+
+    cache = NWSGridCache(prefix="nws")
+    logger.info("NWSGridCache singleton criado (Redis + PostgreSQL)")
+    return cache
+
+
+@lru_cache(maxsize=1)
+def get_http_response_cache() -> HTTPResponseCache:
+    """
+    Singleton lazy do cache HTTP com validadores (ETag/Last-Modified).
+
+    Usado como transport httpx por MET Norway e NWS Forecast.
+    """
+    from backend.infrastructure.cache.http_cache import HTTPResponseCache
+
+    cache = HTTPResponseCache(prefix="http")
+    logger.info("HTTPResponseCache singleton criado (Redis)")
+    return cache
+
+
+# Circuit breakers por fonte (dict em vez de lru_cache: close_all
+# precisa percorrer os já criados)
+_circuit_breakers: dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(source: str) -> CircuitBreaker:
+    """
+    Singleton lazy do circuit breaker de uma fonte.
+
+    O estado fica no Redis (compartilhado entre workers); o singleton
+    só evita recriar conexões e o cache local de limites/p95.
+
+    Args:
+        source: ID da fonte (ex.: "nasa_power", "met_norway")
+    """
+    breaker = _circuit_breakers.get(source)
+    if breaker is None:
+        from backend.infrastructure.circuit_breaker import CircuitBreaker
+
+        breaker = _circuit_breakers.setdefault(source, CircuitBreaker(source))
+    return breaker
+
+
 class ClimateClientFactory:
     """
     Factory oficial para todos os clientes climáticos do EVAonline.
@@ -61,36 +133,48 @@ class ClimateClientFactory:
         """
         from .nasa_power.nasa_power_client import NASAPowerClient
 
-        client = NASAPowerClient(cache=get_climate_cache_service())
+        client = NASAPowerClient(
+            cache=get_climate_cache_service(),
+            breaker=get_circuit_breaker("nasa_power"),
+        )
         logger.debug("NASAPowerClient criado com cache Redis")
         return client
 
     @staticmethod
     def create_met_norway():
         """
-        Cria cliente MET Norway com cache Redis.
+        Cria cliente MET Norway com cache Redis e cache HTTP condicional.
 
         Returns:
             Cliente para região nórdica (1km) e forecast global (9km)
         """
         from .met_norway.met_norway_client import METNorwayClient
 
-        client = METNorwayClient(cache=get_climate_cache_service())
+        client = METNorwayClient(
+            cache=get_climate_cache_service(),
+            http_cache=get_http_response_cache(),
+            breaker=get_circuit_breaker("met_norway"),
+        )
         logger.debug("METNorwayClient criado com cache Redis")
         return client
 
     @staticmethod
     def create_nws():
         """
-        Cria cliente NWS Forecast com cache interno.
+        Cria cliente NWS Forecast com cache de grid (Redis + PostgreSQL)
+        e cache HTTP condicional.
 
         Returns:
             Cliente para previsão oficial NOAA (EUA continental apenas)
         """
         from .nws_forecast.nws_forecast_client import NWSForecastClient
 
-        client = NWSForecastClient()  # Cache interno próprio
-        logger.debug("NWSForecastClient criado (cache interno)")
+        client = NWSForecastClient(
+            grid_cache=get_nws_grid_cache(),
+            http_cache=get_http_response_cache(),
+            breaker=get_circuit_breaker("nws_forecast"),
+        )
+        logger.debug("NWSForecastClient criado com cache de grid")
         return client
 
     @staticmethod
@@ -103,7 +187,11 @@ class ClimateClientFactory:
         """
         from .nws_stations.nws_stations_client import NWSStationsClient
 
-        client = NWSStationsClient(cache=get_climate_cache_service())
+        client = NWSStationsClient(
+            cache=get_climate_cache_service(),
+            grid_cache=get_nws_grid_cache(),
+            breaker=get_circuit_breaker("nws_stations"),
+        )
         logger.debug("NWSStationsClient criado com cache Redis")
         return client
 
@@ -124,7 +212,10 @@ class ClimateClientFactory:
             OpenMeteoForecastClient,
         )
 
-        client = OpenMeteoForecastClient(cache_dir=cache_dir)
+        client = OpenMeteoForecastClient(
+            cache_dir=cache_dir,
+            breaker=get_circuit_breaker("openmeteo_forecast"),
+        )
         logger.debug(
             "OpenMeteoForecastClient criado (cache local: {})", cache_dir
         )
@@ -148,7 +239,9 @@ class ClimateClientFactory:
         )
 
         client = OpenMeteoArchiveClient(
-            cache=get_climate_cache_service(), cache_dir=cache_dir
+            cache=get_climate_cache_service(),
+            cache_dir=cache_dir,
+            breaker=get_circuit_breaker("openmeteo_archive"),
         )
         logger.debug(
             "OpenMeteoArchiveClient criado com cache Redis + local: {}",
@@ -188,6 +281,36 @@ class ClimateClientFactory:
         # Limpa o singleton (importante para testes e reinícios)
         get_climate_cache_service.cache_clear()
 
+        if get_eto_result_cache.cache_info().currsize:
+            try:
+                await get_eto_result_cache().close()
+            except Exception as e:
+                logger.error(f"Erro ao fechar cache de resultados ETo: {e}")
+            get_eto_result_cache.cache_clear()
+
+        # Cache de metadados NWS (só fecha se já foi criado)
+        if get_nws_grid_cache.cache_info().currsize:
+            try:
+                await get_nws_grid_cache().close()
+            except Exception as e:
+                logger.error(f"Erro ao fechar NWSGridCache: {e}")
+            get_nws_grid_cache.cache_clear()
+
+        if get_http_response_cache.cache_info().currsize:
+            try:
+                await get_http_response_cache().close()
+            except Exception as e:
+                logger.error(f"Erro ao fechar HTTPResponseCache: {e}")
+            get_http_response_cache.cache_clear()
+
+        # Circuit breakers (só os já criados)
+        for source, breaker in list(_circuit_breakers.items()):
+            try:
+                await breaker.close()
+            except Exception as e:
+                logger.error(f"Erro ao fechar circuit breaker {source}: {e}")
+        _circuit_breakers.clear()
+
         # Nota: httpx.AsyncClient é criado por request
         # cada cliente já tem seu próprio .aclose() se necessário
         logger.info("ClimateClientFactory: cleanup completo")
@@ -656,6 +656,10 @@ class ClimateSourceManager:
         else:
             selected_sources = available_sources
 
+        selected_sources, circuit_open = self._route_around_open_circuits(
+            selected_sources, available_sources, warnings
+        )
+
         if not selected_sources:
             raise ValueError(
                 f"Nenhuma fonte disponível para {mode.value} em "
@@ -685,7 +689,70 @@ class ClimateSourceManager:
                 "period_days": period_days,
             },
             "warnings": warnings,
+            "circuit_open": circuit_open,
+        }
+
+    @staticmethod
+    def _route_around_open_circuits(
+        selected_sources: list[str],
+        available_sources: list[str],
+        warnings: list[str],
+    ) -> tuple[list[str], list[str]]:
+        """
+        Troca fontes com circuit breaker aberto por alternativas.
+
+        Uma fonte com circuito aberto falharia na hora (CircuitOpenError),
+        então cada uma é substituída pela próxima fonte disponível (mesmo
+        modo e região, em ordem de prioridade) que ainda não foi
+        selecionada. Sem alternativa, a fonte é removida; se nenhuma
+        sobrar, a seleção original é mantida.
+
+        Returns:
+            (fontes selecionadas, fontes puladas por circuito aberto)
+        """
+        from backend.api.services.climate_factory import get_circuit_breaker
+
+        open_sources = {
+            source
+            for source in available_sources
+            if get_circuit_breaker(source).is_open()
         }
+        skipped = [s for s in selected_sources if s in open_sources]
+        if not skipped:
+            return selected_sources, []
+
+        alternatives = [
+            source
+            for source in available_sources
+            if source not in open_sources and source not in selected_sources
+        ]
+        routed: list[str] = []
+        for source in selected_sources:
+            if source not in open_sources:
+                routed.append(source)
+            elif alternatives:
+                alternative = alternatives.pop(0)
+                routed.append(alternative)
+                warnings.append(
+                    f"Circuit breaker aberto para {source}; "
+                    f"usando {alternative}"
+                )
+            else:
+                warnings.append(
+                    f"Circuit breaker aberto para {source}; fonte ignorada"
+                )
+
+        if not routed:
+            warnings.append(
+                f"Circuit breaker aberto para todas as fontes {skipped}; "
+                f"tentando mesmo assim"
+            )
+            return selected_sources, []
+
+        logger.bind(skipped=skipped, sources=routed).warning(
+            "Fontes com circuit breaker aberto substituídas"
+        )
+        return routed, skipped
 
     def get_available_sources_for_location(
         self, lat: float, lon: float
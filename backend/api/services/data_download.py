@@ -13,7 +13,10 @@ try:
     from backend.api.services.climate_source_manager import (
         ClimateSourceManager,
     )
-    from backend.api.services.climate_factory import ClimateClientFactory
+    from backend.api.services.climate_factory import (
+        ClimateClientFactory,
+    )
+    from backend.api.services.climate_columns import ClimateColumns
 except ImportError:
     from ...api.services.climate_validation import (
         ClimateValidationService,
@@ -21,7 +24,23 @@ except ImportError:
     from ...api.services.climate_source_manager import (
         ClimateSourceManager,
     )
-    from ...api.services.climate_factory import ClimateClientFactory
+    from ...api.services.climate_factory import (
+        ClimateClientFactory,
+    )
+    from ...api.services.climate_columns import ClimateColumns
+
+# Harmonizar variáveis OpenMeteo → NASA format para ETo
+# ETo: T2M_MAX, T2M_MIN, T2M (mean), RH2M, WS2M,
+#      ALLSKY_SFC_SW_DWN, PRECTOTCORR
+OPENMETEO_TO_NASA = {
+    "temperature_2m_max": "T2M_MAX",
+    "temperature_2m_min": "T2M_MIN",
+    "temperature_2m_mean": "T2M",  # NASA usa T2M para média
+    "relative_humidity_2m_mean": "RH2M",
+    "wind_speed_2m_mean": "WS2M",
+    "shortwave_radiation_sum": "ALLSKY_SFC_SW_DWN",
+    "precipitation_sum": "PRECTOTCORR",
+}
 
 
 async def download_weather_data(
@@ -77,6 +96,7 @@ async def download_weather_data(
         start_date=data_inicial,
         end_date=data_final,
         allow_future=True,  # Permite forecast
+        max_future_days=5,  # Horizonte do dashboard_forecast
     )
     if not date_valid:
         msg = f"Datas inválidas: {date_details.get('errors')}"
@@ -175,7 +195,12 @@ async def download_weather_data(
             warnings_list.extend(source_result["warnings"])
 
             # Validar que todas as fontes solicitadas estão disponíveis
-            unavailable = set(requested_sources) - set(sources)
+            # (fontes com circuito aberto já foram substituídas)
+            unavailable = (
+                set(requested_sources)
+                - set(sources)
+                - set(source_result.get("circuit_open", []))
+            )
             if unavailable:
                 msg = (
                     f"Fontes indisponíveis para ({latitude}, {longitude}): "
@@ -217,7 +242,7 @@ async def download_weather_data(
                 # Usar factory para garantir cache Redis injetado
                 client = ClimateClientFactory.create_nasa_power()
                 try:
-                    nasa_data = await client.get_daily_data(
+                    nasa_data = await client.get_daily_columns(
                         lat=latitude,
                         lon=longitude,
                         start_date=data_inicial_formatted,
@@ -226,26 +251,8 @@ async def download_weather_data(
                 finally:
                     await client.close()
 
-                # Converte para DataFrame pandas - variáveis NASA POWER
-                data_records = []
-                for record in nasa_data:
-                    data_records.append(
-                        {
-                            "date": record.date,
-                            # Variáveis NASA POWER nativas
-                            "T2M_MAX": record.temp_max,
-                            "T2M_MIN": record.temp_min,
-                            "T2M": record.temp_mean,
-                            "RH2M": record.humidity,
-                            "WS2M": record.wind_speed,
-                            "ALLSKY_SFC_SW_DWN": record.solar_radiation,
-                            "PRECTOTCORR": record.precipitation,
-                        }
-                    )
-
-                weather_df = pd.DataFrame(data_records)
-                weather_df["date"] = pd.to_datetime(weather_df["date"])
-                weather_df.set_index("date", inplace=True)
+                # Colunas NASA POWER nativas (T2M_MAX, ..., PRECTOTCORR)
+                weather_df = nasa_data.to_dataframe()
 
                 logger.info(
                     f"✅ NASA POWER: {len(nasa_data)} registros diários "
@@ -254,17 +261,16 @@ async def download_weather_data(
 
             elif source == "openmeteo_archive":
                 # Open-Meteo Archive (histórico desde 1950)
-                from backend.api.services.openmeteo_archive.openmeteo_archive_sync_adapter import (
-                    OpenMeteoArchiveSyncAdapter,
-                )
-
-                client = OpenMeteoArchiveSyncAdapter()
-                openmeteo_data = client.get_daily_data_sync(
-                    lat=latitude,
-                    lon=longitude,
-                    start_date=data_inicial_formatted,
-                    end_date=data_final_adjusted,
-                )
+                client = ClimateClientFactory.create_openmeteo_archive()
+                try:
+                    openmeteo_data = await client.get_climate_columns(
+                        lat=latitude,
+                        lng=longitude,
+                        start_date=data_inicial_formatted.strftime("%Y-%m-%d"),
+                        end_date=data_final_adjusted.strftime("%Y-%m-%d"),
+                    )
+                finally:
+                    await client.close()
 
                 if not openmeteo_data:
                     msg = (
@@ -275,27 +281,10 @@ async def download_weather_data(
                     warnings_list.append(msg)
                     continue
 
-                # Converte para DataFrame - TODAS as variáveis Open-Meteo
-                weather_df = pd.DataFrame(openmeteo_data)
-                weather_df["date"] = pd.to_datetime(weather_df["date"])
-                weather_df.set_index("date", inplace=True)
-
-                # Harmonizar variáveis OpenMeteo → NASA format para ETo
-                # ETo: T2M_MAX, T2M_MIN, T2M (mean), RH2M, WS2M,
-                #      ALLSKY_SFC_SW_DWN, PRECTOTCORR
-                harmonization = {
-                    "temperature_2m_max": "T2M_MAX",
-                    "temperature_2m_min": "T2M_MIN",
-                    "temperature_2m_mean": "T2M",  # NASA usa T2M para média
-                    "relative_humidity_2m_mean": "RH2M",
-                    "wind_speed_2m_mean": "WS2M",
-                    "shortwave_radiation_sum": "ALLSKY_SFC_SW_DWN",
-                    "precipitation_sum": "PRECTOTCORR",
-                }
-
-                for openmeteo_var, nasa_var in harmonization.items():
-                    if openmeteo_var in weather_df.columns:
-                        weather_df[nasa_var] = weather_df[openmeteo_var]
+                # TODAS as variáveis Open-Meteo + cópias no formato NASA
+                weather_df = openmeteo_data.to_dataframe(
+                    aliases=OPENMETEO_TO_NASA
+                )
 
                 logger.info(
                     f"✅ Open-Meteo Archive: {len(openmeteo_data)} "
@@ -306,11 +295,11 @@ async def download_weather_data(
                 # Open-Meteo Forecast (previsão + recent: -30d a +5d)
                 client = ClimateClientFactory.create_openmeteo_forecast()
                 try:
-                    forecast_data = await client.get_daily_data(
+                    forecast_data = await client.get_climate_columns(
                         lat=latitude,
-                        lon=longitude,
-                        start_date=data_inicial_formatted,
-                        end_date=data_final_formatted,
+                        lng=longitude,
+                        start_date=data_inicial_formatted.strftime("%Y-%m-%d"),
+                        end_date=data_final_formatted.strftime("%Y-%m-%d"),
                     )
                 finally:
                     await client.close()
@@ -324,31 +313,10 @@ async def download_weather_data(
                     warnings_list.append(msg)
                     continue
 
-                # Converte para DataFrame - TODAS as variáveis Open-Meteo
-                weather_df = pd.DataFrame(forecast_data)
-                weather_df["date"] = pd.to_datetime(weather_df["date"])
-                weather_df.set_index("date", inplace=True)
-
-                # Harmonizar variáveis OpenMeteo → NASA format para ETo
-                # ETo: T2M_MAX, T2M_MIN, T2M (mean), RH2M, WS2M,
-                # ALLSKY_SFC_SW_DWN, PRECTOTCORR
-                harmonization = {
-                    "temperature_2m_max": "T2M_MAX",
-                    "temperature_2m_min": "T2M_MIN",
-                    "temperature_2m_mean": "T2M",  # NASA usa T2M para média
-                    "relative_humidity_2m_mean": "RH2M",
-                    "wind_speed_2m_mean": "WS2M",
-                    "shortwave_radiation_sum": "ALLSKY_SFC_SW_DWN",
-                    "precipitation_sum": "PRECTOTCORR",
-                }
-
-                # Renomear colunas existentes
-                for openmeteo_var, nasa_var in harmonization.items():
-                    if openmeteo_var in weather_df.columns:
-                        weather_df[nasa_var] = weather_df[openmeteo_var]
-                        logger.debug(
-                            f"Harmonized: {openmeteo_var} → {nasa_var}"
-                        )
+                # TODAS as variáveis Open-Meteo + cópias no formato NASA
+                weather_df = forecast_data.to_dataframe(
+                    aliases=OPENMETEO_TO_NASA
+                )
 
                 logger.info(
                     f"✅ Open-Meteo Forecast: {len(forecast_data)} "
@@ -402,30 +370,21 @@ async def download_weather_data(
                 logger.info(f"MET Norway - {region_info}")
 
                 # Converte para DataFrame - FILTRA variáveis por região
-                data_records = []
-                for record in met_data:
-                    record_dict = {
-                        "date": record.date,
-                        # Temperaturas (sempre incluídas)
-                        "temperature_2m_max": record.temp_max,
-                        "temperature_2m_min": record.temp_min,
-                        "temperature_2m_mean": record.temp_mean,
-                        # Umidade (sempre incluída)
-                        "relative_humidity_2m_mean": (record.humidity_mean),
-                    }
-
-                    # Precipitação: apenas para região Nordic
-                    if include_precipitation:
-                        record_dict["precipitation_sum"] = (
-                            record.precipitation_sum
-                        )
-                    # Else: omitir precipitação (será None ou ignorada)
-
-                    data_records.append(record_dict)
-
-                weather_df = pd.DataFrame(data_records)
-                weather_df["date"] = pd.to_datetime(weather_df["date"])
-                weather_df.set_index("date", inplace=True)
+                met_fields = {
+                    # Temperaturas (sempre incluídas)
+                    "temp_max": "temperature_2m_max",
+                    "temp_min": "temperature_2m_min",
+                    "temp_mean": "temperature_2m_mean",
+                    # Umidade (sempre incluída)
+                    "humidity_mean": "relative_humidity_2m_mean",
+                }
+                # Precipitação: apenas para região Nordic
+                if include_precipitation:
+                    met_fields["precipitation_sum"] = "precipitation_sum"
+
+                weather_df = ClimateColumns.from_records(
+                    "met_norway", met_data, met_fields
+                ).to_dataframe()
 
                 # Adicionar atribuição CC-BY 4.0 aos warnings
                 warnings_list.append(
@@ -434,7 +393,7 @@ async def download_weather_data(
 
                 # Log de variáveis incluídas
                 logger.info(
-                    "MET Norway: %d registros (%s, %s), " "variáveis: %s",
+                    "MET Norway: {} registros ({}, {}), variáveis: {}",
                     len(met_data),
                     latitude,
                     longitude,
@@ -442,14 +401,12 @@ async def download_weather_data(
                 )
 
             elif source == "nws_forecast":
-                # NWS Forecast (USA, previsões)
+                # NWS Forecast (USA, previsões agregadas de horárias)
                 client = ClimateClientFactory.create_nws()
                 try:
-                    nws_forecast_data = await client.get_daily_forecast(
+                    nws_forecast_data = await client.get_daily_forecast_data(
                         lat=latitude,
                         lon=longitude,
-                        start_date=data_inicial_formatted,
-                        end_date=data_final_adjusted,
                     )
                 finally:
                     await client.close()
@@ -464,34 +421,33 @@ async def download_weather_data(
                     continue
 
                 # Converte para DataFrame - variáveis NWS Forecast
-                data_records = []
-                for record in nws_forecast_data:
-                    data_records.append(
-                        {
-                            "date": record.date,
-                            # Temperaturas
-                            "temperature_2m_max": record.temp_max,
-                            "temperature_2m_min": record.temp_min,
-                            "temperature_2m_mean": record.temp_mean,
-                            # Umidade
-                            "relative_humidity_2m_mean": (
-                                record.humidity_mean
-                            ),
-                            # Vento
-                            "wind_speed_10m_max": record.wind_speed_max,
-                            "wind_speed_10m_mean": record.wind_speed_mean,
-                            # Precipitação
-                            "precipitation_sum": record.precipitation_sum,
-                        }
-                    )
-
-                weather_df = pd.DataFrame(data_records)
-                weather_df["date"] = pd.to_datetime(weather_df["date"])
-                weather_df.set_index("date", inplace=True)
+                weather_df = ClimateColumns.from_records(
+                    "nws_forecast",
+                    nws_forecast_data,
+                    {
+                        # Temperaturas
+                        "temp_max_celsius": "temperature_2m_max",
+                        "temp_min_celsius": "temperature_2m_min",
+                        "temp_mean_celsius": "temperature_2m_mean",
+                        # Umidade
+                        "humidity_mean_percent": "relative_humidity_2m_mean",
+                        # Vento (já convertido para 2m, FAO-56)
+                        "wind_speed_mean_ms": "wind_speed_2m_mean",
+                        # Precipitação
+                        "precip_total_mm": "precipitation_sum",
+                    },
+                ).to_dataframe()
+
+                # A API devolve a previsão inteira (~7 dias); manter só
+                # o período pedido
+                weather_df = weather_df[
+                    (weather_df.index >= data_inicial_formatted)
+                    & (weather_df.index <= data_final_formatted)
+                ]
 
                 logger.info(
-                    "NWS Forecast: %d registros (%s, %s)",
-                    len(nws_forecast_data),
+                    "NWS Forecast: {} registros ({}, {})",
+                    len(weather_df),
                     latitude,
                     longitude,
                 )
@@ -519,28 +475,19 @@ async def download_weather_data(
                     continue
 
                 # Converte para DataFrame - variáveis disponíveis do NWS
-                data_records = []
-                for record in nws_data:
-                    data_records.append(
-                        {
-                            "date": record.date,
-                            # Temperaturas
-                            "temp_celsius": record.temp_mean,
-                            # Umidade
-                            "humidity_percent": record.humidity,
-                            # Vento
-                            "wind_speed_ms": record.wind_speed,
-                            # Precipitação
-                            "precipitation_mm": record.precipitation,
-                        }
-                    )
-
-                weather_df = pd.DataFrame(data_records)
-                weather_df["date"] = pd.to_datetime(weather_df["date"])
-                weather_df.set_index("date", inplace=True)
+                weather_df = ClimateColumns.from_records(
+                    "nws_stations",
+                    nws_data,
+                    {
+                        "temp_mean": "temp_celsius",
+                        "humidity": "humidity_percent",
+                        "wind_speed": "wind_speed_ms",
+                        "precipitation": "precipitation_mm",
+                    },
+                ).to_dataframe()
 
                 logger.info(
-                    "NWS Stations: %d registros (%s, %s)",
+                    "NWS Stations: {} registros ({}, {})",
                     len(nws_data),
                     latitude,
                     longitude,
@@ -627,7 +574,8 @@ async def download_weather_data(
                 warnings_list.append(msg)
 
         weather_data_sources.append(weather_df)
-        logger.debug("%s: DataFrame obtido\n%s", source, weather_df)
+        # Formatação adiada: o repr do DataFrame só sai com DEBUG ativo
+        logger.debug("{}: DataFrame obtido\n{}", source, weather_df)
 
     # Consolidar dados (fusão Kalman será feita em eto_services.py)
     if not weather_data_sources:
@@ -657,5 +605,5 @@ async def download_weather_data(
     # Validação física será feita em data_preprocessing.py
 
     logger.info("Dados finais obtidos com sucesso")
-    logger.debug("DataFrame final:\n%s", weather_data)
+    logger.debug("DataFrame final:\n{}", weather_data)
     return weather_data, warnings_list
@@ -38,6 +38,7 @@ from loguru import logger
 from typing import Literal
 from functools import wraps
 import inspect
+import math
 
 
 class GeographicUtils:
@@ -228,6 +229,31 @@ class GeographicUtils:
         west, south, east, north = bbox
         return (west <= lon <= east) and (south <= lat <= north)
 
+    @staticmethod
+    def distance_km(
+        lat1: float, lon1: float, lat2: float, lon2: float
+    ) -> float:
+        """
+        Distância de grande círculo entre dois pontos (haversine).
+
+        Args:
+            lat1: Latitude do ponto 1
+            lon1: Longitude do ponto 1
+            lat2: Latitude do ponto 2
+            lon2: Longitude do ponto 2
+
+        Returns:
+            float: Distância em km (raio médio da Terra = 6371 km)
+        """
+        phi1, phi2 = math.radians(lat1), math.radians(lat2)
+        d_phi = phi2 - phi1
+        d_lambda = math.radians(lon2 - lon1)
+        a = (
+            math.sin(d_phi / 2) ** 2
+            + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+        )
+        return 2 * 6371.0 * math.asin(math.sqrt(a))
+
     @staticmethod
     def get_region(
         lat: float, lon: float
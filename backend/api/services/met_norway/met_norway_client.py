@@ -45,8 +45,8 @@ from backend.api.services.geographic_utils import (
 from backend.api.services.weather_utils import (
     METNorwayAggregationUtils,  # Movido de aqui para weather_utils
     WeatherConversionUtils,
-    CacheUtils,  # Utilitários de cache
 )
+from backend.infrastructure.http_replay import http_transport
 
 
 # Pydantic model (definido no topo para evitar forward references)
@@ -140,24 +140,6 @@ class METNorwayConfig(BaseModel):
     )
 
 
-class METNorwayCacheMetadata(BaseModel):
-    """Metadata for cached MET Norway responses."""
-
-    last_modified: str | None = Field(
-        None, description="Last-Modified header from API (RFC 1123 format)"
-    )
-    expires: datetime | None = Field(
-        None, description="Expiration timestamp (parsed from Expires header)"
-    )
-    data: list[METNorwayDailyData] = Field(
-        ..., description="Cached forecast data"
-    )
-
-    # Método para serialização JSON (para Redis)
-    def to_json(self) -> str:
-        return self.model_dump_json()  # Pydantic v2
-
-
 class METNorwayClient:
     """
     MET Norway client with
@@ -208,6 +190,8 @@ class METNorwayClient:
         self,
         config: METNorwayConfig | None = None,
         cache: Any | None = None,
+        http_cache: Any | None = None,
+        breaker: Any | None = None,
     ):
         """
         Initialize MET Norway client (GLOBAL).
@@ -215,6 +199,10 @@ class METNorwayClient:
         Args:
             config: Custom configuration (optional)
             cache: ClimateCacheService (optional)
+            http_cache: HTTPResponseCache (optional, DI) - Expires and
+                If-Modified-Since handling for /complete
+            breaker: CircuitBreaker (optional, DI) - shared failure
+                tracking; cache HITs do not reach it
         """
         self.config = config or METNorwayConfig()
 
@@ -229,8 +217,17 @@ class METNorwayClient:
             max_keepalive_connections=self.config.max_keepalive_connections,
             max_connections=self.config.max_connections,
         )
+        # limits vão para o transport (ignorados pelo AsyncClient)
+        if breaker is not None:
+            transport = breaker.transport(limits=limits)
+        else:
+            transport = http_transport("met_norway", limits=limits)
+        if http_cache is not None:
+            transport = http_cache.transport(transport)
         self.client = httpx.AsyncClient(
-            timeout=self.config.timeout, headers=headers, limits=limits
+            timeout=self.config.timeout,
+            headers=headers,
+            transport=transport,
         )
         self.cache = cache
 
@@ -405,50 +402,7 @@ class METNorwayClient:
             f"variables={len(variables)}"
         )
 
-        # Build cache key
-        vars_str = "_".join(sorted(variables)) if variables else "default"
-        cache_key = (
-            f"met_lf_{lat}_{lon}_{altitude or 'default'}_"
-            f"{start_date.date()}_{end_date.date()}_{vars_str}"
-        )
-        cache_metadata_key = f"{cache_key}_metadata"
-
-        # 1. Check cache and expiration
-        last_modified = None
-        if self.cache:
-            # Assuma cache.get retorna JSON; parse para model
-            cached_json = await self.cache.get(cache_metadata_key)
-            if cached_json:
-                try:
-                    cached_metadata = (
-                        METNorwayCacheMetadata.model_validate_json(cached_json)
-                    )
-                    # Check if data has expired
-                    if (
-                        cached_metadata.expires
-                        and datetime.now(cached_metadata.expires.tzinfo)
-                        < cached_metadata.expires
-                    ):
-                        logger.info(
-                            "🎯 Cache HIT (not expired): " "MET Norway"
-                        )
-                        return cached_metadata.data
-
-                    # Data expired - try conditional request with
-                    # If-Modified-Since
-                    logger.info(
-                        "Cache expired, checking with If-Modified-Since..."
-                    )
-                    last_modified = cached_metadata.last_modified
-                except Exception as e:
-                    logger.warning(f"Cache parse error: {e}")
-                    last_modified = None
-            else:
-                last_modified = None
-        else:
-            last_modified = None
-
-        # 2. Fetch from API (with conditional request if possible)
+        # Expires/If-Modified-Since ficam no transport (HTTPResponseCache)
         logger.info("Querying MET Norway API...")
 
         # Endpoint completo: base_url + /complete
@@ -479,54 +433,11 @@ class METNorwayClient:
                     f"lat={lat}, lon={lon}, alt={altitude}"
                 )
 
-                # Add If-Modified-Since header if we have cached data
-                headers = {}
-                if last_modified:
-                    headers["If-Modified-Since"] = last_modified
-                    logger.debug(f"Using If-Modified-Since: {last_modified}")
-
-                response = await self.client.get(
-                    endpoint, params=params, headers=headers
-                )
-
-                # Handle 304 Not Modified
-                if response.status_code == 304:
-                    logger.info("✅ 304 Not Modified: Using cached data")
-                    if self.cache:
-                        cached_json = await self.cache.get(cache_metadata_key)
-                        if cached_json:
-                            try:
-                                cached_metadata = (
-                                    METNorwayCacheMetadata.model_validate_json(
-                                        cached_json
-                                    )
-                                )
-                                # Update expiration time
-                                expires_header = response.headers.get(
-                                    "Expires"
-                                )
-                                if expires_header:
-                                    # Usar CacheUtils
-                                    new_expires = (
-                                        CacheUtils.parse_rfc1123_date(
-                                            expires_header
-                                        )
-                                    )
-                                    cached_metadata.expires = new_expires
-                                    # Re-cache with updated expiration
-                                    ttl = CacheUtils.calculate_cache_ttl(
-                                        new_expires
-                                    )
-                                    await self.cache.set(
-                                        cache_metadata_key,
-                                        cached_metadata.to_json(),  # Serialize
-                                        ttl=ttl,
-                                    )
-                                return cached_metadata.data
-                            except Exception as e:
-                                logger.warning(f"Cache update error: {e}")
-                    # Fallback if cache unavailable
-                    return []
+                response = await self.client.get(endpoint, params=params)
+                if response.headers.get("X-Cache") in ("HIT", "REVALIDATED"):
+                    logger.info(
+                        f"🎯 Cache {response.headers['X-Cache']}: MET Norway"
+                    )
 
                 # Handle 203 Non-Authoritative (deprecated/beta)
                 if response.status_code == 203:
@@ -552,19 +463,6 @@ class METNorwayClient:
 
                 response.raise_for_status()
 
-                # Extract headers
-                last_modified_header = response.headers.get("Last-Modified")
-                expires_header = response.headers.get("Expires")
-
-                logger.debug(
-                    f"Response headers - "
-                    f"Last-Modified: {last_modified_header}, "
-                    f"Expires: {expires_header}"
-                )
-
-                # Parse expires timestamp usando CacheUtils
-                expires_dt = CacheUtils.parse_rfc1123_date(expires_header)
-
                 # Process response
                 data = response.json()
                 parsed_data = self._parse_daily_response(
@@ -575,27 +473,6 @@ class METNorwayClient:
                     f"MET Norway: " f"{len(parsed_data)} days retrieved"
                 )
 
-                # 3. Save to cache with metadata
-                if self.cache and parsed_data:
-                    # Create metadata object
-                    metadata = METNorwayCacheMetadata(
-                        last_modified=last_modified_header,
-                        expires=expires_dt,
-                        data=parsed_data,
-                    )
-
-                    # Calculate TTL from Expires header usando CacheUtils
-                    ttl = CacheUtils.calculate_cache_ttl(expires_dt)
-
-                    # Save to cache
-                    await self.cache.set(
-                        cache_metadata_key, metadata.to_json(), ttl=ttl
-                    )  # Serialize
-                    logger.debug(
-                        f"Cache SAVE: MET Norway"
-                        f"(TTL: {ttl}s, expires: {expires_dt})"
-                    )
-
                 return parsed_data
 
             except httpx.HTTPStatusError as e:
@@ -667,17 +544,12 @@ class METNorwayClient:
             # Usar METNorwayAggregationUtils de weather_utils
             aggregator = METNorwayAggregationUtils()
 
-            # 1. Agregar dados horários em diários
-            daily_raw_data = aggregator.aggregate_hourly_to_daily(
-                timeseries, start_date, end_date
-            )
-
-            # 2. Calcular agregações finais
-            daily_data = aggregator.calculate_daily_aggregations(
-                daily_raw_data, WeatherConversionUtils()
+            # 1. Agregar horários em diários (colunas NumPy + daily_reduce)
+            daily_data = aggregator.aggregate_timeseries(
+                timeseries, start_date, end_date, WeatherConversionUtils()
             )
 
-            # 3. Validar dados agregados
+            # 2. Validar dados agregados
             if not aggregator.validate_daily_data(daily_data):
                 logger.warning("Dados diários falharam na validação")
 
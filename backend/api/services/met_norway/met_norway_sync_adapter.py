@@ -20,13 +20,17 @@ Sem limite de cobertura
 Licença: CC-BY 4.0 - Exibir em todas as visualizações com dados MET Norway
 """
 
-import asyncio
 from datetime import datetime, timedelta
 from typing import Any
 
 from loguru import logger
 
 from backend.api.services.geographic_utils import GeographicUtils
+from backend.api.services.async_bridge import run_sync
+from backend.api.services.climate_factory import (
+    get_circuit_breaker,
+    get_http_response_cache,
+)
 
 from .met_norway_client import (
     METNorwayDailyData,
@@ -60,7 +64,10 @@ class METNorwaySyncAdapter:
         """Get or create client from pool."""
         if self._client is None:
             self._client = METNorwayClient(
-                config=self.config, cache=self.cache
+                config=self.config,
+                cache=self.cache,
+                http_cache=get_http_response_cache(),
+                breaker=get_circuit_breaker("met_norway"),
             )
         return self._client
 
@@ -95,7 +102,7 @@ class METNorwaySyncAdapter:
             ...     end_date=datetime(2024, 1, 7)
             ... )
         """
-        return asyncio.run(
+        return run_sync(
             self._async_get_daily_data(
                 lat=lat,
                 lon=lon,
@@ -147,8 +154,8 @@ class METNorwaySyncAdapter:
             adapter = METNorwaySyncAdapter()
             data = await adapter.get_daily_data(...)
 
-            # Em código síncrono (se necessário)
-            data = asyncio.run(adapter.get_daily_data(...))
+            # Em código síncrono
+            data = adapter.get_daily_data_sync(...)
         """
         client = await self._get_client()  # Reutiliza client do pool
 
@@ -229,7 +236,7 @@ class METNorwaySyncAdapter:
         Returns:
             bool: True se API está acessível
         """
-        return asyncio.run(self._async_health_check())
+        return run_sync(self._async_health_check())
 
     async def _async_health_check(self) -> bool:
         """
@@ -57,10 +57,24 @@ from datetime import datetime, timedelta
 from typing import Any
 
 import httpx
+import numpy as np
 from loguru import logger
 from pydantic import BaseModel, Field
 
+from backend.api.services.climate_columns import ClimateColumns
 from backend.api.services.geographic_utils import GeographicUtils
+from backend.infrastructure.http_replay import http_transport
+
+# Variável NASA POWER → campo de NASAPowerData
+NASA_POWER_VARIABLES = {
+    "T2M_MAX": "temp_max",  # Temp máxima 2m (°C)
+    "T2M_MIN": "temp_min",  # Temp mínima 2m (°C)
+    "T2M": "temp_mean",  # Temp média 2m (°C)
+    "RH2M": "humidity",  # Umidade relativa 2m (%)
+    "WS2M": "wind_speed",  # Velocidade vento 2m (m/s)
+    "ALLSKY_SFC_SW_DWN": "solar_radiation",  # Radiação solar (MJ/m²/day)
+    "PRECTOTCORR": "precipitation",  # Precipitação (mm/dia)
+}
 
 
 class NASAPowerConfig(BaseModel):
@@ -97,7 +111,10 @@ class NASAPowerClient:
     """
 
     def __init__(
-        self, config: NASAPowerConfig | None = None, cache: Any | None = None
+        self,
+        config: NASAPowerConfig | None = None,
+        cache: Any | None = None,
+        breaker: Any | None = None,
     ):
         """
         Inicializa cliente NASA POWER.
@@ -105,9 +122,18 @@ class NASAPowerClient:
         Args:
             config: Configuração customizada (opcional)
             cache: ClimateCacheService (opcional, injetado via DI)
+            breaker: CircuitBreaker (opcional, DI) compartilhado entre
+                workers
         """
         self.config = config or NASAPowerConfig()
-        self.client = httpx.AsyncClient(timeout=self.config.timeout)
+        self.client = httpx.AsyncClient(
+            timeout=self.config.timeout,
+            transport=(
+                breaker.transport()
+                if breaker
+                else http_transport("nasa_power")
+            ),
+        )
         self.cache = cache  # Cache service opcional
 
     async def close(self):
@@ -123,7 +149,36 @@ class NASAPowerClient:
         community: str = "AG",  # UPPERCASE: AG, RE, SB
     ) -> list[NASAPowerData]:
         """
-        Busca dados climáticos diários para um ponto com cache inteligente.
+        Busca dados climáticos diários como lista de NASAPowerData.
+
+        Mantido para consumidores que iteram por dia; para séries longas
+        prefira get_daily_columns (sem objetos por dia).
+
+        Args:
+            lat: Latitude (-90 to 90)
+            lon: Longitude (-180 to 180)
+            start_date: Data inicial (datetime) - DEVE estar validada
+            end_date: Data final (datetime) - DEVE estar validada
+            community: NASA POWER community (AG, RE ou SB)
+
+        Returns:
+            Lista de NASAPowerData com dados climáticos diários
+        """
+        columns = await self.get_daily_columns(
+            lat, lon, start_date, end_date, community
+        )
+        return self._columns_to_records(columns)
+
+    async def get_daily_columns(
+        self,
+        lat: float,
+        lon: float,
+        start_date: datetime,
+        end_date: datetime,
+        community: str = "AG",  # UPPERCASE: AG, RE, SB
+    ) -> ClimateColumns:
+        """
+        Busca dados climáticos diários em formato colunar, com cache.
 
         NOTA: Validações de range devem ser feitas em climate_validation.py
         antes de chamar este método. Este cliente assume dados já validados.
@@ -139,7 +194,9 @@ class NASAPowerClient:
                 - SB: Sustainable Buildings (edifícios sustentáveis)
 
         Returns:
-            Lista de NASAPowerData com dados climáticos diários
+            ClimateColumns com uma coluna por variável NASA POWER
+            (T2M_MAX, T2M_MIN, T2M, RH2M, WS2M, ALLSKY_SFC_SW_DWN,
+            PRECTOTCORR)
         """
         # Validações básicas - usar GeographicUtils (SINGLE SOURCE OF TRUTH)
         if not GeographicUtils.is_valid_coordinate(lat, lon):
@@ -163,7 +220,8 @@ class NASAPowerClient:
                 start=start_date,
                 end=end_date,
             )
-            if cached_data:
+            # Entradas antigas (lista de NASAPowerData) são rebuscadas
+            if isinstance(cached_data, ClimateColumns):
                 logger.info(f"🎯 Cache HIT: NASA POWER lat={lat}, lon={lon}")
                 return cached_data
 
@@ -176,17 +234,7 @@ class NASAPowerClient:
 
         # Parâmetros de requisição
         params = {
-            "parameters": ",".join(
-                [
-                    "T2M_MAX",  # Temp máxima 2m (°C)
-                    "T2M_MIN",  # Temp mínima 2m (°C)
-                    "T2M",  # Temp média 2m (°C)
-                    "RH2M",  # Umidade relativa 2m (%)
-                    "WS2M",  # Velocidade vento 2m (m/s)
-                    "ALLSKY_SFC_SW_DWN",  # Radiação solar (MJ/m²/day)
-                    "PRECTOTCORR",  # Precipitação (mm/dia)
-                ]
-            ),
+            "parameters": ",".join(NASA_POWER_VARIABLES),
             "community": community,
             "longitude": lon,
             "latitude": lat,
@@ -212,7 +260,7 @@ class NASAPowerClient:
                 parsed_data = self._parse_response(data)
 
                 # 3. Salva no cache (se disponível)
-                if self.cache and parsed_data:
+                if self.cache and len(parsed_data):
                     await self.cache.set(
                         source="nasa_power",
                         lat=lat,
@@ -236,15 +284,18 @@ class NASAPowerClient:
         msg = "NASA POWER: Todos os attempts falharam"
         raise httpx.HTTPError(msg)
 
-    def _parse_response(self, data: dict) -> list[NASAPowerData]:
+    def _parse_response(self, data: dict) -> ClimateColumns:
         """
-        Parseia resposta JSON da NASA POWER.
+        Parseia resposta JSON da NASA POWER em formato colunar.
+
+        Cada parâmetro vem como {YYYYMMDD: valor}; os valores vão direto
+        para um array por variável, sem objeto intermediário por dia.
 
         Args:
             data: Resposta JSON
 
         Returns:
-            List[NASAPowerData]: Dados parseados
+            ClimateColumns: Dados parseados (fill value -999 preservado)
         """
         if "properties" not in data or "parameter" not in data["properties"]:
             msg = "Resposta NASA POWER inválida (falta 'parameter')"
@@ -256,25 +307,51 @@ class NASAPowerClient:
         first_param = next(iter(parameters.values()))
         dates = sorted(first_param.keys())
 
-        results = []
-        for date_str in dates:
-            # Radiação já vem em MJ/m²/day com community=ag
-            solar_mj = parameters.get("ALLSKY_SFC_SW_DWN", {}).get(date_str)
-
-            record = NASAPowerData(
-                date=self._format_date(date_str),
-                temp_max=parameters.get("T2M_MAX", {}).get(date_str),
-                temp_min=parameters.get("T2M_MIN", {}).get(date_str),
-                temp_mean=parameters.get("T2M", {}).get(date_str),
-                humidity=parameters.get("RH2M", {}).get(date_str),
-                wind_speed=parameters.get("WS2M", {}).get(date_str),
-                solar_radiation=solar_mj,
-                precipitation=parameters.get("PRECTOTCORR", {}).get(date_str),
+        variables = {}
+        for name in NASA_POWER_VARIABLES:
+            series = parameters.get(name, {})
+            if list(series) == dates:
+                # Caso comum: parâmetro já vem ordenado por data
+                values = list(series.values())
+            else:
+                values = [series.get(d) for d in dates]
+            # None → NaN na conversão para float64
+            variables[name] = np.array(values, dtype=np.float64)
+
+        metadata = {}
+        coordinates = data.get("geometry", {}).get("coordinates") or []
+        if len(coordinates) >= 3:
+            metadata["elevation"] = coordinates[2]
+
+        columns = ClimateColumns(
+            source="nasa_power",
+            dates=np.array(
+                [self._format_date(d) for d in dates], dtype="datetime64[D]"
+            ),
+            variables=variables,
+            metadata=metadata,
+        )
+
+        logger.info(f"NASA POWER: Parseados {len(columns)} registros")
+        return columns
+
+    @staticmethod
+    def _columns_to_records(columns: ClimateColumns) -> list[NASAPowerData]:
+        """Converte colunas em NASAPowerData (uma instância por dia)."""
+        fields = {
+            NASA_POWER_VARIABLES[name]: [
+                None if np.isnan(v) else v for v in values.tolist()
+            ]
+            for name, values in columns.variables.items()
+            if name in NASA_POWER_VARIABLES
+        }
+        return [
+            NASAPowerData(
+                date=str(day),
+                **{attr: values[i] for attr, values in fields.items()},
             )
-            results.append(record)
-
-        logger.info(f"NASA POWER: Parseados {len(results)} registros")
-        return results
+            for i, day in enumerate(columns.dates.tolist())
+        ]
 
     def _format_date(self, date_str: str) -> str:
         """
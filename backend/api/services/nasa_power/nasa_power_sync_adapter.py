@@ -2,15 +2,17 @@
 NASA POWER Sync Adapter - Synchronous wrapper for async client.
 
 Este adapter permite usar o cliente assíncrono NASA POWER em código síncrono
-(Celery tasks, sync endpoints).
+(Celery tasks, sync endpoints). As chamadas rodam no event loop persistente
+de backend.api.services.async_bridge, reutilizando o mesmo cliente HTTP.
 """
 
-import asyncio
 from datetime import datetime
 from typing import Any
 
 from loguru import logger
 
+from backend.api.services.async_bridge import run_sync
+
 from .nasa_power_client import NASAPowerClient, NASAPowerConfig, NASAPowerData
 
 
@@ -31,8 +33,24 @@ class NASAPowerSyncAdapter:
         """
         self.config = config or NASAPowerConfig()
         self.cache = cache
+        # Cliente reutilizado entre chamadas (pool de conexões httpx)
+        self._client: NASAPowerClient | None = None
         logger.info("NASAPowerSyncAdapter initialized")
 
+    def _get_client(self) -> NASAPowerClient:
+        """Retorna o cliente do adapter, criando-o na primeira chamada."""
+        if self._client is None:
+            self._client = NASAPowerClient(
+                config=self.config, cache=self.cache
+            )
+        return self._client
+
+    def close_sync(self) -> None:
+        """Fecha o cliente HTTP reutilizado (se existir)."""
+        if self._client is not None:
+            run_sync(self._client.close())
+            self._client = None
+
     def get_daily_data_sync(
         self,
         lat: float,
@@ -62,7 +80,7 @@ class NASAPowerSyncAdapter:
             ...     end_date=datetime(2024, 1, 7)
             ... )
         """
-        return asyncio.run(
+        return run_sync(
             self._async_get_daily_data(
                 lat=lat,
                 lon=lon,
@@ -81,26 +99,21 @@ class NASAPowerSyncAdapter:
         community: str,
     ) -> list[NASAPowerData]:
         """
-        Método assíncrono interno.
+        Método assíncrono interno (executado no loop da ponte).
 
-        Cria cliente, faz requisição, fecha conexão.
+        Reutiliza o cliente do adapter; a conexão fica aberta para a
+        próxima chamada.
         """
-        client = NASAPowerClient(config=self.config, cache=self.cache)
-
-        try:
-            data = await client.get_daily_data(
-                lat=lat,
-                lon=lon,
-                start_date=start_date,
-                end_date=end_date,
-                community=community,
-            )
-
-            logger.info(f"✅ NASA POWER sync: {len(data)} registros obtidos")
-            return data
+        data = await self._get_client().get_daily_data(
+            lat=lat,
+            lon=lon,
+            start_date=start_date,
+            end_date=end_date,
+            community=community,
+        )
 
-        finally:
-            await client.close()
+        logger.info(f"✅ NASA POWER sync: {len(data)} registros obtidos")
+        return data
 
     def health_check_sync(self) -> bool:
         """
@@ -109,25 +122,11 @@ class NASAPowerSyncAdapter:
         Returns:
             bool: True se API está acessível
         """
-        try:
-            # Verificar se já há event loop rodando
-            asyncio.get_running_loop()
-            import nest_asyncio
-
-            nest_asyncio.apply()
-            return asyncio.run(self._async_health_check())
-        except RuntimeError:
-            # Não há loop rodando
-            return asyncio.run(self._async_health_check())
+        return run_sync(self._async_health_check())
 
     async def _async_health_check(self) -> bool:
         """Health check assíncrono interno."""
-        client = NASAPowerClient(config=self.config, cache=self.cache)
-
-        try:
-            return await client.health_check()
-        finally:
-            await client.close()
+        return await self._get_client().health_check()
 
     @staticmethod
     def get_info() -> dict[str, Any]:
@@ -39,7 +39,6 @@ General FAQs: https://weather-gov.github.io/api/general-faqs
 
 import asyncio
 import os
-from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -52,10 +51,27 @@ try:
     from backend.api.services.geographic_utils import (
         GeographicUtils,
     )
-    from backend.api.services.weather_utils import WeatherConversionUtils
+    from backend.api.services.weather_utils import (
+        WeatherAggregationUtils,
+        WeatherConversionUtils,
+    )
 except ImportError:
     from ..geographic_utils import GeographicUtils
-    from ..weather_utils import WeatherConversionUtils
+    from ..weather_utils import (
+        WeatherAggregationUtils,
+        WeatherConversionUtils,
+    )
+
+from backend.infrastructure.http_replay import http_transport
+
+# Campos numéricos de NWSHourlyData agregados por dia
+NWS_HOURLY_COLUMNS = (
+    "temp_celsius",
+    "humidity_percent",
+    "wind_speed_2m_ms",
+    "precip_mm",
+    "probability_precip_percent",
+)
 
 
 class NWSConfig(BaseModel):
@@ -205,9 +221,34 @@ class NWSForecastClient:
         Status: VALIDADO PARA PRODUCAO (Nov 2025).
     """
 
-    def __init__(self, config: NWSConfig | None = None):
+    def __init__(
+        self,
+        config: NWSConfig | None = None,
+        grid_cache: Any | None = None,
+        http_cache: Any | None = None,
+        breaker: Any | None = None,
+    ):
+        """
+        Inicializa cliente NWS Forecast.
+
+        Args:
+            config: Configuracao customizada (opcional)
+            grid_cache: NWSGridCache (opcional, DI) para o mapeamento
+                ponto -> grid de /points
+            http_cache: HTTPResponseCache (opcional, DI); o forecast
+                horario usa ETag/Cache-Control da API (304 sem corpo)
+            breaker: CircuitBreaker (opcional, DI); HITs do http_cache
+                nao passam por ele
+        """
         self.config = config or NWSConfig()
+        self.grid_cache = grid_cache
+        transport = (
+            breaker.transport() if breaker else http_transport("nws_forecast")
+        )
+        if http_cache:
+            transport = http_cache.transport(transport)
         self.client = httpx.AsyncClient(
+            transport=transport,
             base_url=self.config.base_url,
             timeout=self.config.timeout,
             headers={
@@ -239,17 +280,28 @@ class NWSForecastClient:
         Obtem metadados do grid NWS para coordenadas especificas.
         Necessario para acessar endpoints de forecast.
 
+        Com grid_cache, o mapeamento (praticamente estatico) vem do cache
+        Redis/PostgreSQL; no MISS a API e consultada com as coordenadas
+        quantizadas da chave do cache.
+
         Args:
             lat: Latitude (-90 a 90)
             lon: Longitude (-180 a 180)
 
         Returns:
-            dict com gridId, gridX, gridY, forecast_hourly_url
+            dict com gridId, gridX, gridY, forecast_url,
+            forecast_hourly_url
 
         Raises:
             httpx.HTTPStatusError: Se coordenadas fora da cobertura (404)
             ValueError: Se metadata incompleto
         """
+        if self.grid_cache:
+            cached = await self.grid_cache.get_grid(lat, lon)
+            if cached:
+                return cached
+            lat, lon = self.grid_cache.quantize(lat, lon)
+
         url = f"/points/{lat:.4f},{lon:.4f}"
 
         for attempt in range(self.config.retry_attempts):
@@ -267,12 +319,16 @@ class NWSForecastClient:
                 if not all([grid_id, grid_x, grid_y, forecast_hourly_url]):
                     raise ValueError("Grid metadata incompleto")
 
-                return {
+                metadata = {
                     "gridId": grid_id,
                     "gridX": grid_x,
                     "gridY": grid_y,
+                    "forecast_url": props.get("forecast"),
                     "forecast_hourly_url": forecast_hourly_url,
                 }
+                if self.grid_cache:
+                    await self.grid_cache.set_grid(lat, lon, metadata)
+                return metadata
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 404:
                     raise
@@ -507,83 +563,81 @@ class NWSForecastClient:
         if not hourly_data:
             return []
 
-        daily_groups = defaultdict(list)
+        # Colunas horárias → redução por data local (offset do timestamp)
+        _, local_dates = WeatherAggregationUtils.parse_hourly_times(
+            [hour.timestamp for hour in hourly_data]
+        )
+        valid = np.flatnonzero(~np.isnat(local_dates))
+        local_dates = local_dates[valid]
+        columns = {
+            name: np.array(
+                [getattr(hourly_data[i], name) for i in valid],
+                dtype=np.float64,
+            )
+            for name in NWS_HOURLY_COLUMNS
+        }
+        columns["hours"] = np.ones(valid.size)
+        days, stats = WeatherAggregationUtils.daily_reduce(
+            local_dates,
+            columns,
+            {
+                "hours": ("count",),
+                "temp_celsius": ("mean", "max", "min"),
+                "humidity_percent": ("mean",),
+                # Usar vento a 2m (convertido para FAO-56)
+                "wind_speed_2m_ms": ("mean",),
+                "precip_mm": ("sum", "count"),
+                "probability_precip_percent": ("mean",),
+            },
+        )
 
-        for hour in hourly_data:
-            try:
-                timestamp = datetime.fromisoformat(
-                    hour.timestamp.replace("Z", "+00:00")
-                )
-                date_key = timestamp.date()
-                daily_groups[date_key].append(hour)
-            except Exception:
-                continue
+        # Horas originais de cada dia (mesma ordem de ``days``)
+        hour_counts = stats["hours_count"].astype(int)
+        order = valid[np.argsort(local_dates, kind="stable")]
+        day_hours = np.split(order, np.cumsum(hour_counts)[:-1])
+
+        def _optional(values: np.ndarray) -> list[float | None]:
+            return [None if v != v else v for v in values.tolist()]
+
+        temp_mean = _optional(stats["temp_celsius_mean"])
+        temp_max = _optional(stats["temp_celsius_max"])
+        temp_min = _optional(stats["temp_celsius_min"])
+        humidity_mean = _optional(stats["humidity_percent_mean"])
+        wind_speed_mean = _optional(stats["wind_speed_2m_ms_mean"])
+        precip_total = np.where(
+            stats["precip_mm_count"] > 0, stats["precip_mm_sum"], np.nan
+        )
+        precip_total = _optional(precip_total)
+        prob_precip_mean = _optional(stats["probability_precip_percent_mean"])
 
         daily_data = []
         now = datetime.now()
         five_days_limit = now + timedelta(days=5)
 
-        for date_key in sorted(daily_groups.keys()):
+        for i, date_key in enumerate(days.tolist()):
             if date_key > five_days_limit.date():
                 break  # Limit to 5 days
 
-            hours = daily_groups[date_key]
-
             # Skip dias incompletos (< 20 horas) para evitar viés
-            if len(hours) < 20:
+            if hour_counts[i] < 20:
                 logger.warning(
-                    f"⚠️  Descartando {date_key}: apenas {len(hours)} horas "
-                    f"(dias parciais causam viés nas estatísticas)"
+                    f"⚠️  Descartando {date_key}: apenas {hour_counts[i]} "
+                    f"horas (dias parciais causam viés nas estatísticas)"
                 )
                 continue
 
-            temps = [
-                h.temp_celsius for h in hours if h.temp_celsius is not None
-            ]
-            humidities = [
-                h.humidity_percent
-                for h in hours
-                if h.humidity_percent is not None
-            ]
-            # Usar vento a 2m (convertido para FAO-56)
-            wind_speeds = [
-                h.wind_speed_2m_ms
-                for h in hours
-                if h.wind_speed_2m_ms is not None
-            ]
-            precips = [h.precip_mm for h in hours if h.precip_mm is not None]
-            prob_precips = [
-                h.probability_precip_percent
-                for h in hours
-                if h.probability_precip_percent is not None
-            ]
-
-            temp_mean = float(np.mean(temps)) if temps else None
-            temp_max = float(np.max(temps)) if temps else None
-            temp_min = float(np.min(temps)) if temps else None
-
-            humidity_mean = float(np.mean(humidities)) if humidities else None
-            wind_speed_mean = (
-                float(np.mean(wind_speeds)) if wind_speeds else None
-            )
-
-            precip_total = float(np.sum(precips)) if precips else None
-            prob_precip_mean = (
-                float(np.mean(prob_precips)) if prob_precips else None
-            )
-            short_forecast = hours[0].short_forecast if hours else None
-
+            hours = [hourly_data[j] for j in day_hours[i]]
             daily_data.append(
                 NWSDailyData(
                     date=datetime.combine(date_key, datetime.min.time()),
-                    temp_mean_celsius=temp_mean,
-                    temp_max_celsius=temp_max,
-                    temp_min_celsius=temp_min,
-                    humidity_mean_percent=humidity_mean,
-                    wind_speed_mean_ms=wind_speed_mean,
-                    precip_total_mm=precip_total,
-                    probability_precip_mean_percent=prob_precip_mean,
-                    short_forecast=short_forecast,
+                    temp_mean_celsius=temp_mean[i],
+                    temp_max_celsius=temp_max[i],
+                    temp_min_celsius=temp_min[i],
+                    humidity_mean_percent=humidity_mean[i],
+                    wind_speed_mean_ms=wind_speed_mean[i],
+                    precip_total_mm=precip_total[i],
+                    probability_precip_mean_percent=prob_precip_mean[i],
+                    short_forecast=hours[0].short_forecast,
                     hourly_data=hours,
                 )
             )
@@ -641,8 +695,13 @@ class NWSForecastClient:
 # Factory function
 def create_nws_forecast_client(
     config: NWSConfig | None = None,
+    grid_cache: Any | None = None,
+    http_cache: Any | None = None,
+    breaker: Any | None = None,
 ) -> NWSForecastClient:
-    return NWSForecastClient(config)
+    return NWSForecastClient(
+        config, grid_cache=grid_cache, http_cache=http_cache, breaker=breaker
+    )
 
 
 # Alias
@@ -21,7 +21,6 @@ Related Files:
 - nws_stations_sync_adapter.py: Adapter para estacoes/observacoes
 """
 
-import asyncio
 from datetime import datetime
 from typing import List, Optional
 
@@ -29,6 +28,13 @@ import pandas as pd
 from loguru import logger
 from pydantic import BaseModel
 
+from backend.api.services.async_bridge import run_sync
+from backend.api.services.climate_factory import (
+    get_circuit_breaker,
+    get_http_response_cache,
+    get_nws_grid_cache,
+)
+
 from .nws_forecast_client import (
     create_nws_forecast_client,
 )
@@ -92,14 +98,18 @@ class NWSDailyForecastSyncAdapter:
 
     def __init__(self):
         """Inicializar adapter com cliente NWS assincrono."""
-        self.client = create_nws_forecast_client()
+        self.client = create_nws_forecast_client(
+            grid_cache=get_nws_grid_cache(),
+            http_cache=get_http_response_cache(),
+            breaker=get_circuit_breaker("nws_forecast"),
+        )
 
     def health_check_sync(self) -> bool:
         """
         Verificar se NWS API está acessível (sincrono).
 
-        Cria event loop se necessário e executa health check
-        do cliente assincrono de forma bloqueante.
+        Executa o health check do cliente assincrono no event loop
+        persistente (async_bridge) de forma bloqueante.
 
         Returns:
             bool: True se API está funcionando, False caso contrário
@@ -110,15 +120,7 @@ class NWSDailyForecastSyncAdapter:
                 print("NWS API disponível")
         """
         try:
-            # Criar event loop se não existir
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-
-            # Executar health check de forma síncrona
-            result = loop.run_until_complete(self.client.health_check())
+            result = run_sync(self.client.health_check())
             return result.get("status") == "ok"
         except Exception as e:
             logger.error(f"NWS Forecast health check failed: {e}")
@@ -246,14 +248,10 @@ class NWSDailyForecastSyncAdapter:
             Lista de registros diários agregados
         """
         try:
-            # Executar método assíncrono de forma síncrona
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(
+            # Loop persistente: self.client mantém o pool entre chamadas
+            return run_sync(
                 self._get_daily_data_async(lat, lon, start_date, end_date)
             )
-            loop.close()
-            return result
         except Exception as e:
             logger.error(f"NWS Forecast sync wrapper failed: {e}")
             return []
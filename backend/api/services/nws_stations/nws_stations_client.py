@@ -31,15 +31,21 @@ Workflow Típico:
 2. get_station_observations(station_id, start, end) → Observações
 3. Agregar para diário: mean (temp/humidity/wind), sum (precip)
 
+Várias estações (fusão por distância):
+get_multi_station_observations(lat, lon, start, end, n_stations)
+→ colunas por estação, buscadas em paralelo
+
 API Reference: https://www.weather.gov/documentation/services-web-api
 General FAQs: https://weather-gov.github.io/api/general-faqs
 """
 
+import asyncio
 import os
 from datetime import datetime, timedelta
 from typing import Any
 
 import httpx
+import numpy as np
 from loguru import logger
 from pydantic import BaseModel, Field
 
@@ -48,8 +54,30 @@ try:
     from backend.api.services.geographic_utils import (
         GeographicUtils,
     )
+    from backend.api.services.weather_utils import WeatherAggregationUtils
 except ImportError:
     from ..geographic_utils import GeographicUtils
+    from ..weather_utils import WeatherAggregationUtils
+
+from backend.infrastructure.http_replay import http_transport
+
+# Estações guardadas por ponto no cache de metadados (NWSGridCache)
+STATIONS_CACHE_SIZE = 50
+
+# Propriedades das observações NWS → colunas de get_observation_columns
+OBSERVATION_FIELDS = {
+    "temperature": "temp_celsius",
+    "maxTemperatureLast24Hours": "temp_max_24h",
+    "minTemperatureLast24Hours": "temp_min_24h",
+    "dewpoint": "dewpoint_celsius",
+    "relativeHumidity": "humidity_percent",
+    "windSpeed": "wind_speed_ms",
+    "precipitationLastHour": "precipitation_1h_mm",
+}
+
+# Paginação de /stations/{id}/observations (máximo da API: 500)
+OBSERVATION_PAGE_LIMIT = 500
+OBSERVATION_MAX_PAGES = 10
 
 
 class NWSStationsConfig(BaseModel):
@@ -189,6 +217,8 @@ class NWSStationsClient:
         self,
         config: NWSStationsConfig | None = None,
         cache: Any | None = None,
+        grid_cache: Any | None = None,
+        breaker: Any | None = None,
     ):
         """
         Inicializa cliente NWS Stations.
@@ -196,8 +226,13 @@ class NWSStationsClient:
         Args:
             config: Configuração customizada (opcional)
             cache: ClimateCacheService (opcional, DI)
+            grid_cache: NWSGridCache (opcional, DI) para a lista de
+                estações próximas de cada ponto
+            breaker: CircuitBreaker (opcional, DI) compartilhado entre
+                workers
         """
         self.config = config or NWSStationsConfig()
+        self.grid_cache = grid_cache
 
         # Headers recomendados NWS
         headers = {
@@ -209,6 +244,11 @@ class NWSStationsClient:
             timeout=self.config.timeout,
             headers=headers,
             follow_redirects=True,
+            transport=(
+                breaker.transport()
+                if breaker
+                else http_transport("nws_stations")
+            ),
         )
         self.cache = cache
         logger.info("✅ NWSStationsClient initialized")
@@ -262,6 +302,18 @@ class NWSStationsClient:
 
         limit = limit or self.config.max_stations
 
+        # Lista de estações por ponto é praticamente estática: com
+        # grid_cache, guarda STATIONS_CACHE_SIZE estações por ponto
+        # quantizado e consulta a API nas coordenadas quantizadas
+        use_cache = self.grid_cache is not None and (
+            limit <= STATIONS_CACHE_SIZE
+        )
+        if use_cache:
+            cached = await self.grid_cache.get_stations(lat, lon)
+            if cached is not None:
+                return [NWSStation(**item) for item in cached[:limit]]
+            lat, lon = self.grid_cache.quantize(lat, lon)
+
         logger.info(f"🔍 Buscando estações NWS próximas a ({lat}, {lon})")
 
         try:
@@ -275,7 +327,8 @@ class NWSStationsClient:
             features = data.get("features", [])
 
             stations = []
-            for feature in features[:limit]:
+            fetch_count = STATIONS_CACHE_SIZE if use_cache else limit
+            for feature in features[:fetch_count]:
                 props = feature.get("properties", {})
                 geom = feature.get("geometry", {})
                 coords = geom.get("coordinates", [None, None])
@@ -291,6 +344,12 @@ class NWSStationsClient:
                 )
                 stations.append(station)
 
+            if use_cache:
+                await self.grid_cache.set_stations(
+                    lat, lon, [station.model_dump() for station in stations]
+                )
+                stations = stations[:limit]
+
             logger.info(f"✅ Encontradas {len(stations)} estações NWS")
             return stations
 
@@ -439,6 +498,183 @@ class NWSStationsClient:
             )
             raise
 
+    async def get_observation_columns(
+        self,
+        station_id: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        max_pages: int = OBSERVATION_MAX_PAGES,
+    ) -> dict[str, np.ndarray]:
+        """
+        Busca observações de uma estação NWS em formato colunar.
+
+        Mesma consulta de get_station_observations, mas cada página da
+        coleção GeoJSON é lida numa única passada para listas por
+        propriedade, sem NWSObservation por hora. Segue
+        ``pagination.next`` até ``max_pages`` páginas.
+
+        Args:
+            station_id: ID da estação (ex: "KJFK")
+            start_date: Data inicial (opcional, padrão: últimas 24h)
+            end_date: Data final (opcional, padrão: agora)
+            max_pages: Máximo de páginas da API
+
+        Returns:
+            Dict com 'timestamp' (datetime64[s] UTC, ordem crescente) e
+            um array float64 por coluna de OBSERVATION_FIELDS, mais
+            'wind_speed_2m_ms' (FAO-56); valores ausentes = NaN
+
+        Raises:
+            httpx.HTTPError: Erro de comunicação com API
+        """
+        if end_date is None:
+            end_date = datetime.now()
+        if start_date is None:
+            start_date = end_date - timedelta(days=1)
+
+        url = f"{self.config.base_url}/stations/{station_id}/observations"
+        params: dict[str, Any] | None = {
+            "start": start_date.replace(microsecond=0).isoformat() + "Z",
+            "end": end_date.replace(microsecond=0).isoformat() + "Z",
+            "limit": OBSERVATION_PAGE_LIMIT,
+        }
+
+        timestamps: list[str] = []
+        values: dict[str, list] = {
+            name: [] for name in OBSERVATION_FIELDS.values()
+        }
+
+        try:
+            for _ in range(max_pages):
+                response = await self.client.get(url, params=params)
+                response.raise_for_status()
+                data = response.json()
+
+                features = data.get("features") or []
+                self._collect_observations(features, timestamps, values)
+
+                # URL de next já traz os parâmetros da consulta
+                url = (data.get("pagination") or {}).get("next")
+                params = None
+                if not url or not features:
+                    break
+            else:
+                logger.warning(
+                    f"⚠️  {station_id}: observações truncadas em "
+                    f"{max_pages} páginas"
+                )
+        except httpx.HTTPError as e:
+            logger.error(
+                f"❌ Erro ao buscar observações NWS {station_id}: {e}"
+            )
+            raise
+
+        instants, _ = WeatherAggregationUtils.parse_hourly_times(timestamps)
+        valid = ~np.isnat(instants)
+        order = np.argsort(instants[valid], kind="stable")
+
+        columns: dict[str, np.ndarray] = {"timestamp": instants[valid][order]}
+        for name, column in values.items():
+            # None → NaN na conversão para float64
+            columns[name] = np.array(column, dtype=np.float64)[valid][order]
+
+        # FAO-56 Eq. 47: u2 = u10 × 0.748
+        columns["wind_speed_2m_ms"] = columns["wind_speed_ms"] * 0.748
+
+        logger.info(
+            f"✅ Obtidas {order.size} observações NWS {station_id} "
+            f"({int(np.isnan(columns['temp_celsius']).sum())} sem "
+            f"temperatura)"
+        )
+        return columns
+
+    @staticmethod
+    def _collect_observations(
+        features: list[dict],
+        timestamps: list[str],
+        values: dict[str, list],
+    ) -> None:
+        """Acumula timestamp e valores de cada feature nas listas."""
+        columns = [
+            (prop, values[name]) for prop, name in OBSERVATION_FIELDS.items()
+        ]
+        for feature in features:
+            props = feature.get("properties") or {}
+            timestamp = props.get("timestamp")
+            if not timestamp:
+                continue
+            timestamps.append(timestamp)
+            for prop, column in columns:
+                item = props.get(prop)
+                column.append(
+                    item.get("value") if isinstance(item, dict) else None
+                )
+
+    async def get_multi_station_observations(
+        self,
+        lat: float,
+        lon: float,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        n_stations: int = 3,
+        max_concurrency: int = 4,
+    ) -> list[dict[str, Any]]:
+        """
+        Busca observações das N estações mais próximas em paralelo.
+
+        As consultas por estação rodam concorrentemente, limitadas por
+        um semáforo (rate limit NWS: ~5 requests/second). Falha de uma
+        estação só gera log; as demais seguem.
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+            start_date: Data inicial (opcional, padrão: últimas 24h)
+            end_date: Data final (opcional, padrão: agora)
+            n_stations: Número de estações mais próximas
+            max_concurrency: Máximo de requisições simultâneas
+
+        Returns:
+            Lista de {'station': NWSStation (com distance_km),
+            'observations': colunas de get_observation_columns}, na
+            ordem de proximidade
+
+        Raises:
+            ValueError: Se coordenadas fora de cobertura
+            httpx.HTTPError: Erro ao buscar a lista de estações
+        """
+        stations = await self.find_nearest_stations(lat, lon, n_stations)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(station: NWSStation) -> dict[str, np.ndarray] | None:
+            async with semaphore:
+                try:
+                    return await self.get_observation_columns(
+                        station.station_id, start_date, end_date
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"⚠️  Estação {station.station_id} ignorada: {e}"
+                    )
+                    return None
+
+        results = await asyncio.gather(*(fetch(s) for s in stations))
+
+        output = []
+        for station, observations in zip(stations, results):
+            if observations is None:
+                continue
+            if station.distance_km is None:
+                station.distance_km = GeographicUtils.distance_km(
+                    lat, lon, station.latitude, station.longitude
+                )
+            output.append({"station": station, "observations": observations})
+
+        logger.info(
+            f"✅ Observações de {len(output)}/{len(stations)} estações NWS"
+        )
+        return output
+
     async def get_latest_observation(
         self, station_id: str
     ) -> NWSObservation | None:
@@ -742,7 +978,9 @@ class NWSStationsClient:
 
 # Factory function para compatibilidade
 def create_nws_stations_client(
-    config: NWSStationsConfig | None = None, cache: Any | None = None
+    config: NWSStationsConfig | None = None,
+    cache: Any | None = None,
+    grid_cache: Any | None = None,
 ) -> NWSStationsClient:
     """
     Factory function para criar NWSStationsClient.
@@ -750,8 +988,9 @@ def create_nws_stations_client(
     Args:
         config: Configuração customizada
         cache: Cache service
+        grid_cache: Cache de estações próximas (NWSGridCache)
 
     Returns:
         NWSStationsClient configurado
     """
-    return NWSStationsClient(config=config, cache=cache)
+    return NWSStationsClient(config=config, cache=cache, grid_cache=grid_cache)
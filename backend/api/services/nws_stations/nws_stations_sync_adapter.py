@@ -29,13 +29,15 @@ Usage:
     >>> print(f"Obtidos {len(data)} registros de NWS")
 """
 
-import asyncio
 from datetime import datetime, timedelta
 from typing import Any
 
 import pandas as pd
 from loguru import logger
 
+from backend.api.services.async_bridge import run_sync
+from backend.api.services.climate_factory import get_nws_grid_cache
+
 from .nws_stations_client import NWSStationsClient, NWSStationsConfig
 
 
@@ -67,7 +69,7 @@ class NWSStationsSyncAdapter:
     """
     Adapter síncrono para NWSStationsClient assíncrono.
 
-    Converte chamadas síncronas em assíncronas usando asyncio.run(),
+    Executa as chamadas assíncronas no event loop persistente (async_bridge),
     mantendo compatibilidade com código legacy (Celery tasks).
 
     Responsabilidades:
@@ -148,7 +150,7 @@ class NWSStationsSyncAdapter:
         )
 
         # Executa função assíncrona de forma síncrona
-        return asyncio.run(
+        return run_sync(
             self._async_get_daily_data(
                 lat=lat,
                 lon=lon,
@@ -176,7 +178,11 @@ class NWSStationsSyncAdapter:
         6. Calcula agregações (min, max, média)
         7. Retorna como DailyNWSData
         """
-        client = NWSStationsClient(config=self.config, cache=self.cache)
+        client = NWSStationsClient(
+            config=self.config,
+            cache=self.cache,
+            grid_cache=get_nws_grid_cache(),
+        )
 
         try:
             # 1. Validar cobertura USA
@@ -474,7 +480,7 @@ class NWSStationsSyncAdapter:
         Returns:
             bool: True se API está acessível
         """
-        return asyncio.run(self._async_health_check())
+        return run_sync(self._async_health_check())
 
     async def _async_health_check(self) -> bool:
         """
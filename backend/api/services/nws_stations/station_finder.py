@@ -5,12 +5,17 @@ Station Finder com PostGIS
 - Integração com dados históricos
 """
 
+import math
+from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 from loguru import logger
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from backend.api.services.async_bridge import run_sync
+
 
 class StationFinder:
     """
@@ -18,6 +23,7 @@ class StationFinder:
 
     Métodos:
     - find_stations_in_radius: Busca por raio (usando índice espacial)
+    - get_nws_stations_data: Resumo das N estações NWS mais próximas
     - get_weighted_climate_data: Dados ponderados por distância
     - find_studied_city: Busca cidade com histórico na DB
     """
@@ -369,6 +375,82 @@ class StationFinder:
             logger.error(f"Error fetching monthly normals: {e}")
             return None
 
+    async def get_nws_stations_data(
+        self,
+        target_lat: float,
+        target_lon: float,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        n_stations: int = 5,
+        client: Optional[Any] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Resume observações das N estações NWS mais próximas
+
+        As observações são buscadas em paralelo
+        (NWSStationsClient.get_multi_station_observations) e cada
+        estação vira um dict no formato de find_stations_in_radius,
+        pronto para get_weighted_climate_data(stations_data=...).
+
+        Args:
+            target_lat: Latitude do alvo (cobertura USA)
+            target_lon: Longitude do alvo
+            start_date: Data inicial (padrão: últimas 24h)
+            end_date: Data final (padrão: agora)
+            n_stations: Número de estações
+            client: NWSStationsClient (se None, cria e fecha um)
+
+        Returns:
+            Lista de estações com distance_km e médias do período
+            (variáveis sem observação ficam de fora)
+        """
+        from backend.api.services.nws_stations.nws_stations_client import (
+            NWSStationsClient,
+        )
+
+        owns_client = client is None
+        client = client or NWSStationsClient()
+        try:
+            results = await client.get_multi_station_observations(
+                target_lat,
+                target_lon,
+                start_date,
+                end_date,
+                n_stations=n_stations,
+            )
+        finally:
+            if owns_client:
+                await client.close()
+
+        stations_data = []
+        for item in results:
+            station = item["station"]
+            obs = item["observations"]
+            summary = {
+                "station_code": station.station_id,
+                "station_name": station.name,
+                "latitude": station.latitude,
+                "longitude": station.longitude,
+                "elevation_m": station.elevation_m,
+                "data_source": "nws_stations",
+                "distance_km": station.distance_km,
+                "n_observations": int(obs["timestamp"].size),
+            }
+            for key, column, func in (
+                ("temp_mean", "temp_celsius", np.mean),
+                ("temp_max", "temp_celsius", np.max),
+                ("temp_min", "temp_celsius", np.min),
+                ("humidity_mean", "humidity_percent", np.mean),
+                ("wind_speed_2m_mean", "wind_speed_2m_ms", np.mean),
+                ("precipitation_sum", "precipitation_1h_mm", np.sum),
+            ):
+                values = obs[column][~np.isnan(obs[column])]
+                if values.size:
+                    summary[key] = float(func(values))
+            stations_data.append(summary)
+
+        return stations_data
+
     async def get_weighted_climate_data(
         self,
         target_lat: float,
@@ -380,13 +462,15 @@ class StationFinder:
         Calcula dados climáticos ponderados pela distância
 
         Peso = 1 / (distância + 0.1)
-        Normaliza para que soma dos pesos = 1
+        Normaliza por variável, para que a soma dos pesos das estações
+        que reportam a variável seja 1 (NaN/ausente não entra)
 
         Args:
             target_lat: Latitude
             target_lon: Longitude
             radius_km: Raio de busca
-            stations_data: Lista de estações (se None, busca na DB)
+            stations_data: Lista de estações (se None, busca na DB;
+                para NWS use get_nws_stations_data)
 
         Returns:
             Dict com dados ponderados
@@ -401,6 +485,7 @@ class StationFinder:
             return {}
 
         weighted_data = {}
+        key_weights: Dict[str, float] = {}
         total_weight = 0.0
 
         for station in stations_data:
@@ -423,14 +508,19 @@ class StationFinder:
                     "longitude",
                     "id",
                     "elevation_m",
+                    "n_observations",
                 ]:
+                    if isinstance(value, float) and math.isnan(value):
+                        continue
                     if key not in weighted_data:
                         weighted_data[key] = 0.0
+                        key_weights[key] = 0.0
                     weighted_data[key] += value * weight
+                    key_weights[key] += weight
 
         # Normalizar pesos
         for key in weighted_data:
-            weighted_data[key] /= total_weight
+            weighted_data[key] /= key_weights[key]
 
         logger.info(
             f"Weighted climate data calculated from {len(stations_data)} "
@@ -521,7 +611,8 @@ class StationFinder:
         """
         Wrapper síncrono para find_studied_city() - compatível com código síncrono.
 
-        Usa asyncio.run() internamente para executar coroutine.
+        Executa a coroutine no event loop persistente (async_bridge).
+        Não usar dentro de coroutines: lá, use await.
 
         Args:
             target_lat: Latitude do alvo
@@ -537,28 +628,9 @@ class StationFinder:
             >>> if city:
             ...     print(f"Encontrada: {city['city_name']} a {city['distance_km']:.1f}km")
         """
-        import asyncio
-
-        try:
-            # Tentar executar diretamente com asyncio.run
-            return asyncio.run(
-                self.find_studied_city(target_lat, target_lon, max_distance_km)
-            )
-        except RuntimeError as e:
-            if "already running" in str(e):
-                # Se já há event loop rodando, criar nova task
-                import concurrent.futures
-
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run,
-                        self.find_studied_city(
-                            target_lat, target_lon, max_distance_km
-                        ),
-                    )
-                    return future.result()
-            else:
-                raise
+        return run_sync(
+            self.find_studied_city(target_lat, target_lon, max_distance_km)
+        )
 
     def find_stations_in_radius_sync(
         self,
@@ -570,7 +642,8 @@ class StationFinder:
         """
         Wrapper síncrono para find_stations_in_radius() - compatível com código síncrono.
 
-        Usa asyncio.run() internamente para executar coroutine.
+        Executa a coroutine no event loop persistente (async_bridge).
+        Não usar dentro de coroutines: lá, use await.
 
         Args:
             target_lat: Latitude do alvo
@@ -586,27 +659,8 @@ class StationFinder:
             >>> stations = finder.find_stations_in_radius_sync(-15.7939, -47.8828, 50)
             >>> print(f"Encontradas {len(stations)} estações")
         """
-        import asyncio
-
-        try:
-            # Tentar executar diretamente com asyncio.run
-            return asyncio.run(
-                self.find_stations_in_radius(
-                    target_lat, target_lon, radius_km, limit
-                )
+        return run_sync(
+            self.find_stations_in_radius(
+                target_lat, target_lon, radius_km, limit
             )
-        except RuntimeError as e:
-            if "already running" in str(e):
-                # Se já há event loop rodando, criar nova task
-                import concurrent.futures
-
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run,
-                        self.find_stations_in_radius(
-                            target_lat, target_lon, radius_km, limit
-                        ),
-                    )
-                    return future.result()
-            else:
-                raise
+        )
@@ -31,6 +31,7 @@ CACHE STRATEGY (Nov 2025):
 - TTL: 24h (dados históricos são estáveis, mas podem ter correções)
 """
 
+from contextlib import nullcontext
 from datetime import datetime, timedelta
 from typing import Any, Dict
 
@@ -39,8 +40,10 @@ import requests_cache
 from loguru import logger
 from retry_requests import retry
 
+from backend.api.services.climate_columns import ClimateColumns
 from backend.api.services.geographic_utils import GeographicUtils
-from backend.api.services.weather_utils import WeatherConversionUtils
+from backend.infrastructure.cache.api_usage_tracker import track_session
+from backend.infrastructure.http_replay import mount_replay
 
 
 class OpenMeteoArchiveConfig:
@@ -87,16 +90,23 @@ class OpenMeteoArchiveClient:
     Supports Redis cache (via ClimateCache) with fallback to local cache.
     """
 
-    def __init__(self, cache: Any | None = None, cache_dir: str = ".cache"):
+    def __init__(
+        self,
+        cache: Any | None = None,
+        cache_dir: str = ".cache",
+        breaker: Any | None = None,
+    ):
         """
         Initialize Archive client with caching and retry logic.
 
         Args:
             cache: Optional ClimateCache instance (Redis)
             cache_dir: Directory for fallback requests_cache
+            breaker: Optional CircuitBreaker (shared across workers)
         """
         self.config = OpenMeteoArchiveConfig()
         self.cache = cache  # Redis cache (opcional)
+        self.breaker = breaker  # Circuit breaker (opcional)
         self._setup_client(cache_dir)
 
         cache_type = "Redis" if cache else "Local"
@@ -115,6 +125,8 @@ class OpenMeteoArchiveClient:
             retries=self.config.RETRY_ATTEMPTS,
             backoff_factor=self.config.BACKOFF_FACTOR,
         )
+        mount_replay(retry_session, "openmeteo_archive")
+        track_session(retry_session, "openmeteo_archive")
         self.client = openmeteo_requests.Client(session=retry_session)  # type: ignore[arg-type]  # noqa: E501
         logger.debug(f"Cache dir: {cache_dir}, TTL: 24 hours")
 
@@ -126,7 +138,40 @@ class OpenMeteoArchiveClient:
         end_date: str,
     ) -> Dict[str, Any]:
         """
-        Get historical climate data from Archive API.
+        Get historical climate data from Archive API (dict of lists).
+
+        Formato legado de get_climate_columns: {'location',
+        'climate_data': {'dates': [...], var: [...]}, 'metadata'}.
+
+        Args:
+            lat: Latitude (-90 to 90)
+            lng: Longitude (-180 to 180)
+            start_date: Start date (YYYY-MM-DD, >= 1990-01-01)
+            end_date: End date (YYYY-MM-DD, <= hoje - 2 dias)
+        """
+        columns = await self.get_climate_columns(
+            lat, lng, start_date, end_date
+        )
+        return {
+            "location": columns.metadata["location"],
+            "climate_data": columns.to_lists(),
+            "metadata": {
+                "api": "archive",
+                "url": self.config.BASE_URL,
+                "data_points": len(columns),
+                "cache_ttl_hours": 24,
+            },
+        }
+
+    async def get_climate_columns(
+        self,
+        lat: float,
+        lng: float,
+        start_date: str,
+        end_date: str,
+    ) -> ClimateColumns:
+        """
+        Get historical climate data from Archive API (columnar).
 
         IMPORTANTE: Este cliente ASSUME que:
         - Coordenadas validadas em climate_validation.py
@@ -142,6 +187,10 @@ class OpenMeteoArchiveClient:
             lng: Longitude (-180 to 180)
             start_date: Start date (YYYY-MM-DD, >= 1990-01-01)
             end_date: End date (YYYY-MM-DD, <= hoje - 2 dias)
+
+        Returns:
+            ClimateColumns com as 10 variáveis diárias +
+            wind_speed_2m_mean (FAO-56)
         """
         # 1. Validate inputs
         self._validate_inputs(lat, lng, start_date, end_date)
@@ -151,7 +200,8 @@ class OpenMeteoArchiveClient:
             cache_key = self._get_cache_key(lat, lng, start_date, end_date)
             cached_data = await self.cache.get(cache_key)
 
-            if cached_data:
+            # Entradas antigas (dict de listas) são rebuscadas
+            if isinstance(cached_data, ClimateColumns):
                 logger.info(
                     f"✅ Cache HIT (Redis): OpenMeteo Archive "
                     f"({lat:.4f}, {lng:.4f})"
@@ -177,87 +227,32 @@ class OpenMeteoArchiveClient:
 
         # 4. Fetch data from Archive API
         try:
-            responses = self.client.weather_api(
-                self.config.BASE_URL, params=params
-            )
-            response = responses[0]  # Single location
-
-            # 4. Extract location metadata
-            location = {
-                "latitude": response.Latitude(),
-                "longitude": response.Longitude(),
-                "elevation": response.Elevation(),
-                "timezone": response.Timezone(),
-                "timezone_abbreviation": response.TimezoneAbbreviation(),
-                "utc_offset_seconds": response.UtcOffsetSeconds(),
-            }
-
-            # 5. Extract climate data
-            daily = response.Daily()
-            # Handle scalar (single day) vs array timestamps
-            time_data = daily.Time()  # type: ignore
-            if hasattr(time_data, "tolist"):
-                timestamps = time_data.tolist()  # type: ignore
-            else:
-                timestamps = [int(time_data)]
-
-            dates = [datetime.fromtimestamp(ts) for ts in timestamps]
-
-            climate_data = {"dates": dates}
-
-            # Map variables to data
-            for i, var_name in enumerate(self.config.DAILY_VARIABLES):
-                try:
-                    values = daily.Variables(i).ValuesAsNumpy()  # type: ignore
-                    # Handle scalar values (single day) vs arrays
-                    if hasattr(values, "tolist"):
-                        climate_data[var_name] = values.tolist()  # type: ignore  # noqa: E501
-                    else:
-                        # Scalar value - wrap in list
-                        climate_data[var_name] = [float(values)]  # type: ignore  # noqa: E501
-                except Exception as e:
-                    logger.warning(f"Variable {var_name} not available: {e}")
-                    climate_data[var_name] = [None] * len(dates)  # type: ignore  # noqa: E501
-
-            # Convert wind from 10m to 2m for FAO-56 PM equation
-            if "wind_speed_10m_mean" in climate_data:
-                wind_10m = climate_data["wind_speed_10m_mean"]  # type: ignore
-                wind_2m = [
-                    WeatherConversionUtils.convert_wind_10m_to_2m(w) if w is not None else None  # type: ignore  # noqa: E501
-                    for w in wind_10m  # type: ignore
-                ]
-                climate_data["wind_speed_2m_mean"] = wind_2m  # type: ignore
-                logger.debug(
-                    f"✅ Converted wind 10m→2m: {len(wind_2m)} values"
+            # Circuit breaker compartilhado (openmeteo_requests não é httpx)
+            guard = self.breaker.track() if self.breaker else nullcontext()
+            async with guard:
+                responses = self.client.weather_api(
+                    self.config.BASE_URL, params=params
                 )
+            response = responses[0]  # Single location
 
-            # 6. Add metadata
-            metadata = {
-                "api": "archive",
-                "url": self.config.BASE_URL,
-                "data_points": len(dates),
-                "cache_ttl_hours": 24,
-            }
-
-            result = {
-                "location": location,
-                "climate_data": climate_data,
-                "metadata": metadata,
-            }
+            # 5. Arrays NumPy do FlatBuffers direto para colunas
+            columns = ClimateColumns.from_openmeteo(
+                "openmeteo_archive", response, self.config.DAILY_VARIABLES
+            )
 
             logger.info(
-                f"✅ Archive: {len(dates)} days | "
-                f"Elevation: {location['elevation']:.0f}m"
+                f"✅ Archive: {len(columns)} days | "
+                f"Elevation: {columns.metadata['location']['elevation']:.0f}m"
             )
 
-            # 7. Save to Redis cache (if available)
+            # 6. Save to Redis cache (if available)
             if self.cache:
                 ttl = 86400  # 24h
                 cache_key = self._get_cache_key(lat, lng, start_date, end_date)
-                await self.cache.set(cache_key, result, ttl=ttl)
+                await self.cache.set(cache_key, columns, ttl=ttl)
                 logger.debug(f"💾 Cached with TTL {ttl}s (24h)")
 
-            return result
+            return columns
 
         except Exception as e:
             logger.error(f"Archive API error: {str(e)}")
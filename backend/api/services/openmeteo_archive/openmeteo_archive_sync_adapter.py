@@ -23,13 +23,14 @@ CACHE STRATEGY (Nov 2025):
 - TTL: 24h (dados históricos estáveis)
 """
 
-import asyncio
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Union
 
 import pandas as pd
 from loguru import logger
 
+from backend.api.services.async_bridge import run_sync
+
 from .openmeteo_archive_client import (
     OpenMeteoArchiveClient,
 )
@@ -62,6 +63,8 @@ class OpenMeteoArchiveSyncAdapter:
         """
         self.cache = cache  # Redis cache (opcional)
         self.cache_dir = cache_dir
+        # Cliente reutilizado entre chamadas (sessão HTTP + cache local)
+        self._client: OpenMeteoArchiveClient | None = None
 
         cache_type = "Redis" if cache else "Local"
         logger.info(
@@ -69,6 +72,14 @@ class OpenMeteoArchiveSyncAdapter:
             f"1940 to today-30d)"
         )
 
+    def _get_client(self) -> OpenMeteoArchiveClient:
+        """Retorna o cliente do adapter, criando-o na primeira chamada."""
+        if self._client is None:
+            self._client = OpenMeteoArchiveClient(
+                cache=self.cache, cache_dir=self.cache_dir
+            )
+        return self._client
+
     def get_daily_data_sync(
         self,
         lat: float,
@@ -102,31 +113,7 @@ class OpenMeteoArchiveSyncAdapter:
         if isinstance(end_date, str):
             end_date = datetime.fromisoformat(end_date)
 
-        # Executar async de forma segura
-        try:
-            # Tentar obter loop existente
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # Loop já está rodando (contexto de servidor async)
-                # Criar nova task no loop existente
-                import concurrent.futures
-
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run,
-                        self._async_get_data(lat, lon, start_date, end_date),
-                    )
-                    return future.result()
-            else:
-                # Loop existe mas não está rodando
-                return loop.run_until_complete(
-                    self._async_get_data(lat, lon, start_date, end_date)
-                )
-        except RuntimeError:
-            # Nenhum loop, criar um novo
-            return asyncio.run(
-                self._async_get_data(lat, lon, start_date, end_date)
-            )
+        return run_sync(self._async_get_data(lat, lon, start_date, end_date))
 
     async def _async_get_data(
         self,
@@ -141,9 +128,7 @@ class OpenMeteoArchiveSyncAdapter:
         Usa best_match model e wind_speed_unit=ms para consistência.
         """
         try:
-            client = OpenMeteoArchiveClient(
-                cache=self.cache, cache_dir=self.cache_dir
-            )
+            client = self._get_client()
 
             response = await client.get_climate_data(
                 lat=lat,
@@ -190,7 +175,7 @@ class OpenMeteoArchiveSyncAdapter:
         Returns:
             True se API está funcionando, False caso contrário
         """
-        return asyncio.run(self._async_health_check())
+        return run_sync(self._async_health_check())
 
     async def _async_health_check(self) -> bool:
         """
@@ -199,9 +184,7 @@ class OpenMeteoArchiveSyncAdapter:
         Testa: Brasília, 1 ano atrás, best_match model.
         """
         try:
-            client = OpenMeteoArchiveClient(
-                cache=self.cache, cache_dir=self.cache_dir
-            )
+            client = self._get_client()
 
             # Testar com coordenadas de referência (Brasília)
             # Usar data histórica segura (1 ano atrás)
@@ -33,6 +33,7 @@ CACHE STRATEGY (Nov 2025):
   * Recent (passado): 6h
 """
 
+from contextlib import nullcontext
 from datetime import datetime, timedelta
 from typing import Any, Dict
 
@@ -41,7 +42,10 @@ import requests_cache
 from loguru import logger
 from retry_requests import retry
 
+from backend.api.services.climate_columns import ClimateColumns
 from backend.api.services.geographic_utils import GeographicUtils
+from backend.infrastructure.cache.api_usage_tracker import track_session
+from backend.infrastructure.http_replay import mount_replay
 
 
 class OpenMeteoForecastConfig:
@@ -89,16 +93,23 @@ class OpenMeteoForecastClient:
     Supports Redis cache (via ClimateCache) with fallback to local cache.
     """
 
-    def __init__(self, cache: Any | None = None, cache_dir: str = ".cache"):
+    def __init__(
+        self,
+        cache: Any | None = None,
+        cache_dir: str = ".cache",
+        breaker: Any | None = None,
+    ):
         """
         Initialize Forecast client with caching and retry logic.
 
         Args:
             cache: Optional ClimateCache instance (Redis)
             cache_dir: Directory for fallback requests_cache
+            breaker: Optional CircuitBreaker (shared across workers)
         """
         self.config = OpenMeteoForecastConfig()
         self.cache = cache  # Redis cache (opcional)
+        self.breaker = breaker  # Circuit breaker (opcional)
         self._setup_client(cache_dir)
 
         cache_type = "Redis" if cache else "Local"
@@ -109,14 +120,20 @@ class OpenMeteoForecastClient:
 
     def _setup_client(self, cache_dir: str):
         """Setup requests cache and retry session."""
+        # cache_control: Cache-Control/Expires da API têm precedência
+        # sobre CACHE_TTL; respostas expiradas com ETag/Last-Modified
+        # são revalidadas (304) em vez de baixadas de novo
         cache_session = requests_cache.CachedSession(
-            cache_dir, expire_after=self.config.CACHE_TTL
+            cache_dir, expire_after=self.config.CACHE_TTL, cache_control=True
         )
         retry_session = retry(
             cache_session,
             retries=self.config.RETRY_ATTEMPTS,
             backoff_factor=self.config.BACKOFF_FACTOR,
         )
+        mount_replay(retry_session, "openmeteo_forecast")
+        track_session(retry_session, "openmeteo_forecast")
+        self._session = retry_session
         self.client = openmeteo_requests.Client(session=retry_session)  # type: ignore[arg-type]  # noqa: E501
         logger.debug(f"Cache dir: {cache_dir}, TTL: 6 hours")
 
@@ -128,7 +145,34 @@ class OpenMeteoForecastClient:
         end_date: str,
     ) -> Dict[str, Any]:
         """
-        Get recent/future climate data from Forecast API.
+        Get recent/future climate data from Forecast API (dict of lists).
+
+        Formato legado de get_climate_columns: {'location',
+        'climate_data': {'dates': [...], var: [...]}, 'metadata'}.
+        """
+        columns = await self.get_climate_columns(
+            lat, lng, start_date, end_date
+        )
+        return {
+            "location": columns.metadata["location"],
+            "climate_data": columns.to_lists(),
+            "metadata": {
+                "api": "forecast",
+                "url": self.config.BASE_URL,
+                "data_points": len(columns),
+                "cache_ttl_hours": columns.metadata["cache_ttl_hours"],
+            },
+        }
+
+    async def get_climate_columns(
+        self,
+        lat: float,
+        lng: float,
+        start_date: str,
+        end_date: str,
+    ) -> ClimateColumns:
+        """
+        Get recent/future climate data from Forecast API (columnar).
 
         IMPORTANTE: Este cliente ASSUME que:
         - Coordenadas validadas em climate_validation.py
@@ -169,13 +213,11 @@ class OpenMeteoForecastClient:
             cache_key = self._get_cache_key(lat, lng, start_date, end_date)
             cached_data = await self.cache.get(cache_key)
 
-            if cached_data:
-                days_cached = len(
-                    cached_data.get("climate_data", {}).get("dates", [])
-                )
+            # Entradas antigas (dict de listas) são rebuscadas
+            if isinstance(cached_data, ClimateColumns):
                 logger.info(
                     f"✅ Cache HIT (Redis): OpenMeteo Forecast "
-                    f"({lat:.4f}, {lng:.4f}) - {days_cached} days cached"
+                    f"({lat:.4f}, {lng:.4f}) - {len(cached_data)} days cached"
                 )
                 return cached_data
 
@@ -226,106 +268,48 @@ class OpenMeteoForecastClient:
 
         # 4. Fetch data from Forecast API
         try:
-            responses = self.client.weather_api(
-                self.config.BASE_URL, params=params
-            )
+            # Circuit breaker compartilhado (openmeteo_requests não é httpx)
+            guard = self.breaker.track() if self.breaker else nullcontext()
+            async with guard:
+                responses = self.client.weather_api(
+                    self.config.BASE_URL, params=params
+                )
             response = responses[0]  # Single location
 
-            # 5. Extract location metadata
-            location = {
-                "latitude": response.Latitude(),
-                "longitude": response.Longitude(),
-                "elevation": response.Elevation(),
-                "timezone": response.Timezone(),
-                "timezone_abbreviation": response.TimezoneAbbreviation(),
-                "utc_offset_seconds": response.UtcOffsetSeconds(),
-            }
-
-            # 6. Extract climate data
-            daily = response.Daily()
-            # Handle scalar (single day) vs array timestamps
-            time_data = daily.Time()  # type: ignore
-
-            logger.debug(f"Raw time_data type: {type(time_data)}")
-            logger.debug(f"Raw time_data value: {time_data}")
-            logger.debug(f"Has tolist: {hasattr(time_data, 'tolist')}")
-
-            if hasattr(time_data, "tolist"):
-                timestamps = time_data.tolist()  # type: ignore
-            else:
-                timestamps = [int(time_data)]
-
-            logger.debug(f"Timestamps extracted: {len(timestamps)} items")
-            logger.debug(f"First 3 timestamps: {timestamps[:3]}")
-
-            dates = [datetime.fromtimestamp(ts) for ts in timestamps]
-
-            logger.info(
-                f"✅ API returned {len(dates)} days: "
-                f"{dates[0].date()} to {dates[-1].date()} | "
-                f"Elevation: {location['elevation']}m"
+            # 5. Arrays NumPy do FlatBuffers direto para colunas
+            columns = ClimateColumns.from_openmeteo(
+                "openmeteo_forecast", response, self.config.DAILY_VARIABLES
+            )
+            columns.metadata["cache_ttl_hours"] = self._get_ttl_hours(
+                start_date, end_date
             )
 
-            climate_data = {"dates": dates}
-
-            # Map variables to data
-            for i, var_name in enumerate(self.config.DAILY_VARIABLES):
-                try:
-                    values = daily.Variables(i).ValuesAsNumpy()  # type: ignore
-                    # Handle scalar values (single day) vs arrays
-                    if hasattr(values, "tolist"):
-                        climate_data[var_name] = values.tolist()  # type: ignore  # noqa: E501
-                    else:
-                        # Scalar value - wrap in list
-                        climate_data[var_name] = [float(values)]  # type: ignore  # noqa: E501
-                except Exception as e:
-                    logger.warning(f"Variable {var_name} not available: {e}")
-                    climate_data[var_name] = [None] * len(dates)  # type: ignore  # noqa: E501
-
-            # Convert wind from 10m to 2m for FAO-56 PM equation
-            if "wind_speed_10m_mean" in climate_data:
-                wind_10m = climate_data["wind_speed_10m_mean"]  # type: ignore
-                wind_2m = [
-                    self.convert_wind_10m_to_2m(w) if w is not None else None  # type: ignore  # noqa: E501
-                    for w in wind_10m  # type: ignore
-                ]
-                climate_data["wind_speed_2m_mean"] = wind_2m  # type: ignore
-                logger.debug(
-                    f"✅ Converted wind 10m→2m: {len(wind_2m)} values"
+            if len(columns):
+                logger.info(
+                    f"✅ API returned {len(columns)} days: "
+                    f"{columns.dates[0]} to {columns.dates[-1]} | "
+                    f"Elevation: {columns.metadata['location']['elevation']}m"
                 )
 
-            # 7. Add metadata
-            metadata = {
-                "api": "forecast",
-                "url": self.config.BASE_URL,
-                "data_points": len(dates),
-                "cache_ttl_hours": self._get_ttl_hours(start_date, end_date),
-            }
-
-            result = {
-                "location": location,
-                "climate_data": climate_data,
-                "metadata": metadata,
-            }
-
-            logger.info(
-                f"✅ Forecast: {len(dates)} days | "
-                f"Elevation: {location['elevation']:.0f}m"
-            )
-
-            # 8. Save to Redis cache (if available)
+            # 6. Save to Redis cache (if available)
             if self.cache:
                 ttl = self._get_ttl_seconds(start_date, end_date)
                 cache_key = self._get_cache_key(lat, lng, start_date, end_date)
-                await self.cache.set(cache_key, result, ttl=ttl)
+                await self.cache.set(cache_key, columns, ttl=ttl)
                 logger.debug(f"💾 Cached with TTL {ttl}s")
 
-            return result
+            return columns
 
         except Exception as e:
             logger.error(f"Forecast API error: {str(e)}")
             raise
 
+    async def close(self) -> None:
+        """
+        Close the HTTP session (pooled connections + requests_cache).
+        """
+        self._session.close()
+
     @staticmethod
     def convert_wind_10m_to_2m(wind_10m: float | None) -> float | None:
         """
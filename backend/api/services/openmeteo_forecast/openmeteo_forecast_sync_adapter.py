@@ -24,13 +24,14 @@ CACHE STRATEGY (Nov 2025):
 - TTL dinâmico: 1h (forecast), 6h (recent)
 """
 
-import asyncio
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Union
 
 import pandas as pd
 from loguru import logger
 
+from backend.api.services.async_bridge import run_sync
+
 from backend.api.services.openmeteo_forecast.openmeteo_forecast_client import (
     OpenMeteoForecastClient,
 )
@@ -60,6 +61,8 @@ class OpenMeteoForecastSyncAdapter:
         """
         self.cache = cache  # Redis cache (opcional)
         self.cache_dir = cache_dir
+        # Cliente reutilizado entre chamadas (sessão HTTP + cache local)
+        self._client: OpenMeteoForecastClient | None = None
 
         cache_type = "Redis" if cache else "Local"
         logger.info(
@@ -67,6 +70,14 @@ class OpenMeteoForecastSyncAdapter:
             f"-25d to +5d = 30d total)"
         )
 
+    def _get_client(self) -> OpenMeteoForecastClient:
+        """Retorna o cliente do adapter, criando-o na primeira chamada."""
+        if self._client is None:
+            self._client = OpenMeteoForecastClient(
+                cache=self.cache, cache_dir=self.cache_dir
+            )
+        return self._client
+
     def get_daily_data_sync(
         self,
         lat: float,
@@ -119,31 +130,7 @@ class OpenMeteoForecastSyncAdapter:
             )
             end_date = datetime.combine(max_date, datetime.min.time())
 
-        # Executar async de forma segura (igual Archive adapter)
-        try:
-            # Tentar obter loop existente
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # Loop já está rodando (contexto de servidor async)
-                # Criar nova task no loop existente
-                import concurrent.futures
-
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run,
-                        self._async_get_data(lat, lon, start_date, end_date),
-                    )
-                    return future.result()
-            else:
-                # Loop existe mas não está rodando
-                return loop.run_until_complete(
-                    self._async_get_data(lat, lon, start_date, end_date)
-                )
-        except RuntimeError:
-            # Nenhum loop, criar um novo
-            return asyncio.run(
-                self._async_get_data(lat, lon, start_date, end_date)
-            )
+        return run_sync(self._async_get_data(lat, lon, start_date, end_date))
 
     async def _async_get_data(
         self,
@@ -158,9 +145,7 @@ class OpenMeteoForecastSyncAdapter:
         Usa best_match model, past_days=30, e wind_speed_unit=ms.
         """
         try:
-            client = OpenMeteoForecastClient(
-                cache=self.cache, cache_dir=self.cache_dir
-            )
+            client = self._get_client()
 
             response = await client.get_climate_data(
                 lat=lat,
@@ -220,24 +205,7 @@ class OpenMeteoForecastSyncAdapter:
         """
         Verifica se Forecast API está acessível (síncrono).
         """
-        try:
-            # Tentar obter loop existente
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # Loop já está rodando
-                import concurrent.futures
-
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run, self._async_health_check()
-                    )
-                    return future.result()
-            else:
-                # Loop existe mas não está rodando
-                return loop.run_until_complete(self._async_health_check())
-        except RuntimeError:
-            # Nenhum loop, criar um novo
-            return asyncio.run(self._async_health_check())
+        return run_sync(self._async_health_check())
 
     async def _async_health_check(self) -> bool:
         """
@@ -246,9 +214,7 @@ class OpenMeteoForecastSyncAdapter:
         Testa: Brasília, data atual, best_match model.
         """
         try:
-            client = OpenMeteoForecastClient(
-                cache=self.cache, cache_dir=self.cache_dir
-            )
+            client = self._get_client()
 
             # Testar com coordenadas de referência (Brasília)
             # Usar data atual (Forecast API sempre tem)
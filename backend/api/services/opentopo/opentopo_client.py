@@ -58,6 +58,7 @@ from loguru import logger
 from pydantic import BaseModel, Field
 
 from backend.api.services.geographic_utils import GeographicUtils
+from backend.infrastructure.http_replay import http_transport
 
 
 class OpenTopoConfig(BaseModel):
@@ -107,6 +108,7 @@ class OpenTopoClient:
             base_url=self.config.base_url,
             timeout=self.config.timeout,
             follow_redirects=True,
+            transport=http_transport("opentopo"),
         )
         logger.info(
             f"OpenTopoClient inicializado | "
@@ -35,8 +35,6 @@ Uso no Cálculo de ETo FAO-56:
    Aumenta ~10% por 1000m de altitude
 """
 
-import asyncio
-import concurrent.futures
 from typing import Any
 
 from loguru import logger
@@ -47,6 +45,7 @@ from backend.api.services.opentopo.opentopo_client import (
     OpenTopoConfig,
     OpenTopoLocation,
 )
+from backend.api.services.async_bridge import run_sync
 
 
 class OpenTopoSyncAdapter:
@@ -110,27 +109,7 @@ class OpenTopoSyncAdapter:
             ...     print(f"Elevation: {location.elevation}m")
             Elevation: 1172m
         """
-        try:
-            # Tentar obter loop existente
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # Loop já está rodando (contexto async)
-                # Usar executor para evitar "RuntimeError: This event loop
-                # is already running"
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run,
-                        self._async_get_elevation(lat, lon, dataset),
-                    )
-                    return future.result()
-            else:
-                # Loop existe mas não está rodando
-                return loop.run_until_complete(
-                    self._async_get_elevation(lat, lon, dataset)
-                )
-        except RuntimeError:
-            # Nenhum loop, criar um novo
-            return asyncio.run(self._async_get_elevation(lat, lon, dataset))
+        return run_sync(self._async_get_elevation(lat, lon, dataset))
 
     async def _async_get_elevation(
         self,
@@ -175,27 +154,7 @@ class OpenTopoSyncAdapter:
             >>> for loc in results:
             ...     print(f"{loc.lat}, {loc.lon}: {loc.elevation}m")
         """
-        try:
-            # Tentar obter loop existente
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # Loop já está rodando
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run,
-                        self._async_get_elevations_batch(locations, dataset),
-                    )
-                    return future.result()
-            else:
-                # Loop existe mas não está rodando
-                return loop.run_until_complete(
-                    self._async_get_elevations_batch(locations, dataset)
-                )
-        except RuntimeError:
-            # Nenhum loop, criar um novo
-            return asyncio.run(
-                self._async_get_elevations_batch(locations, dataset)
-            )
+        return run_sync(self._async_get_elevations_batch(locations, dataset))
 
     async def _async_get_elevations_batch(
         self,
@@ -226,21 +185,7 @@ class OpenTopoSyncAdapter:
         Returns:
             True (sempre, pois fallback é automático globalmente)
         """
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run,
-                        self._async_is_in_coverage(lat, lon),
-                    )
-                    return future.result()
-            else:
-                return loop.run_until_complete(
-                    self._async_is_in_coverage(lat, lon)
-                )
-        except RuntimeError:
-            return asyncio.run(self._async_is_in_coverage(lat, lon))
+        return run_sync(self._async_is_in_coverage(lat, lon))
 
     async def _async_is_in_coverage(self, lat: float, lon: float) -> bool:
         """
@@ -259,18 +204,7 @@ class OpenTopoSyncAdapter:
         Returns:
             bool: True if API is accessible
         """
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run, self._async_health_check()
-                    )
-                    return future.result()
-            else:
-                return loop.run_until_complete(self._async_health_check())
-        except RuntimeError:
-            return asyncio.run(self._async_health_check())
+        return run_sync(self._async_health_check())
 
     async def _async_health_check(self) -> bool:
         """
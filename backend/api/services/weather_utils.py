@@ -16,8 +16,9 @@ SINGLE SOURCE OF TRUTH para:
 - Métricas Prometheus para validações
 """
 
-from datetime import datetime, timezone
-from typing import Any, Dict, List
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Sequence
 from collections import defaultdict
 
 import numpy as np
@@ -618,7 +619,6 @@ class WeatherAggregationUtils:
         start_date: datetime,
         end_date: datetime,
         field_mapping: dict[str, str],
-        timezone_utils=None,
     ) -> dict[str, list[dict[str, Any]]]:
         """
         Aggregate hourly weather data into daily buckets.
@@ -634,12 +634,10 @@ class WeatherAggregationUtils:
             end_date: End date for aggregation (timezone-aware)
             field_mapping: Mapping of API field names to internal names
                           e.g., {'air_temperature': 'temperature_2m'}
-            timezone_utils: Optional TimezoneUtils instance for timezone
-                           handling (if None, uses datetime.date() for
-                           grouping)
 
         Returns:
-            Dictionary mapping dates (YYYY-MM-DD) to lists of hourly data
+            Dictionary mapping local dates (YYYY-MM-DD) to lists of hourly
+            data ('time' as UTC datetime)
 
         Example:
             >>> from datetime import datetime, timezone
@@ -656,64 +654,172 @@ class WeatherAggregationUtils:
             >>> print(result.keys())
             dict_keys(['2024-01-15'])
         """
+        entries = [entry for entry in timeseries if entry.get("time")]
+        if not entries:
+            return {}
+
+        # Parse vetorizado; timestamps inválidos viram NaT e são ignorados
+        # (timestamps sem offset são UTC, como TimezoneUtils.make_aware)
+        instants, local_dates = WeatherAggregationUtils.parse_hourly_times(
+            [entry["time"] for entry in entries]
+        )
+        start = WeatherAggregationUtils._to_utc_datetime64(start_date)
+        end = WeatherAggregationUtils._to_utc_datetime64(end_date)
+        selected = np.flatnonzero(
+            ~np.isnat(instants) & (instants >= start) & (instants <= end)
+        )
+        if selected.size < len(entries):
+            logger.debug(
+                f"{len(entries) - selected.size} entradas horárias fora do "
+                f"período ou com timestamp inválido"
+            )
+
         daily_data: dict[str, list[dict[str, Any]]] = {}
+        for i, day, dt in zip(
+            selected.tolist(),
+            local_dates[selected].astype(str).tolist(),
+            instants[selected].tolist(),
+        ):
+            entry = entries[i]
+            mapped_entry = {"time": dt.replace(tzinfo=timezone.utc)}
+            for api_field, internal_field in field_mapping.items():
+                if api_field in entry:
+                    mapped_entry[internal_field] = entry[api_field]
+            daily_data.setdefault(day, []).append(mapped_entry)
 
-        for entry in timeseries:
-            try:
-                time_str = entry.get("time")
-                if not time_str:
-                    continue
+        return daily_data
 
-                # Parse timestamp
-                if isinstance(time_str, str):
-                    # Handle ISO 8601 format
-                    if "T" in time_str:
-                        dt = datetime.fromisoformat(
-                            time_str.replace("Z", "+00:00")
-                        )
-                    else:
-                        dt = datetime.fromisoformat(time_str)
-                elif isinstance(time_str, datetime):
-                    dt = time_str
-                else:
-                    logger.warning(f"Invalid time format: {time_str}")
-                    continue
+    @staticmethod
+    def _to_utc_datetime64(value: datetime) -> np.datetime64:
+        """Converte datetime (naive = UTC) para datetime64[s] UTC."""
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return np.datetime64(value, "s")
 
-                # Make timezone-aware if needed
-                if timezone_utils and hasattr(timezone_utils, "make_aware"):
-                    dt = timezone_utils.make_aware(dt)
-                elif dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
+    @staticmethod
+    def parse_hourly_times(
+        times: Sequence[Any],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Converte timestamps ISO 8601 em arrays de instante e data local.
 
-                # Filter by date range
-                if not (start_date <= dt <= end_date):
-                    continue
+        O parse é feito pelo NumPy sobre o trecho 'YYYY-MM-DDTHH:MM:SS';
+        o offset ('Z', '+HH:MM', ausente = UTC) é lido do sufixo. A data
+        local é a do próprio timestamp, como ``datetime.date()``:
+        '2024-01-15T22:00:00-05:00' pertence a 2024-01-15, embora seja
+        03:00 UTC do dia seguinte.
 
-                # Extract date key (YYYY-MM-DD)
-                date_key = dt.date().isoformat()
+        Args:
+            times: Strings ISO 8601 ou datetimes
 
-                # Initialize daily bucket
-                if date_key not in daily_data:
-                    daily_data[date_key] = []
+        Returns:
+            (instantes UTC datetime64[s], datas locais datetime64[D]);
+            timestamps inválidos viram NaT
+        """
+        texts = [t if isinstance(t, str) else t.isoformat() for t in times]
+        try:
+            local = np.array([t[:19] for t in texts], dtype="datetime64[s]")
+        except ValueError:
+            local = np.array(
+                [_parse_local_time(t[:19]) for t in texts],
+                dtype="datetime64[s]",
+            )
+        offsets = np.array(
+            [_utc_offset_seconds(t[19:]) for t in texts],
+            dtype="timedelta64[s]",
+        )
+        return local - offsets, local.astype("datetime64[D]")
 
-                # Map fields to internal names
-                mapped_entry = {"time": dt}
-                for api_field, internal_field in field_mapping.items():
-                    if api_field in entry:
-                        value = entry[api_field]
-                        # Handle nested data structures
-                        if isinstance(value, dict):
-                            mapped_entry[internal_field] = value
-                        else:
-                            mapped_entry[internal_field] = value
+    @staticmethod
+    def daily_reduce(
+        dates: np.ndarray,
+        columns: dict[str, np.ndarray],
+        reductions: dict[str, Sequence[str]],
+    ) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+        """
+        Redução agrupada por data de colunas horárias (vetorizada).
 
-                daily_data[date_key].append(mapped_entry)
+        Agrupa com ``np.unique`` e reduz com ``np.bincount`` (soma,
+        contagem, média) e ``ufunc.at`` (máximo, mínimo). NaN = ausente.
 
-            except Exception as e:
-                logger.warning(f"Error processing hourly entry: {e}")
-                continue
+        Args:
+            dates: Data (datetime64[D]) de cada hora
+            columns: {variável: array float64 horário}
+            reductions: {variável: ('mean', 'max', 'min', 'sum', 'count')}
 
-        return daily_data
+        Returns:
+            (dias ordenados, {'{variável}_{função}': array por dia});
+            mean/max/min de dia sem valores = NaN, sum = 0
+
+        Example:
+            >>> days, stats = WeatherAggregationUtils.daily_reduce(
+            ...     dates,
+            ...     {'temp': temps, 'precip': precips},
+            ...     {'temp': ('mean', 'max', 'min'), 'precip': ('sum',)},
+            ... )
+            >>> stats['temp_max']
+        """
+        days, inverse = np.unique(dates, return_inverse=True)
+        n_days = days.size
+        stats: dict[str, np.ndarray] = {}
+
+        for name, funcs in reductions.items():
+            values = np.asarray(columns[name], dtype=np.float64)
+            valid = ~np.isnan(values)
+            groups = inverse[valid]
+            present = values[valid]
+            count = np.bincount(groups, minlength=n_days)
+
+            for func in funcs:
+                if func == "count":
+                    out = count.astype(np.float64)
+                elif func in ("sum", "mean"):
+                    out = np.bincount(groups, present, minlength=n_days)
+                    if func == "mean":
+                        out = np.divide(
+                            out,
+                            count,
+                            out=np.full(n_days, np.nan),
+                            where=count > 0,
+                        )
+                elif func in ("max", "min"):
+                    ufunc = np.maximum if func == "max" else np.minimum
+                    out = np.full(n_days, -np.inf if func == "max" else np.inf)
+                    ufunc.at(out, groups, present)
+                    out[count == 0] = np.nan
+                else:
+                    raise ValueError(f"Redução desconhecida: {func}")
+                stats[f"{name}_{func}"] = out
+
+        return days, stats
+
+
+@lru_cache(maxsize=64)
+def _utc_offset_seconds(suffix: str) -> int | None:
+    """
+    Offset UTC em segundos a partir do sufixo de um timestamp ISO 8601.
+
+    Aceita frações de segundo antes do offset ('.000Z'). Sufixo vazio é
+    tratado como UTC; sufixo inválido retorna None (vira NaT).
+    """
+    suffix = suffix.lstrip(".0123456789")
+    if suffix in ("", "Z"):
+        return 0
+    try:
+        offset = datetime.fromisoformat(f"2000-01-01T00:00:00{suffix}")
+    except ValueError:
+        return None
+    return int(offset.utcoffset().total_seconds())
+
+
+def _parse_local_time(text: str) -> str:
+    """Valida um timestamp sem offset para o NumPy ('NaT' se inválido)."""
+    try:
+        np.datetime64(text, "s")
+    except ValueError:
+        logger.warning(f"Invalid time format: {text}")
+        return "NaT"
+    return text
 
 
 class CacheUtils:
@@ -721,7 +827,8 @@ class CacheUtils:
     Utilitários para cache de respostas HTTP de APIs climáticas.
 
     Centraliza parsing de headers HTTP e cálculo de TTL para cache.
-    Usado por clientes como MET Norway para implementar conditional requests.
+    Usado pelo HTTPResponseCache (infrastructure/cache/http_cache.py)
+    para validade e conditional requests de todos os clientes.
     """
 
     @staticmethod
@@ -784,6 +891,71 @@ class CacheUtils:
         # Cap entre 60s e 86400s (24h)
         return max(60, min(ttl, 86400))
 
+    @staticmethod
+    def parse_cache_control(header: str | None) -> dict[str, str | None]:
+        """
+        Parse do header Cache-Control em diretivas.
+
+        Args:
+            header: Header string (e.g., "public, max-age=3600")
+
+        Returns:
+            Dict {diretiva em minúsculas: valor ou None}
+
+        Exemplo:
+            >>> CacheUtils.parse_cache_control('max-age=60, no-cache')
+            {'max-age': '60', 'no-cache': None}
+        """
+        directives: dict[str, str | None] = {}
+        for part in (header or "").split(","):
+            name, sep, value = part.strip().partition("=")
+            if name:
+                directives[name.lower()] = value.strip('"') if sep else None
+        return directives
+
+    @staticmethod
+    def response_expires(headers: Mapping[str, str]) -> datetime | None:
+        """
+        Instante de expiração de uma resposta HTTP (RFC 7234 §4.2.1).
+
+        Cache-Control max-age tem precedência sobre Expires; o header Age
+        é descontado do max-age.
+
+        Args:
+            headers: Headers da resposta (chaves em minúsculas ou
+                httpx.Headers)
+
+        Returns:
+            Datetime timezone-aware UTC ou None se a resposta não
+            informa validade
+        """
+        directives = CacheUtils.parse_cache_control(
+            headers.get("cache-control")
+        )
+        max_age = directives.get("max-age")
+        if max_age is not None:
+            try:
+                age = int(headers.get("age") or 0)
+                return datetime.now(timezone.utc) + timedelta(
+                    seconds=int(max_age) - age
+                )
+            except ValueError:
+                logger.warning(f"Invalid max-age/Age: {max_age}")
+
+        return CacheUtils.parse_rfc1123_date(headers.get("expires"))
+
+
+# Campos horários MET Norway extraídos em colunas (ordem da extração)
+MET_HOURLY_FIELDS = (
+    "temp",  # instant.air_temperature
+    "humidity",  # instant.relative_humidity
+    "wind_speed",  # instant.wind_speed (10m)
+    "precipitation_1h",  # next_1_hours.precipitation_amount
+    "precipitation_6h",  # next_6_hours.precipitation_amount
+    "temp_max_6h",  # next_6_hours.air_temperature_max
+    "temp_min_6h",  # next_6_hours.air_temperature_min
+)
+
 
 class METNorwayAggregationUtils:
     """
@@ -1031,6 +1203,160 @@ class METNorwayAggregationUtils:
         result.sort(key=lambda x: x["date"])
         return result
 
+    @staticmethod
+    def extract_hourly_columns(
+        timeseries: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Extrai a timeseries MET Norway em colunas NumPy numa só passada.
+
+        Args:
+            timeseries: Lista de entradas horárias da API
+
+        Returns:
+            Dict com 'time' (lista de timestamps) e um array float64 por
+            campo de MET_HOURLY_FIELDS (NaN = ausente)
+        """
+        rows = []
+        for entry in timeseries:
+            time_str = entry.get("time")
+            if not time_str:
+                continue
+            data = entry.get("data") or {}
+            instant = (data.get("instant") or {}).get("details") or {}
+            next_1h = (data.get("next_1_hours") or {}).get("details") or {}
+            next_6h = (data.get("next_6_hours") or {}).get("details") or {}
+            rows.append(
+                (
+                    time_str,
+                    instant.get("air_temperature"),
+                    instant.get("relative_humidity"),
+                    instant.get("wind_speed"),
+                    next_1h.get("precipitation_amount"),
+                    next_6h.get("precipitation_amount"),
+                    next_6h.get("air_temperature_max"),
+                    next_6h.get("air_temperature_min"),
+                )
+            )
+
+        if not rows:
+            return {"time": []}
+
+        times, *values = zip(*rows)
+        columns: Dict[str, Any] = {"time": list(times)}
+        for name, column in zip(MET_HOURLY_FIELDS, values):
+            # None → NaN na conversão
+            columns[name] = np.array(column, dtype=np.float64)
+        return columns
+
+    @staticmethod
+    def aggregate_timeseries(
+        timeseries: List[Dict[str, Any]],
+        start_date: datetime,
+        end_date: datetime,
+        weather_utils: WeatherConversionUtils | None = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Agrega a timeseries horária MET Norway em registros diários.
+
+        Caminho vetorizado equivalente a ``aggregate_hourly_to_daily`` +
+        ``calculate_daily_aggregations``: extrai as colunas uma vez,
+        filtra o período com máscara e reduz por data local com
+        ``daily_reduce`` (np.unique + np.bincount), sem listas Python por
+        dia.
+
+        Args:
+            timeseries: Lista de entradas horárias da API
+            start_date: Data inicial (naive = UTC)
+            end_date: Data final (naive = UTC)
+            weather_utils: Instância de WeatherConversionUtils
+
+        Returns:
+            Lista de registros diários ordenada por data (mesmas chaves
+            de ``calculate_daily_aggregations``)
+        """
+        weather_utils = weather_utils or WeatherConversionUtils()
+        columns = METNorwayAggregationUtils.extract_hourly_columns(timeseries)
+        if not columns["time"]:
+            return []
+
+        instants, local_dates = WeatherAggregationUtils.parse_hourly_times(
+            columns.pop("time")
+        )
+        start = WeatherAggregationUtils._to_utc_datetime64(start_date)
+        end = WeatherAggregationUtils._to_utc_datetime64(end_date)
+        mask = ~np.isnat(instants) & (instants >= start) & (instants <= end)
+        if not mask.any():
+            return []
+
+        days, daily = WeatherAggregationUtils.daily_reduce(
+            local_dates[mask],
+            {name: values[mask] for name, values in columns.items()},
+            {
+                "temp": ("mean", "max", "min"),
+                "humidity": ("mean",),
+                "wind_speed": ("mean",),
+                "precipitation_1h": ("sum", "count"),
+                "precipitation_6h": ("mean", "count"),
+                "temp_max_6h": ("max",),
+                "temp_min_6h": ("min",),
+            },
+        )
+
+        # Extremos: preferir 6h, fallback instantâneo
+        temp_max = np.where(
+            np.isnan(daily["temp_max_6h_max"]),
+            daily["temp_max"],
+            daily["temp_max_6h_max"],
+        )
+        temp_min = np.where(
+            np.isnan(daily["temp_min_6h_min"]),
+            daily["temp_min"],
+            daily["temp_min_6h_min"],
+        )
+
+        # Precipitação: priorizar 1h (soma), fallback 6h (média, assume
+        # overlap entre janelas), senão 0
+        precipitation = np.where(
+            daily["precipitation_1h_count"] > 0,
+            daily["precipitation_1h_sum"],
+            np.where(
+                daily["precipitation_6h_count"] > 0,
+                daily["precipitation_6h_mean"],
+                0.0,
+            ),
+        )
+
+        def _optional(values: np.ndarray) -> List[float | None]:
+            return [None if v != v else v for v in values.tolist()]
+
+        records = zip(
+            days.tolist(),
+            _optional(temp_max),
+            _optional(temp_min),
+            _optional(daily["temp_mean"]),
+            _optional(daily["humidity_mean"]),
+            precipitation.tolist(),
+            _optional(daily["wind_speed_mean"]),
+        )
+        return [
+            {
+                "date": day,
+                "temp_max": t_max,
+                "temp_min": t_min,
+                "temp_mean": t_mean,
+                "humidity_mean": humidity,
+                "precipitation_sum": precip,
+                # Vento: converter 10m → 2m usando FAO-56
+                "wind_speed_2m_mean": weather_utils.convert_wind_10m_to_2m(
+                    wind_10m
+                ),
+            }
+            for day, t_max, t_min, t_mean, humidity, precip, wind_10m in (
+                records
+            )
+        ]
+
     @staticmethod
     def validate_daily_data(daily_data: List[Dict[str, Any]]) -> bool:
         """
@@ -1,62 +1,72 @@
-# core
-from backend.api.services.climate_factory import ClimateClientFactory
-from backend.api.services.climate_source_manager import ClimateSourceManager
-from backend.api.services.climate_source_selector import ClimateSourceSelector
-from backend.api.services.climate_validation import ClimateValidationService
-
-# clients
-from backend.api.services.nasa_power.nasa_power_client import NASAPowerClient
-from backend.api.services.openmeteo_archive.openmeteo_archive_client import (
-    OpenMeteoArchiveClient,
-)
-from backend.api.services.openmeteo_forecast.openmeteo_forecast_client import (
-    OpenMeteoForecastClient,
-)
-from backend.api.services.met_norway.met_norway_client import (
-    METNorwayClient,
-)
-from backend.api.services.nws_forecast.nws_forecast_client import (
-    NWSForecastClient,
-)
-from backend.api.services.nws_stations.nws_stations_client import (
-    NWSStationsClient,
-)
-
-# adapters
-from backend.api.services.nasa_power.nasa_power_sync_adapter import (
-    NASAPowerSyncAdapter,
-)
-from backend.api.services.openmeteo_archive.openmeteo_archive_sync_adapter import (  # noqa: E501
-    OpenMeteoArchiveSyncAdapter,
-)
-from backend.api.services.openmeteo_forecast.openmeteo_forecast_sync_adapter import (  # noqa: E501
-    OpenMeteoForecastSyncAdapter,
-)
-from backend.api.services.nws_forecast.nws_forecast_sync_adapter import (
-    NWSDailyForecastSyncAdapter,
-)
-from backend.api.services.nws_stations.nws_stations_sync_adapter import (
-    NWSStationsSyncAdapter,
-)
-
-
-__all__ = [
-    # Core
-    "ClimateClientFactory",
-    "ClimateSourceManager",
-    "ClimateSourceSelector",
-    "ClimateValidationService",
-    # Clients
-    "NASAPowerClient",
-    "OpenMeteoArchiveClient",
-    "OpenMeteoForecastClient",
-    "METNorwayClient",
-    "NWSForecastClient",
-    "NWSStationsClient",
-    # Adapters
-    "NASAPowerSyncAdapter",
-    "OpenMeteoArchiveSyncAdapter",
-    "OpenMeteoForecastSyncAdapter",
-    "NWSDailyForecastSyncAdapter",
-    "NWSStationsSyncAdapter",
-]
+"""
+Núcleo do EVAonline (cálculo ETo, processamento, analytics).
+
+Os atalhos abaixo (serviços, clients e adapters climáticos) são
+carregados sob demanda: importar qualquer submódulo de backend.core
+(ex.: backend.core.analytics nas rotas) não deve trazer pandas, numpy
+e os clients HTTP para o processo.
+"""
+
+import importlib
+from typing import Any
+
+_LAZY_IMPORTS = {
+    # core
+    "ClimateClientFactory": "backend.api.services.climate_factory",
+    "ClimateSourceManager": "backend.api.services.climate_source_manager",
+    "ClimateSourceSelector": "backend.api.services.climate_source_selector",
+    "ClimateValidationService": "backend.api.services.climate_validation",
+    # clients
+    "NASAPowerClient": "backend.api.services.nasa_power.nasa_power_client",
+    "OpenMeteoArchiveClient": (
+        "backend.api.services.openmeteo_archive.openmeteo_archive_client"
+    ),
+    "OpenMeteoForecastClient": (
+        "backend.api.services.openmeteo_forecast.openmeteo_forecast_client"
+    ),
+    "METNorwayClient": "backend.api.services.met_norway.met_norway_client",
+    "NWSForecastClient": (
+        "backend.api.services.nws_forecast.nws_forecast_client"
+    ),
+    "NWSStationsClient": (
+        "backend.api.services.nws_stations.nws_stations_client"
+    ),
+    # adapters
+    "NASAPowerSyncAdapter": (
+        "backend.api.services.nasa_power.nasa_power_sync_adapter"
+    ),
+    "OpenMeteoArchiveSyncAdapter": (
+        "backend.api.services.openmeteo_archive."
+        "openmeteo_archive_sync_adapter"
+    ),
+    "OpenMeteoForecastSyncAdapter": (
+        "backend.api.services.openmeteo_forecast."
+        "openmeteo_forecast_sync_adapter"
+    ),
+    "NWSDailyForecastSyncAdapter": (
+        "backend.api.services.nws_forecast.nws_forecast_sync_adapter"
+    ),
+    "NWSStationsSyncAdapter": (
+        "backend.api.services.nws_stations.nws_stations_sync_adapter"
+    ),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Lazy loading dos atalhos de backend.core.
+
+    Args:
+        name: Nome da classe a ser importada
+
+    Returns:
+        Classe importada dinamicamente
+    """
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name])
+        return getattr(module, name)
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+__all__ = list(_LAZY_IMPORTS)
@@ -52,6 +52,18 @@ def __getattr__(name: str) -> Any:
             "backend.core.data_processing.data_preprocessing",
             "preprocessing",
         ),
+        "preprocess_block": (
+            "backend.core.data_processing.data_preprocessing",
+            "preprocess_block",
+        ),
+        "PreprocessingReport": (
+            "backend.core.data_processing.data_preprocessing",
+            "PreprocessingReport",
+        ),
+        "preprocess_stream": (
+            "backend.core.data_processing.data_preprocessing",
+            "preprocess_stream",
+        ),
         # Kalman ensemble
         "KalmanEnsembleStrategy": (
             "backend.core.data_processing.kalman_ensemble",
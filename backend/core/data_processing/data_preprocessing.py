@@ -1,7 +1,20 @@
+import calendar
 import os
 import pickle
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import timedelta
-from typing import List, Optional, Tuple
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 import pandas as pd
@@ -13,6 +26,58 @@ from loguru import logger
 REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379/0")
 CACHE_EXPIRY_HOURS = 24  # 24 hours
 
+# Colunas calculadas a partir do índice (Ra e termos FAO-56)
+DERIVED_COLUMNS = ("day_of_year", "Ra", "dr", "delta", "omega_s")
+
+# Janelas de preprocess_stream (aliases → frequência pandas)
+CHUNK_FREQUENCIES = {"year": "YS", "season": "QS-DEC"}
+
+# Colunas de radiação validadas contra Ra (0.03Ra ≤ Rs < Ra)
+RADIATION_COLUMNS = ("ALLSKY_SFC_SW_DWN", "shortwave_radiation_sum")
+
+# Colunas fora da detecção IQR: já têm limites físicos estritos
+IQR_EXCLUDED_COLUMNS = frozenset(
+    {
+        "Ra",
+        "dr",
+        "delta",
+        "omega_s",  # Calculated parameters
+        # Temperature variables (already validated with physical limits)
+        "T2M_MAX",
+        "T2M_MIN",
+        "T2M",
+        "temperature_2m_max",
+        "temperature_2m_min",
+        "temperature_2m_mean",
+        "temp_celsius",
+        # Humidity variables (already validated 0-100%)
+        "RH2M",
+        "relative_humidity_2m_max",
+        "relative_humidity_2m_mean",
+        "relative_humidity_2m_min",
+        "humidity_percent",
+        # Wind variables (already validated 0-100 m/s)
+        "WS2M",
+        "wind_speed_10m_max",
+        "wind_speed_10m_mean",
+        "wind_speed_ms",
+        # Precipitation variables (already validated 0-450 mm)
+        "PRECTOTCORR",
+        "precipitation_sum",
+        "precipitation_mm",
+        # Radiation variables (validated with Ra)
+        "ALLSKY_SFC_SW_DWN",
+        "shortwave_radiation_sum",
+        # Duration variables (validated 0-24h)
+        "daylight_duration",
+        "sunshine_duration",
+        # Pressure variables (validated 900-1100 hPa)
+        "pressure_mean_sea_level",
+        # ETo variables (validated 0-15 mm/day)
+        "et0_fao_evapotranspiration",
+    }
+)
+
 
 def _get_validation_limits(
     region: str = "global",
@@ -106,6 +171,60 @@ def _get_validation_limits(
         return global_limits
 
 
+def _radiation_parameters(
+    index: pd.DatetimeIndex, latitude: float
+) -> Dict[str, np.ndarray]:
+    """
+    Calcula Ra (FAO-56, Eq. 21) e seus termos para cada linha.
+
+    O ano bissexto é decidido pelo ano mais frequente do índice.
+
+    Returns:
+        Dict[str, np.ndarray]: day_of_year, Ra, dr, delta e omega_s
+    """
+    day_of_year = index.dayofyear.to_numpy()
+    year = index.year.value_counts().index[0]
+    total_days_in_year = 366 if calendar.isleap(year) else 365
+
+    phi = latitude * np.pi / 180
+    angle = 2 * np.pi * day_of_year / total_days_in_year
+    dr = 1 + 0.033 * np.cos(angle)
+    delta = 0.409 * np.sin(angle - 1.39)
+    omega_s = np.arccos(-np.tan(phi) * np.tan(delta))
+    const = (24 * 60 * 0.0820) / np.pi
+    ra = (
+        const
+        * dr
+        * (
+            omega_s * np.sin(phi) * np.sin(delta)
+            + np.cos(phi) * np.cos(delta) * np.sin(omega_s)
+        )
+    )
+    return {
+        "day_of_year": day_of_year,
+        "Ra": ra,
+        "dr": dr,
+        "delta": delta,
+        "omega_s": omega_s,
+    }
+
+
+def _adaptive_iqr_factor(col_name: str, iqr_factor: float) -> float:
+    """Get adaptive IQR factor based on variable name."""
+    col_lower = col_name.lower()
+
+    # Strict factors for variables with low expected variability
+    if any(term in col_lower for term in ["pressure", "duration", "sunshine"]):
+        return iqr_factor * 0.8  # 1.2
+
+    # Lenient factors for variables with high natural variability
+    if any(term in col_lower for term in ["evapotranspiration", "eto"]):
+        return iqr_factor * 1.5  # 2.25
+
+    # Default factor for others
+    return iqr_factor
+
+
 @shared_task
 def data_initial_validate(
     weather_df: pd.DataFrame, latitude: float, region: str = "global"
@@ -159,64 +278,18 @@ def data_initial_validate(
         raise ValueError(msg)
 
     weather_df = weather_df.copy()
-    if isinstance(weather_df.index, pd.DatetimeIndex):
-        weather_df["day_of_year"] = weather_df.index.dayofyear
-    else:
-        raise ValueError("DataFrame index must be DatetimeIndex")
-
-    def is_leap_year(year: int) -> bool:
-        return (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
-
-    if isinstance(weather_df.index, pd.DatetimeIndex):
-        # Use the most common year in the dataset for leap year calculation
-        year = weather_df.index.year.value_counts().index[0]
-    else:
+    if not isinstance(weather_df.index, pd.DatetimeIndex):
         raise ValueError("DataFrame index must be DatetimeIndex")
-    total_days_in_year = 366 if is_leap_year(year) else 365
-
-    # Calculate extraterrestrial radiation (Ra) - optimized for unique
-    # day_of_year values
-    phi = latitude * np.pi / 180
-    unique_days = weather_df["day_of_year"].unique()
-    day_of_year_unique = unique_days.astype(float)
-
-    dr = 1 + 0.033 * np.cos(
-        2 * np.pi * day_of_year_unique / total_days_in_year
-    )
-    delta = 0.409 * np.sin(
-        (2 * np.pi * day_of_year_unique / total_days_in_year) - 1.39
-    )
-    omega_s = np.arccos(-np.tan(phi) * np.tan(delta))
-    const = (24 * 60 * 0.0820) / np.pi
-    Ra_unique = (
-        const
-        * dr
-        * (
-            omega_s * np.sin(phi) * np.sin(delta)
-            + np.cos(phi) * np.cos(delta) * np.sin(omega_s)
-        )
-    )
 
-    # Create mapping from day_of_year to Ra
-    ra_mapping = dict(zip(unique_days, Ra_unique))
-
-    # Apply Ra values to DataFrame
-    weather_df["Ra"] = weather_df["day_of_year"].map(ra_mapping)
+    # Extraterrestrial radiation (Ra) and its terms, stored for reference
+    for name, values in _radiation_parameters(
+        weather_df.index, latitude
+    ).items():
+        weather_df[name] = values
     if not (weather_df["Ra"] > 0).all():
         warnings.append("Invalid Ra values detected.")
         logger.error(warnings[-1])
 
-    # Store additional parameters for reference
-    weather_df["dr"] = weather_df["day_of_year"].map(
-        dict(zip(unique_days, dr))
-    )
-    weather_df["delta"] = weather_df["day_of_year"].map(
-        dict(zip(unique_days, delta))
-    )
-    weather_df["omega_s"] = weather_df["day_of_year"].map(
-        dict(zip(unique_days, omega_s))
-    )
-
     # Apply physical limits based on region
     # Suporta TODAS as variáveis retornadas pelas 7 fontes de dados para ETo:
     # NASA POWER, Open-Meteo Archive/Forecast,
@@ -323,53 +396,11 @@ def detect_outliers_iqr(
         )
         logger.warning(warnings[-1])
 
-    # Exclude columns that already have strict physical validation
-    # These variables have well-defined physical limits, so IQR is redundant
-    excluded_cols = {
-        "Ra",
-        "dr",
-        "delta",
-        "omega_s",  # Calculated parameters
-        # Temperature variables (already validated with physical limits)
-        "T2M_MAX",
-        "T2M_MIN",
-        "T2M",
-        "temperature_2m_max",
-        "temperature_2m_min",
-        "temperature_2m_mean",
-        "temp_celsius",
-        # Humidity variables (already validated 0-100%)
-        "RH2M",
-        "relative_humidity_2m_max",
-        "relative_humidity_2m_mean",
-        "relative_humidity_2m_min",
-        "humidity_percent",
-        # Wind variables (already validated 0-100 m/s)
-        "WS2M",
-        "wind_speed_10m_max",
-        "wind_speed_10m_mean",
-        "wind_speed_ms",
-        # Precipitation variables (already validated 0-450 mm)
-        "PRECTOTCORR",
-        "precipitation_sum",
-        "precipitation_mm",
-        # Radiation variables (validated with Ra)
-        "ALLSKY_SFC_SW_DWN",
-        "shortwave_radiation_sum",
-        # Duration variables (validated 0-24h)
-        "daylight_duration",
-        "sunshine_duration",
-        # Pressure variables (validated 900-1100 hPa)
-        "pressure_mean_sea_level",
-        # ETo variables (validated 0-15 mm/day)
-        "et0_fao_evapotranspiration",
-    }
-
     # Get numeric columns excluding already validated ones
     numeric_cols = [
         col
         for col in weather_df.columns
-        if col not in excluded_cols
+        if col not in IQR_EXCLUDED_COLUMNS
         and weather_df[col].dtype
         in [np.float64, np.int64, np.float32, np.int32]
     ]
@@ -382,35 +413,6 @@ def detect_outliers_iqr(
         logger.info(warnings[-1])
         return weather_df, warnings
 
-    # Adaptive IQR factors based on variable characteristics
-    adaptive_factors = {
-        # Variables that might have natural variability - use stricter IQR
-        "default": iqr_factor,  # 1.5
-        # Variables with high natural variability - use more lenient IQR
-        "lenient": iqr_factor * 1.5,  # 2.25
-        # Variables with low variability - use stricter IQR
-        "strict": iqr_factor * 0.8,  # 1.2
-    }
-
-    # Determine IQR factor for each variable
-    def get_iqr_factor(col_name: str) -> float:
-        """Get adaptive IQR factor based on variable name."""
-        col_lower = col_name.lower()
-
-        # Strict factors for variables with low expected variability
-        if any(
-            term in col_lower for term in ["pressure", "duration", "sunshine"]
-        ):
-            return adaptive_factors["strict"]
-
-        # Lenient factors for variables with high natural variability
-        elif any(term in col_lower for term in ["evapotranspiration", "eto"]):
-            return adaptive_factors["lenient"]
-
-        # Default factor for others
-        else:
-            return adaptive_factors["default"]
-
     total_outliers_removed = 0
 
     for col in numeric_cols:
@@ -432,7 +434,7 @@ def detect_outliers_iqr(
             )
             continue
 
-        iqr_factor_adaptive = get_iqr_factor(col)
+        iqr_factor_adaptive = _adaptive_iqr_factor(col, iqr_factor)
 
         # Global IQR detection for short-term data (7-30 days)
         Q1 = col_data.quantile(0.25)
@@ -571,6 +573,489 @@ def data_impute(weather_df: pd.DataFrame) -> Tuple[pd.DataFrame, List[str]]:
     return weather_df, warnings
 
 
+@dataclass
+class PreprocessingReport:
+    """
+    Structured counts produced by preprocess_block.
+
+    Attributes:
+        rows: Number of rows processed
+        invalid: {column: values outside physical/Ra limits set to NaN}
+        outliers: {column: IQR outliers set to NaN}
+        imputed: {column: NaN values filled by interpolation}
+        unfilled: {column: NaN values left (column without any data)}
+        iqr_skipped: {column: "insufficient_data" | "no_variance"}
+        iqr_factors: {column: adaptive IQR factor used}
+        converted_radiation: Columns converted from J/m²/day to MJ/m²/day
+        invalid_ra: True if any Ra value is not positive
+        max_outlier_percent: Outlier share that triggers a warning
+    """
+
+    rows: int
+    invalid: Dict[str, int] = field(default_factory=dict)
+    outliers: Dict[str, int] = field(default_factory=dict)
+    imputed: Dict[str, int] = field(default_factory=dict)
+    unfilled: Dict[str, int] = field(default_factory=dict)
+    iqr_skipped: Dict[str, str] = field(default_factory=dict)
+    iqr_factors: Dict[str, float] = field(default_factory=dict)
+    converted_radiation: List[str] = field(default_factory=list)
+    invalid_ra: bool = False
+    max_outlier_percent: float = 5.0
+
+    def totals(self) -> Dict[str, int]:
+        """Total values per stage (invalid, outliers, imputed, unfilled)."""
+        return {
+            "invalid": sum(self.invalid.values()),
+            "outliers": sum(self.outliers.values()),
+            "imputed": sum(self.imputed.values()),
+            "unfilled": sum(self.unfilled.values()),
+        }
+
+    def to_warnings(self) -> List[str]:
+        """
+        Formats the counts as the text warnings of the staged pipeline.
+
+        Returns:
+            List[str]: One message per column/stage plus a summary
+        """
+
+        def percent(count: int) -> float:
+            return count / self.rows * 100 if self.rows else 0.0
+
+        messages = []
+        if self.invalid_ra:
+            messages.append("Invalid Ra values detected.")
+        for col in self.converted_radiation:
+            messages.append(f"Converted {col} from J/m²/day to MJ/m²/day")
+        for col, count in self.invalid.items():
+            messages.append(
+                f"Invalid values in {col}: {count} records "
+                f"({percent(count):.2f}%) replaced with NaN."
+            )
+        for col, reason in self.iqr_skipped.items():
+            detail = (
+                "no variance in data"
+                if reason == "no_variance"
+                else "insufficient data"
+            )
+            messages.append(f"Skipping outlier detection for {col}: {detail}.")
+        for col, count in self.outliers.items():
+            if percent(count) > self.max_outlier_percent:
+                messages.append(
+                    f"WARNING: High outlier percentage in {col}: "
+                    f"{count} outliers ({percent(count):.2f}%) "
+                    f"exceeds limit of {self.max_outlier_percent}%. "
+                    f"Consider reviewing data quality."
+                )
+            messages.append(
+                f"Detected {count} outliers in {col} "
+                f"({percent(count):.2f}%) using global IQR "
+                f"(factor: {self.iqr_factors[col]:.2f})."
+            )
+        for col, count in self.imputed.items():
+            messages.append(
+                f"Imputed {count} missing values in {col} "
+                f"({percent(count):.2f}%) using linear interpolation."
+            )
+        for col, count in self.unfilled.items():
+            messages.append(
+                f"Warning: {count} missing values in {col} could not be "
+                f"imputed (no valid data)."
+            )
+
+        totals = self.totals()
+        messages.append(
+            f"Preprocessing summary: {totals['invalid']} validation "
+            f"corrections, {totals['outliers']} outlier removals, "
+            f"{totals['imputed']} imputations performed."
+        )
+        return messages
+
+
+def _value_columns(weather_df: pd.DataFrame) -> List[str]:
+    """Numeric (non-bool, non-derived) columns that go into the block."""
+    return [
+        col
+        for col in weather_df.columns
+        if col not in DERIVED_COLUMNS
+        and pd.api.types.is_numeric_dtype(weather_df[col])
+        and not pd.api.types.is_bool_dtype(weather_df[col])
+    ]
+
+
+def _apply_physical_limits(
+    block: np.ndarray,
+    value_cols: List[str],
+    ra: np.ndarray,
+    region: str,
+    report: PreprocessingReport,
+) -> None:
+    """Converts radiation units and sets out-of-limit values to NaN."""
+    rad_idx = [
+        j for j, col in enumerate(value_cols) if col in RADIATION_COLUMNS
+    ]
+
+    # Radiação em J/m²/dia → MJ/m²/dia (antes dos limites)
+    for j in rad_idx:
+        column = block[:, j]
+        if np.isfinite(column).any() and np.nanmax(column) > 100:
+            column /= 1_000_000
+            report.converted_radiation.append(value_cols[j])
+            logger.info(
+                f"Converted {value_cols[j]} from J/m²/day to MJ/m²/day"
+            )
+
+    # Limites físicos por coluna, em broadcast sobre o bloco.
+    # Comparações com NaN são False: só valores presentes contam
+    limits = _get_validation_limits(region)
+    lower = np.full(len(value_cols), -np.inf)
+    upper = np.full(len(value_cols), np.inf)
+    closed_lower = np.ones(len(value_cols), dtype=bool)
+    closed_upper = np.ones(len(value_cols), dtype=bool)
+    for j, col in enumerate(value_cols):
+        if col in limits:
+            lower[j], upper[j], inclusive = limits[col]
+            closed_lower[j] = inclusive in ("left", "both")
+            closed_upper[j] = inclusive in ("right", "both")
+
+    invalid = (block < lower) | (~closed_lower & (block == lower))
+    invalid |= (block > upper) | (~closed_upper & (block == upper))
+    if rad_idx:
+        rad = block[:, rad_idx]
+        invalid[:, rad_idx] |= (rad < 0.03 * ra[:, None]) | (
+            rad >= ra[:, None]
+        )
+    block[invalid] = np.nan
+    report.invalid = {
+        value_cols[j]: int(count)
+        for j, count in enumerate(invalid.sum(axis=0))
+        if count
+    }
+
+
+def _global_quartiles(
+    sub: np.ndarray, iqr_cols: List[str]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Q1/Q3 of each column over the whole block (7-30 day windows)."""
+    q1, q3 = np.nanquantile(sub, [0.25, 0.75], axis=0)
+    return q1, q3
+
+
+def _remove_outliers(
+    block: np.ndarray,
+    value_cols: List[str],
+    iqr_factor: float,
+    report: PreprocessingReport,
+    quartiles: Callable[
+        [np.ndarray, List[str]], Tuple[np.ndarray, np.ndarray]
+    ] = _global_quartiles,
+) -> None:
+    """
+    Sets IQR outliers to NaN.
+
+    Args:
+        quartiles: Returns (Q1, Q3) for the sub-block of IQR columns,
+            broadcastable to it: one value per column (global) or one
+            per row and column (e.g. month-of-year statistics)
+    """
+    valid_counts = np.count_nonzero(~np.isnan(block), axis=0)
+    iqr_idx = []
+    for j, col in enumerate(value_cols):
+        if col in IQR_EXCLUDED_COLUMNS:
+            continue
+        if valid_counts[j] < 5:
+            report.iqr_skipped[col] = "insufficient_data"
+        else:
+            iqr_idx.append(j)
+    if not iqr_idx:
+        return
+
+    iqr_cols = [value_cols[j] for j in iqr_idx]
+    sub = block[:, iqr_idx]
+    q1, q3 = quartiles(sub, iqr_cols)
+    iqr = q3 - q1
+    factors = np.array(
+        [_adaptive_iqr_factor(col, iqr_factor) for col in iqr_cols]
+    )
+    no_variance = np.nanmax(sub, axis=0) == np.nanmin(sub, axis=0)
+    outliers = ((sub < q1 - factors * iqr) | (sub > q3 + factors * iqr)) & (
+        iqr > 0
+    )
+    rows, cols = np.nonzero(outliers)
+    block[rows, np.asarray(iqr_idx)[cols]] = np.nan
+
+    for k, col in enumerate(iqr_cols):
+        if no_variance[k]:
+            report.iqr_skipped[col] = "no_variance"
+            continue
+        report.iqr_factors[col] = float(factors[k])
+        count = int(outliers[:, k].sum())
+        if count:
+            report.outliers[col] = count
+
+
+def _impute_in_place(
+    block: np.ndarray,
+    value_cols: List[str],
+    report: PreprocessingReport,
+    anchor: Optional[np.ndarray] = None,
+) -> None:
+    """
+    Linear interpolation by position, written into the block.
+
+    Edges take the nearest value. With anchor (last row of the previous
+    chunk, position -1), leading gaps interpolate from it instead.
+    """
+    n_rows = len(block)
+    missing = np.isnan(block)
+    positions = np.arange(n_rows)
+    for j in np.flatnonzero(missing.any(axis=0)):
+        col_missing = missing[:, j]
+        present = ~col_missing
+        xp = positions[present]
+        fp = block[present, j]
+        if anchor is not None and not np.isnan(anchor[j]):
+            xp = np.concatenate(([-1], xp))
+            fp = np.concatenate(([anchor[j]], fp))
+        count = int(col_missing.sum())
+        if not len(xp):
+            report.unfilled[value_cols[j]] = count
+            continue
+        block[col_missing, j] = np.interp(positions[col_missing], xp, fp)
+        report.imputed[value_cols[j]] = count
+
+
+def _assemble_frame(
+    block: np.ndarray,
+    weather_df: pd.DataFrame,
+    value_cols: List[str],
+    params: Dict[str, np.ndarray],
+) -> pd.DataFrame:
+    """DataFrame over the block, with non-numeric and Ra columns."""
+    result = pd.DataFrame(
+        block, index=weather_df.index, columns=value_cols, copy=False
+    )
+    for col in weather_df.columns:
+        if col not in result.columns and col not in DERIVED_COLUMNS:
+            result[col] = weather_df[col]
+    for name, values in params.items():
+        result[name] = values
+    order = [
+        col for col in weather_df.columns if col not in DERIVED_COLUMNS
+    ] + list(params)
+    if list(result.columns) != order:
+        result = result[order]
+    return result
+
+
+def _check_inputs(weather_df: pd.DataFrame, latitude: float) -> None:
+    if weather_df.empty:
+        raise ValueError("Input DataFrame is empty.")
+    if not isinstance(weather_df.index, pd.DatetimeIndex):
+        raise ValueError(
+            "DataFrame index must be in datetime format (YYYY-MM-DD)."
+        )
+    if not (-90 <= latitude <= 90):
+        raise ValueError("Latitude must be between -90 and 90.")
+
+
+def preprocess_block(
+    weather_df: pd.DataFrame,
+    latitude: float,
+    region: str = "global",
+    iqr_factor: float = 1.5,
+    max_outlier_percent: float = 5.0,
+) -> Tuple[pd.DataFrame, PreprocessingReport]:
+    """
+    Fused preprocessing: validation, IQR outliers and imputation.
+
+    Same stages as data_initial_validate → detect_outliers_iqr →
+    data_impute, applied to a single float64 block copied once from the
+    DataFrame:
+
+    - Physical limits and the Ra check are broadcast masks over the block
+    - All quartiles come from one np.nanquantile call
+    - Interpolation writes into the block in place
+
+    Differences from the staged pipeline: radiation in J/m²/day is
+    converted before the limits are checked (the staged version
+    invalidated it first), values that were already NaN are not counted
+    as invalid, and day_of_year is treated as a derived column (no IQR).
+
+    Args:
+        weather_df (pd.DataFrame): Weather data with datetime index.
+        latitude (float): Latitude for Ra calculation, between -90 and 90.
+        region (str): "brazil" or "global" physical limits.
+        iqr_factor (float): Base factor for IQR bounds (default: 1.5).
+        max_outlier_percent (float): Outlier share per variable that
+            triggers a warning (default: 5.0%).
+
+    Returns:
+        Tuple[pd.DataFrame, PreprocessingReport]: Preprocessed DataFrame
+        (with Ra columns) and structured counts.
+    """
+    _check_inputs(weather_df, latitude)
+
+    report = PreprocessingReport(
+        rows=len(weather_df), max_outlier_percent=max_outlier_percent
+    )
+    params = _radiation_parameters(weather_df.index, latitude)
+    report.invalid_ra = not bool((params["Ra"] > 0).all())
+
+    value_cols = _value_columns(weather_df)
+    # Única cópia dos dados: todas as etapas trabalham neste bloco
+    block = weather_df[value_cols].to_numpy(dtype=np.float64, copy=True)
+
+    _apply_physical_limits(block, value_cols, params["Ra"], region, report)
+    _remove_outliers(block, value_cols, iqr_factor, report)
+    _impute_in_place(block, value_cols, report)
+    result = _assemble_frame(block, weather_df, value_cols, params)
+
+    totals = report.totals()
+    logger.info(
+        f"Preprocessing block ({len(block)}x{len(value_cols)}): "
+        f"{totals['invalid']} invalid, {totals['outliers']} outliers, "
+        f"{totals['imputed']} imputed"
+    )
+    return result, report
+
+
+class _MonthlyQuartiles:
+    """
+    Month-of-year Q1/Q3 over a rolling history of chunks.
+
+    For each calendar month, keeps the (post-limit) values of the last
+    history_years chunks that contained it; the quartiles of a chunk use
+    that history plus the chunk itself, so memory stays bounded by
+    history_years × 366 rows.
+    """
+
+    def __init__(self, history_years: int):
+        self.history_years = history_years
+        # {mês: deque[(colunas, valores do mês num chunk)]}
+        self.history: Dict[int, Deque[Tuple[Tuple[str, ...], np.ndarray]]]
+        self.history = {}
+
+    def __call__(
+        self, sub: np.ndarray, iqr_cols: List[str], months: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        key = tuple(iqr_cols)
+        q1 = np.full_like(sub, np.nan)
+        q3 = np.full_like(sub, np.nan)
+        for month in np.unique(months):
+            rows = months == month
+            past = self.history.setdefault(
+                int(month), deque(maxlen=self.history_years)
+            )
+            sample = np.vstack(
+                [values for cols, values in past if cols == key] + [sub[rows]]
+            )
+            # Colunas sem nenhum valor no mês ficam com quartis NaN
+            # (comparações falsas: nenhum outlier)
+            has_data = ~np.isnan(sample).all(axis=0)
+            if has_data.any():
+                q1[np.ix_(rows, has_data)], q3[np.ix_(rows, has_data)] = (
+                    np.nanquantile(sample[:, has_data], [0.25, 0.75], axis=0)
+                )
+            past.append((key, sub[rows].copy()))
+        return q1, q3
+
+
+def preprocess_stream(
+    weather_data: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+    latitude: float,
+    region: str = "global",
+    chunk: str = "year",
+    history_years: int = 10,
+    iqr_factor: float = 1.5,
+    max_outlier_percent: float = 5.0,
+) -> Iterator[Tuple[pd.DataFrame, PreprocessingReport]]:
+    """
+    Streaming preprocessing for multi-decade series (e.g. 1991-2020).
+
+    The series is processed in bounded chunks (yearly or seasonal
+    windows) with the same stages as preprocess_block, except that the
+    IQR bounds come from month-of-year quartiles over the chunk plus the
+    previous history_years chunks, instead of a single global IQR over
+    30 years. Gaps at the start of a chunk interpolate from the last row
+    of the previous one.
+
+    Args:
+        weather_data: DataFrame with datetime index (split by ``chunk``)
+            or an iterable of chronological DataFrames (already chunked,
+            e.g. read year by year)
+        latitude (float): Latitude for Ra calculation, between -90 and 90.
+        region (str): "brazil" or "global" physical limits.
+        chunk (str): "year", "season" (DJF/MAM/JJA/SON) or a pandas
+            frequency; ignored for iterables
+        history_years (int): Chunks kept per month for the quartiles.
+        iqr_factor (float): Base factor for IQR bounds (default: 1.5).
+        max_outlier_percent (float): Outlier share per variable that
+            triggers a warning (default: 5.0%).
+
+    Yields:
+        Tuple[pd.DataFrame, PreprocessingReport]: Cleaned chunk (with Ra
+        columns) and its structured counts.
+
+    Example:
+        >>> for clean, report in preprocess_stream(df_30y, -22.7):
+        ...     append_to_parquet(clean)
+    """
+    if not (-90 <= latitude <= 90):
+        raise ValueError("Latitude must be between -90 and 90.")
+
+    if isinstance(weather_data, pd.DataFrame):
+        _check_inputs(weather_data, latitude)
+        freq = CHUNK_FREQUENCIES.get(chunk, chunk)
+        chunks: Iterable[pd.DataFrame] = (
+            group
+            for _, group in weather_data.groupby(pd.Grouper(freq=freq))
+            if not group.empty
+        )
+    else:
+        chunks = weather_data
+
+    quartiles = _MonthlyQuartiles(history_years)
+    last_row: Dict[str, float] = {}
+    n_chunks = n_rows = 0
+
+    for weather_df in chunks:
+        _check_inputs(weather_df, latitude)
+        report = PreprocessingReport(
+            rows=len(weather_df), max_outlier_percent=max_outlier_percent
+        )
+        params = _radiation_parameters(weather_df.index, latitude)
+        report.invalid_ra = not bool((params["Ra"] > 0).all())
+        months = weather_df.index.month.to_numpy()
+
+        value_cols = _value_columns(weather_df)
+        block = weather_df[value_cols].to_numpy(dtype=np.float64, copy=True)
+
+        _apply_physical_limits(block, value_cols, params["Ra"], region, report)
+        _remove_outliers(
+            block,
+            value_cols,
+            iqr_factor,
+            report,
+            lambda sub, cols: quartiles(sub, cols, months),
+        )
+        anchor = np.array([last_row.get(col, np.nan) for col in value_cols])
+        _impute_in_place(block, value_cols, report, anchor)
+        last_row = dict(zip(value_cols, block[-1]))
+
+        n_chunks += 1
+        n_rows += len(block)
+        totals = report.totals()
+        logger.debug(
+            f"Preprocessing chunk {weather_df.index[0].date()}→"
+            f"{weather_df.index[-1].date()}: {totals['invalid']} invalid, "
+            f"{totals['outliers']} outliers, {totals['imputed']} imputed"
+        )
+        yield _assemble_frame(block, weather_df, value_cols, params), report
+
+    logger.info(f"Streaming preprocessing: {n_chunks} chunks, {n_rows} rows")
+
+
 @shared_task
 def preprocessing(
     weather_df: pd.DataFrame,
@@ -581,6 +1066,9 @@ def preprocessing(
     """
     Preprocessing pipeline: validation, outlier detection, and imputation.
 
+    The three stages run fused in preprocess_block; the structured counts
+    are formatted as text warnings (see PreprocessingReport.to_warnings).
+
     This function implements the complete preprocessing pipeline for climate
     data used in ETo calculations. Input data should already be spatially
     interpolated (e.g., via IDW/ADW methods as described in Xavier et al.
@@ -655,21 +1143,9 @@ def preprocessing(
             warnings.append(f"Unexpected cache error: {e}")
             logger.error(warnings[-1])
 
-    # Step 1: Initial validation
-    weather_df, validate_warnings = data_initial_validate(
-        weather_df, latitude, region
-    )
-    warnings.extend(validate_warnings)
-
-    # Step 2: Outlier detection with IQR
-    weather_df, outlier_warnings = detect_outliers_iqr(
-        weather_df, iqr_factor=1.5
-    )
-    warnings.extend(outlier_warnings)
-
-    # Step 3: Imputation
-    weather_df, impute_warnings = data_impute(weather_df)
-    warnings.extend(impute_warnings)
+    # Validation, outlier detection and imputation in one block
+    weather_df, report = preprocess_block(weather_df, latitude, region)
+    warnings.extend(report.to_warnings())
 
     # Save to cache
     if redis_client and cache_key:
@@ -693,28 +1169,4 @@ def preprocessing(
             warnings.append(f"Unexpected cache save error: {e}")
             logger.error(warnings[-1])
 
-    # Final summary: Count total operations performed
-    total_invalid = sum(
-        1
-        for w in warnings
-        if "Invalid values" in w and any(char.isdigit() for char in w)
-    )
-    total_outliers = sum(
-        1
-        for w in warnings
-        if "outliers" in w and any(char.isdigit() for char in w)
-    )
-    total_imputed = sum(
-        1
-        for w in warnings
-        if "missing values" in w and any(char.isdigit() for char in w)
-    )
-
-    warnings.append(
-        f"Preprocessing summary: {total_invalid} validation "
-        f"corrections, {total_outliers} outlier removals, "
-        f"{total_imputed} imputations performed."
-    )
-    logger.info(warnings[-1])
-
     return weather_df, warnings
@@ -163,11 +163,13 @@ class AdaptiveKalmanFilter:
             process_variance=max(process_var, 1e-5),
             measurement_variance=max(measurement_var, 0.01),
         )
+        # Um filtro por variável e dia: formatação só se DEBUG ativo
         logger.debug(
-            f"AdaptiveKalmanFilter initialized: "
-            f"normal={self.monthly_normal}, "
-            f"std={self.historical_std:.2f}, "
-            f"confidence={station_confidence:.2f}"
+            "AdaptiveKalmanFilter initialized: "
+            "normal={}, std={:.2f}, confidence={:.2f}",
+            self.monthly_normal,
+            self.historical_std,
+            station_confidence,
         )
 
     def update(
@@ -287,8 +289,9 @@ class ClimateKalmanFusion:
                     measurement_variance=measurement_variance
                 )
                 logger.debug(
-                    f"SimpleKalmanFilter created for {variable} "
-                    f"(confidence={station_confidence})"
+                    "SimpleKalmanFilter created for {} (confidence={})",
+                    variable,
+                    station_confidence,
                 )
 
             # Aplicar filtro
@@ -342,8 +345,11 @@ class ClimateKalmanFusion:
                     station_confidence=station_confidence,
                 )
                 logger.debug(
-                    f"AdaptiveKalmanFilter created for {variable} "
-                    f"(normal={normal:.2f}, std={std:.2f})"
+                    "AdaptiveKalmanFilter created for {} "
+                    "(normal={:.2f}, std={:.2f})",
+                    variable,
+                    normal,
+                    std,
                 )
 
             # Aplicar filtro com peso
@@ -393,8 +399,10 @@ class ClimateKalmanFusion:
         total_weight = sum(distance_weights)
         distance_weights = [w / total_weight for w in distance_weights]
 
-        logger.debug(
-            f"Fusing {n_stations} stations with weights: {distance_weights}"
+        logger.opt(lazy=True).debug(
+            "Fusing {} stations with weights: {}",
+            lambda: n_stations,
+            lambda: [round(w, 4) for w in distance_weights],
         )
 
         for station_idx, station in enumerate(stations_data):
@@ -516,7 +524,8 @@ class KalmanEnsembleStrategy:
         Returns:
             Dict com dados fusionados e qualidade
         """
-        logger.info(f"Auto fusion for ({latitude:.4f}, {longitude:.4f})")
+        # Chamado uma vez por dia da série: DEBUG, formatação adiada
+        logger.debug("Auto fusion for ({:.4f}, {:.4f})", latitude, longitude)
 
         # 1️⃣ Buscar histórico do PostgreSQL
         has_history, monthly_normals, historical_stds = (
@@ -525,7 +534,7 @@ class KalmanEnsembleStrategy:
 
         # 2️⃣ Decidir estratégia
         if has_history and monthly_normals:
-            logger.info("✅ Using Adaptive Kalman (with historical data)")
+            logger.debug("✅ Using Adaptive Kalman (with historical data)")
 
             # Determinar mês atual ou usar média anual
             current_month = datetime.now().month
@@ -539,7 +548,7 @@ class KalmanEnsembleStrategy:
                 station_confidence=0.85,  # Próximo aos 27 estudos
             )
         else:
-            logger.info("⚠️ Using Simple Kalman (no historical data)")
+            logger.debug("⚠️ Using Simple Kalman (no historical data)")
 
             if stations_data:
                 return self.fusion.fuse_multiple_stations(
@@ -583,7 +592,7 @@ class KalmanEnsembleStrategy:
             try:
                 cached = self.redis.get(cache_key)
                 if cached:
-                    logger.debug(f"✅ Redis HIT: {cache_key}")
+                    logger.debug("✅ Redis HIT: {}", cache_key)
                     data = json.loads(cached)
                     return (
                         data.get("has_history"),
@@ -600,7 +609,9 @@ class KalmanEnsembleStrategy:
 
         try:
             logger.debug(
-                f"🔍 Buscando histórico no PostgreSQL: ({latitude:.4f}, {longitude:.4f})"
+                "🔍 Buscando histórico no PostgreSQL: ({:.4f}, {:.4f})",
+                latitude,
+                longitude,
             )
 
             city_data = await self.station_finder.find_studied_city(
@@ -610,8 +621,11 @@ class KalmanEnsembleStrategy:
             )
 
             if not city_data:
-                logger.info(
-                    f"No studied city found within 10km of ({latitude:.4f}, {longitude:.4f})"
+                # Consultado a cada dia fundido: DEBUG
+                logger.debug(
+                    "No studied city found within 10km of ({:.4f}, {:.4f})",
+                    latitude,
+                    longitude,
                 )
                 return False, {}, {}
 
@@ -731,7 +745,8 @@ class KalmanEnsembleStrategy:
         """
         Wrapper síncrono para auto_fuse() - compatível com código síncrono.
 
-        Detecta se já há event loop rodando e usa abordagem apropriada.
+        Executa a coroutine no event loop persistente (async_bridge).
+        Não usar dentro de coroutines: lá, ``await auto_fuse()``.
 
         Args:
             latitude: Latitude do ponto de interesse
@@ -751,35 +766,14 @@ class KalmanEnsembleStrategy:
             ...     current_measurements={'temperature_max': 28.5, ...}
             ... )
         """
-        import asyncio
-
-        try:
-            # Verificar se já há event loop rodando
-            asyncio.get_running_loop()
-            # Se há loop rodando, usar ThreadPoolExecutor
-            import concurrent.futures
-
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(
-                    asyncio.run,
-                    self.auto_fuse(
-                        latitude,
-                        longitude,
-                        current_measurements,
-                        stations_data,
-                        distance_weights,
-                    ),
-                )
-                return future.result()
-
-        except RuntimeError:
-            # Não há event loop rodando, usar asyncio.run normalmente
-            return asyncio.run(
-                self.auto_fuse(
-                    latitude,
-                    longitude,
-                    current_measurements,
-                    stations_data,
-                    distance_weights,
-                )
+        from backend.api.services.async_bridge import run_sync
+
+        return run_sync(
+            self.auto_fuse(
+                latitude,
+                longitude,
+                current_measurements,
+                stations_data,
+                distance_weights,
             )
+        )
@@ -17,22 +17,16 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
+from celery import shared_task
 from loguru import logger
 
 from backend.core.eto_calculation.eto_services import (
     EToCalculationService,
     EToProcessingService,
 )
-from backend.infrastructure.celery.celery_config import celery_app as app
-
-# Configuração do logging
-logger.add(
-    "./logs/eto_calculator.log",
-    rotation="10 MB",
-    retention="10 days",
-    level="INFO",
-    format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}",
-)
+
+# Sinks de log (inclusive logs/eto_calculator.log) ficam em
+# config.logging_config, com escrita assíncrona
 
 # Constantes
 MATOPIBA_BOUNDS = {
@@ -124,7 +118,7 @@ def calculate_eto(
         raise
 
 
-@app.task(
+@shared_task(
     bind=True,
     name="backend.core.eto_calculation.eto_calculation.calculate_eto_pipeline",
 )
@@ -31,6 +31,7 @@ from backend.api.services.weather_utils import (
     WeatherValidationUtils,
 )
 from backend.api.services.geographic_utils import GeographicUtils
+from backend.infrastructure import tracing, worker_memory
 from config.logging_config import log_execution_time
 
 
@@ -459,6 +460,7 @@ class EToProcessingService:
         self.logger = logger
 
     @log_execution_time
+    @tracing.traced("eto.process_location")
     async def process_location(
         self,
         latitude: float,
@@ -545,9 +547,11 @@ class EToProcessingService:
             # (Open-Meteo já retorna elevation sem custo extra)
             logger.info("📊 Etapa 1: Baixar dados climáticos")
 
-            weather_data, download_warnings = await download_weather_data(
-                database, start_date, end_date, longitude, latitude
-            )
+            with tracing.span("eto.download", source=database):
+                weather_data, download_warnings = await download_weather_data(
+                    database, start_date, end_date, longitude, latitude
+                )
+                worker_memory.record_frame("eto.download", weather_data)
 
             if weather_data is None or weather_data.empty:
                 raise ValueError("Falha ao obter dados meteorológicos")
@@ -582,9 +586,10 @@ class EToProcessingService:
                 )
                 try:
                     topo_client = OpenTopoClient()
-                    topo_location = await topo_client.get_elevation(
-                        latitude, longitude
-                    )
+                    with tracing.span("eto.elevation", source="opentopo"):
+                        topo_location = await topo_client.get_elevation(
+                            latitude, longitude
+                        )
 
                     if topo_location:
                         elevation_opentopo = topo_location.elevation
@@ -685,9 +690,11 @@ class EToProcessingService:
             # 5️⃣ PRÉ-PROCESSAMENTO
             logger.info("📈 Etapa 5: Pré-processamento de dados")
 
-            weather_data, preprocessing_warnings = preprocessing(
-                weather_data, latitude
-            )
+            with tracing.span("eto.preprocessing", rows=len(weather_data)):
+                weather_data, preprocessing_warnings = preprocessing(
+                    weather_data, latitude
+                )
+                worker_memory.record_frame("eto.preprocessing", weather_data)
 
             # Adicionar elevação ao DataFrame
             weather_data["elevation_m"] = final_elevation
@@ -705,47 +712,61 @@ class EToProcessingService:
             et0_series = []
             raw_data_list = []  # Para salvar no banco
 
-            for idx, row in weather_data_fused.iterrows():
-                measurements = row.to_dict()
-                measurements["latitude"] = latitude
-                measurements["longitude"] = longitude
-                # Converter idx para string de data
-                if isinstance(idx, Timestamp):
-                    date_str_val = str(idx.date())
-                else:
-                    date_str_val = str(idx)[:10]
-                measurements["date"] = date_str_val
-
-                # Usar elevação e fatores pré-calculados
-                et0_result = self.et0_calc.calculate_et0(
-                    measurements,
-                    elevation_factors=elevation_factors,
-                )
+            with tracing.span("eto.et0", days=len(weather_data_fused)):
+                worker_memory.record_frame("eto.et0", weather_data_fused)
+                for idx, row in weather_data_fused.iterrows():
+                    measurements = row.to_dict()
+                    measurements["latitude"] = latitude
+                    measurements["longitude"] = longitude
+                    # Converter idx para string de data
+                    if isinstance(idx, Timestamp):
+                        date_str_val = str(idx.date())
+                    else:
+                        date_str_val = str(idx)[:10]
+                    measurements["date"] = date_str_val
+                    # NASA POWER usa "T2M" para média,
+                    # calculate_et0 espera "T2M_MEAN"
+                    if (
+                        "T2M_MEAN" not in measurements
+                        and "T2M" in measurements
+                    ):
+                        measurements["T2M_MEAN"] = measurements["T2M"]
+
+                    # Usar elevação e fatores pré-calculados
+                    et0_result = self.et0_calc.calculate_et0(
+                        measurements,
+                        elevation_factors=elevation_factors,
+                    )
 
-                # 5. Detecção anomalia (com histórico)
-                historical = await self._get_historical_et0_normal(
-                    latitude, longitude, date_str_val
-                )
-                anomaly = self.et0_calc.detect_anomalies(
-                    et0_result["et0_mm_day"], historical
-                )
+                    # Preparar dados para salvamento
+                    raw_data_list.append(
+                        {
+                            "date": measurements["date"],
+                            "raw_data": measurements,
+                            "eto_result": et0_result,
+                        }
+                    )
 
-                et0_data = {
-                    "date": date_str_val,
-                    "et0_mm_day": et0_result["et0_mm_day"],
-                    "quality": et0_result["quality"],
-                    "anomaly": anomaly,
-                }
-                et0_series.append(et0_data)
+            # Detecção de anomalia (com histórico): consultas de normais
+            # ficam fora de eto.et0 para o span medir só o cálculo
+            with tracing.span("eto.anomaly", days=len(raw_data_list)):
+                for item in raw_data_list:
+                    et0_result = item["eto_result"]
+                    historical = await self._get_historical_et0_normal(
+                        latitude, longitude, item["date"]
+                    )
+                    anomaly = self.et0_calc.detect_anomalies(
+                        et0_result["et0_mm_day"], historical
+                    )
 
-                # Preparar dados para salvamento
-                raw_data_list.append(
-                    {
-                        "date": measurements["date"],
-                        "raw_data": measurements,
-                        "eto_result": et0_result,
-                    }
-                )
+                    et0_series.append(
+                        {
+                            "date": item["date"],
+                            "et0_mm_day": et0_result["et0_mm_day"],
+                            "quality": et0_result["quality"],
+                            "anomaly": anomaly,
+                        }
+                    )
 
             # 8️⃣ SALVAR NO BANCO PostgreSQL
             logger.info("💾 Etapa 8: Salvar dados no banco")
@@ -807,6 +828,7 @@ class EToProcessingService:
             if topo_client:
                 await topo_client.close()
 
+    @tracing.traced("eto.fusion")
     async def _fuse_data(
         self, weather_data: pd.DataFrame, latitude: float, longitude: float
     ) -> Tuple[pd.DataFrame, List[str]]:
@@ -830,16 +852,12 @@ class EToProcessingService:
                 # Converter linha para dict
                 current_measurements = row.to_dict()
 
-                # Usar wrapper síncrono se disponível
-                if hasattr(self.kalman, "auto_fuse_sync"):
-                    result = self.kalman.auto_fuse_sync(
-                        latitude, longitude, current_measurements
-                    )
-                else:
-                    # Fallback para async
-                    result = await self.kalman.auto_fuse(
-                        latitude, longitude, current_measurements
-                    )
+                # await direto: os wrappers *_sync usam run_sync, que
+                # falha dentro do loop da ponte (Celery) e bloqueia o
+                # loop do FastAPI
+                result = await self.kalman.auto_fuse(
+                    latitude, longitude, current_measurements
+                )
 
                 fused_records.append(result)
 
@@ -852,6 +870,7 @@ class EToProcessingService:
             self.logger.warning(f"Fusão falhou, usando dados brutos: {str(e)}")
             return weather_data, warnings
 
+    @tracing.traced("eto.anomaly_lookup")
     async def _get_historical_et0_normal(
         self, latitude: float, longitude: float, date_str: str
     ) -> Optional[Dict[str, float]]:
@@ -868,14 +887,9 @@ class EToProcessingService:
         """
         try:
             # Buscar cidade estudada próxima
-            if hasattr(self.station_finder, "find_studied_city_sync"):
-                city_data = self.station_finder.find_studied_city_sync(
-                    latitude, longitude, max_distance_km=10
-                )
-            else:
-                city_data = await self.station_finder.find_studied_city(
-                    latitude, longitude, max_distance_km=10
-                )
+            city_data = await self.station_finder.find_studied_city(
+                latitude, longitude, max_distance_km=10
+            )
 
             if not city_data or "monthly_data" not in city_data:
                 return None
@@ -895,9 +909,11 @@ class EToProcessingService:
             }
 
         except Exception as e:
-            self.logger.debug(f"Não foi possível obter histórico: {str(e)}")
+            # Chamado por dia da série: formatação só com DEBUG ativo
+            self.logger.debug("Não foi possível obter histórico: {}", e)
             return None
 
+    @tracing.traced("eto.db_save")
     async def _save_to_database(
         self,
         latitude: float,
@@ -913,6 +929,12 @@ class EToProcessingService:
         """
         Salva dados climáticos e ETo no banco PostgreSQL.
 
+        Todos os dias são gravados em um único
+        INSERT ... ON CONFLICT (source_api, latitude, longitude, date)
+        DO UPDATE, apoiado na constraint uq_climate_data_location_date.
+        Evita um SELECT + INSERT/UPDATE por dia (~180 round trips
+        para uma requisição de 90 dias).
+
         Args:
             latitude: Latitude
             longitude: Longitude
@@ -924,108 +946,73 @@ class EToProcessingService:
             if not raw_data_list:
                 return
 
+            from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+            from backend.database.data_storage import (
+                HOT_COLUMNS,
+                extract_hot_columns,
+            )
             from backend.database.models.climate_data import ClimateData
-            from datetime import datetime as dt
 
-            saved_count = 0
+            now = datetime.utcnow()
+            elevation_metadata = {
+                "source": elevation_source,
+                "opentopo": elevation_opentopo,
+                "archive": elevation_archive,
+                "forecast": elevation_forecast,
+            }
 
+            # Uma linha por data (a última ocorrência vence, como antes)
+            rows: Dict[datetime, Dict[str, Any]] = {}
             for data_item in raw_data_list:
-                try:
-                    date_str = data_item["date"]
-                    date_obj = dt.strptime(date_str, "%Y-%m-%d")
-
-                    # Verificar se já existe
-                    existing = (
-                        self.db_session.query(ClimateData)
-                        .filter_by(
-                            source_api=source_api,
-                            latitude=latitude,
-                            longitude=longitude,
-                            date=date_obj,
-                        )
-                        .first()
-                    )
-
-                    if existing:
-                        # Atualizar registro existente
-                        # Converter NaN para None (PostgreSQL JSONB)
-                        import math
-
-                        raw_data_clean = {}
-                        for k, v in data_item["raw_data"].items():
-                            if isinstance(v, float) and math.isnan(v):
-                                raw_data_clean[k] = None
-                            else:
-                                raw_data_clean[k] = v
-
-                        existing.raw_data = raw_data_clean
-                        existing.eto_mm_day = data_item["eto_result"][
-                            "et0_mm_day"
-                        ]
-                        existing.eto_method = data_item["eto_result"]["method"]
-                        existing.quality_flags = {
-                            "quality": data_item["eto_result"]["quality"]
-                        }
-                        existing.elevation = elevation
-                        existing.elevation_metadata = {
-                            "source": elevation_source,
-                            "opentopo": elevation_opentopo,
-                            "archive": elevation_archive,
-                            "forecast": elevation_forecast,
-                        }
-                        existing.updated_at = dt.utcnow()
-                    else:
-                        # Criar novo registro
-                        # Converter NaN para None (PostgreSQL JSONB)
-                        import math
-
-                        raw_data_clean = {}
-                        for k, v in data_item["raw_data"].items():
-                            if isinstance(v, float) and math.isnan(v):
-                                raw_data_clean[k] = None
-                            else:
-                                raw_data_clean[k] = v
-
-                        climate_record = ClimateData(
-                            source_api=source_api,
-                            latitude=latitude,
-                            longitude=longitude,
-                            elevation=elevation,
-                            date=date_obj,
-                            raw_data=raw_data_clean,  # Sem NaN
-                            harmonized_data=None,
-                            eto_mm_day=data_item["eto_result"]["et0_mm_day"],
-                            eto_method=data_item["eto_result"]["method"],
-                            quality_flags={
-                                "quality": data_item["eto_result"]["quality"]
-                            },
-                            elevation_metadata={
-                                "source": elevation_source,
-                                "opentopo": elevation_opentopo,
-                                "archive": elevation_archive,
-                                "forecast": elevation_forecast,
-                            },
-                            processing_metadata={
-                                "components": data_item["eto_result"].get(
-                                    "components", {}
-                                ),
-                                "processed_at": dt.utcnow().isoformat(),
-                            },
-                        )
-                        self.db_session.add(climate_record)
-
-                    saved_count += 1
+                eto_result = data_item["eto_result"]
+                date_obj = datetime.strptime(data_item["date"], "%Y-%m-%d")
+                # Converter NaN para None (PostgreSQL JSONB)
+                raw_data_clean = {
+                    k: None if isinstance(v, float) and math.isnan(v) else v
+                    for k, v in data_item["raw_data"].items()
+                }
+                rows[date_obj] = {
+                    "source_api": source_api,
+                    "latitude": latitude,
+                    "longitude": longitude,
+                    "elevation": elevation,
+                    "date": date_obj,
+                    "raw_data": raw_data_clean,
+                    "harmonized_data": None,
+                    "eto_mm_day": eto_result["et0_mm_day"],
+                    "eto_method": eto_result["method"],
+                    "quality_flags": {"quality": eto_result["quality"]},
+                    "processing_metadata": {
+                        "components": eto_result.get("components", {}),
+                        "elevation": elevation_metadata,
+                        "processed_at": now.isoformat(),
+                    },
+                    "created_at": now,
+                    "updated_at": now,
+                    **extract_hot_columns(None, raw_data_clean),
+                }
 
-                except Exception as e:
-                    self.logger.warning(
-                        f"Erro ao salvar registro {date_str}: {str(e)}"
-                    )
-                    continue
+            stmt = pg_insert(ClimateData).values(list(rows.values()))
+            excluded = stmt.excluded
+            stmt = stmt.on_conflict_do_update(
+                constraint="uq_climate_data_location_date",
+                set_={
+                    "elevation": excluded.elevation,
+                    "raw_data": excluded.raw_data,
+                    "eto_mm_day": excluded.eto_mm_day,
+                    "eto_method": excluded.eto_method,
+                    "quality_flags": excluded.quality_flags,
+                    "processing_metadata": excluded.processing_metadata,
+                    "updated_at": excluded.updated_at,
+                    **{col: excluded[col] for col in HOT_COLUMNS},
+                },
+            )
 
-            # Commit de todos os registros
+            self.db_session.execute(stmt)
             self.db_session.commit()
             self.logger.info(
-                f"✅ {saved_count} registros salvos no banco "
+                f"✅ {len(rows)} registros salvos no banco "
                 f"(fonte: {source_api})"
             )
 
@@ -1034,6 +1021,7 @@ class EToProcessingService:
             self.db_session.rollback()
             # Não falhar a requisição por erro de salvamento
 
+    @tracing.traced("eto.recommendations")
     def _generate_recomendations(self, et0_series: List[Dict]) -> List[str]:
         """
         Gera recomendações agrícolas baseadas em ET0.
@@ -1103,6 +1091,7 @@ class EToProcessingService:
         }
 
     @log_execution_time
+    @tracing.traced("eto.process_location_with_sources")
     async def process_location_with_sources(
         self,
         latitude: float,
@@ -1155,9 +1144,17 @@ class EToProcessingService:
                         f"📥 Baixando dados de {source_id} para "
                         f"({latitude}, {longitude})"
                     )
-                    weather_data, warnings = await download_weather_data(
-                        source_id, start_date, end_date, longitude, latitude
-                    )
+                    with tracing.span("eto.download", source=source_id):
+                        weather_data, warnings = await download_weather_data(
+                            source_id,
+                            start_date,
+                            end_date,
+                            longitude,
+                            latitude,
+                        )
+                        worker_memory.record_frame(
+                            "eto.download", weather_data
+                        )
 
                     if weather_data is not None and not weather_data.empty:
                         # Adicionar metadados da fonte
@@ -1186,6 +1183,33 @@ class EToProcessingService:
                     "Nenhum dado climático disponível das fontes selecionadas."
                 )
 
+            # 1b. Elevação ausente: OpenTopo, depois a elevação da fonte
+            # (sem ela o ETo falha em todos os dias)
+            if elevation is None:
+                topo_client = OpenTopoClient()
+                try:
+                    with tracing.span("eto.elevation", source="opentopo"):
+                        topo_location = await topo_client.get_elevation(
+                            latitude, longitude
+                        )
+                    if topo_location:
+                        elevation = topo_location.elevation
+                except Exception as e:
+                    self.logger.warning(f"⚠️ OpenTopo falhou: {e}")
+                finally:
+                    await topo_client.close()
+
+                if elevation is None:
+                    elevation = next(
+                        (
+                            df.attrs["elevation"]
+                            for df in all_weather_data
+                            if df.attrs.get("elevation") is not None
+                        ),
+                        None,
+                    )
+                self.logger.info(f"🗻 Elevação obtida: {elevation}")
+
             # 2. ✅ CORREÇÃO: Combinar dados por data para fusão Kalman
             import pandas as pd
 
@@ -1203,9 +1227,11 @@ class EToProcessingService:
             # 3. Preprocessing (normalização, outlier detection)
             # Detectar região baseada na latitude (Brasil: -35 a 5 lat)
             region = "brazil" if -35 <= latitude <= 5 else "global"
-            combined_data, preprocessing_warnings = preprocessing(
-                combined_data, latitude, region=region
-            )
+            with tracing.span("eto.preprocessing", rows=len(combined_data)):
+                combined_data, preprocessing_warnings = preprocessing(
+                    combined_data, latitude, region=region
+                )
+                worker_memory.record_frame("eto.preprocessing", combined_data)
             fusion_warnings.extend(preprocessing_warnings)
 
             # 4. ✅ CORREÇÃO: Fusão Kalman POR DIA (múltiplas fontes)
@@ -1216,98 +1242,101 @@ class EToProcessingService:
 
             fused_records = []
 
-            # Agrupar por data (múltiplas linhas por data = múltiplas fontes)
-            for date_key, group in combined_data.groupby(level=0):
-                # Se apenas 1 fonte, sem necessidade de fusão
-                if len(group) == 1:
-                    single_record = group.iloc[0].to_dict()
-                    fused_records.append(
-                        {
-                            "date": date_key,
-                            **single_record,
-                            "fusion_applied": False,
-                        }
-                    )
-                    continue
-
-                # Aplicar Kalman para múltiplas fontes
-                try:
-                    # Variáveis climáticas para fusão
-                    climate_vars = [
-                        "temperature_2m_max",
-                        "temperature_2m_min",
-                        "temperature_2m_mean",
-                        "relative_humidity_2m_mean",
-                        "wind_speed_2m_mean",
-                        "shortwave_radiation_sum",
-                        "precipitation_sum",
-                    ]
-
-                    # Preparar dados de cada fonte separadamente
-                    # para fusão real
-                    stations_data = []
-                    for idx, row in group.iterrows():
-                        station_measurement = {}
-                        for var in climate_vars:
-                            if var in row.index and not pd.isna(row[var]):
-                                station_measurement[var] = row[var]
-                        if station_measurement:
-                            stations_data.append(station_measurement)
-
-                    if len(stations_data) > 1:
-                        # ✅ FUSÃO REAL: múltiplas fontes via Kalman
-                        fused_result = self.kalman.auto_fuse_sync(
-                            latitude,
-                            longitude,
-                            current_measurements={},
-                            # Não usado quando stations_data é fornecido
-                            stations_data=stations_data,
-                            distance_weights=None,
-                            # Pesos iguais para todas as fontes
-                        )
-
+            with tracing.span("eto.fusion", sources=len(all_weather_data)):
+                # Agrupar por data (várias linhas por data = várias fontes)
+                for date_key, group in combined_data.groupby(level=0):
+                    # Se apenas 1 fonte, sem necessidade de fusão
+                    if len(group) == 1:
+                        single_record = group.iloc[0].to_dict()
                         fused_records.append(
                             {
                                 "date": date_key,
-                                **fused_result,
-                                "fusion_applied": True,
-                                "fusion_strategy": self.kalman.fusion.fusion_strategy,
-                                "sources_count": len(stations_data),
+                                **single_record,
+                                "fusion_applied": False,
                             }
                         )
-                    else:
-                        # Apenas 1 fonte válida - usar diretamente
+                        continue
+
+                    # Aplicar Kalman para múltiplas fontes
+                    try:
+                        # Variáveis climáticas para fusão
+                        climate_vars = [
+                            "temperature_2m_max",
+                            "temperature_2m_min",
+                            "temperature_2m_mean",
+                            "relative_humidity_2m_mean",
+                            "wind_speed_2m_mean",
+                            "shortwave_radiation_sum",
+                            "precipitation_sum",
+                        ]
+
+                        # Preparar dados de cada fonte separadamente
+                        # para fusão real
+                        stations_data = []
+                        for idx, row in group.iterrows():
+                            station_measurement = {}
+                            for var in climate_vars:
+                                if var in row.index and not pd.isna(row[var]):
+                                    station_measurement[var] = row[var]
+                            if station_measurement:
+                                stations_data.append(station_measurement)
+
+                        if len(stations_data) > 1:
+                            # ✅ FUSÃO REAL: múltiplas fontes via Kalman
+                            fused_result = await self.kalman.auto_fuse(
+                                latitude,
+                                longitude,
+                                current_measurements={},
+                                # Não usado quando stations_data é fornecido
+                                stations_data=stations_data,
+                                distance_weights=None,
+                                # Pesos iguais para todas as fontes
+                            )
+
+                            fused_records.append(
+                                {
+                                    "date": date_key,
+                                    **fused_result,
+                                    "fusion_applied": True,
+                                    "fusion_strategy": (
+                                        self.kalman.fusion.fusion_strategy
+                                    ),
+                                    "sources_count": len(stations_data),
+                                }
+                            )
+                        else:
+                            # Apenas 1 fonte válida - usar diretamente
+                            fused_records.append(
+                                {
+                                    "date": date_key,
+                                    **stations_data[0],
+                                    "fusion_applied": False,
+                                    "sources_count": 1,
+                                }
+                            )
+
+                    except Exception as e:
+                        self.logger.error(f"Fusão falhou para {date_key}: {e}")
+                        # Fallback: usar primeira fonte disponível
+                        fallback_data = {}
+                        for var in climate_vars:
+                            if var in group.columns:
+                                values = group[var].dropna().tolist()
+                                if values:
+                                    fallback_data[var] = values[
+                                        0
+                                    ]  # Primeira fonte
+
                         fused_records.append(
                             {
                                 "date": date_key,
-                                **stations_data[0],
+                                **fallback_data,
                                 "fusion_applied": False,
-                                "sources_count": 1,
+                                "fusion_error": str(e),
+                                "sources_count": len(group),
                             }
                         )
 
-                except Exception as e:
-                    self.logger.error(f"Fusão falhou para {date_key}: {e}")
-                    # Fallback: usar primeira fonte disponível
-                    fallback_data = {}
-                    for var in climate_vars:
-                        if var in group.columns:
-                            values = group[var].dropna().tolist()
-                            if values:
-                                fallback_data[var] = values[
-                                    0
-                                ]  # Primeira fonte
-
-                    fused_records.append(
-                        {
-                            "date": date_key,
-                            **fallback_data,
-                            "fusion_applied": False,
-                            "fusion_error": str(e),
-                            "sources_count": len(group),
-                        }
-                    )
-
             # Criar DataFrame fusionado
             weather_data_fused = pd.DataFrame(fused_records)
             weather_data_fused.set_index("date", inplace=True)
@@ -1319,83 +1348,91 @@ class EToProcessingService:
             # 5. Calcular ETo para cada dia
             et0_series = []
 
-            for idx, row in weather_data_fused.iterrows():
-                try:
-                    measurements = row.to_dict()
-                    measurements["latitude"] = latitude
-                    measurements["longitude"] = longitude
-                    # Converter idx para string de data
-                    if isinstance(idx, Timestamp):
-                        date_str_val = str(idx.date())
-                    else:
-                        date_str_val = str(idx)[:10]
-                    measurements["date"] = date_str_val
-                    if elevation:
-                        measurements["elevation_m"] = elevation
-
-                    # Debug: verificar chaves disponíveis antes do mapeamento
-                    # self.logger.warning(
-                    #     f"Medições disponíveis para {idx}: "
-                    #     f"{list(measurements.keys())}"
-                    # )
-
-                    # ✅ CORREÇÃO: Mapear nomes de colunas da fusão
-                    # para nomes esperados por calculate_et0
-                    column_mapping = {
-                        "temperature_2m_max": "T2M_MAX",
-                        "temperature_2m_min": "T2M_MIN",
-                        "temperature_2m_mean": "T2M_MEAN",
-                        "relative_humidity_2m_mean": "RH2M",
-                        "wind_speed_2m_mean": "WS2M",
-                        "shortwave_radiation_sum": "ALLSKY_SFC_SW_DWN",
-                        "precipitation_sum": "PRECTOTCORR",
-                        # NASA POWER usa "T2M" para média, calculate_et0 espera "T2M_MEAN"
-                        "T2M": "T2M_MEAN",
-                    }
-
-                    # Aplicar mapeamento
-                    for old_col, new_col in column_mapping.items():
-                        if old_col in measurements:
-                            measurements[new_col] = measurements.pop(old_col)
-
-                    # Debug: verificar após mapeamento
-                    # self.logger.warning(
-                    #     f"Após mapeamento para {idx}: "
-                    #     f"{list(measurements.keys())}"
-                    # )
-
-                    # Debug: verificar se elevation_m está presente
-                    if "elevation_m" not in measurements:
-                        self.logger.warning(
-                            f"Elevation ausente para {idx}, tentando obter..."
-                        )
+            with tracing.span("eto.et0", days=len(weather_data_fused)):
+                worker_memory.record_frame("eto.et0", weather_data_fused)
+                for idx, row in weather_data_fused.iterrows():
+                    try:
+                        measurements = row.to_dict()
+                        measurements["latitude"] = latitude
+                        measurements["longitude"] = longitude
+                        # Converter idx para string de data
+                        if isinstance(idx, Timestamp):
+                            date_str_val = str(idx.date())
+                        else:
+                            date_str_val = str(idx)[:10]
+                        measurements["date"] = date_str_val
                         if elevation:
                             measurements["elevation_m"] = elevation
-                        else:
-                            self.logger.error(
-                                f"Elevation não disponível para {idx}"
+
+                        # Debug: verificar chaves antes do mapeamento
+                        # self.logger.warning(
+                        #     f"Medições disponíveis para {idx}: "
+                        #     f"{list(measurements.keys())}"
+                        # )
+
+                        # ✅ CORREÇÃO: Mapear nomes de colunas da fusão
+                        # para nomes esperados por calculate_et0
+                        column_mapping = {
+                            "temperature_2m_max": "T2M_MAX",
+                            "temperature_2m_min": "T2M_MIN",
+                            "temperature_2m_mean": "T2M_MEAN",
+                            "relative_humidity_2m_mean": "RH2M",
+                            "wind_speed_2m_mean": "WS2M",
+                            "shortwave_radiation_sum": "ALLSKY_SFC_SW_DWN",
+                            "precipitation_sum": "PRECTOTCORR",
+                            # NASA POWER usa "T2M" para média,
+                            # calculate_et0 espera "T2M_MEAN"
+                            "T2M": "T2M_MEAN",
+                        }
+
+                        # Aplicar mapeamento
+                        for old_col, new_col in column_mapping.items():
+                            if old_col in measurements:
+                                measurements[new_col] = measurements.pop(
+                                    old_col
+                                )
+
+                        # Debug: verificar após mapeamento
+                        # self.logger.warning(
+                        #     f"Após mapeamento para {idx}: "
+                        #     f"{list(measurements.keys())}"
+                        # )
+
+                        # Debug: verificar se elevation_m está presente
+                        if "elevation_m" not in measurements:
+                            self.logger.warning(
+                                f"Elevation ausente para {idx}, "
+                                "tentando obter..."
                             )
-                            continue
+                            if elevation:
+                                measurements["elevation_m"] = elevation
+                            else:
+                                self.logger.error(
+                                    f"Elevation não disponível para {idx}"
+                                )
+                                continue
 
-                    et0_result = self.et0_calc.calculate_et0(measurements)
+                        et0_result = self.et0_calc.calculate_et0(measurements)
 
-                    et0_series.append(
-                        {
-                            "date": measurements["date"],
-                            "et0_mm_day": et0_result["et0_mm_day"],
-                            "quality": et0_result["quality"],
-                            "anomaly": {
-                                "is_anomaly": False,
-                                "z_score": 0.0,
-                            },  # Placeholder - será implementado com histórico
-                        }
-                    )
+                        et0_series.append(
+                            {
+                                "date": measurements["date"],
+                                "et0_mm_day": et0_result["et0_mm_day"],
+                                "quality": et0_result["quality"],
+                                # Placeholder - será implementado com
+                                # histórico
+                                "anomaly": {
+                                    "is_anomaly": False,
+                                    "z_score": 0.0,
+                                },
+                            }
+                        )
 
-                except Exception as e:
-                    self.logger.warning(
-                        f"Erro no cálculo ETo para {idx}: {str(e)}"
-                    )
-                    continue
+                    except Exception as e:
+                        self.logger.warning(
+                            f"Erro no cálculo ETo para {idx}: {str(e)}"
+                        )
+                        continue
 
             if not et0_series:
                 raise ValueError("Falha no cálculo de ETo para todos os dias.")
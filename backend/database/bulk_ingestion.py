@@ -0,0 +1,202 @@
+"""
+Ingestão em massa via PostgreSQL COPY (psycopg3).
+
+Fluxo: linhas (geradas sob demanda) → COPY para tabela temporária de
+staging → INSERT ... SELECT ... ON CONFLICT para a tabela final.
+
+As linhas são consumidas de um iterável em lotes de tamanho fixo, então
+cargas longas (séries multi-década de todas as cidades estudadas) não
+precisam ficar inteiras em memória nem no cliente nem na staging.
+"""
+
+import math
+from itertools import islice
+from typing import Any, Iterable, Optional, Sequence
+
+from loguru import logger
+from psycopg import sql
+from psycopg.types.json import Jsonb
+from sqlalchemy.orm import Session
+
+# Tamanho padrão do lote COPY → merge
+DEFAULT_BATCH_SIZE = 50_000
+
+
+# Coluna extra da staging com a ordem de chegada das linhas
+STAGING_ORDINAL = "_stg_ord"
+
+
+def _sanitize_json(value: Any) -> Any:
+    """Troca NaN/±inf por None em qualquer nível (JSON não os aceita)."""
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, dict):
+        return {k: _sanitize_json(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_sanitize_json(v) for v in value]
+    return value
+
+
+def _adapt_value(value: Any) -> Any:
+    """Adapta valores Python para o COPY (JSONB e NaN → NULL)."""
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, (dict, list)):
+        return Jsonb(_sanitize_json(value))
+    return value
+
+
+def _table_identifier(table: str) -> sql.Identifier:
+    """Converte 'schema.tabela' (ou 'tabela') em identificador seguro."""
+    return sql.Identifier(*table.split("."))
+
+
+def _build_merge_query(
+    table: str,
+    staging: str,
+    columns: Sequence[str],
+    conflict_columns: Sequence[str],
+    update_columns: Optional[Sequence[str]],
+) -> sql.Composed:
+    """
+    Monta INSERT ... SELECT DISTINCT ON ... ON CONFLICT.
+
+    DISTINCT ON evita o erro "ON CONFLICT DO UPDATE command cannot
+    affect row a second time" quando o lote traz chaves repetidas. A
+    ordenação pelo ordinal da staging reproduz inserts sequenciais: com
+    DO UPDATE vence a última linha escrita, com DO NOTHING a primeira.
+    """
+    cols = sql.SQL(", ").join(map(sql.Identifier, columns))
+    conflict = sql.SQL(", ").join(map(sql.Identifier, conflict_columns))
+
+    if update_columns:
+        order = sql.SQL("DESC")
+        action = sql.SQL("DO UPDATE SET {}").format(
+            sql.SQL(", ").join(
+                sql.SQL("{} = EXCLUDED.{}").format(
+                    sql.Identifier(col), sql.Identifier(col)
+                )
+                for col in update_columns
+            )
+        )
+    else:
+        order = sql.SQL("ASC")
+        action = sql.SQL("DO NOTHING")
+
+    return sql.SQL(
+        "INSERT INTO {table} ({cols}) "
+        "SELECT DISTINCT ON ({conflict}) {cols} FROM {staging} "
+        "ORDER BY {conflict}, {ordinal} {order} "
+        "ON CONFLICT ({conflict}) {action}"
+    ).format(
+        table=_table_identifier(table),
+        cols=cols,
+        conflict=conflict,
+        staging=sql.Identifier(staging),
+        ordinal=sql.Identifier(STAGING_ORDINAL),
+        order=order,
+        action=action,
+    )
+
+
+def copy_merge(
+    db: Session,
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+    conflict_columns: Sequence[str],
+    update_columns: Optional[Sequence[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """
+    Carrega linhas via COPY em staging e faz merge na tabela final.
+
+    Executa na transação corrente da sessão; o commit fica a cargo do
+    chamador (mesmo contrato de ``db.add_all``/``db.execute``).
+
+    Args:
+        db: Sessão SQLAlchemy ligada ao PostgreSQL (driver psycopg3)
+        table: Tabela destino ('tabela' ou 'schema.tabela')
+        columns: Colunas na ordem dos valores de cada linha
+        rows: Iterável de tuplas (pode ser um gerador)
+        conflict_columns: Colunas da constraint única usada no
+            ON CONFLICT
+        update_columns: Colunas atualizadas em conflito
+            (None ou vazio → DO NOTHING)
+        batch_size: Linhas por ciclo COPY → merge
+
+    Returns:
+        Número de linhas inseridas ou atualizadas
+
+    Examples:
+        >>> with get_db_context() as db:
+        ...     copy_merge(
+        ...         db,
+        ...         "climate_history.monthly_climate_normals",
+        ...         ["city_id", "period_key", "month", "eto_mm_day"],
+        ...         ((1, "1991-2020", m, 4.2) for m in range(1, 13)),
+        ...         conflict_columns=["city_id", "period_key", "month"],
+        ...         update_columns=["eto_mm_day"],
+        ...     )
+        ...     db.commit()
+        12
+    """
+    staging = f"_stg_{table.replace('.', '_')}"
+    raw_conn = db.connection().connection.driver_connection
+
+    cols = sql.SQL(", ").join(map(sql.Identifier, columns))
+    # Recriada a cada chamada: outra chamada na mesma transação pode ter
+    # deixado a staging com outro conjunto de colunas
+    drop_staging = sql.SQL("DROP TABLE IF EXISTS {staging}").format(
+        staging=sql.Identifier(staging)
+    )
+    create_staging = sql.SQL(
+        "CREATE TEMP TABLE {staging} ON COMMIT DROP AS "
+        "SELECT {cols}, 0::bigint AS {ordinal} FROM {table} WITH NO DATA"
+    ).format(
+        staging=sql.Identifier(staging),
+        cols=cols,
+        ordinal=sql.Identifier(STAGING_ORDINAL),
+        table=_table_identifier(table),
+    )
+    copy_stmt = sql.SQL(
+        "COPY {staging} ({cols}, {ordinal}) FROM STDIN"
+    ).format(
+        staging=sql.Identifier(staging),
+        cols=cols,
+        ordinal=sql.Identifier(STAGING_ORDINAL),
+    )
+    merge_stmt = _build_merge_query(
+        table, staging, columns, conflict_columns, update_columns
+    )
+    truncate_stmt = sql.SQL("TRUNCATE {staging}").format(
+        staging=sql.Identifier(staging)
+    )
+
+    iterator = iter(rows)
+    merged = 0
+
+    with raw_conn.cursor() as cur:
+        cur.execute(drop_staging)
+        cur.execute(create_staging)
+
+        while True:
+            written = 0
+            with cur.copy(copy_stmt) as copy:
+                for row in islice(iterator, batch_size):
+                    copy.write_row([*map(_adapt_value, row), written])
+                    written += 1
+
+            if not written:
+                break
+
+            cur.execute(merge_stmt)
+            merged += max(cur.rowcount, 0)
+            cur.execute(truncate_stmt)
+
+            logger.debug(
+                f"COPY {table}: lote de {written} linhas "
+                f"({merged} gravadas até agora)"
+            )
+
+    return merged
@@ -6,13 +6,17 @@ NWS Forecast, NWS Stations) com harmonização automática de variáveis.
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from loguru import logger
+from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Query
 
+from backend.database.bulk_ingestion import DEFAULT_BATCH_SIZE, copy_merge
 from backend.database.connection import get_db_context
 from backend.database.models import APIVariables, ClimateData
+from backend.database.models.climate_data import HOT_COLUMN_ALIASES
 
 
 # ==============================================================================
@@ -51,7 +55,9 @@ def get_variable_mapping(source_api: str) -> Dict[str, str]:
 
 
 def harmonize_data(
-    raw_data: Dict[str, Any], source_api: str
+    raw_data: Dict[str, Any],
+    source_api: str,
+    mapping: Optional[Dict[str, str]] = None,
 ) -> Dict[str, Any]:
     """
     Harmoniza dados de uma API para formato padronizado.
@@ -59,6 +65,8 @@ def harmonize_data(
     Args:
         raw_data: Dados originais da API
         source_api: Nome da API fonte
+        mapping: Mapeamento já carregado (evita uma query por registro
+            em cargas em massa)
 
     Returns:
         Dict com dados em formato padronizado
@@ -79,7 +87,8 @@ def harmonize_data(
         {'temp_max_c': 28.5, 'humidity_percent': 65.0}
     """
     try:
-        mapping = get_variable_mapping(source_api)
+        if mapping is None:
+            mapping = get_variable_mapping(source_api)
         harmonized = {}
 
         for api_var, value in raw_data.items():
@@ -100,6 +109,52 @@ def harmonize_data(
         return raw_data
 
 
+# Colunas tipadas, na ordem de HOT_COLUMN_ALIASES (definida no modelo)
+HOT_COLUMNS = tuple(HOT_COLUMN_ALIASES)
+
+
+def extract_hot_columns(
+    harmonized: Optional[Dict[str, Any]],
+    raw_data: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Optional[float]]:
+    """
+    Extrai as variáveis do ETo para as colunas tipadas de ClimateData.
+
+    Procura primeiro nos dados harmonizados e depois nos dados brutos.
+    Valores ausentes, não numéricos ou NaN viram None.
+
+    Args:
+        harmonized: Saída de harmonize_data (pode ser None)
+        raw_data: Dados originais da API (fallback)
+
+    Returns:
+        Dict {coluna: valor} para todas as HOT_COLUMNS
+
+    Examples:
+        >>> extract_hot_columns({'temp_max_c': 28.5}, {'RH2M': 65.0})
+        {'temp_max_c': 28.5, ..., 'humidity_percent': 65.0, ...}
+    """
+    sources = [d for d in (harmonized, raw_data) if d]
+    values: Dict[str, Optional[float]] = {}
+
+    for column, aliases in HOT_COLUMN_ALIASES.items():
+        value = None
+        for source in sources:
+            for alias in aliases:
+                candidate = source.get(alias)
+                if isinstance(candidate, (int, float)) and not isinstance(
+                    candidate, bool
+                ):
+                    if candidate == candidate:  # NaN != NaN
+                        value = float(candidate)
+                        break
+            if value is not None:
+                break
+        values[column] = value
+
+    return values
+
+
 # ==============================================================================
 # SALVAMENTO DE DADOS - MODELO MODERNO (ClimateData)
 # ==============================================================================
@@ -172,6 +227,7 @@ def save_climate_data(
                 harmonized = None
                 if auto_harmonize and "raw_data" in d:
                     harmonized = harmonize_data(d["raw_data"], source_api)
+                hot_values = extract_hot_columns(harmonized, d.get("raw_data"))
 
                 # Cria objeto ClimateData
                 climate_obj = ClimateData(
@@ -187,6 +243,7 @@ def save_climate_data(
                     eto_method=d.get("eto_method", "penman_monteith"),
                     quality_flags=d.get("quality_flags"),
                     processing_metadata=d.get("processing_metadata"),
+                    **hot_values,
                 )
                 climate_objects.append(climate_obj)
 
@@ -212,11 +269,164 @@ def save_climate_data(
         raise
 
 
+# ==============================================================================
+# INGESTÃO EM MASSA (COPY → STAGING → MERGE)
+# ==============================================================================
+
+# Colunas gravadas pelo caminho COPY (ordem das tuplas geradas)
+CLIMATE_DATA_COPY_COLUMNS = (
+    "source_api",
+    "latitude",
+    "longitude",
+    "elevation",
+    "timezone",
+    "date",
+    "raw_data",
+    "harmonized_data",
+    "eto_mm_day",
+    "eto_method",
+    "quality_flags",
+    "processing_metadata",
+    "updated_at",
+    *HOT_COLUMNS,
+)
+
+CLIMATE_DATA_CONFLICT_COLUMNS = (
+    "source_api",
+    "latitude",
+    "longitude",
+    "date",
+)
+
+
+def _iter_climate_rows(
+    data: Iterable[Dict[str, Any]],
+    source_api: str,
+    mapping: Optional[Dict[str, str]],
+) -> Iterator[Tuple[Any, ...]]:
+    """Converte registros (mesmo formato de save_climate_data) em tuplas."""
+    now = datetime.utcnow()
+    for d in data:
+        raw = d.get("raw_data", {})
+        harmonized = (
+            harmonize_data(raw, source_api, mapping)
+            if mapping is not None and raw
+            else None
+        )
+        yield (
+            source_api,
+            d["latitude"],
+            d["longitude"],
+            d.get("elevation"),
+            d.get("timezone"),
+            d["date"],
+            raw,
+            harmonized,
+            d.get("eto_mm_day"),
+            d.get("eto_method", "penman_monteith"),
+            d.get("quality_flags"),
+            d.get("processing_metadata"),
+            now,
+            *extract_hot_columns(harmonized, raw).values(),
+        )
+
+
+def save_climate_data_bulk(
+    data: Iterable[Dict[str, Any]],
+    source_api: str,
+    auto_harmonize: bool = True,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """
+    Salva dados climáticos em massa via COPY + merge (upsert).
+
+    Alternativa a save_climate_data para cargas grandes (séries
+    históricas multi-década): aceita qualquer iterável, inclusive
+    geradores, e grava em lotes sem materializar objetos ORM. Linhas já
+    existentes (source_api, latitude, longitude, date) são atualizadas.
+
+    Args:
+        data: Iterável de dicts no formato de save_climate_data
+        source_api: Nome da API fonte
+        auto_harmonize: Se True, harmoniza dados automaticamente
+            (mapeamento carregado uma única vez)
+        batch_size: Registros por lote COPY → merge
+
+    Returns:
+        Número de registros inseridos ou atualizados
+
+    Examples:
+        >>> def rows():
+        ...     for day, values in series:  # 1991-2020
+        ...         yield {
+        ...             'latitude': -22.72,
+        ...             'longitude': -47.64,
+        ...             'date': day,
+        ...             'raw_data': values,
+        ...         }
+        >>> save_climate_data_bulk(rows(), 'nasa_power')
+        10958
+    """
+    try:
+        mapping = get_variable_mapping(source_api) if auto_harmonize else None
+
+        with get_db_context() as db:
+            count = copy_merge(
+                db,
+                ClimateData.__tablename__,
+                CLIMATE_DATA_COPY_COLUMNS,
+                _iter_climate_rows(data, source_api, mapping),
+                conflict_columns=CLIMATE_DATA_CONFLICT_COLUMNS,
+                update_columns=[
+                    col
+                    for col in CLIMATE_DATA_COPY_COLUMNS
+                    if col not in CLIMATE_DATA_CONFLICT_COLUMNS
+                ],
+                batch_size=batch_size,
+            )
+            db.commit()
+
+        logger.info(
+            f"✅ Salvos {count} registros de {source_api} "
+            f"no PostgreSQL (COPY)"
+        )
+        return count
+
+    except SQLAlchemyError as e:
+        logger.error(f"❌ Erro SQLAlchemy ao salvar dados (COPY): {e}")
+        raise
+    except Exception as e:
+        logger.error(f"❌ Erro ao salvar dados climáticos (COPY): {e}")
+        raise
+
+
 # ==============================================================================
 # QUERIES E UTILITÁRIOS
 # ==============================================================================
 
 
+def _climate_range_query(
+    query: Query,
+    latitude: float,
+    longitude: float,
+    start_date: datetime,
+    end_date: datetime,
+    source_api: Optional[str] = None,
+) -> Query:
+    """Aplica o filtro de localização/intervalo e ordena por data."""
+    query = query.filter(
+        ClimateData.latitude == latitude,
+        ClimateData.longitude == longitude,
+        ClimateData.date >= start_date,
+        ClimateData.date <= end_date,
+    )
+
+    if source_api:
+        query = query.filter(ClimateData.source_api == source_api)
+
+    return query.order_by(ClimateData.date)
+
+
 def get_climate_data(
     latitude: float,
     longitude: float,
@@ -238,17 +448,59 @@ def get_climate_data(
         Lista de objetos ClimateData
     """
     with get_db_context() as db:
-        query = db.query(ClimateData).filter(
-            ClimateData.latitude == latitude,
-            ClimateData.longitude == longitude,
-            ClimateData.date >= start_date,
-            ClimateData.date <= end_date,
-        )
+        results = _climate_range_query(
+            db.query(ClimateData),
+            latitude,
+            longitude,
+            start_date,
+            end_date,
+            source_api,
+        ).all()
+
+    return results
+
+
+def get_climate_series(
+    latitude: float,
+    longitude: float,
+    start_date: datetime,
+    end_date: datetime,
+    source_api: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Busca série climática lendo apenas as colunas tipadas.
+
+    Versão enxuta de get_climate_data para o pipeline ETo e exportações:
+    não carrega raw_data/harmonized_data, então o PostgreSQL não precisa
+    fazer detoast nem o Python parsear JSONB linha a linha.
+
+    Args:
+        latitude: Latitude
+        longitude: Longitude
+        start_date: Data inicial
+        end_date: Data final
+        source_api: Filtro opcional por API
 
-        if source_api:
-            query = query.filter(ClimateData.source_api == source_api)
+    Returns:
+        Lista de dicts com date, source_api, eto_mm_day e HOT_COLUMNS
+    """
+    columns = [
+        ClimateData.date,
+        ClimateData.source_api,
+        ClimateData.eto_mm_day,
+        *(getattr(ClimateData, col) for col in HOT_COLUMNS),
+    ]
 
-        results = query.order_by(ClimateData.date).all()
+    with get_db_context() as db:
+        query = _climate_range_query(
+            db.query(*columns),
+            latitude,
+            longitude,
+            start_date,
+            end_date,
+            source_api,
+        )
+        results = [dict(row._mapping) for row in query]
 
     return results
 
@@ -281,3 +533,99 @@ def check_data_exists(
         )
 
     return count > 0
+
+
+# ==============================================================================
+# PARTIÇÕES DE climate_data (migration 003)
+# ==============================================================================
+
+
+def ensure_climate_data_partitions(
+    years_ahead: int = 1, start_year: Optional[int] = None
+) -> List[int]:
+    """
+    Garante partições anuais de climate_data até o ano atual + N.
+
+    Chama a função SQL climate_data_ensure_year_partition, que cria a
+    partição do ano (subdividida por source_api) e move para ela linhas
+    que tenham caído na partição DEFAULT. Anos com linhas na DEFAULT
+    (cargas históricas de anos sem partição) também ganham a sua.
+
+    Args:
+        years_ahead: Quantos anos à frente do atual pré-criar
+        start_year: Primeiro ano a verificar (default: ano atual)
+
+    Returns:
+        Lista de anos cujas partições foram criadas agora
+    """
+    current_year = datetime.utcnow().year
+    first_year = start_year if start_year is not None else current_year
+
+    created = []
+    with get_db_context() as db:
+        default_years = db.execute(
+            text(
+                "SELECT DISTINCT EXTRACT(YEAR FROM date)::INTEGER "
+                "FROM climate_data_default"
+            )
+        ).scalars()
+        years = set(range(first_year, current_year + years_ahead + 1))
+        years.update(default_years)
+
+        for year in sorted(years):
+            was_created = db.execute(
+                text("SELECT climate_data_ensure_year_partition(:year)"),
+                {"year": year},
+            ).scalar()
+            if was_created:
+                created.append(year)
+        db.commit()
+
+    if created:
+        logger.info(f"✅ Partições climate_data criadas: {created}")
+    return created
+
+
+def drop_climate_data_partitions_before(year: int) -> List[int]:
+    """
+    Remove (DETACH + DROP) partições anuais anteriores a um ano.
+
+    Retenção barata: cada ano removido é um DROP TABLE, sem DELETE
+    linha a linha nem VACUUM posterior.
+
+    Args:
+        year: Primeiro ano mantido
+
+    Returns:
+        Lista de anos removidos
+    """
+    with get_db_context() as db:
+        years = (
+            db.execute(
+                text(
+                    """
+                    SELECT substring(c.relname FROM 'climate_data_y([0-9]+)$')
+                        ::INTEGER AS year
+                    FROM pg_inherits i
+                    JOIN pg_class c ON c.oid = i.inhrelid
+                    WHERE i.inhparent = 'climate_data'::regclass
+                      AND c.relname ~ '^climate_data_y[0-9]+$'
+                    """
+                )
+            )
+            .scalars()
+            .all()
+        )
+
+        dropped = []
+        for old_year in sorted(y for y in years if y < year):
+            db.execute(
+                text("SELECT climate_data_drop_year_partition(:year)"),
+                {"year": old_year},
+            )
+            dropped.append(old_year)
+        db.commit()
+
+    if dropped:
+        logger.info(f"🗑️ Partições climate_data removidas: {dropped}")
+    return dropped
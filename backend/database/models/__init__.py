@@ -5,6 +5,8 @@ Exporta todos os modelos de banco de dados.
 from backend.database.models.admin_user import AdminUser
 from backend.database.models.api_variables import APIVariables
 from backend.database.models.climate_data import ClimateData
+from backend.database.models.climate_series import ClimateSeriesYearly
+from backend.database.models.nws_grid_point import NWSGridPoint
 from backend.database.models.user_cache import CacheMetadata, UserSessionCache
 from backend.database.models.user_favorites import (
     FavoriteLocation,
@@ -16,6 +18,8 @@ __all__ = [
     "AdminUser",
     "APIVariables",
     "ClimateData",
+    "ClimateSeriesYearly",
+    "NWSGridPoint",
     "UserSessionCache",
     "CacheMetadata",
     "UserFavorites",
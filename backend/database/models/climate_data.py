@@ -11,12 +11,60 @@ Suporta 6 fontes de dados com JSONB flexível:
 """
 
 from datetime import datetime
+from typing import Dict, Tuple
 
-from sqlalchemy import Column, DateTime, Float, Index, Integer, String
+from sqlalchemy import (
+    REAL,
+    Column,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 
 from backend.database.connection import Base
 
+# Colunas tipadas de ClimateData → nomes aceitos em harmonized_data/raw_data
+# (nomes padronizados dos dois seeds de api_variables + nomes brutos
+# NASA POWER / Open-Meteo usados pelo pipeline ETo), em ordem de prioridade.
+# Fonte única para a gravação (data_storage), o índice de cobertura e o
+# backfill da migration 004
+HOT_COLUMN_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "temp_max_c": ("temp_max_c", "temp_max", "T2M_MAX", "temperature_2m_max"),
+    "temp_min_c": ("temp_min_c", "temp_min", "T2M_MIN", "temperature_2m_min"),
+    "temp_mean_c": (
+        "temp_mean_c",
+        "temp_mean",
+        "T2M_MEAN",
+        "T2M",
+        "temperature_2m_mean",
+    ),
+    "humidity_percent": (
+        "humidity_percent",
+        "relative_humidity_mean",
+        "RH2M",
+        "relative_humidity_2m_mean",
+    ),
+    # Só nomes de u2 (2 m, média): wind_speed_ms dos seeds mistura 10 m e
+    # máximas diárias e não pode ir para a coluna lida pelo ETo
+    "wind_speed_2m_ms": ("wind_speed_2m_mean", "WS2M"),
+    "solar_radiation_mjm2": (
+        "solar_radiation_mjm2",
+        "solar_radiation",
+        "ALLSKY_SFC_SW_DWN",
+        "shortwave_radiation_sum",
+    ),
+    "precipitation_mm": (
+        "precipitation_mm",
+        "precipitation_sum_mm",
+        "PRECTOTCORR",
+        "precipitation_sum",
+    ),
+}
+
 
 class ClimateData(Base):
     """
@@ -36,6 +84,9 @@ class ClimateData(Base):
         date: Data dos dados climáticos
         raw_data: Dados originais da API em formato JSONB (flexível)
         harmonized_data: Dados normalizados em formato padronizado
+        temp_max_c ... precipitation_mm: Colunas tipadas (real) com as
+            variáveis usadas pelo ETo/exportações, extraídas de
+            harmonized_data/raw_data na gravação (evita ler JSONB)
         eto_mm_day: Evapotranspiração de referência calculada (mm/dia)
         eto_method: Método usado para cálculo (penman_monteith, etc.)
         quality_flags: Flags de qualidade dos dados
@@ -83,10 +134,30 @@ class ClimateData(Base):
 
     __tablename__ = "climate_data"
     __table_args__ = (
+        # Chave natural (migration 001) - alvo do upsert ON CONFLICT
+        UniqueConstraint(
+            "source_api",
+            "latitude",
+            "longitude",
+            "date",
+            name="uq_climate_data_location_date",
+        ),
         # Índices compostos para otimização
-        Index("idx_climate_location_date", "latitude", "longitude", "date"),
-        Index("idx_climate_source_date", "source_api", "date"),
-        Index("idx_climate_date", "date"),
+        # (a tabela física é particionada por ano/fonte - migration 003;
+        # source_api + date é coberto por partition pruning)
+        # Cobre as queries de intervalo (get_climate_series) - migration 004
+        Index(
+            "idx_climate_data_location_hot",
+            "latitude",
+            "longitude",
+            "date",
+            postgresql_include=[
+                "source_api",
+                "eto_mm_day",
+                *HOT_COLUMN_ALIASES,
+            ],
+        ),
+        Index("idx_climate_date", "date", postgresql_using="brin"),
         # Schema público
         {"schema": "public"},
     )
@@ -143,6 +214,25 @@ class ClimateData(Base):
         comment="Dados harmonizados em formato padronizado",
     )
 
+    # === Variáveis harmonizadas (colunas tipadas "quentes") ===
+    # Preenchidas por data_storage.extract_hot_columns na gravação;
+    # queries de intervalo leem só estas colunas (sem detoast de JSONB)
+    temp_max_c = Column(REAL, nullable=True, comment="Tmax (°C)")
+    temp_min_c = Column(REAL, nullable=True, comment="Tmin (°C)")
+    temp_mean_c = Column(REAL, nullable=True, comment="Tmean (°C)")
+    humidity_percent = Column(
+        REAL, nullable=True, comment="Umidade relativa média (%)"
+    )
+    wind_speed_2m_ms = Column(
+        REAL, nullable=True, comment="Velocidade do vento a 2m - u2 (m/s)"
+    )
+    solar_radiation_mjm2 = Column(
+        REAL, nullable=True, comment="Radiação solar - Rs (MJ/m²/dia)"
+    )
+    precipitation_mm = Column(
+        REAL, nullable=True, comment="Precipitação (mm/dia)"
+    )
+
     # === Resultado ETo ===
     eto_mm_day = Column(
         Float,
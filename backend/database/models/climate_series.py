@@ -0,0 +1,108 @@
+"""
+Modelo para armazenamento compacto de séries climáticas longas.
+
+Uma linha por (fonte, ponto de grade, ano) com um array ``real[]`` por
+variável, indexado pelo dia do ano (posição 0 = 1º de janeiro). Uma
+série 1991-2020 de uma cidade ocupa 30 linhas em vez de ~11 mil linhas
+de climate_data com JSONB.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import (
+    REAL,
+    Column,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from backend.database.connection import Base
+
+
+class ClimateSeriesYearly(Base):
+    """
+    Série diária de um ano inteiro para uma fonte e localização.
+
+    Cada coluna de variável guarda 365/366 valores (dias sem dado = NaN),
+    com as mesmas variáveis das colunas tipadas de ClimateData.
+
+    Attributes:
+        source_api: Nome da API fonte ('nasa_power', etc.)
+        latitude: Latitude do ponto de grade
+        longitude: Longitude do ponto de grade
+        year: Ano da série
+        n_days: Número de dias do ano (365 ou 366)
+        eto_mm_day ... precipitation_mm: Arrays real[] por variável
+        updated_at: Data da última gravação
+
+    Examples:
+        # Leitura direta em NumPy
+        >>> from backend.database.series_storage import load_series
+        >>> series = load_series(
+        ...     'nasa_power', -22.72, -47.64,
+        ...     date(1991, 1, 1), date(2020, 12, 31),
+        ... )
+        >>> series['temp_max_c'].shape
+        (10958,)
+    """
+
+    __tablename__ = "climate_series_yearly"
+    __table_args__ = (
+        UniqueConstraint(
+            "source_api",
+            "latitude",
+            "longitude",
+            "year",
+            name="uq_climate_series_yearly_location_year",
+        ),
+        Index("idx_climate_series_yearly_year", "year"),
+        {"schema": "public"},
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    source_api = Column(String(50), nullable=False, comment="Fonte da API")
+    latitude = Column(Float, nullable=False, comment="Latitude")
+    longitude = Column(Float, nullable=False, comment="Longitude")
+    year = Column(SmallInteger, nullable=False, comment="Ano da série")
+    n_days = Column(
+        SmallInteger, nullable=False, comment="Dias no ano (365/366)"
+    )
+
+    # === Variáveis (um valor por dia do ano) ===
+    eto_mm_day = Column(ARRAY(REAL), nullable=True, comment="ETo (mm/dia)")
+    temp_max_c = Column(ARRAY(REAL), nullable=True, comment="Tmax (°C)")
+    temp_min_c = Column(ARRAY(REAL), nullable=True, comment="Tmin (°C)")
+    temp_mean_c = Column(ARRAY(REAL), nullable=True, comment="Tmean (°C)")
+    humidity_percent = Column(
+        ARRAY(REAL), nullable=True, comment="Umidade relativa (%)"
+    )
+    wind_speed_2m_ms = Column(
+        ARRAY(REAL), nullable=True, comment="Vento a 2m - u2 (m/s)"
+    )
+    solar_radiation_mjm2 = Column(
+        ARRAY(REAL), nullable=True, comment="Radiação solar (MJ/m²/dia)"
+    )
+    precipitation_mm = Column(
+        ARRAY(REAL), nullable=True, comment="Precipitação (mm/dia)"
+    )
+
+    updated_at = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        comment="Data da última gravação",
+    )
+
+    def __repr__(self):
+        return (
+            f"<ClimateSeriesYearly(source={self.source_api}, "
+            f"lat={self.latitude}, lon={self.longitude}, "
+            f"year={self.year})>"
+        )
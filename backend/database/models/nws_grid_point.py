@@ -0,0 +1,79 @@
+"""
+Modelo para cache persistente de metadados de grid NWS.
+
+O mapeamento ponto → grid NWS (/points/{lat},{lon}) praticamente não
+muda, assim como a lista de estações próximas de um ponto. Esta tabela
+guarda os dois por coordenada quantizada, como segundo nível do cache
+Redis (backend.infrastructure.cache.nws_grid_cache).
+"""
+
+from datetime import datetime
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+
+from backend.database.connection import Base
+
+
+class NWSGridPoint(Base):
+    """
+    Metadados NWS de um ponto quantizado (grid e estações próximas).
+
+    Attributes:
+        latitude: Latitude quantizada (NWSGridCache.quantize)
+        longitude: Longitude quantizada
+        grid_id: Escritório NWS (ex.: 'BOU')
+        grid_x: Coluna do grid
+        grid_y: Linha do grid
+        forecast_url: URL do forecast por períodos
+        forecast_hourly_url: URL do forecast horário
+        grid_updated_at: Data da última consulta a /points
+        stations: Lista de estações próximas (JSON, ordem da API)
+        stations_updated_at: Data da última consulta a /points/.../stations
+    """
+
+    __tablename__ = "nws_grid_points"
+    __table_args__ = (
+        UniqueConstraint(
+            "latitude", "longitude", name="uq_nws_grid_points_location"
+        ),
+        {"schema": "public"},
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    latitude = Column(Float, nullable=False, comment="Latitude quantizada")
+    longitude = Column(Float, nullable=False, comment="Longitude quantizada")
+
+    # === Grid (/points/{lat},{lon}) ===
+    grid_id = Column(String(10), nullable=True, comment="Escritório NWS")
+    grid_x = Column(Integer, nullable=True, comment="Coluna do grid")
+    grid_y = Column(Integer, nullable=True, comment="Linha do grid")
+    forecast_url = Column(Text, nullable=True, comment="URL forecast")
+    forecast_hourly_url = Column(
+        Text, nullable=True, comment="URL forecast horário"
+    )
+    grid_updated_at = Column(
+        DateTime, nullable=True, comment="Última consulta do grid"
+    )
+
+    # === Estações próximas (/points/{lat},{lon}/stations) ===
+    stations = Column(JSONB, nullable=True, comment="Estações próximas")
+    stations_updated_at = Column(
+        DateTime, nullable=True, comment="Última consulta das estações"
+    )
+
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return (
+            f"<NWSGridPoint(lat={self.latitude}, lon={self.longitude}, "
+            f"grid={self.grid_id}/{self.grid_x},{self.grid_y})>"
+        )
@@ -0,0 +1,236 @@
+"""
+Armazenamento compacto de séries diárias longas (arrays anuais).
+
+Grava e lê a tabela climate_series_yearly: uma linha por
+(fonte, localização, ano) com um array ``real[]`` por variável.
+Pensado para séries multi-década (validação 1991-2020, exportações
+históricas), onde climate_data geraria dezenas de milhares de linhas
+com JSONB por localização.
+
+A leitura devolve arrays NumPy diretamente, sem objetos por dia.
+"""
+
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+from loguru import logger
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from backend.database.connection import get_db_context
+from backend.database.data_storage import HOT_COLUMNS
+from backend.database.models.climate_series import ClimateSeriesYearly
+
+# Variáveis armazenadas (mesmas colunas tipadas de climate_data + ETo)
+SERIES_VARIABLES: Tuple[str, ...] = ("eto_mm_day", *HOT_COLUMNS)
+
+
+def _days_in_year(year: int) -> int:
+    """Número de dias do ano (365 ou 366)."""
+    start = np.datetime64(f"{year}-01-01", "D")
+    end = np.datetime64(f"{year + 1}-01-01", "D")
+    return int((end - start).astype(int))
+
+
+def split_by_year(
+    dates: Iterable[Any],
+    values: Dict[str, Sequence[float]],
+) -> Iterator[Tuple[int, Dict[str, np.ndarray]]]:
+    """
+    Divide uma série diária em arrays anuais alinhados ao dia do ano.
+
+    Args:
+        dates: Datas da série (date, datetime, str ISO ou datetime64)
+        values: {variável: valores} na mesma ordem de ``dates``
+
+    Yields:
+        (ano, {variável: array float32 de 365/366 posições}); dias sem
+        dado ficam como NaN
+    """
+    day_index = np.asarray(dates, dtype="datetime64[D]")
+    years = day_index.astype("datetime64[Y]").astype(int) + 1970
+    columns = {
+        var: np.asarray(vals, dtype=np.float32)
+        for var, vals in values.items()
+        if var in SERIES_VARIABLES
+    }
+
+    for year in np.unique(years):
+        mask = years == year
+        offsets = (
+            day_index[mask] - np.datetime64(f"{year}-01-01", "D")
+        ).astype(int)
+        n_days = _days_in_year(int(year))
+
+        arrays = {}
+        for var, column in columns.items():
+            arr = np.full(n_days, np.nan, dtype=np.float32)
+            arr[offsets] = column[mask]
+            arrays[var] = arr
+
+        yield int(year), arrays
+
+
+def save_series(
+    source_api: str,
+    latitude: float,
+    longitude: float,
+    dates: Iterable[Any],
+    values: Dict[str, Sequence[float]],
+) -> int:
+    """
+    Salva uma série diária no formato de arrays anuais (upsert).
+
+    Dias já gravados e ausentes na nova série são preservados: os
+    arrays novos são completados com os existentes antes do upsert.
+
+    Args:
+        source_api: Nome da API fonte
+        latitude: Latitude do ponto de grade
+        longitude: Longitude do ponto de grade
+        dates: Datas da série
+        values: {variável: valores}; variáveis fora de SERIES_VARIABLES
+            são ignoradas
+
+    Returns:
+        Número de anos gravados
+
+    Examples:
+        >>> df = download_weather_data(...)  # 1991-2020
+        >>> save_series(
+        ...     'nasa_power', -22.72, -47.64,
+        ...     df.index,
+        ...     {'temp_max_c': df['T2M_MAX'], 'eto_mm_day': df['ETo']},
+        ... )
+        30
+    """
+    yearly = dict(split_by_year(dates, values))
+    if not yearly:
+        return 0
+
+    table = ClimateSeriesYearly
+    with get_db_context() as db:
+        # Completa dias ausentes com o que já está no banco
+        existing = (
+            db.query(table)
+            .filter(
+                table.source_api == source_api,
+                table.latitude == latitude,
+                table.longitude == longitude,
+                table.year.in_(list(yearly)),
+            )
+            .all()
+        )
+        for row in existing:
+            for var, arr in yearly[row.year].items():
+                stored = getattr(row, var)
+                if stored is None:
+                    continue
+                missing = np.isnan(arr)
+                arr[missing] = np.asarray(stored, dtype=np.float32)[missing]
+
+        now = datetime.utcnow()
+        rows = [
+            {
+                "source_api": source_api,
+                "latitude": latitude,
+                "longitude": longitude,
+                "year": year,
+                "n_days": _days_in_year(year),
+                "updated_at": now,
+                **{var: arr.tolist() for var, arr in arrays.items()},
+            }
+            for year, arrays in yearly.items()
+        ]
+        variables = sorted(
+            {var for arrays in yearly.values() for var in arrays}
+        )
+
+        stmt = pg_insert(table).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_climate_series_yearly_location_year",
+            set_={
+                "updated_at": stmt.excluded.updated_at,
+                **{var: stmt.excluded[var] for var in variables},
+            },
+        )
+        db.execute(stmt)
+        db.commit()
+
+    logger.info(
+        f"✅ Série {source_api} ({latitude}, {longitude}): "
+        f"{len(rows)} anos gravados"
+    )
+    return len(rows)
+
+
+def load_series(
+    source_api: str,
+    latitude: float,
+    longitude: float,
+    start_date: date,
+    end_date: date,
+    variables: Optional[Sequence[str]] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Lê uma série diária como arrays NumPy.
+
+    Args:
+        source_api: Nome da API fonte
+        latitude: Latitude do ponto de grade
+        longitude: Longitude do ponto de grade
+        start_date: Data inicial (inclusiva)
+        end_date: Data final (inclusiva)
+        variables: Variáveis desejadas (default: SERIES_VARIABLES)
+
+    Returns:
+        Dict com 'dates' (datetime64[D]) e um array float32 por variável,
+        todos com um elemento por dia do intervalo (NaN = sem dado)
+    """
+    variables = tuple(variables or SERIES_VARIABLES)
+    unknown = set(variables) - set(SERIES_VARIABLES)
+    if unknown:
+        raise ValueError(f"Variáveis desconhecidas: {sorted(unknown)}")
+
+    start = np.datetime64(start_date, "D")
+    end = np.datetime64(end_date, "D")
+    dates = np.arange(start, end + 1, dtype="datetime64[D]")
+    result: Dict[str, np.ndarray] = {"dates": dates}
+    for var in variables:
+        result[var] = np.full(len(dates), np.nan, dtype=np.float32)
+
+    table = ClimateSeriesYearly
+    first_year = int(start.astype("datetime64[Y]").astype(int)) + 1970
+    last_year = int(end.astype("datetime64[Y]").astype(int)) + 1970
+
+    with get_db_context() as db:
+        rows = (
+            db.query(table.year, *(getattr(table, v) for v in variables))
+            .filter(
+                table.source_api == source_api,
+                table.latitude == latitude,
+                table.longitude == longitude,
+                table.year >= first_year,
+                table.year <= last_year,
+            )
+            .order_by(table.year)
+            .all()
+        )
+
+    for row in rows:
+        year_start = np.datetime64(f"{row.year}-01-01", "D")
+        # Posição do 1º dia do ano dentro do intervalo pedido
+        offset = int((year_start - start).astype(int))
+        src_from = max(0, -offset)
+        dst_from = max(0, offset)
+
+        for var in variables:
+            stored = getattr(row, var)
+            if stored is None:
+                continue
+            arr = np.asarray(stored, dtype=np.float32)[src_from:]
+            length = min(len(arr), len(dates) - dst_from)
+            if length > 0:
+                result[var][dst_from : dst_from + length] = arr[:length]
+
+    return result
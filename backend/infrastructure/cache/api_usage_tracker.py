@@ -1,8 +1,23 @@
 """
 API Usage Tracker - Monitor daily API consumption.
 
-Rastreia consumo diário de cada API climática e alerta
-quando próximo dos limites.
+Rastreia consumo de cada API climática (por minuto e por dia), com
+ritmo de consumo da quota e alerta quando próximo dos limites.
+
+Cada requisição que sai para uma fonte é contada no transport base dos
+clientes (http_transport para httpx, track_session para as sessões
+requests do Open-Meteo): retries e hedges contam, hits de cache não.
+
+record/track_api_call só incrementam um contador em memória; o
+UsageRecorder grava o acumulado no Redis em lote (um pipeline a cada
+FLUSH_SECONDS), em hashes por minuto e por dia com um campo por fonte:
+
+    api_usage:minute:202501011230 → {nasa_power: 12, met_norway: 3}
+    api_usage:day:2025-01-01      → {nasa_power: 245, ...}
+
+Depois de cada gravação, o mesmo pipeline lê o dia e os últimos
+BURN_WINDOW_MINUTES minutos: o snapshot local (get_quota_status) e os
+gauges climate_api_quota_* ficam atualizados sem varrer chaves.
 
 Usage:
     from backend.infrastructure.cache.api_usage_tracker import (
@@ -22,12 +37,25 @@ Usage:
         logger.warning("NASA POWER quota exceeded!")
 """
 
-from datetime import datetime
+import math
+import os
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Callable
 
+import httpx
 from loguru import logger
 from redis import Redis
 
-from backend.core.config import settings
+from backend.api.middleware.prometheus_metrics import (
+    CLIMATE_API_BURN_RATE,
+    CLIMATE_API_EXHAUSTION_SECONDS,
+    CLIMATE_API_QUOTA_USED,
+)
+from config.settings.app_config import get_settings
 
 # API Limits (requests per day)
 API_LIMITS = {
@@ -43,61 +71,321 @@ API_LIMITS = {
 WARNING_THRESHOLD = 0.80  # 80%
 CRITICAL_THRESHOLD = 0.95  # 95%
 
+KEY_PREFIX = "api_usage"
+MINUTE_FORMAT = "%Y%m%d%H%M"
+DAY_FORMAT = "%Y-%m-%d"
+
 
+@lru_cache(maxsize=1)
 def _get_redis() -> Redis:
-    """Get Redis connection."""
-    return Redis.from_url(settings.redis.redis_url, decode_responses=True)
+    """Cliente Redis compartilhado (pool de conexões do próprio cliente)."""
+    return Redis.from_url(
+        get_settings().redis.redis_url,
+        decode_responses=True,
+        socket_connect_timeout=2,
+        socket_timeout=2,
+    )
 
 
-def _get_usage_key(api_name: str, date: str | None = None) -> str:
-    """Get Redis key for API usage tracking."""
+def _minute_key(minute: str) -> str:
+    """Hash de chamadas por fonte num minuto (YYYYmmddHHMM)."""
+    return f"{KEY_PREFIX}:minute:{minute}"
+
+
+def _get_usage_key(date: str | None = None) -> str:
+    """Hash de chamadas por fonte num dia (YYYY-MM-DD, padrão: hoje)."""
     if date is None:
-        date = datetime.now().strftime("%Y-%m-%d")
-    return f"api_usage:{api_name}:{date}"
+        date = datetime.now().strftime(DAY_FORMAT)
+    return f"{KEY_PREFIX}:day:{date}"
 
 
-def track_api_call(api_name: str, requests_count: int = 1) -> int:
-    """
-    Track API call and return current daily usage.
+def _usage_stats(api_name: str, current_usage: int) -> dict[str, Any]:
+    """Estatísticas de uso do dia frente ao limite da API."""
+    limit = API_LIMITS.get(api_name)
+    if limit is not None:
+        usage_percent = (current_usage / limit) * 100
+        remaining = limit - current_usage
+    else:
+        usage_percent = None
+        remaining = None
 
-    Args:
-        api_name: Nome da API ("nasa_power", "nws_forecast", etc.)
-        requests_count: Número de requests feitos (padrão: 1)
+    return {
+        "requests_today": current_usage,
+        "limit": limit,
+        "usage_percent": usage_percent,
+        "remaining": remaining,
+    }
 
-    Returns:
-        Número total de requests hoje para essa API
 
-    Example:
-        >>> usage = track_api_call("nasa_power")
-        >>> print(f"NASA POWER usage today: {usage}/1000")
+class UsageRecorder:
     """
-    redis = _get_redis()
-    key = _get_usage_key(api_name)
+    Contadores de chamadas por fonte, gravados no Redis em lote.
 
-    # Incrementar contador
-    current_usage_raw = redis.incr(key, requests_count)
-    current_usage = int(current_usage_raw) if current_usage_raw else 0
+    record() é seguro entre threads e não faz I/O; uma thread daemon
+    (recriada após fork, como no async_bridge) grava a cada
+    FLUSH_SECONDS, ou antes se MAX_PENDING chamadas se acumularem.
+    Erros de Redis só geram log: o lote volta para o buffer e vai na
+    próxima gravação.
+    """
 
-    # Definir TTL de 48h (manter histórico 2 dias)
-    redis.expire(key, 86400 * 2)
+    FLUSH_SECONDS = 5.0
+    MAX_PENDING = 500
+    MINUTE_TTL = 2 * 3600
+    DAY_TTL = 2 * 86400  # Manter histórico 2 dias
+    BURN_WINDOW_MINUTES = 15
+
+    def __init__(self, redis_factory: Callable[[], Redis] = _get_redis):
+        """
+        Inicializa o recorder.
+
+        Args:
+            redis_factory: Fornece o cliente Redis (síncrono)
+        """
+        self._redis_factory = redis_factory
+        self._lock = threading.Lock()
+        self._pending: Counter = Counter()  # (minuto, fonte) → chamadas
+        self._pending_total = 0
+        self._wakeup = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+        self._levels: dict[str, str] = {}
+        self.snapshot: dict[str, dict[str, Any]] = {}
+        self.snapshot_at = float("-inf")
+
+    def record(self, source: str, count: int = 1) -> None:
+        """Conta ``count`` chamadas à fonte no minuto corrente."""
+        minute = datetime.now().strftime(MINUTE_FORMAT)
+        self._ensure_thread()
+        with self._lock:
+            self._pending[(minute, source)] += count
+            self._pending_total += count
+            full = self._pending_total >= self.MAX_PENDING
+        if full:
+            self._wakeup.set()
+
+    def pending(self, source: str) -> int:
+        """Chamadas de hoje à fonte ainda não gravadas no Redis."""
+        today = datetime.now().strftime("%Y%m%d")
+        with self._lock:
+            return sum(
+                count
+                for (minute, name), count in self._pending.items()
+                if name == source and minute.startswith(today)
+            )
 
-    # Verificar e alertar se próximo do limite
-    limit = API_LIMITS.get(api_name)
-    if limit is not None:
-        usage_percent = current_usage / limit
+    def flush(self) -> bool:
+        """
+        Grava o buffer e atualiza snapshot e gauges (um pipeline).
+
+        Returns:
+            False se o Redis falhou (o lote continua no buffer)
+        """
+        with self._lock:
+            batch, self._pending = self._pending, Counter()
+            self._pending_total = 0
+
+        now = datetime.now()
+        minutes = [
+            (now - timedelta(minutes=offset)).strftime(MINUTE_FORMAT)
+            for offset in range(self.BURN_WINDOW_MINUTES)
+        ]
+        try:
+            pipe = self._redis_factory().pipeline(transaction=False)
+            expires: dict[str, int] = {}
+            for (minute, source), count in batch.items():
+                day = f"{minute[:4]}-{minute[4:6]}-{minute[6:8]}"
+                pipe.hincrby(_minute_key(minute), source, count)
+                pipe.hincrby(_get_usage_key(day), source, count)
+                expires[_minute_key(minute)] = self.MINUTE_TTL
+                expires[_get_usage_key(day)] = self.DAY_TTL
+            for key, ttl in expires.items():
+                pipe.expire(key, ttl)
+            pipe.hgetall(_get_usage_key(now.strftime(DAY_FORMAT)))
+            for minute in minutes:
+                pipe.hgetall(_minute_key(minute))
+            results = pipe.execute()
+        except Exception as e:
+            with self._lock:
+                self._pending.update(batch)
+                self._pending_total += sum(batch.values())
+            logger.warning(f"Erro ao gravar uso de APIs no Redis: {e}")
+            return False
+
+        window = results[-len(minutes) :]
+        self._update_snapshot(results[-len(minutes) - 1], window, now)
+        return True
 
+    def status(self, max_age: float | None = None) -> dict[str, dict]:
+        """
+        Snapshot de uso, ritmo e projeção por fonte.
+
+        Args:
+            max_age: Idade máxima do snapshot (padrão: 2 * FLUSH_SECONDS);
+                mais velho que isso, grava/relê antes de responder
+        """
+        if max_age is None:
+            max_age = 2 * self.FLUSH_SECONDS
+        if time.monotonic() - self.snapshot_at > max_age:
+            self.flush()
+        return self.snapshot
+
+    def _update_snapshot(
+        self,
+        today: dict[str, str],
+        window: list[dict[str, str]],
+        now: datetime,
+    ) -> None:
+        # Janela: minutos completos + a fração do minuto corrente
+        elapsed = len(window) - 1 + now.second / 60
+        midnight = datetime.combine(
+            now.date() + timedelta(days=1), datetime.min.time()
+        )
+        until_reset = (midnight - now).total_seconds()
+
+        snapshot = {}
+        for source in set(API_LIMITS) | set(today):
+            used = int(today.get(source, 0))
+            calls = sum(int(minute.get(source, 0)) for minute in window)
+            stats = _usage_stats(source, used)
+            stats["burn_rate_per_minute"] = calls / elapsed
+            stats["exhaustion_seconds"] = None
+
+            CLIMATE_API_BURN_RATE.labels(source=source).set(
+                stats["burn_rate_per_minute"]
+            )
+            limit = stats["limit"]
+            if limit is not None:
+                # Projeção no ritmo atual; +Inf se não esgota antes da
+                # virada do dia (quando a quota zera)
+                exhaustion = math.inf
+                if stats["remaining"] <= 0:
+                    exhaustion = 0.0
+                elif calls:
+                    seconds = stats["remaining"] / calls * elapsed * 60
+                    if seconds < until_reset:
+                        exhaustion = seconds
+                stats["exhaustion_seconds"] = exhaustion
+                CLIMATE_API_EXHAUSTION_SECONDS.labels(source=source).set(
+                    exhaustion
+                )
+                CLIMATE_API_QUOTA_USED.labels(source=source).set(used / limit)
+                self._alert(source, used, limit)
+            snapshot[source] = stats
+
+        self.snapshot = snapshot
+        self.snapshot_at = time.monotonic()
+
+    def _alert(self, source: str, used: int, limit: int) -> None:
+        """Loga quando a fonte cruza os limiares (uma vez por nível)."""
+        usage_percent = used / limit
         if usage_percent >= CRITICAL_THRESHOLD:
+            level = "critical"
+        elif usage_percent >= WARNING_THRESHOLD:
+            level = "warning"
+        else:
+            level = "ok"
+        if self._levels.get(source, "ok") == level:
+            return
+        self._levels[source] = level
+
+        if level == "critical":
             logger.critical(
-                f"🚨 {api_name.upper()} CRITICAL: {current_usage}/{limit} "
+                f"🚨 {source.upper()} CRITICAL: {used}/{limit} "
                 f"requests ({usage_percent:.1%}) - NEAR LIMIT!"
             )
-        elif usage_percent >= WARNING_THRESHOLD:
+        elif level == "warning":
             logger.warning(
-                f"⚠️ {api_name.upper()} WARNING: {current_usage}/{limit} "
+                f"⚠️ {source.upper()} WARNING: {used}/{limit} "
                 f"requests ({usage_percent:.1%})"
             )
 
-    return current_usage
+    def _ensure_thread(self) -> None:
+        """Inicia a thread de gravação (de novo em processo filho)."""
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            # Após fork: o buffer herdado é do processo pai
+            self._pending.clear()
+            self._pending_total = 0
+            self._thread = threading.Thread(
+                target=self._run, name="api-usage-recorder", daemon=True
+            )
+            self._thread.start()
+            self._pid = os.getpid()
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait(self.FLUSH_SECONDS)
+            self._wakeup.clear()
+            self.flush()
+
+
+@lru_cache(maxsize=1)
+def get_usage_recorder() -> UsageRecorder:
+    """Recorder do processo (compartilhado por todas as fontes)."""
+    return UsageRecorder()
+
+
+class UsageTransport(httpx.AsyncBaseTransport):
+    """Transport httpx que conta cada requisição enviada à fonte."""
+
+    def __init__(self, source: str, transport: httpx.AsyncBaseTransport):
+        self.source = source
+        self.transport = transport
+
+    async def handle_async_request(
+        self, request: httpx.Request
+    ) -> httpx.Response:
+        track_api_call(self.source)
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+def track_session(session: Any, source: str) -> None:
+    """
+    Conta as respostas de uma sessão requests que vieram da rede (nem
+    do requests-cache, ``from_cache``, nem do modo replay, ``x-replay``).
+
+    Args:
+        session: Sessão requests (ex.: CachedSession do Open-Meteo)
+        source: ID da fonte
+    """
+
+    def count(response, *args, **kwargs):
+        if getattr(response, "from_cache", False):
+            return
+        if "x-replay" not in response.headers:
+            track_api_call(source)
+
+    session.hooks["response"].append(count)
+
+
+def track_api_call(api_name: str, requests_count: int = 1) -> int:
+    """
+    Track API call and return current daily usage.
+
+    Não faz I/O: o uso retornado é o do último snapshot mais as
+    chamadas ainda não gravadas por este processo.
+
+    Args:
+        api_name: Nome da API ("nasa_power", "nws_forecast", etc.)
+        requests_count: Número de requests feitos (padrão: 1)
+
+    Returns:
+        Número total de requests hoje para essa API (aproximado)
+
+    Example:
+        >>> usage = track_api_call("nasa_power")
+        >>> print(f"NASA POWER usage today: {usage}/1000")
+    """
+    recorder = get_usage_recorder()
+    recorder.record(api_name, requests_count)
+    recorded = recorder.snapshot.get(api_name, {}).get("requests_today", 0)
+    return recorded + recorder.pending(api_name)
 
 
 def get_api_usage(
@@ -124,30 +412,26 @@ def get_api_usage(
         >>> stats = get_api_usage("nasa_power")
         >>> print(f"Used: {stats['usage_percent']:.1f}%")
     """
-    redis = _get_redis()
-    key = _get_usage_key(api_name, date)
-
-    # Get current usage
-    usage_str = redis.get(key)
+    usage_str = _get_redis().hget(_get_usage_key(date), api_name)
     current_usage = int(usage_str) if usage_str else 0
+    if date is None:
+        current_usage += get_usage_recorder().pending(api_name)
+    return _usage_stats(api_name, current_usage)
 
-    # Get limit
-    limit = API_LIMITS.get(api_name)
 
-    # Calculate stats
-    if limit is not None:
-        usage_percent = (current_usage / limit) * 100
-        remaining = limit - current_usage
-    else:
-        usage_percent = None
-        remaining = None
+def get_quota_status() -> dict[str, dict]:
+    """
+    Uso, ritmo e projeção de esgotamento de todas as fontes.
 
-    return {
-        "requests_today": current_usage,
-        "limit": limit,
-        "usage_percent": usage_percent,
-        "remaining": remaining,
-    }
+    Lido do snapshot do processo (no máximo 2 * FLUSH_SECONDS de
+    idade), então pode ser consultado a cada requisição.
+
+    Returns:
+        Dict por fonte com os campos de get_api_usage mais
+        "burn_rate_per_minute" (média da janela) e "exhaustion_seconds"
+        (None sem limite; inf se não esgota antes da virada do dia)
+    """
+    return get_usage_recorder().status()
 
 
 def check_api_quota(api_name: str, required_requests: int = 1) -> bool:
@@ -173,9 +457,10 @@ def check_api_quota(api_name: str, required_requests: int = 1) -> bool:
     if limit is None:
         return True
 
-    # Verificar uso atual
-    stats = get_api_usage(api_name)
-    current_usage = stats["requests_today"] or 0
+    # Verificar uso atual (snapshot + chamadas ainda não gravadas)
+    recorder = get_usage_recorder()
+    stats = recorder.status().get(api_name, {})
+    current_usage = stats.get("requests_today", 0) + recorder.pending(api_name)
 
     # Verificar se tem espaço
     return (current_usage + required_requests) <= limit
@@ -186,7 +471,7 @@ def get_all_api_usage() -> dict[str, dict]:
     Get usage stats for all APIs.
 
     Returns:
-        Dict com stats de todas APIs:
+        Dict com stats de todas APIs (um HGETALL):
         {
             "nasa_power": {"requests_today": 245, "limit": 1000, ...},
             "nws_forecast": {...},
@@ -198,8 +483,14 @@ def get_all_api_usage() -> dict[str, dict]:
         >>> for api_name, api_stats in stats.items():
         ...     print(f"{api_name}: {api_stats['requests_today']} requests")
     """
+    today = _get_redis().hgetall(_get_usage_key())
+    recorder = get_usage_recorder()
     return {
-        api_name: get_api_usage(api_name) for api_name in API_LIMITS.keys()
+        api_name: _usage_stats(
+            api_name,
+            int(today.get(api_name, 0)) + recorder.pending(api_name),
+        )
+        for api_name in set(API_LIMITS) | set(today)
     }
 
 
@@ -214,33 +505,5 @@ def reset_api_usage(api_name: str, date: str | None = None) -> None:
     Example:
         >>> reset_api_usage("nasa_power")  # Reset today's counter
     """
-    redis = _get_redis()
-    key = _get_usage_key(api_name, date)
-    redis.delete(key)
+    _get_redis().hdel(_get_usage_key(date), api_name)
     logger.info(f"🔄 Reset usage counter for {api_name}")
-
-
-# Exemplo de uso em clientes de API:
-"""
-# Em nasa_power_client.py, adicionar:
-
-from backend.infrastructure.cache.api_usage_tracker import (
-    track_api_call,
-    check_api_quota,
-)
-
-async def get_daily_data(...):
-    # Verificar quota antes de chamar API
-    if not check_api_quota("nasa_power"):
-        raise APIQuotaExceeded(
-            "NASA POWER daily limit reached. Try again tomorrow."
-        )
-    
-    # Chamar API
-    response = await client.get(url)
-    
-    # Registrar chamada
-    track_api_call("nasa_power")
-    
-    return process_response(response)
-"""
@@ -4,6 +4,9 @@ Fornece cache inteligente com TTL dinâmico baseado na idade dos dados.
 
 Features:
 - TTL dinâmico: dados históricos (30d), recentes (1d), forecast (1h)
+- Stale-while-revalidate: forecast expirado ainda é servido durante a
+  janela de graça da fonte (CLIMATE_FORECAST_STALE_GRACE) enquanto é
+  atualizado em background
 - Métricas Prometheus integradas
 - Chaves únicas por fonte + coordenadas + período
 - Async/await para alta performance
@@ -35,6 +38,10 @@ class ClimateCacheService:
 
     Chave do cache: {prefix}:{source}:{lat}:{lon}:{start}:{end}
     Exemplo: climate:nasa:48.86:2.35:20241001:20241008
+
+    Fontes com janela de graça (get_stale_grace > 0) gravam também
+    {chave}:fresh com o TTL normal; a chave de dados vive TTL + graça.
+    Sem o marcador, o dado está "stale" (ver get_with_freshness).
     """
 
     # TTL constants (em segundos)
@@ -43,6 +50,9 @@ class ClimateCacheService:
     TTL_VERY_RECENT = 43200  # 12 horas
     TTL_FORECAST = 3600  # 1 hora
 
+    # Trava de atualização em background (evita refresh duplicado)
+    REFRESH_LOCK_TTL = 300  # 5 minutos
+
     def __init__(self, prefix: str = "climate"):
         """
         Inicializa serviço de cache.
@@ -59,7 +69,7 @@ class ClimateCacheService:
         """Inicializa conexão Redis assíncrona."""
         try:
             self.redis = Redis.from_url(
-                settings.REDIS_URL,
+                settings.redis.redis_url,
                 decode_responses=False,
                 socket_connect_timeout=5,
                 socket_timeout=5,
@@ -103,7 +113,9 @@ class ClimateCacheService:
 
         return f"{self.prefix}:{source}:{lat_r}:{lon_r}:{start_str}:{end_str}"
 
-    def _get_ttl(self, start_date: datetime) -> int:
+    def _get_ttl(
+        self, start_date: datetime, end_date: datetime | None = None
+    ) -> int:
         """
         Calcula TTL dinâmico baseado na idade dos dados.
 
@@ -115,6 +127,8 @@ class ClimateCacheService:
 
         Args:
             start_date: Data inicial dos dados
+            end_date: Data final; período que termina no futuro contém
+                forecast (ex.: dashboard_forecast de hoje a hoje+5d)
 
         Returns:
             int: TTL em segundos
@@ -122,7 +136,7 @@ class ClimateCacheService:
         now = datetime.now()
         days_diff = (now - start_date).days
 
-        if start_date > now:
+        if start_date > now or (end_date is not None and end_date > now):
             # Forecast (futuro)
             return self.TTL_FORECAST
         elif days_diff < 7:
@@ -135,6 +149,16 @@ class ClimateCacheService:
             # Dados históricos
             return self.TTL_HISTORICAL
 
+    @staticmethod
+    def get_stale_grace(source: str) -> int:
+        """
+        Janela de graça (segundos) para servir dado expirado da fonte.
+
+        Configurada em CLIMATE_FORECAST_STALE_GRACE (JSON por fonte);
+        fontes fora da configuração não têm graça (0).
+        """
+        return int(settings.climate_apis.FORECAST_STALE_GRACE.get(source, 0))
+
     async def get(
         self,
         source: str,
@@ -154,8 +178,15 @@ class ClimateCacheService:
             end: Data final
 
         Returns:
-            Dados deserializados ou None se não existir/erro
+            Dados deserializados ou None se não existir/erro (dados
+            stale de fontes com janela de graça também retornam None)
         """
+        if self.get_stale_grace(source) > 0:
+            data, is_stale = await self.get_with_freshness(
+                source, lat, lon, start, end
+            )
+            return None if is_stale else data
+
         if not self.redis:
             logger.warning("Redis indisponível, cache desabilitado")
             return None
@@ -225,11 +256,21 @@ class ClimateCacheService:
             return False
 
         key = self._make_key(source, lat, lon, start, end)
-        ttl = self._get_ttl(start)
+        ttl = self._get_ttl(start, end)
+        grace = self.get_stale_grace(source)
 
         try:
             serialized = pickle.dumps(data)
-            await self.redis.setex(key, ttl, serialized)
+            if grace:
+                # Graça só estende forecast; o marcador vale para todos
+                extra = grace if ttl == self.TTL_FORECAST else 0
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    pipe.setex(key, ttl + extra, serialized)
+                    pipe.setex(f"{key}:fresh", ttl, b"1")
+                    pipe.delete(f"{key}:refresh")
+                    await pipe.execute()
+            else:
+                await self.redis.setex(key, ttl, serialized)
 
             ttl_hours = ttl / 3600
             logger.info(
@@ -252,6 +293,75 @@ class ClimateCacheService:
             logger.error(f"Erro ao salvar cache: {e}")
             return False
 
+    async def get_with_freshness(
+        self,
+        source: str,
+        lat: float,
+        lon: float,
+        start: datetime,
+        end: datetime,
+    ) -> tuple[Any | None, bool]:
+        """
+        Busca dados do cache informando se já passaram do TTL.
+
+        Para fontes com janela de graça, dados expirados continuam
+        disponíveis por get_stale_grace(source) segundos.
+
+        Returns:
+            (dados ou None, is_stale); is_stale=True indica que os dados
+            devem ser servidos e atualizados em background
+        """
+        if not self.redis:
+            return None, False
+
+        key = self._make_key(source, lat, lon, start, end)
+
+        try:
+            data, fresh = await self.redis.mget(key, f"{key}:fresh")
+        except Exception as e:
+            logger.error(f"Erro ao buscar cache: {e}")
+            return None, False
+
+        if not data:
+            logger.info(f"❌ Cache MISS: {key}")
+            return None, False
+
+        is_stale = fresh is None and self.get_stale_grace(source) > 0
+        logger.info(f"🎯 Cache {'STALE' if is_stale else 'HIT'}: {key}")
+        return pickle.loads(data), is_stale
+
+    async def try_lock_refresh(
+        self,
+        source: str,
+        lat: float,
+        lon: float,
+        start: datetime,
+        end: datetime,
+    ) -> bool:
+        """
+        Reserva a atualização em background de uma entrada stale.
+
+        A trava expira em REFRESH_LOCK_TTL e é removida pelo set() que
+        grava os dados novos.
+
+        Returns:
+            bool: True se quem chamou deve disparar o refresh
+        """
+        if not self.redis:
+            return False
+
+        key = self._make_key(source, lat, lon, start, end)
+
+        try:
+            return bool(
+                await self.redis.set(
+                    f"{key}:refresh", b"1", nx=True, ex=self.REFRESH_LOCK_TTL
+                )
+            )
+        except Exception as e:
+            logger.error(f"Erro ao travar refresh: {e}")
+            return False
+
     async def delete(
         self,
         source: str,
@@ -279,7 +389,7 @@ class ClimateCacheService:
         key = self._make_key(source, lat, lon, start, end)
 
         try:
-            await self.redis.delete(key)
+            await self.redis.delete(key, f"{key}:fresh")
             logger.info(f"🗑️ Cache DELETE: {key}")
             return True
 
@@ -12,12 +12,13 @@ Benefits:
 - Distribui carga ao longo do tempo
 """
 
-import asyncio
 from datetime import datetime, timedelta
 
 from celery import shared_task
 from loguru import logger
 
+from backend.api.services.async_bridge import run_sync
+
 # Cidades mundiais mais populares (top 50)
 POPULAR_WORLD_CITIES = [
     {"name": "Paris", "lat": 48.8566, "lon": 2.3522, "country": "França"},
@@ -258,6 +259,30 @@ POPULAR_NORDIC_CITIES = [
 ]
 
 
+def _warming_quota_left(source: str) -> bool:
+    """
+    True se ainda há quota para o pre-fetch da fonte.
+
+    O pre-fetch para antes de passar do WARNING_THRESHOLD da quota
+    diária: o restante fica para requisições de usuários. Lê o snapshot
+    do api_usage_tracker (sem I/O na maior parte das chamadas).
+    """
+    from backend.infrastructure.cache.api_usage_tracker import (
+        API_LIMITS,
+        WARNING_THRESHOLD,
+        check_api_quota,
+    )
+
+    limit = API_LIMITS.get(source)
+    if limit is None:
+        return True
+    reserve = int(limit * (1 - WARNING_THRESHOLD))
+    if check_api_quota(source, required_requests=reserve + 1):
+        return True
+    logger.warning(f"⏸️ Pre-fetch {source} interrompido: quota reservada")
+    return False
+
+
 @shared_task(
     bind=True, max_retries=3, name="climate.prefetch_nasa_popular_cities"
 )
@@ -292,12 +317,15 @@ def prefetch_nasa_popular_cities(self):
         success_count = 0
         failed_cities = []
 
-        # Pre-fetch cada cidade
+        # Pre-fetch cada cidade (para se a quota diária apertar)
         for idx, city in enumerate(POPULAR_WORLD_CITIES, 1):
+            if not _warming_quota_left("nasa_power"):
+                failed_cities.extend(
+                    c["name"] for c in POPULAR_WORLD_CITIES[idx - 1 :]
+                )
+                break
             try:
-                # Usa asyncio para chamar método async
-                loop = asyncio.get_event_loop()
-                data = loop.run_until_complete(
+                data = run_sync(
                     client.get_daily_data(
                         lat=city["lat"],
                         lon=city["lon"],
@@ -308,9 +336,13 @@ def prefetch_nasa_popular_cities(self):
 
                 if data:
                     success_count += 1
-                    logger.info(
-                        f"✅ [{idx}/{len(POPULAR_WORLD_CITIES)}] "
-                        f"{city['name']}, {city['country']}"
+                    # Progresso por cidade: DEBUG (o resumo final é INFO)
+                    logger.debug(
+                        "✅ [{}/{}] {}, {}",
+                        idx,
+                        len(POPULAR_WORLD_CITIES),
+                        city["name"],
+                        city["country"],
                     )
                 else:
                     failed_cities.append(city["name"])
@@ -340,8 +372,8 @@ def prefetch_nasa_popular_cities(self):
         )
 
         # Fecha conexões
-        loop.run_until_complete(cache.close())
-        loop.run_until_complete(client.close())
+        run_sync(cache.close())
+        run_sync(client.close())
 
         return result
 
@@ -371,23 +403,22 @@ def cleanup_old_cache():
 
         logger.info("🧹 Iniciando limpeza de cache climático antigo")
 
-        loop = asyncio.get_event_loop()
         redis = Redis.from_url(
             settings.redis.redis_url, decode_responses=False
         )
 
         # Busca todas as chaves 'climate:*'
-        keys = loop.run_until_complete(redis.keys("climate:*"))
+        keys = run_sync(redis.keys("climate:*"))
 
         removed_count = 0
         kept_count = 0
 
         for key in keys:
-            ttl = loop.run_until_complete(redis.ttl(key))
+            ttl = run_sync(redis.ttl(key))
 
             # Remove se TTL expirado (< 0) ou muito baixo (< 1 hora)
             if ttl < 0 or ttl < 3600:
-                loop.run_until_complete(redis.delete(key))
+                run_sync(redis.delete(key))
                 removed_count += 1
             else:
                 kept_count += 1
@@ -397,7 +428,7 @@ def cleanup_old_cache():
             f"{kept_count} mantidas"
         )
 
-        loop.run_until_complete(redis.close())
+        run_sync(redis.close())
 
         return {
             "status": "success",
@@ -428,7 +459,6 @@ def generate_cache_stats():
         from config.settings import get_settings
 
         settings = get_settings()
-        loop = asyncio.get_event_loop()
         redis = Redis.from_url(
             settings.redis.redis_url, decode_responses=False
         )
@@ -438,14 +468,14 @@ def generate_cache_stats():
         stats = {}
 
         for source in sources:
-            keys = loop.run_until_complete(redis.keys(f"climate:{source}:*"))
+            keys = run_sync(redis.keys(f"climate:{source}:*"))
             stats[source] = {
                 "total_keys": len(keys),
                 "memory_mb": 0,
             }  # TODO: calcular tamanho real
 
         # Total geral
-        total_keys = loop.run_until_complete(redis.dbsize())
+        total_keys = run_sync(redis.dbsize())
 
         result = {
             "timestamp": datetime.now().isoformat(),
@@ -455,7 +485,7 @@ def generate_cache_stats():
 
         logger.info(f"📊 Cache stats: {result}")
 
-        loop.run_until_complete(redis.close())
+        run_sync(redis.close())
 
         return result
 
@@ -485,7 +515,7 @@ def prefetch_nws_forecast_usa_cities(self):
         logger.info("🚀 Iniciando pre-fetch NWS Forecast (30 cidades USA)")
 
         # Importa dentro da task para evitar circular imports
-        from backend.api.services.nws_forecast_sync_adapter import (
+        from backend.api.services.nws_forecast import (
             NWSDailyForecastSyncAdapter,
         )
 
@@ -511,10 +541,13 @@ def prefetch_nws_forecast_usa_cities(self):
 
                 if data:
                     success_count += 1
-                    logger.info(
-                        f"✅ [{idx}/{len(POPULAR_USA_CITIES)}] "
-                        f"{city['name']}, {city['state']} - "
-                        f"{len(data)} dias"
+                    logger.debug(
+                        "✅ [{}/{}] {}, {} - {} dias",
+                        idx,
+                        len(POPULAR_USA_CITIES),
+                        city["name"],
+                        city["state"],
+                        len(data),
                     )
                 else:
                     failed_cities.append(city["name"])
@@ -578,7 +611,7 @@ def prefetch_nws_stations_usa_cities(self):
         logger.info("🚀 Iniciando pre-fetch NWS Stations (30 cidades USA)")
 
         # Importa dentro da task para evitar circular imports
-        from backend.api.services.nws_stations_sync_adapter import (
+        from backend.api.services.nws_stations import (
             NWSStationsSyncAdapter,
         )
 
@@ -607,10 +640,13 @@ def prefetch_nws_stations_usa_cities(self):
                 if data:
                     success_count += 1
                     total_observations += len(data)
-                    logger.info(
-                        f"✅ [{idx}/{len(POPULAR_USA_CITIES)}] "
-                        f"{city['name']}, {city['state']} - "
-                        f"{len(data)} dias"
+                    logger.debug(
+                        "✅ [{}/{}] {}, {} - {} dias",
+                        idx,
+                        len(POPULAR_USA_CITIES),
+                        city["name"],
+                        city["state"],
+                        len(data),
                     )
                 else:
                     failed_cities.append(city["name"])
@@ -690,8 +726,13 @@ def prefetch_openmeteo_forecast_popular_cities(self):
         failed_cities = []
         total_days = 0
 
-        # Pre-fetch cada cidade
+        # Pre-fetch cada cidade (para se a quota diária apertar)
         for idx, city in enumerate(POPULAR_WORLD_CITIES, 1):
+            if not _warming_quota_left("openmeteo_forecast"):
+                failed_cities.extend(
+                    c["name"] for c in POPULAR_WORLD_CITIES[idx - 1 :]
+                )
+                break
             try:
                 data = adapter.get_data_sync(
                     lat=city["lat"],
@@ -703,9 +744,13 @@ def prefetch_openmeteo_forecast_popular_cities(self):
                 if data:
                     success_count += 1
                     total_days += len(data)
-                    logger.info(
-                        f"✅ [{idx}/{len(POPULAR_WORLD_CITIES)}] "
-                        f"{city['name']}, {city['country']} - {len(data)} dias"
+                    logger.debug(
+                        "✅ [{}/{}] {}, {} - {} dias",
+                        idx,
+                        len(POPULAR_WORLD_CITIES),
+                        city["name"],
+                        city["country"],
+                        len(data),
                     )
                 else:
                     failed_cities.append(city["name"])
@@ -737,10 +782,7 @@ def prefetch_openmeteo_forecast_popular_cities(self):
         )
 
         # Fecha cache
-        import asyncio
-
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(cache.close())
+        run_sync(cache.close())
 
         return result
 
@@ -796,8 +838,13 @@ def prefetch_openmeteo_archive_popular_cities(self):
         failed_cities = []
         total_days = 0
 
-        # Pre-fetch cada cidade
+        # Pre-fetch cada cidade (para se a quota diária apertar)
         for idx, city in enumerate(POPULAR_WORLD_CITIES, 1):
+            if not _warming_quota_left("openmeteo_archive"):
+                failed_cities.extend(
+                    c["name"] for c in POPULAR_WORLD_CITIES[idx - 1 :]
+                )
+                break
             try:
                 data = adapter.get_data_sync(
                     lat=city["lat"],
@@ -809,10 +856,13 @@ def prefetch_openmeteo_archive_popular_cities(self):
                 if data:
                     success_count += 1
                     total_days += len(data)
-                    logger.info(
-                        f"✅ [{idx}/{len(POPULAR_WORLD_CITIES)}] "
-                        f"{city['name']}, {city['country']} - "
-                        f"{len(data)} dias históricos"
+                    logger.debug(
+                        "✅ [{}/{}] {}, {} - {} dias históricos",
+                        idx,
+                        len(POPULAR_WORLD_CITIES),
+                        city["name"],
+                        city["country"],
+                        len(data),
                     )
                 else:
                     failed_cities.append(city["name"])
@@ -849,10 +899,7 @@ def prefetch_openmeteo_archive_popular_cities(self):
         )
 
         # Fecha cache
-        import asyncio
-
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(cache.close())
+        run_sync(cache.close())
 
         return result
 
@@ -941,14 +988,20 @@ def prefetch_met_norway_nordic_cities(self):
                         nordic_count += 1
 
                     quality = "1km+radar" if is_nordic else "9km ECMWF"
-                    logger.info(
-                        f"✅ [{idx}/{len(POPULAR_NORDIC_CITIES)}] "
-                        f"{city['name']}, {city['country']} - "
-                        f"{len(data)} dias ({quality})"
+                    logger.debug(
+                        "✅ [{}/{}] {}, {} - {} dias ({})",
+                        idx,
+                        len(POPULAR_NORDIC_CITIES),
+                        city["name"],
+                        city["country"],
+                        len(data),
+                        quality,
                     )
                 else:
                     failed_cities.append(city["name"])
-                    logger.warning(f"⚠️ Sem dados forecast para {city['name']}")
+                    logger.warning(
+                        f"⚠️ Sem dados forecast para {city['name']}"
+                    )
 
             except Exception as e:
                 failed_cities.append(city["name"])
@@ -981,10 +1034,7 @@ def prefetch_met_norway_nordic_cities(self):
         )
 
         # Fecha cache
-        import asyncio
-
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(cache.close())
+        run_sync(cache.close())
 
         return result
 
@@ -0,0 +1,291 @@
+"""
+Cache HTTP com validadores (RFC 7234) compartilhado pelos clientes.
+
+Qualquer cliente httpx pode usar o cache trocando o transport:
+
+    client = httpx.AsyncClient(transport=http_cache.transport())
+
+O transport guarda no Redis o corpo de cada GET com status 200, os
+validadores (ETag/Last-Modified) e a validade (Cache-Control max-age ou
+Expires, via CacheUtils). Enquanto a entrada está fresca, a resposta sai
+do Redis sem tocar a rede; depois de expirar, a requisição vai com
+If-None-Match/If-Modified-Since e um 304 só renova a validade, sem
+baixar nem reparsear o corpo.
+
+Entradas ficam no Redis por RETAIN_STALE segundos após expirar, para
+que os validadores sirvam às requisições condicionais.
+
+Graceful degradation: erros de Redis só geram log; a requisição segue
+para a API normalmente.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from typing import Any
+from weakref import WeakKeyDictionary
+
+import httpx
+from loguru import logger
+from redis.asyncio import Redis
+
+from backend.api.services.weather_utils import CacheUtils
+from config.settings.app_config import get_settings
+
+settings = get_settings()
+
+# Headers guardados junto com o corpo (sem Content-Encoding: o corpo
+# fica armazenado já decodificado)
+STORED_HEADERS = (
+    "content-type",
+    "etag",
+    "last-modified",
+    "expires",
+    "cache-control",
+    "date",
+)
+
+
+class HTTPResponseCache:
+    """
+    Armazenamento Redis de respostas HTTP com validadores.
+
+    Chave Redis: {prefix}:{host}:{sha1(url + Accept)} → hash com
+    'body', 'headers' (JSON) e 'fresh_until' (epoch).
+    """
+
+    # Tempo extra no Redis após expirar (segundos)
+    RETAIN_STALE = 86400  # 24 horas
+
+    def __init__(self, prefix: str = "http"):
+        """
+        Inicializa o cache.
+
+        Args:
+            prefix: Prefixo das chaves Redis
+        """
+        self.prefix = prefix
+        # Um cliente Redis por event loop (FastAPI e async_bridge)
+        self._clients: WeakKeyDictionary = WeakKeyDictionary()
+        logger.info("✅ HTTPResponseCache inicializado")
+
+    def _redis(self) -> Redis | None:
+        """Cliente Redis do event loop corrente (criado sob demanda)."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            try:
+                client = Redis.from_url(
+                    settings.redis.redis_url,
+                    decode_responses=False,
+                    socket_connect_timeout=5,
+                    socket_timeout=5,
+                )
+            except Exception as e:
+                logger.error(f"❌ Redis connection failed: {e}")
+                return None
+            self._clients[loop] = client
+        return client
+
+    def transport(
+        self, transport: httpx.AsyncBaseTransport | None = None, **kwargs
+    ) -> "CachingTransport":
+        """
+        Cria um transport httpx com este cache.
+
+        Args:
+            transport: Transport interno (ex.: CircuitBreakerTransport,
+                para que HITs não passem pelo breaker); padrão
+                httpx.AsyncHTTPTransport
+            **kwargs: Repassados a httpx.AsyncHTTPTransport (ex.: limits)
+
+        Returns:
+            CachingTransport para httpx.AsyncClient(transport=...)
+        """
+        return CachingTransport(
+            self, transport or httpx.AsyncHTTPTransport(**kwargs)
+        )
+
+    def make_key(self, request: httpx.Request) -> str:
+        """Chave da resposta: URL completa (com query) + Accept."""
+        accept = request.headers.get("accept", "")
+        digest = hashlib.sha1(
+            f"{request.url}|{accept}".encode(), usedforsecurity=False
+        ).hexdigest()
+        return f"{self.prefix}:{request.url.host}:{digest}"
+
+    async def load(self, key: str) -> dict[str, Any] | None:
+        """
+        Lê uma entrada do cache.
+
+        Returns:
+            {'body': bytes, 'headers': dict, 'fresh_until': float} ou
+            None se não existir (ou Redis indisponível)
+        """
+        redis = self._redis()
+        if not redis:
+            return None
+        try:
+            raw = await redis.hgetall(key)
+        except Exception as e:
+            logger.warning(f"Erro ao ler HTTP cache Redis: {e}")
+            return None
+        if not raw or b"body" not in raw:
+            return None
+        return {
+            "body": raw[b"body"],
+            "headers": json.loads(raw[b"headers"]),
+            "fresh_until": float(raw[b"fresh_until"]),
+        }
+
+    async def store(
+        self,
+        key: str,
+        headers: dict[str, str],
+        fresh_until: float,
+        body: bytes | None = None,
+    ) -> None:
+        """
+        Grava (ou renova, com body=None) uma entrada do cache.
+
+        Args:
+            key: Chave de make_key
+            headers: Headers de STORED_HEADERS
+            fresh_until: Epoch até quando a entrada é fresca
+            body: Corpo decodificado; None mantém o corpo existente
+        """
+        redis = self._redis()
+        if not redis:
+            return
+        mapping: dict[str, Any] = {
+            "headers": json.dumps(headers),
+            "fresh_until": str(fresh_until),
+        }
+        if body is not None:
+            mapping["body"] = body
+        ttl = int(max(0.0, fresh_until - time.time())) + self.RETAIN_STALE
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.hset(key, mapping=mapping)
+                pipe.expire(key, ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Erro ao salvar HTTP cache Redis: {e}")
+
+    async def close(self) -> None:
+        """Fecha a conexão Redis do event loop corrente."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.close()
+
+
+class CachingTransport(httpx.AsyncBaseTransport):
+    """
+    Transport httpx que aplica o HTTPResponseCache aos GETs.
+
+    Requisições que já trazem If-None-Match/If-Modified-Since (o cliente
+    faz a própria validação) passam direto. Respostas servidas pelo
+    cache trazem o header X-Cache (HIT ou REVALIDATED).
+    """
+
+    def __init__(
+        self, cache: HTTPResponseCache, transport: httpx.AsyncBaseTransport
+    ):
+        self.cache = cache
+        self.transport = transport
+
+    async def handle_async_request(
+        self, request: httpx.Request
+    ) -> httpx.Response:
+        if request.method != "GET" or (
+            "if-none-match" in request.headers
+            or "if-modified-since" in request.headers
+        ):
+            return await self.transport.handle_async_request(request)
+
+        key = self.cache.make_key(request)
+        entry = await self.cache.load(key)
+
+        if entry is not None:
+            if time.time() < entry["fresh_until"]:
+                logger.debug(f"🎯 HTTP cache HIT: {request.url}")
+                return self._cached_response(entry, "HIT")
+
+            etag = entry["headers"].get("etag")
+            last_modified = entry["headers"].get("last-modified")
+            if etag:
+                request.headers["If-None-Match"] = etag
+            if last_modified:
+                request.headers["If-Modified-Since"] = last_modified
+
+        response = await self.transport.handle_async_request(request)
+
+        if response.status_code == 304 and entry is not None:
+            await response.aclose()
+            headers = {**entry["headers"], **self._stored_headers(response)}
+            fresh_until = self._fresh_until(headers)
+            await self.cache.store(key, headers, fresh_until)
+            logger.debug(f"✅ HTTP 304 Not Modified: {request.url}")
+            return self._cached_response(
+                {**entry, "headers": headers}, "REVALIDATED"
+            )
+
+        if response.status_code != 200 or not self._storable(response):
+            return response
+
+        body = await response.aread()
+        headers = self._stored_headers(response)
+        fresh_until = self._fresh_until(headers)
+        if (
+            "etag" in headers
+            or "last-modified" in headers
+            or fresh_until > time.time()
+        ):
+            await self.cache.store(key, headers, fresh_until, body)
+
+        return httpx.Response(
+            200,
+            headers={**headers, "X-Cache": "MISS"},
+            content=body,
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+    @staticmethod
+    def _stored_headers(response: httpx.Response) -> dict[str, str]:
+        return {
+            name: response.headers[name]
+            for name in STORED_HEADERS
+            if name in response.headers
+        }
+
+    @staticmethod
+    def _storable(response: httpx.Response) -> bool:
+        directives = CacheUtils.parse_cache_control(
+            response.headers.get("cache-control")
+        )
+        return "no-store" not in directives and "private" not in directives
+
+    @staticmethod
+    def _fresh_until(headers: dict[str, str]) -> float:
+        """Epoch de expiração (0 = revalidar sempre)."""
+        directives = CacheUtils.parse_cache_control(
+            headers.get("cache-control")
+        )
+        if "no-cache" in directives:
+            return 0.0
+        expires = CacheUtils.response_expires(headers)
+        if expires is None or expires.timestamp() <= time.time():
+            return 0.0
+        return time.time() + CacheUtils.calculate_cache_ttl(expires)
+
+    @staticmethod
+    def _cached_response(entry: dict[str, Any], status: str) -> httpx.Response:
+        return httpx.Response(
+            200,
+            headers={**entry["headers"], "X-Cache": status},
+            content=entry["body"],
+        )
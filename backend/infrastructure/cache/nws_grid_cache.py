@@ -0,0 +1,277 @@
+"""
+Cache persistente de metadados NWS (ponto → grid e estações próximas).
+
+Todo forecast NWS precisa de /points/{lat},{lon} antes de
+/gridpoints/.../forecast/hourly, e a busca de estações usa
+/points/{lat},{lon}/stations. Os dois mapeamentos praticamente não
+mudam, então ficam em dois níveis:
+
+1. Redis (TTL longo) - leitura rápida, compartilhada entre workers
+2. PostgreSQL (tabela nws_grid_points) - sobrevive a flush do Redis
+
+Chave: coordenadas quantizadas em QUANTIZE_DECIMALS casas (~1km). Os
+clientes consultam a API já com as coordenadas quantizadas, de modo que
+o valor em cache é exatamente o da chave.
+
+Graceful degradation: erros de Redis ou PostgreSQL só geram log; o
+cliente segue para a API.
+"""
+
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from loguru import logger
+from redis.asyncio import Redis
+
+from config.settings.app_config import get_settings
+
+settings = get_settings()
+
+
+class NWSGridCache:
+    """
+    Cache Redis + PostgreSQL para metadados NWS por ponto.
+
+    Chaves Redis:
+    - {prefix}:grid:{lat}:{lon} → JSON com gridId/gridX/gridY/URLs
+    - {prefix}:stations:{lat}:{lon} → JSON com a lista de estações
+    """
+
+    QUANTIZE_DECIMALS = 2  # 0.01° ≈ 1.1km (célula NWS = 2.5km)
+
+    # TTL Redis (segundos)
+    TTL_GRID = 2592000  # 30 dias
+    TTL_STATIONS = 604800  # 7 dias
+
+    # Idade máxima das linhas PostgreSQL
+    MAX_AGE_GRID = timedelta(days=180)
+    MAX_AGE_STATIONS = timedelta(days=30)
+
+    # Após falha do PostgreSQL, pula o banco por este tempo (segundos)
+    DB_RETRY_AFTER = 300
+
+    def __init__(self, prefix: str = "nws"):
+        """
+        Inicializa o cache.
+
+        Args:
+            prefix: Prefixo das chaves Redis
+        """
+        self.prefix = prefix
+        # Um cliente Redis por event loop: o singleton é usado tanto no
+        # loop do FastAPI quanto no loop do async_bridge (sync adapters)
+        self._clients: WeakKeyDictionary = WeakKeyDictionary()
+        self._db_disabled_until = 0.0
+        logger.info("✅ NWSGridCache inicializado")
+
+    def _redis(self) -> Redis | None:
+        """Cliente Redis do event loop corrente (criado sob demanda)."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            try:
+                client = Redis.from_url(
+                    settings.redis.redis_url,
+                    decode_responses=True,
+                    socket_connect_timeout=5,
+                    socket_timeout=5,
+                )
+            except Exception as e:
+                logger.error(f"❌ Redis connection failed: {e}")
+                return None
+            self._clients[loop] = client
+        return client
+
+    @classmethod
+    def quantize(cls, lat: float, lon: float) -> tuple[float, float]:
+        """
+        Quantiza coordenadas para a chave do cache.
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+
+        Returns:
+            (lat, lon) arredondados em QUANTIZE_DECIMALS casas
+        """
+        return (
+            round(lat, cls.QUANTIZE_DECIMALS),
+            round(lon, cls.QUANTIZE_DECIMALS),
+        )
+
+    def _make_key(self, kind: str, lat: float, lon: float) -> str:
+        lat_q, lon_q = self.quantize(lat, lon)
+        return f"{self.prefix}:{kind}:{lat_q}:{lon_q}"
+
+    # ------------------------------------------------------------------
+    # API pública
+    # ------------------------------------------------------------------
+
+    async def get_grid(self, lat: float, lon: float) -> dict[str, Any] | None:
+        """
+        Busca metadados de grid (gridId, gridX, gridY, URLs).
+
+        Returns:
+            Dict no formato de NWSForecastClient._get_grid_metadata ou
+            None se não houver entrada válida
+        """
+        return await self._get("grid", lat, lon)
+
+    async def set_grid(
+        self, lat: float, lon: float, metadata: dict[str, Any]
+    ) -> None:
+        """Salva metadados de grid no Redis e no PostgreSQL."""
+        await self._set("grid", lat, lon, metadata)
+
+    async def get_stations(
+        self, lat: float, lon: float
+    ) -> list[dict[str, Any]] | None:
+        """
+        Busca a lista de estações próximas (dicts de NWSStation).
+
+        Returns:
+            Lista na ordem da API ou None se não houver entrada válida
+        """
+        return await self._get("stations", lat, lon)
+
+    async def set_stations(
+        self, lat: float, lon: float, stations: list[dict[str, Any]]
+    ) -> None:
+        """Salva a lista de estações próximas no Redis e no PostgreSQL."""
+        await self._set("stations", lat, lon, stations)
+
+    async def close(self) -> None:
+        """Fecha a conexão Redis do event loop corrente."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.close()
+
+    # ------------------------------------------------------------------
+    # Níveis Redis → PostgreSQL
+    # ------------------------------------------------------------------
+
+    async def _get(self, kind: str, lat: float, lon: float) -> Any | None:
+        key = self._make_key(kind, lat, lon)
+
+        redis = self._redis()
+        if redis:
+            try:
+                raw = await redis.get(key)
+                if raw:
+                    logger.debug(f"🎯 NWS cache HIT (Redis): {key}")
+                    return json.loads(raw)
+            except Exception as e:
+                logger.warning(f"Erro ao ler NWS cache Redis: {e}")
+
+        value = await self._run_db(self._load_row, kind, lat, lon)
+        if value is None:
+            logger.debug(f"❌ NWS cache MISS: {key}")
+            return None
+
+        logger.debug(f"🎯 NWS cache HIT (PostgreSQL): {key}")
+        await self._set_redis(kind, key, value)
+        return value
+
+    async def _set(self, kind: str, lat: float, lon: float, value) -> None:
+        key = self._make_key(kind, lat, lon)
+        await self._set_redis(kind, key, value)
+        await self._run_db(self._save_row, kind, lat, lon, value)
+
+    async def _set_redis(self, kind: str, key: str, value: Any) -> None:
+        redis = self._redis()
+        if not redis:
+            return
+        ttl = self.TTL_GRID if kind == "grid" else self.TTL_STATIONS
+        try:
+            await redis.setex(key, ttl, json.dumps(value))
+        except Exception as e:
+            logger.warning(f"Erro ao salvar NWS cache Redis: {e}")
+
+    async def _run_db(self, func, *args) -> Any | None:
+        """Executa acesso ao banco em thread, com backoff após falha."""
+        if time.monotonic() < self._db_disabled_until:
+            return None
+        try:
+            return await asyncio.to_thread(func, *args)
+        except Exception as e:
+            self._db_disabled_until = time.monotonic() + self.DB_RETRY_AFTER
+            logger.warning(
+                f"NWS cache PostgreSQL indisponível "
+                f"(ignorado por {self.DB_RETRY_AFTER}s): {e}"
+            )
+            return None
+
+    def _load_row(self, kind: str, lat: float, lon: float) -> Any | None:
+        from backend.database.connection import get_db_context
+        from backend.database.models.nws_grid_point import NWSGridPoint
+
+        lat_q, lon_q = self.quantize(lat, lon)
+        with get_db_context() as db:
+            row = (
+                db.query(NWSGridPoint)
+                .filter(
+                    NWSGridPoint.latitude == lat_q,
+                    NWSGridPoint.longitude == lon_q,
+                )
+                .first()
+            )
+
+        if row is None:
+            return None
+
+        now = datetime.utcnow()
+        if kind == "grid":
+            fresh = (
+                row.grid_updated_at is not None
+                and now - row.grid_updated_at < self.MAX_AGE_GRID
+            )
+            if not fresh or not row.grid_id:
+                return None
+            return {
+                "gridId": row.grid_id,
+                "gridX": row.grid_x,
+                "gridY": row.grid_y,
+                "forecast_url": row.forecast_url,
+                "forecast_hourly_url": row.forecast_hourly_url,
+            }
+
+        fresh = (
+            row.stations_updated_at is not None
+            and now - row.stations_updated_at < self.MAX_AGE_STATIONS
+        )
+        return row.stations if fresh else None
+
+    def _save_row(self, kind: str, lat: float, lon: float, value) -> None:
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+        from backend.database.connection import get_db_context
+        from backend.database.models.nws_grid_point import NWSGridPoint
+
+        lat_q, lon_q = self.quantize(lat, lon)
+        now = datetime.utcnow()
+        if kind == "grid":
+            fields = {
+                "grid_id": value["gridId"],
+                "grid_x": value["gridX"],
+                "grid_y": value["gridY"],
+                "forecast_url": value.get("forecast_url"),
+                "forecast_hourly_url": value.get("forecast_hourly_url"),
+                "grid_updated_at": now,
+            }
+        else:
+            fields = {"stations": value, "stations_updated_at": now}
+
+        stmt = pg_insert(NWSGridPoint).values(
+            latitude=lat_q, longitude=lon_q, created_at=now, **fields
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_nws_grid_points_location",
+            set_={name: stmt.excluded[name] for name in fields},
+        )
+        with get_db_context() as db:
+            db.execute(stmt)
+            db.commit()
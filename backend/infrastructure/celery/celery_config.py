@@ -8,6 +8,11 @@ from datetime import datetime
 
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import (
+    before_task_publish,
+    worker_init,
+    worker_process_init,
+)
 from kombu import Queue
 from redis import Redis
 
@@ -15,12 +20,14 @@ from backend.api.middleware.prometheus_metrics import (
     CELERY_TASK_DURATION,
     CELERY_TASKS_TOTAL,
 )
+from backend.infrastructure import profiling, tracing, worker_memory
 
 # from config.settings import get_settings
 from config.settings.app_config import (
     get_celery_broker_url,
     get_celery_result_backend,
     get_legacy_settings,
+    get_settings,
 )
 
 # Carregar configurações (compatibilidade/URLs do Celery)
@@ -35,6 +42,18 @@ celery_app = Celery(
     backend=result_backend,
 )
 
+# Header da mensagem que pede profiling da task (ver apply_async)
+PROFILE_HEADER = "x_profile"
+
+# Módulos pesados do pipeline (pandas, numpy, clients HTTP), importados
+# uma vez no processo principal do worker (ver _preload_worker_modules)
+WORKER_PRELOAD_MODULES = (
+    "backend.api.services.data_download",
+    "backend.core.eto_calculation.eto_services",
+    "backend.core.data_processing.data_preprocessing",
+    "backend.core.data_processing.kalman_ensemble",
+)
+
 # Métricas Prometheus
 # As métricas são importadas do main.py para evitar duplicação
 
@@ -64,25 +83,142 @@ class MonitoredProgressTask(celery_app.Task):
             logging.warning(f"Falha ao publicar progresso: {e}")
 
     def __call__(self, *args, **kwargs):
-        """Rastreia duração e status da tarefa para Prometheus."""
+        """
+        Rastreia duração, status e memória da tarefa para Prometheus.
+
+        A execução roda num span filho do traceparent recebido nos
+        headers da mensagem (requisição HTTP que publicou a task). No
+        processo do pool, worker_memory mede o RSS da task e decide se
+        o processo deve ser reciclado ao terminá-la.
+        """
         import time
 
+        profile_id = kwargs.pop("profile", None) or self._profile_header()
         start_time = time.time()
-        try:
+        with (
+            tracing.span(
+                f"celery.task {self.name}",
+                parent=tracing.extract(self._trace_headers()),
+                kind="consumer",
+                metric=False,
+                attributes={"celery.task_id": self.request.id},
+            ),
+            worker_memory.track_task(self.name, sample=not profile_id),
+        ):
+            try:
+                if profile_id:
+                    result = self._profiled_call(profile_id, args, kwargs)
+                else:
+                    result = super().__call__(*args, **kwargs)
+                CELERY_TASKS_TOTAL.labels(
+                    task_name=self.name, status="SUCCESS"
+                ).inc()
+                return result
+            except Exception:
+                CELERY_TASKS_TOTAL.labels(
+                    task_name=self.name, status="FAILURE"
+                ).inc()
+                raise
+            finally:
+                CELERY_TASK_DURATION.labels(task_name=self.name).observe(
+                    time.time() - start_time
+                )
+
+    def apply_async(self, args=None, kwargs=None, **options):
+        """
+        ``profile=True`` (ou um id de profile) nos kwargs vira o header
+        x_profile: a task executa sob profile_execution sem o kwarg
+        precisar existir na assinatura dela.
+        """
+        if kwargs and "profile" in kwargs:
+            kwargs = dict(kwargs)
+            profile = kwargs.pop("profile")
+            if profile:
+                options["headers"] = {
+                    **(options.get("headers") or {}),
+                    PROFILE_HEADER: (
+                        profile
+                        if isinstance(profile, str)
+                        else profiling.new_profile_id()
+                    ),
+                }
+        return super().apply_async(args, kwargs, **options)
+
+    def _profile_header(self) -> str | None:
+        """Id de profile pedido no header x_profile (se houver)."""
+        return getattr(
+            self.request, PROFILE_HEADER, None
+        ) or self._trace_headers().get(PROFILE_HEADER)
+
+    def _profiled_call(self, profile_id, args, kwargs):
+        """Executa a task sob profiling (CPU da task e da ponte async)."""
+        with profiling.profile_execution(
+            f"celery {self.name}",
+            kind="celery",
+            attributes={"celery.task_id": self.request.id},
+            bridge=True,
+            profile_id=(profile_id if isinstance(profile_id, str) else None),
+        ) as run:
             result = super().__call__(*args, **kwargs)
-            CELERY_TASKS_TOTAL.labels(
-                task_name=self.name, status="SUCCESS"
-            ).inc()
-            return result
-        except Exception:
-            CELERY_TASKS_TOTAL.labels(
-                task_name=self.name, status="FAILURE"
-            ).inc()
-            raise
-        finally:
-            CELERY_TASK_DURATION.labels(task_name=self.name).observe(
-                time.time() - start_time
-            )
+        if isinstance(result, dict):
+            result = {**result, "profile_id": run.profile_id}
+        return result
+
+    def _trace_headers(self) -> dict:
+        """Headers da mensagem com traceparent (protocolo 1 ou 2)."""
+        headers = dict(getattr(self.request, "headers", None) or {})
+        traceparent = getattr(self.request, "traceparent", None)
+        if traceparent:
+            headers["traceparent"] = traceparent
+        return headers
+
+
+@before_task_publish.connect
+def _inject_trace_context(headers=None, **kwargs):
+    """Propaga o span corrente (ex.: requisição HTTP) para a task."""
+    if headers is not None:
+        tracing.inject(headers)
+
+
+@worker_init.connect
+def _preload_worker_modules(**kwargs):
+    """
+    Importa o pipeline no processo principal do worker, antes do fork.
+
+    Os módulos das tasks importam pandas/numpy/clients só ao executar
+    (API, beat e flower não pagam esse custo). No worker, importar uma
+    vez antes do fork faz os processos do pool (inclusive os recriados
+    por max_tasks_per_child) herdarem os módulos já carregados.
+    """
+    import importlib
+    import time
+
+    from loguru import logger
+
+    start = time.perf_counter()
+    for module in WORKER_PRELOAD_MODULES:
+        importlib.import_module(module)
+    elapsed = time.perf_counter() - start
+    logger.info(f"📦 Pipeline pré-carregado no worker em {elapsed:.2f}s")
+
+
+@worker_process_init.connect
+def _setup_worker_logging(**kwargs):
+    """
+    Sinks loguru assíncronos em cada processo do pool.
+
+    Configurado após o fork: a thread de escrita do enqueue não
+    sobrevive ao fork do processo principal.
+    """
+    from config.logging_config import setup_logging_from_settings
+
+    setup_logging_from_settings()
+
+
+@worker_process_init.connect
+def _setup_worker_memory(**kwargs):
+    """Telemetria de memória e reciclagem no processo do pool."""
+    worker_memory.install()
 
 
 # Definir classe base para todas as tarefas
@@ -116,6 +252,14 @@ celery_app.conf.update(
         Queue("data_processing"),
         Queue("elevation"),
     ),
+    # Teto de memória por processo do pool (KiB): o billiard verifica
+    # após cada task; worker_memory também recicla por crescimento
+    # sustentado (settings.worker_memory)
+    worker_max_memory_per_child=(
+        get_settings().worker_memory.MAX_RSS_MB * 1024
+        if get_settings().worker_memory.ENABLED
+        else None
+    ),
 )
 
 # Configuração de tarefas periódicas
@@ -166,6 +310,13 @@ celery_app.conf.beat_schedule = {
         "task": "backend.infrastructure.celery.tasks.sync_visitor_data",
         "schedule": crontab(minute=30),  # A cada 30 minutos
     },
+    # Partições anuais de climate_data (dia 1 de cada mês, 01:00 BRT)
+    "maintain-climate-data-partitions": {
+        "task": (
+            "backend.infrastructure.celery.tasks.maintain_climate_partitions"
+        ),
+        "schedule": crontab(hour=1, minute=0, day_of_month=1),
+    },
     # Tasks legadas
     "cleanup-expired-data": {
         "task": (
@@ -188,7 +339,5 @@ celery_app.autodiscover_tasks(
         "backend.infrastructure.cache.climate_tasks",
         "backend.infrastructure.celery.tasks",
         "backend.core.eto_calculation",
-        "backend.api.services.data_download",
-        "backend.api.services.openmeteo",
     ]
 )
@@ -4,12 +4,15 @@ Celery tasks para EVAonline.
 Tasks disponíveis:
 - eto_calculation: Cálculo ETo com progresso em tempo real
 - data_download: Download histórico + envio por email
+- partition_maintenance: Partições anuais de climate_data
 """
 
 from .eto_calculation import calculate_eto_task
 from .data_download import process_historical_download
+from .partition_maintenance import maintain_climate_partitions
 
 __all__ = [
     "calculate_eto_task",
     "process_historical_download",
+    "maintain_climate_partitions",
 ]
@@ -60,8 +60,8 @@ def calculate_eto_task(
         ValidationError: Se parâmetros inválidos
         APIError: Se todas as fontes falharem
     """
-    import asyncio
     from backend.core.eto_calculation.eto_services import EToProcessingService
+    from backend.api.services.async_bridge import run_sync
     from backend.database.connection import get_db
     from backend.api.services.climate_validation import (
         ClimateValidationService,
@@ -171,7 +171,7 @@ def calculate_eto_task(
 
         # O process_location_with_sources já faz download +
         # processamento completo
-        result = asyncio.run(
+        result = run_sync(
             service.process_location_with_sources(
                 latitude=lat,
                 longitude=lon,
@@ -203,6 +203,24 @@ def calculate_eto_task(
             "mode": mode,
         }
 
+        # dashboard_forecast: resultado alimenta o stale-while-revalidate
+        # da rota (mesma chave: fonte pedida + período)
+        if mode == OperationMode.DASHBOARD_FORECAST.value:
+            from backend.api.services.climate_factory import (
+                get_eto_result_cache,
+            )
+
+            run_sync(
+                get_eto_result_cache().set(
+                    source="+".join(sources or selected_sources),
+                    lat=lat,
+                    lon=lon,
+                    start=start_dt,
+                    end=end_dt,
+                    data=final_result,
+                )
+            )
+
         self.update_state(
             state="PROGRESS",
             meta={
@@ -0,0 +1,57 @@
+"""
+Tarefa Celery para manutenção das partições de climate_data.
+
+Garante que a partição anual do ano corrente e do próximo existam antes
+de receberem dados (prefetch de forecast cruza a virada do ano), cria a
+dos anos que caíram na partição DEFAULT (cargas históricas) e,
+opcionalmente, aplica retenção removendo partições antigas.
+"""
+
+from datetime import datetime
+from typing import Any, Dict
+
+from loguru import logger
+
+from backend.database.data_storage import (
+    drop_climate_data_partitions_before,
+    ensure_climate_data_partitions,
+)
+from backend.infrastructure.celery.celery_config import celery_app
+from config.settings.app_config import get_settings
+
+
+@celery_app.task(
+    name="backend.infrastructure.celery.tasks.maintain_climate_partitions"
+)
+def maintain_climate_partitions(years_ahead: int = 1) -> Dict[str, Any]:
+    """
+    Cria partições futuras de climate_data e aplica retenção.
+
+    Executada mensalmente pelo Celery Beat.
+
+    Args:
+        years_ahead: Quantos anos à frente do atual pré-criar
+
+    Returns:
+        Dict com anos criados e removidos
+    """
+    try:
+        created = ensure_climate_data_partitions(years_ahead=years_ahead)
+
+        # Retenção em anos (0 = manter tudo)
+        retention = get_settings().database.CLIMATE_DATA_RETENTION_YEARS
+        dropped = []
+        if retention > 0:
+            first_kept = datetime.utcnow().year - retention
+            dropped = drop_climate_data_partitions_before(first_kept)
+
+        logger.info(
+            f"✅ Partições climate_data: criadas={created}, "
+            f"removidas={dropped}"
+        )
+        return {"created": created, "dropped": dropped}
+
+    except Exception as e:
+        error_msg = f"Erro na manutenção de partições: {str(e)}"
+        logger.error(f"❌ {error_msg}")
+        return {"error": error_msg}
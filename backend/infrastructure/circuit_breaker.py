@@ -0,0 +1,512 @@
+"""
+Circuit breakers por fonte climática, com estado compartilhado no Redis.
+
+Cada fonte (nasa_power, met_norway, ...) tem um CircuitBreaker. Todos os
+workers (FastAPI e Celery) alimentam os mesmos contadores no Redis, então
+uma API fora do ar abre o circuito para todos de uma vez:
+
+- FECHADO: chamadas passam; falhas (exceção, HTTP 5xx/429 ou chamada
+  acima do limite de latência da fonte) são contadas numa janela de
+  WINDOW_SECONDS. Com pelo menos min_calls chamadas e taxa de falha
+  >= failure_rate, o circuito abre.
+- ABERTO: chamadas falham na hora com CircuitOpenError (sem retry e sem
+  esperar timeout) por open_seconds; ClimateSourceManager escolhe outra
+  fonte enquanto isso.
+- SEMIABERTO: passado open_seconds, uma única chamada de teste segue
+  para a API; sucesso fecha o circuito, falha reabre.
+
+Os limites padrão vêm de settings.climate_apis (CLIMATE_CIRCUIT_*) e
+podem ser ajustados em tempo de execução, para todos os workers, no hash
+Redis {prefix}:{source}:config:
+
+    HSET cb:nasa_power:config failure_rate 0.3 slow_call_seconds 10
+
+Hedged requests (opcional, CLIMATE_HEDGED_REQUESTS): um GET que passa do
+p95 de latência da fonte ganha uma cópia e vale a primeira resposta.
+
+Graceful degradation: erros de Redis só geram log e o circuito se
+comporta como fechado.
+"""
+
+import asyncio
+import statistics
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+from weakref import WeakKeyDictionary
+
+import httpx
+import redis
+from loguru import logger
+from redis.asyncio import Redis
+
+from backend.api.middleware.prometheus_metrics import (
+    CIRCUIT_BREAKER_REJECTED,
+    CIRCUIT_BREAKER_TRIPS,
+    HEDGED_REQUESTS,
+)
+from backend.infrastructure.http_replay import http_transport
+from config.settings.app_config import get_settings
+
+settings = get_settings()
+
+
+class CircuitOpenError(Exception):
+    """
+    Chamada rejeitada: circuito da fonte aberto.
+
+    Não herda de httpx.HTTPError de propósito: os loops de retry dos
+    clientes capturam httpx.HTTPError, e uma fonte com circuito aberto
+    deve falhar imediatamente.
+    """
+
+    def __init__(self, source: str, retry_after: float | None = None):
+        self.source = source
+        self.retry_after = retry_after
+        detail = f" (retry em {retry_after:.0f}s)" if retry_after else ""
+        super().__init__(f"Circuit breaker aberto para {source}{detail}")
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker de uma fonte, com estado no Redis.
+
+    Chaves Redis ({prefix}:{source}:...):
+    - calls:{bucket} → hash {calls, failures} da janela (EXPIRE 2 janelas)
+    - open → presente enquanto o circuito está aberto (EX open_seconds)
+    - half_open → próxima chamada após abrir é de teste
+    - probe → trava da chamada de teste (SET NX)
+    - latency → últimas LATENCY_SAMPLES latências (ms), para o p95
+    - config → overrides dos limites (failure_rate, min_calls,
+      open_seconds, slow_call_seconds)
+    """
+
+    WINDOW_SECONDS = 60
+    LATENCY_SAMPLES = 200
+    MIN_LATENCY_SAMPLES = 20  # Abaixo disso não há p95 (nem hedge)
+    HALF_OPEN_TTL = 3600  # Validade da marca half_open após reabrir
+    PROBE_TIMEOUT = 60  # Trava da chamada de teste (segundos)
+    REFRESH_SECONDS = 30  # Cache local de config + p95
+    STATE_CACHE_SECONDS = 5  # Cache local de "fechado" em is_open
+    DEFAULT_SLOW_CALL_SECONDS = 20.0
+
+    def __init__(self, source: str, prefix: str = "cb"):
+        """
+        Inicializa o breaker.
+
+        Args:
+            source: ID da fonte (mesmo de ClimateSourceManager)
+            prefix: Prefixo das chaves Redis
+        """
+        self.source = source
+        self.prefix = prefix
+        apis = settings.climate_apis
+        self._defaults: dict[str, float] = {
+            "failure_rate": apis.CIRCUIT_FAILURE_RATE,
+            "min_calls": apis.CIRCUIT_MIN_CALLS,
+            "open_seconds": apis.CIRCUIT_OPEN_SECONDS,
+            "slow_call_seconds": apis.CIRCUIT_SLOW_CALL_SECONDS.get(
+                source, self.DEFAULT_SLOW_CALL_SECONDS
+            ),
+        }
+        self._limits = dict(self._defaults)
+        self._p95: float | None = None
+        self._refreshed_at = float("-inf")
+        # Circuito aberto conhecido localmente (evita ida ao Redis)
+        self._open_until = 0.0
+        # Um cliente Redis por event loop (FastAPI e async_bridge) e um
+        # síncrono para ClimateSourceManager
+        self._clients: WeakKeyDictionary = WeakKeyDictionary()
+        self._sync_client: redis.Redis | None = None
+        self._sync_check_at = 0.0
+
+    def _key(self, name: str) -> str:
+        return f"{self.prefix}:{self.source}:{name}"
+
+    def _redis(self) -> Redis | None:
+        """Cliente Redis do event loop corrente (criado sob demanda)."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            try:
+                client = Redis.from_url(
+                    settings.redis.redis_url,
+                    decode_responses=True,
+                    socket_connect_timeout=2,
+                    socket_timeout=2,
+                )
+            except Exception as e:
+                logger.error(f"❌ Redis connection failed: {e}")
+                return None
+            self._clients[loop] = client
+        return client
+
+    # ------------------------------------------------------------------
+    # API pública
+    # ------------------------------------------------------------------
+
+    def is_open(self) -> bool:
+        """
+        Indica (de forma síncrona) se o circuito da fonte está aberto.
+
+        Usado por ClimateSourceManager na seleção de fontes, que roda
+        dentro de código async: o estado fica em cache local (aberto até
+        o fim do TTL, fechado por STATE_CACHE_SECONDS), então o Redis
+        síncrono é lido no máximo uma vez por janela. Um circuito aberto
+        por outro worker dentro da janela ainda é barrado em before_call.
+        Em semiaberto retorna False, para que a chamada de teste aconteça.
+        """
+        now = time.monotonic()
+        if now < self._open_until:
+            return True
+        if now < self._sync_check_at:
+            return False
+        try:
+            if self._sync_client is None:
+                self._sync_client = redis.Redis.from_url(
+                    settings.redis.redis_url,
+                    decode_responses=True,
+                    socket_connect_timeout=1,
+                    socket_timeout=1,
+                )
+            ttl_ms = self._sync_client.pttl(self._key("open"))
+        except Exception as e:
+            # Redis fora: não insiste a cada seleção de fontes
+            self._sync_check_at = now + self.REFRESH_SECONDS
+            logger.warning(f"Erro ao ler circuit breaker Redis: {e}")
+            return False
+        if ttl_ms > 0:
+            self._open_until = time.monotonic() + ttl_ms / 1000
+            return True
+        self._sync_check_at = now + self.STATE_CACHE_SECONDS
+        return False
+
+    async def before_call(self) -> bool:
+        """
+        Verifica se a chamada pode seguir.
+
+        Returns:
+            True se esta é a chamada de teste do semiaberto
+
+        Raises:
+            CircuitOpenError: Circuito aberto ou teste já em andamento
+        """
+        remaining = self._open_until - time.monotonic()
+        if remaining > 0:
+            self._reject(remaining)
+
+        client = self._redis()
+        if not client:
+            return False
+        acquired = False
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.pttl(self._key("open"))
+                pipe.exists(self._key("half_open"))
+                ttl_ms, half_open = await pipe.execute()
+            if ttl_ms <= 0 and half_open:
+                acquired = await client.set(
+                    self._key("probe"), "1", nx=True, ex=self.PROBE_TIMEOUT
+                )
+        except Exception as e:
+            logger.warning(f"Erro ao ler circuit breaker Redis: {e}")
+            return False
+
+        if ttl_ms > 0:
+            self._open_until = time.monotonic() + ttl_ms / 1000
+            self._reject(ttl_ms / 1000)
+        if not half_open:
+            return False
+        if not acquired:
+            # Outro worker já está testando a fonte
+            self._reject(None)
+        logger.info(f"🔌 Circuit breaker {self.source}: chamada de teste")
+        return True
+
+    async def record(
+        self, success: bool, elapsed: float, probe: bool = False
+    ) -> None:
+        """
+        Registra o resultado de uma chamada.
+
+        Args:
+            success: False para exceção ou HTTP 5xx/429
+            elapsed: Duração da chamada (segundos)
+            probe: Retorno de before_call (chamada de teste)
+        """
+        limits, _ = await self._refresh()
+        failed = not success or elapsed >= limits["slow_call_seconds"]
+
+        client = self._redis()
+        if not client:
+            return
+
+        now = time.time()
+        bucket = int(now // self.WINDOW_SECONDS)
+        key = self._key(f"calls:{bucket}")
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.hincrby(key, "calls", 1)
+                pipe.hincrby(key, "failures", int(failed))
+                pipe.expire(key, 2 * self.WINDOW_SECONDS)
+                pipe.lpush(self._key("latency"), int(elapsed * 1000))
+                pipe.ltrim(self._key("latency"), 0, self.LATENCY_SAMPLES - 1)
+                pipe.hmget(
+                    self._key(f"calls:{bucket - 1}"), "calls", "failures"
+                )
+                calls, failures, _, _, _, previous = await pipe.execute()
+
+            if probe:
+                if failed:
+                    await self._trip(client, bucket, "chamada de teste falhou")
+                else:
+                    await client.delete(
+                        self._key("half_open"), self._key("probe")
+                    )
+                    logger.info(f"✅ Circuit breaker {self.source} fechado")
+                return
+
+            # Janela deslizante: bucket anterior pesa o que resta dele
+            weight = 1 - (now % self.WINDOW_SECONDS) / self.WINDOW_SECONDS
+            calls += int(previous[0] or 0) * weight
+            failures += int(previous[1] or 0) * weight
+            if (
+                failed
+                and calls >= limits["min_calls"]
+                and failures / calls >= limits["failure_rate"]
+            ):
+                await self._trip(
+                    client,
+                    bucket,
+                    f"{failures:.0f}/{calls:.0f} falhas na janela",
+                )
+        except Exception as e:
+            logger.warning(f"Erro ao salvar circuit breaker Redis: {e}")
+
+    @asynccontextmanager
+    async def track(self) -> AsyncIterator[None]:
+        """
+        Protege um bloco (clientes sem httpx, ex.: openmeteo_requests).
+
+        Exceções contam como falha e são repassadas.
+
+        Raises:
+            CircuitOpenError: Circuito aberto
+        """
+        probe = await self.before_call()
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            await self.record(False, time.perf_counter() - start, probe)
+            raise
+        await self.record(True, time.perf_counter() - start, probe)
+
+    async def latency_p95(self) -> float | None:
+        """p95 de latência da fonte em segundos (None sem amostras)."""
+        _, p95 = await self._refresh()
+        return p95
+
+    def transport(
+        self,
+        transport: httpx.AsyncBaseTransport | None = None,
+        hedge: bool | None = None,
+        **kwargs,
+    ) -> "CircuitBreakerTransport":
+        """
+        Cria um transport httpx protegido por este breaker.
+
+        Args:
+            transport: Transport interno (padrão: http_transport da fonte,
+                rede ou gravação/replay)
+            hedge: Hedged GETs (padrão: CLIMATE_HEDGED_REQUESTS)
+            **kwargs: Repassados a httpx.AsyncHTTPTransport (ex.: limits)
+        """
+        if hedge is None:
+            hedge = settings.climate_apis.HEDGED_REQUESTS
+        return CircuitBreakerTransport(
+            self, transport or http_transport(self.source, **kwargs), hedge
+        )
+
+    async def close(self) -> None:
+        """Fecha as conexões Redis (event loop corrente e síncrona)."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.close()
+        if self._sync_client is not None:
+            self._sync_client.close()
+            self._sync_client = None
+
+    # ------------------------------------------------------------------
+    # Internos
+    # ------------------------------------------------------------------
+
+    def _reject(self, retry_after: float | None) -> None:
+        CIRCUIT_BREAKER_REJECTED.labels(source=self.source).inc()
+        raise CircuitOpenError(self.source, retry_after)
+
+    async def _trip(self, client: Redis, bucket: int, reason: str) -> None:
+        """Abre o circuito para todos os workers."""
+        open_seconds = int(self._limits["open_seconds"])
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.set(self._key("open"), reason, ex=open_seconds)
+            pipe.set(
+                self._key("half_open"),
+                "1",
+                ex=open_seconds + self.HALF_OPEN_TTL,
+            )
+            # Contadores zerados: após o teste a janela recomeça
+            pipe.delete(
+                self._key(f"calls:{bucket}"),
+                self._key(f"calls:{bucket - 1}"),
+                self._key("probe"),
+            )
+            await pipe.execute()
+        self._open_until = time.monotonic() + open_seconds
+        CIRCUIT_BREAKER_TRIPS.labels(source=self.source).inc()
+        logger.warning(
+            f"⚡ Circuit breaker {self.source} ABERTO por {open_seconds}s: "
+            f"{reason}"
+        )
+
+    async def _refresh(self) -> tuple[dict[str, float], float | None]:
+        """Limites (defaults + config Redis) e p95, cacheados localmente."""
+        if time.monotonic() - self._refreshed_at < self.REFRESH_SECONDS:
+            return self._limits, self._p95
+        self._refreshed_at = time.monotonic()
+
+        client = self._redis()
+        if not client:
+            return self._limits, self._p95
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.hgetall(self._key("config"))
+                pipe.lrange(self._key("latency"), 0, -1)
+                overrides, samples = await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Erro ao ler circuit breaker Redis: {e}")
+            return self._limits, self._p95
+
+        limits = dict(self._defaults)
+        for name, value in overrides.items():
+            if name in limits:
+                try:
+                    limits[name] = float(value)
+                except ValueError:
+                    logger.warning(
+                        f"Circuit breaker {self.source}: {name}={value!r} "
+                        f"inválido em {self._key('config')}"
+                    )
+        self._limits = limits
+
+        if len(samples) >= self.MIN_LATENCY_SAMPLES:
+            latencies = [int(ms) for ms in samples]
+            self._p95 = statistics.quantiles(latencies, n=20)[-1] / 1000
+        else:
+            self._p95 = None
+        return self._limits, self._p95
+
+
+class CircuitBreakerTransport(httpx.AsyncBaseTransport):
+    """
+    Transport httpx que passa cada requisição pelo CircuitBreaker.
+
+    HTTP 5xx e 429 contam como falha da fonte; demais status (inclusive
+    404 e 400) são respostas válidas. Com hedge=True, um GET que passa
+    do p95 da fonte ganha uma segunda requisição idêntica; a primeira
+    resposta vence e a outra é cancelada.
+    """
+
+    def __init__(
+        self,
+        breaker: CircuitBreaker,
+        transport: httpx.AsyncBaseTransport,
+        hedge: bool = False,
+    ):
+        self.breaker = breaker
+        self.transport = transport
+        self.hedge = hedge
+
+    async def handle_async_request(
+        self, request: httpx.Request
+    ) -> httpx.Response:
+        probe = await self.breaker.before_call()
+        start = time.perf_counter()
+        try:
+            if self.hedge and request.method == "GET" and not probe:
+                response = await self._hedged(request)
+            else:
+                response = await self.transport.handle_async_request(request)
+        except Exception:
+            await self.breaker.record(
+                False, time.perf_counter() - start, probe
+            )
+            raise
+        success = response.status_code < 500 and response.status_code != 429
+        await self.breaker.record(success, time.perf_counter() - start, probe)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+    async def _hedged(self, request: httpx.Request) -> httpx.Response:
+        delay = await self.breaker.latency_p95()
+        if delay is None:
+            return await self.transport.handle_async_request(request)
+
+        primary = asyncio.create_task(
+            self.transport.handle_async_request(request)
+        )
+        tasks: dict[asyncio.Task, str] = {primary: "primary"}
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done:
+                return primary.result()
+
+            logger.debug(
+                f"🔀 Hedged GET {self.breaker.source} após {delay:.2f}s: "
+                f"{request.url}"
+            )
+            hedge = asyncio.create_task(
+                self.transport.handle_async_request(
+                    httpx.Request(
+                        request.method,
+                        request.url,
+                        headers=request.headers,
+                        extensions=request.extensions,
+                    )
+                )
+            )
+            tasks[hedge] = "hedge"
+            return await self._first_response(tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _first_response(
+        self, tasks: dict[asyncio.Task, str]
+    ) -> httpx.Response:
+        """Primeira resposta sem exceção; a última exceção se ambas falham."""
+        pending = set(tasks)
+        error: BaseException | None = None
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            responses: list[Any] = []
+            for task in done:
+                if task.exception() is None:
+                    responses.append(task)
+                else:
+                    error = task.exception()
+            if responses:
+                # Empate: fecha as respostas que não serão usadas
+                for loser in responses[1:]:
+                    await loser.result().aclose()
+                winner = responses[0]
+                HEDGED_REQUESTS.labels(
+                    source=self.breaker.source, winner=tasks[winner]
+                ).inc()
+                return winner.result()
+        assert error is not None
+        raise error
@@ -0,0 +1,584 @@
+"""
+Gravação e replay HTTP das APIs climáticas (testes de carga offline).
+
+Todos os clientes climáticos recebem o transport base daqui:
+http_transport() para os clientes httpx (NASA POWER, MET Norway, NWS,
+OpenTopoData) e mount_replay() para as sessões requests do Open-Meteo.
+O modo vem de CLIMATE_HTTP_REPLAY_MODE:
+
+- off (padrão): rede normal, sem custo extra.
+- record: cada resposta real é gravada em
+  {CLIMATE_HTTP_REPLAY_DIR}/{source}/{chave}.json, com a latência
+  observada.
+- replay: nenhuma requisição sai da máquina; as respostas vêm das
+  gravações. Sem gravação exata (método + host + path + query), vale
+  uma gravação do mesmo método + path (coordenadas/datas diferentes);
+  sem nenhuma, a fonte falha como se estivesse fora do ar.
+
+Por ser o transport mais interno, circuit breaker, hedging, cache HTTP
+e retries dos clientes se comportam como em produção. Como os workers
+Celery leem as mesmas variáveis, o caminho completo /eto/calculate →
+Celery → WebSocket roda sem rede.
+
+No replay, latência e erros seguem o perfil JSON de
+CLIMATE_HTTP_REPLAY_PROFILE (sem perfil: latência gravada):
+
+    {
+      "seed": 42,
+      "default": {"latency_scale": 1.0},
+      "nasa_power": {"latency_p50_ms": 900, "latency_p99_ms": 8000,
+                     "error_rate": 0.02, "error_status": 503}
+    }
+
+Latência com p50/p99 segue uma lognormal; acima do timeout de leitura
+do cliente vira timeout. Os sorteios dependem só de (seed, fonte,
+requisição, n-ésima repetição), então o mesmo cenário se repete
+igual mesmo com requisições concorrentes.
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import math
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import httpx
+import requests
+import urllib3
+from loguru import logger
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from backend.infrastructure.cache.api_usage_tracker import UsageTransport
+from config.settings.app_config import get_settings
+
+settings = get_settings()
+
+# Headers descartados na gravação (o corpo fica gravado decodificado)
+DROPPED_HEADERS = (
+    "content-encoding",
+    "content-length",
+    "transfer-encoding",
+    "connection",
+)
+
+# z do percentil 99 da normal padrão (p50/p99 → sigma da lognormal)
+_Z99 = 2.3263
+
+
+class ReplayMissError(httpx.TransportError):
+    """Replay sem gravação para a requisição (fonte "fora do ar")."""
+
+
+@dataclass(frozen=True)
+class Recording:
+    """Resposta gravada de uma API."""
+
+    method: str
+    url: str
+    status: int
+    headers: dict[str, str]
+    body: bytes
+    elapsed_ms: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = {
+            "method": self.method,
+            "url": self.url,
+            "status": self.status,
+            "headers": self.headers,
+            "elapsed_ms": round(self.elapsed_ms, 1),
+        }
+        try:
+            data["body"] = self.body.decode("utf-8")
+        except UnicodeDecodeError:
+            # Open-Meteo responde em FlatBuffers
+            data["body_b64"] = base64.b64encode(self.body).decode("ascii")
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Recording":
+        if "body_b64" in data:
+            body = base64.b64decode(data["body_b64"])
+        else:
+            body = data.get("body", "").encode("utf-8")
+        return cls(
+            method=data["method"],
+            url=data["url"],
+            status=int(data["status"]),
+            headers=data.get("headers", {}),
+            body=body,
+            elapsed_ms=float(data.get("elapsed_ms", 0.0)),
+        )
+
+
+def request_key(method: str, url: httpx.URL) -> str:
+    """Chave da gravação: método + host + path + query ordenada."""
+    query = sorted(url.params.multi_items())
+    raw = f"{method.upper()} {url.host}{url.path}?{query}"
+    return hashlib.sha1(raw.encode()).hexdigest()[:20]
+
+
+class FixtureStore:
+    """
+    Gravações em disco: {root}/{source}/{chave}.json.
+
+    Cada fonte é carregada inteira na primeira consulta (as gravações
+    são pequenas e o replay não deve tocar o disco por requisição).
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self._recordings: dict[str, dict[str, Recording]] = {}
+        # (source, método, host, path) → chaves, para o fallback
+        self._by_path: dict[tuple[str, str, str, str], list[str]] = {}
+
+    def save(self, source: str, recording: Recording) -> Path:
+        """Grava (ou sobrescreve) a resposta; escrita atômica."""
+        url = httpx.URL(recording.url)
+        key = request_key(recording.method, url)
+        path = self.root / source / f"{key}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(
+            json.dumps(recording.to_dict(), ensure_ascii=False, indent=1),
+            encoding="utf-8",
+        )
+        tmp.replace(path)
+        with self._lock:
+            if source in self._recordings:
+                self._index(source, key, recording)
+        return path
+
+    def lookup(
+        self, source: str, method: str, url: httpx.URL
+    ) -> tuple[Recording | None, bool]:
+        """
+        Busca a gravação da requisição.
+
+        Returns:
+            (gravação ou None, exata?) — sem exata, uma do mesmo
+            método + host + path, escolhida pela chave (determinística)
+        """
+        key = request_key(method, url)
+        with self._lock:
+            if source not in self._recordings:
+                self._load(source)
+            recording = self._recordings[source].get(key)
+            if recording is not None:
+                return recording, True
+            candidates = self._by_path.get(
+                (source, method.upper(), url.host, url.path)
+            )
+            if not candidates:
+                return None, False
+            fallback = candidates[int(key, 16) % len(candidates)]
+            return self._recordings[source][fallback], False
+
+    def _load(self, source: str) -> None:
+        self._recordings[source] = {}
+        for path in sorted((self.root / source).glob("*.json")):
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                recording = Recording.from_dict(data)
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Gravação HTTP inválida {path}: {e}")
+                continue
+            self._index(source, path.stem, recording)
+        logger.info(
+            f"📼 HTTP replay {source}: "
+            f"{len(self._recordings[source])} gravações"
+        )
+
+    def _index(self, source: str, key: str, recording: Recording) -> None:
+        if key not in self._recordings[source]:
+            url = httpx.URL(recording.url)
+            self._by_path.setdefault(
+                (source, recording.method.upper(), url.host, url.path), []
+            ).append(key)
+        self._recordings[source][key] = recording
+
+
+@dataclass(frozen=True)
+class LatencyProfile:
+    """
+    Latência e erros injetados no replay de uma fonte.
+
+    Sem latency_p50_ms, usa a latência gravada × latency_scale.
+    """
+
+    latency_p50_ms: float | None = None
+    latency_p99_ms: float | None = None
+    latency_scale: float = 1.0
+    error_rate: float = 0.0
+    error_status: int = 503
+
+    def draw(
+        self, rng: random.Random, recorded_ms: float
+    ) -> tuple[float, int | None]:
+        """
+        Sorteia (latência em segundos, status de erro ou None).
+        """
+        if self.latency_p50_ms is None:
+            latency_ms = recorded_ms * self.latency_scale
+        else:
+            p99 = self.latency_p99_ms or self.latency_p50_ms
+            sigma = max(math.log(p99 / self.latency_p50_ms), 0.0) / _Z99
+            latency_ms = rng.lognormvariate(
+                math.log(self.latency_p50_ms), sigma
+            )
+        error = self.error_status if rng.random() < self.error_rate else None
+        return latency_ms / 1000, error
+
+
+@dataclass
+class ReplayProfile:
+    """Perfis por fonte ("default" vale para as demais) e seed."""
+
+    seed: int = 0
+    default: LatencyProfile = field(default_factory=LatencyProfile)
+    sources: dict[str, LatencyProfile] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: str | Path | None) -> "ReplayProfile":
+        """Lê o perfil JSON (caminho vazio: latência gravada, sem erros)."""
+        if not path:
+            return cls()
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        names = {f.name for f in fields(LatencyProfile)}
+
+        def parse(values: dict[str, Any]) -> LatencyProfile:
+            unknown = set(values) - names
+            if unknown:
+                raise ValueError(
+                    f"Perfil HTTP replay {path}: campos desconhecidos "
+                    f"{sorted(unknown)}"
+                )
+            return LatencyProfile(**values)
+
+        seed = int(data.pop("seed", 0))
+        default = parse(data.pop("default", {}))
+        return cls(
+            seed=seed,
+            default=default,
+            sources={name: parse(values) for name, values in data.items()},
+        )
+
+    def for_source(self, source: str) -> LatencyProfile:
+        return self.sources.get(source, self.default)
+
+
+class _Replayer:
+    """Lógica comum do replay (httpx e requests)."""
+
+    def __init__(
+        self, source: str, store: FixtureStore, profile: ReplayProfile
+    ):
+        self.source = source
+        self.store = store
+        self.profile = profile
+        self._lock = threading.Lock()
+        self._seen: dict[str, int] = {}
+
+    def plan(
+        self, method: str, url: httpx.URL
+    ) -> tuple[Recording, float, int | None, bool]:
+        """
+        Gravação, latência (s), status de erro e se a gravação é exata.
+
+        Raises:
+            ReplayMissError: Nenhuma gravação para o método + path
+        """
+        recording, exact = self.store.lookup(self.source, method, url)
+        if recording is None:
+            raise ReplayMissError(
+                f"HTTP replay {self.source}: sem gravação para "
+                f"{method} {url}"
+            )
+        key = request_key(method, url)
+        with self._lock:
+            n = self._seen.get(key, 0)
+            self._seen[key] = n + 1
+        rng = random.Random(f"{self.profile.seed}:{self.source}:{key}:{n}")
+        delay, error = self.profile.for_source(self.source).draw(
+            rng, recording.elapsed_ms
+        )
+        return recording, delay, error, exact
+
+    @staticmethod
+    def headers(
+        recording: Recording, error: int | None, exact: bool
+    ) -> dict[str, str]:
+        if error is not None:
+            return {"content-type": "application/json", "x-replay": "error"}
+        return {
+            **recording.headers,
+            "x-replay": "hit" if exact else "fallback",
+        }
+
+    @staticmethod
+    def body(recording: Recording, error: int | None) -> bytes:
+        if error is not None:
+            return json.dumps({"error": f"replay injected {error}"}).encode()
+        return recording.body
+
+
+class RecordReplayTransport(httpx.AsyncBaseTransport):
+    """
+    Transport httpx que grava (record) ou serve (replay) respostas.
+
+    Em record, o transport interno faz a requisição real; em replay, ele
+    não é usado.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        store: FixtureStore,
+        mode: str = "replay",
+        profile: ReplayProfile | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Modo HTTP replay inválido: {mode}")
+        self.source = source
+        self.store = store
+        self.mode = mode
+        if transport is None and mode == "record":
+            transport = httpx.AsyncHTTPTransport()
+        self.transport = transport
+        self._replayer = _Replayer(source, store, profile or ReplayProfile())
+
+    async def handle_async_request(
+        self, request: httpx.Request
+    ) -> httpx.Response:
+        if self.mode == "record":
+            return await self._record(request)
+
+        recording, delay, error, exact = self._replayer.plan(
+            request.method, request.url
+        )
+        read_timeout = request.extensions.get("timeout", {}).get("read")
+        if read_timeout is not None and delay > read_timeout:
+            await asyncio.sleep(read_timeout)
+            raise httpx.ReadTimeout(
+                f"HTTP replay {self.source}: timeout simulado",
+                request=request,
+            )
+        await asyncio.sleep(delay)
+        return httpx.Response(
+            error or recording.status,
+            headers=_Replayer.headers(recording, error, exact),
+            content=_Replayer.body(recording, error),
+            request=request,
+        )
+
+    async def aclose(self) -> None:
+        if self.transport is not None:
+            await self.transport.aclose()
+
+    async def _record(self, request: httpx.Request) -> httpx.Response:
+        assert self.transport is not None
+        start = time.perf_counter()
+        response = await self.transport.handle_async_request(request)
+        body = await response.aread()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name not in DROPPED_HEADERS
+        }
+        path = self.store.save(
+            self.source,
+            Recording(
+                method=request.method,
+                url=str(request.url),
+                status=response.status_code,
+                headers=headers,
+                body=body,
+                elapsed_ms=elapsed_ms,
+            ),
+        )
+        logger.debug(f"📼 HTTP gravado {self.source}: {path.name}")
+        return httpx.Response(
+            response.status_code,
+            headers=headers,
+            content=body,
+            request=request,
+            extensions=response.extensions,
+        )
+
+
+class RecordReplayAdapter(HTTPAdapter):
+    """
+    Adapter requests equivalente ao RecordReplayTransport.
+
+    Para sessões requests (openmeteo_requests); montado por
+    mount_replay(), que preserva o max_retries já configurado.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        store: FixtureStore,
+        mode: str = "replay",
+        profile: ReplayProfile | None = None,
+        **kwargs,
+    ):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Modo HTTP replay inválido: {mode}")
+        super().__init__(**kwargs)
+        self.source = source
+        self.store = store
+        self.mode = mode
+        self._replayer = _Replayer(source, store, profile or ReplayProfile())
+
+    def send(self, request, stream=False, timeout=None, **kwargs):
+        if self.mode == "record":
+            return self._record(request, stream, timeout, **kwargs)
+
+        try:
+            recording, delay, error, exact = self._replayer.plan(
+                request.method, httpx.URL(request.url)
+            )
+        except ReplayMissError as e:
+            raise requests.ConnectionError(str(e), request=request) from e
+        read_timeout = timeout[1] if isinstance(timeout, tuple) else timeout
+        if read_timeout is not None and delay > read_timeout:
+            time.sleep(read_timeout)
+            raise requests.ReadTimeout(
+                f"HTTP replay {self.source}: timeout simulado",
+                request=request,
+            )
+        time.sleep(delay)
+        return self._build(
+            request,
+            error or recording.status,
+            _Replayer.headers(recording, error, exact),
+            _Replayer.body(recording, error),
+        )
+
+    def _record(self, request, stream, timeout, **kwargs):
+        start = time.perf_counter()
+        response = super().send(
+            request, stream=False, timeout=timeout, **kwargs
+        )
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        headers = {
+            name.lower(): value
+            for name, value in response.headers.items()
+            if name.lower() not in DROPPED_HEADERS
+        }
+        self.store.save(
+            self.source,
+            Recording(
+                method=request.method,
+                url=request.url,
+                status=response.status_code,
+                headers=headers,
+                body=response.content,
+                elapsed_ms=elapsed_ms,
+            ),
+        )
+        return response
+
+    def _build(self, request, status, headers, body):
+        # raw urllib3: requests_cache lê atributos dele ao gravar
+        raw = urllib3.HTTPResponse(
+            body=body,
+            headers=headers,
+            status=status,
+            preload_content=False,
+            request_url=request.url,
+        )
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(headers)
+        response.raw = raw
+        response._content = body
+        response.url = request.url
+        response.request = request
+        response.reason = "Replay"
+        response.encoding = requests.utils.get_encoding_from_headers(
+            response.headers
+        )
+        response.connection = self
+        return response
+
+
+# ============================================================================
+# INTEGRAÇÃO COM OS CLIENTES
+# ============================================================================
+
+
+@lru_cache(maxsize=1)
+def _fixture_store() -> FixtureStore:
+    return FixtureStore(settings.climate_apis.HTTP_REPLAY_DIR)
+
+
+@lru_cache(maxsize=1)
+def _replay_profile() -> ReplayProfile:
+    return ReplayProfile.load(settings.climate_apis.HTTP_REPLAY_PROFILE)
+
+
+def http_transport(source: str, **kwargs) -> httpx.AsyncBaseTransport:
+    """
+    Transport base de um cliente climático httpx.
+
+    Args:
+        source: ID da fonte (pasta das gravações)
+        **kwargs: Repassados a httpx.AsyncHTTPTransport (ex.: limits)
+
+    Returns:
+        httpx.AsyncHTTPTransport (modo off) ou RecordReplayTransport;
+        requisições que chegam à rede contam no api_usage_tracker
+    """
+    mode = settings.climate_apis.HTTP_REPLAY_MODE
+    if mode == "off":
+        return UsageTransport(source, httpx.AsyncHTTPTransport(**kwargs))
+    return RecordReplayTransport(
+        source,
+        _fixture_store(),
+        mode=mode,
+        profile=_replay_profile(),
+        transport=(
+            UsageTransport(source, httpx.AsyncHTTPTransport(**kwargs))
+            if mode == "record"
+            else None
+        ),
+    )
+
+
+def mount_replay(session: requests.Session, source: str) -> None:
+    """
+    Monta o RecordReplayAdapter numa sessão requests (modo record/replay).
+
+    Args:
+        session: Sessão (ex.: CachedSession já com retry)
+        source: ID da fonte (pasta das gravações)
+    """
+    mode = settings.climate_apis.HTTP_REPLAY_MODE
+    if mode == "off":
+        return
+    for prefix in ("https://", "http://"):
+        current = session.get_adapter(prefix)
+        session.mount(
+            prefix,
+            RecordReplayAdapter(
+                source,
+                _fixture_store(),
+                mode=mode,
+                profile=_replay_profile(),
+                max_retries=getattr(current, "max_retries", 0),
+            ),
+        )
+    logger.info(f"📼 HTTP {mode} ativo para {source}")
@@ -7,13 +7,16 @@ Climate History Data Loader
 
 import json
 import warnings
+from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from loguru import logger
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from backend.database.bulk_ingestion import copy_merge
+
 warnings.filterwarnings("ignore")
 
 
@@ -164,6 +167,108 @@ class ClimateHistoryLoader:
             self.db_session.rollback()
             return None
 
+    # Colunas gravadas por insert_monthly_normals (ordem das tuplas)
+    MONTHLY_NORMALS_COLUMNS = (
+        "city_id",
+        "period_key",
+        "month",
+        "eto_normal",
+        "eto_daily_mean",
+        "eto_daily_median",
+        "eto_daily_std",
+        "eto_p01",
+        "eto_p05",
+        "eto_p10",
+        "eto_p25",
+        "eto_p75",
+        "eto_p90",
+        "eto_p95",
+        "eto_p99",
+        "eto_abs_min",
+        "eto_abs_max",
+        "precip_normal",
+        "precip_daily_mean",
+        "precip_daily_median",
+        "precip_daily_std",
+        "precip_p95",
+        "precip_p99",
+        "precip_max",
+        "rain_days",
+        "dry_days",
+        "rain_probability",
+        "precip_intensity",
+        "n_days",
+        "created_at",
+        "updated_at",
+    )
+
+    # Chave JSON de origem para cada coluna (entre city_id/period/month
+    # e created_at/updated_at)
+    MONTHLY_NORMALS_JSON_KEYS = (
+        "normal",
+        "daily_mean",
+        "daily_median",
+        "daily_std",
+        "p01",
+        "p05",
+        "p10",
+        "p25",
+        "p75",
+        "p90",
+        "p95",
+        "p99",
+        "abs_min",
+        "abs_max",
+        "precip_normal",
+        "precip_daily_mean",
+        "precip_daily_median",
+        "precip_daily_std",
+        "precip_p95",
+        "precip_p99",
+        "precip_max",
+        "rain_days",
+        "dry_days",
+        "rain_probability",
+        "precip_intensity",
+        "n_days",
+    )
+
+    def iter_monthly_normals(
+        self,
+        city_id: int,
+        json_data: dict,
+    ) -> Iterator[tuple]:
+        """
+        Gera as linhas de normais mensais de uma cidade (uma por mês)
+
+        Yields: tuplas na ordem de MONTHLY_NORMALS_COLUMNS
+        """
+        normals_data = json_data.get("climate_normals_all_periods", {})
+        period_key = json_data.get("reference_period_key", "unknown")
+        now = datetime.utcnow()
+
+        for _period_str, periods_data in normals_data.items():
+            monthly_data = periods_data.get("monthly", {})
+
+            for month_str, month_data in monthly_data.items():
+                try:
+                    month = int(month_str)
+                except (TypeError, ValueError) as e:
+                    logger.warning(f"Error processing month {month_str}: {e}")
+                    continue
+
+                yield (
+                    city_id,
+                    period_key,
+                    month,
+                    *(
+                        month_data.get(key)
+                        for key in self.MONTHLY_NORMALS_JSON_KEYS
+                    ),
+                    now,
+                    now,
+                )
+
     def insert_monthly_normals(
         self,
         city_id: int,
@@ -172,112 +277,19 @@ class ClimateHistoryLoader:
         """
         Insere normais mensais para uma cidade
 
+        Usa COPY em staging + INSERT ... ON CONFLICT DO NOTHING em um
+        único lote, em vez de um SELECT + INSERT por mês.
+
         Returns: número de registros inseridos
         """
         try:
-            normals_data = json_data.get("climate_normals_all_periods", {})
-            period_key = json_data.get("reference_period_key", "unknown")
-
-            inserted_count = 0
-
-            for _period_str, periods_data in normals_data.items():
-                monthly_data = periods_data.get("monthly", {})
-
-                for month_str, month_data in monthly_data.items():
-                    try:
-                        month = int(month_str)
-
-                        # Preparar dados do mês
-                        normal_data = {
-                            "city_id": city_id,
-                            "period_key": period_key,
-                            "month": month,
-                            "eto_normal": month_data.get("normal"),
-                            "eto_daily_mean": month_data.get("daily_mean"),
-                            "eto_daily_median": month_data.get("daily_median"),
-                            "eto_daily_std": month_data.get("daily_std"),
-                            "eto_p01": month_data.get("p01"),
-                            "eto_p05": month_data.get("p05"),
-                            "eto_p10": month_data.get("p10"),
-                            "eto_p25": month_data.get("p25"),
-                            "eto_p75": month_data.get("p75"),
-                            "eto_p90": month_data.get("p90"),
-                            "eto_p95": month_data.get("p95"),
-                            "eto_p99": month_data.get("p99"),
-                            "eto_abs_min": month_data.get("abs_min"),
-                            "eto_abs_max": month_data.get("abs_max"),
-                            "precip_normal": month_data.get("precip_normal"),
-                            "precip_daily_mean": month_data.get(
-                                "precip_daily_mean"
-                            ),
-                            "precip_daily_median": month_data.get(
-                                "precip_daily_median"
-                            ),
-                            "precip_daily_std": month_data.get(
-                                "precip_daily_std"
-                            ),
-                            "precip_p95": month_data.get("precip_p95"),
-                            "precip_p99": month_data.get("precip_p99"),
-                            "precip_max": month_data.get("precip_max"),
-                            "rain_days": month_data.get("rain_days"),
-                            "dry_days": month_data.get("dry_days"),
-                            "rain_probability": month_data.get(
-                                "rain_probability"
-                            ),
-                            "precip_intensity": month_data.get(
-                                "precip_intensity"
-                            ),
-                            "n_days": month_data.get("n_days"),
-                        }
-
-                        # Verificar se já existe
-                        check_query = text(
-                            """
-                        SELECT id FROM climate_history.monthly_climate_normals
-                        WHERE city_id = :city_id AND period_key = :period_key
-                        AND month = :month
-                        LIMIT 1
-                        """
-                        )
-                        existing = self.db_session.execute(
-                            check_query,
-                            {
-                                "city_id": city_id,
-                                "period_key": period_key,
-                                "month": month,
-                            },
-                        ).first()
-
-                        if not existing:
-                            # Inserir registro de forma segura
-                            # Usar SQLAlchemy insert para evitar SQL injection
-                            from sqlalchemy import MetaData, Table
-
-                            # Criar tabela metadata dinamicamente
-                            metadata = MetaData()
-                            monthly_normals = Table(
-                                "monthly_climate_normals",
-                                metadata,
-                                schema="climate_history",
-                                autoload_with=self.db_session.bind,
-                            )
-
-                            # Preparar dados com timestamps
-                            insert_data = normal_data.copy()
-                            insert_data["created_at"] = text("now()")
-                            insert_data["updated_at"] = text("now()")
-
-                            insert_stmt = monthly_normals.insert().values(
-                                **insert_data
-                            )
-                            self.db_session.execute(insert_stmt)
-                            inserted_count += 1
-
-                    except Exception as e:
-                        logger.warning(
-                            f"Error processing month {month_str}: {e}"
-                        )
-                        continue
+            inserted_count = copy_merge(
+                self.db_session,
+                "climate_history.monthly_climate_normals",
+                self.MONTHLY_NORMALS_COLUMNS,
+                self.iter_monthly_normals(city_id, json_data),
+                conflict_columns=["city_id", "period_key", "month"],
+            )
 
             self.db_session.commit()
             logger.info(
@@ -0,0 +1,389 @@
+"""
+Profiling sob demanda de uma execução real (requisição HTTP ou task).
+
+Um admin pede o profile de uma execução específica em produção, em vez
+de reproduzir localmente:
+
+- HTTP: header ``X-Profile: 1`` (com ``X-Admin-Token``) em
+  POST /internal/eto/calculate; a resposta traz os ids do profile da
+  requisição e do da task Celery disparada (``profile_ids``)
+- Celery: kwarg ``profile=True`` (ou um id) em qualquer
+  MonitoredProgressTask; o kwarg viaja como header da mensagem, fora da
+  assinatura da task
+
+Cada execução gera, por thread perfilada, ``profile.html`` e
+``profile.txt`` (pyinstrument, amostragem) ou ``profile.txt`` e
+``profile.prof`` (cProfile, sem pyinstrument instalado; abre no
+snakeviz), mais ``memory.txt`` (tracemalloc: alocações entre início e
+fim e pico). Tasks rodam o pipeline no loop do async_bridge, então a
+thread do loop é perfilada junto (artefatos ``bridge-*``; com cProfile
+no Python 3.12+ um único profile já cobre todas as threads).
+
+Os artefatos ficam em disco (settings.profiling, PROFILING_*), num
+diretório compartilhado entre API e workers, e são baixados pela página
+de administração (/api/v1/admin/profiles).
+
+    with profiling.profile_execution("celery calculate_eto_task") as run:
+        ...
+    run.profile_id
+"""
+
+import asyncio
+import io
+import json
+import marshal
+import os
+import pstats
+import re
+import secrets
+import shutil
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterator
+
+from loguru import logger
+
+from config.settings.app_config import get_settings
+
+PROFILE_ID_PATTERN = re.compile(r"^\d{8}T\d{6}-[0-9a-f]{8}$")
+
+_tracemalloc_lock = threading.Lock()
+_tracemalloc_users = 0
+
+
+@dataclass
+class ProfileRun:
+    """Uma execução perfilada: metadados e artefatos."""
+
+    profile_id: str
+    label: str
+    kind: str
+    attributes: dict[str, Any] = field(default_factory=dict)
+    started_at: str = ""
+    duration_s: float = 0.0
+    peak_memory_bytes: int = 0
+    profiler: str = ""
+    artifacts: dict[str, bytes] = field(default_factory=dict)
+
+    def to_meta(self) -> dict[str, Any]:
+        """Metadados JSON (sem o conteúdo dos artefatos)."""
+        return {
+            "profile_id": self.profile_id,
+            "label": self.label,
+            "kind": self.kind,
+            "attributes": self.attributes,
+            "started_at": self.started_at,
+            "duration_s": round(self.duration_s, 4),
+            "peak_memory_bytes": self.peak_memory_bytes,
+            "profiler": self.profiler,
+            "artifacts": sorted(self.artifacts),
+        }
+
+
+class ProfileStore:
+    """
+    Profiles em disco: um diretório por execução (meta.json + artefatos).
+
+    Ao salvar, remove os profiles mais antigos que ``ttl_seconds`` e os
+    que excedem ``max_profiles``.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        ttl_seconds: int = 7 * 86400,
+        max_profiles: int = 50,
+    ):
+        self.root = Path(root)
+        self.ttl_seconds = ttl_seconds
+        self.max_profiles = max_profiles
+
+    def save(self, run: ProfileRun) -> Path:
+        """Grava a execução (escrita atômica do diretório)."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        target = self.root / run.profile_id
+        tmp = self.root / f".{run.profile_id}.tmp"
+        tmp.mkdir()
+        for name, content in run.artifacts.items():
+            (tmp / name).write_bytes(content)
+        (tmp / "meta.json").write_text(
+            json.dumps(run.to_meta(), ensure_ascii=False, default=str),
+            encoding="utf-8",
+        )
+        os.replace(tmp, target)
+        self.prune()
+        return target
+
+    def recent(self, limit: int = 50) -> list[dict[str, Any]]:
+        """Metadados dos profiles, do mais recente ao mais antigo."""
+        metas = []
+        for profile_id in self._ids()[:limit]:
+            meta = self.get_meta(profile_id)
+            if meta is not None:
+                metas.append(meta)
+        return metas
+
+    def get_meta(self, profile_id: str) -> dict[str, Any] | None:
+        """Metadados de um profile (None se não existir)."""
+        if not PROFILE_ID_PATTERN.match(profile_id):
+            return None
+        path = self.root / profile_id / "meta.json"
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def artifact_path(self, profile_id: str, name: str) -> Path | None:
+        """Caminho de um artefato listado em meta.json (ou None)."""
+        meta = self.get_meta(profile_id)
+        if meta is None or name not in meta["artifacts"]:
+            return None
+        return self.root / profile_id / name
+
+    def prune(self) -> int:
+        """Remove profiles expirados ou além de max_profiles."""
+        cutoff = time.time() - self.ttl_seconds
+        removed = 0
+        for index, profile_id in enumerate(self._ids()):
+            path = self.root / profile_id
+            if index >= self.max_profiles or path.stat().st_mtime < cutoff:
+                shutil.rmtree(path, ignore_errors=True)
+                removed += 1
+        return removed
+
+    def _ids(self) -> list[str]:
+        """Ids existentes, mais recentes primeiro (o id começa pela data)."""
+        if not self.root.is_dir():
+            return []
+        return sorted(
+            (
+                path.name
+                for path in self.root.iterdir()
+                if PROFILE_ID_PATTERN.match(path.name)
+            ),
+            reverse=True,
+        )
+
+
+@lru_cache
+def get_profile_store() -> ProfileStore:
+    """Store de settings.profiling (PROFILING_DIR, TTL, MAX_PROFILES)."""
+    settings = get_settings().profiling
+    return ProfileStore(
+        settings.DIR, settings.TTL_SECONDS, settings.MAX_PROFILES
+    )
+
+
+def new_profile_id() -> str:
+    """Id ordenável por data: 20250101T120000-1a2b3c4d."""
+    return f"{time.strftime('%Y%m%dT%H%M%S')}-{secrets.token_hex(4)}"
+
+
+class _ThreadProfiler:
+    """
+    Profiler da thread que chama start() (pyinstrument ou cProfile).
+
+    ``async_mode="enabled"`` segue só a task asyncio corrente (requisição
+    FastAPI); ``"disabled"`` amostra a thread inteira (loop da ponte).
+    """
+
+    def __init__(self, interval: float, async_mode: str = "disabled"):
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            import cProfile
+
+            self.kind = "cprofile"
+            self._profiler: Any = cProfile.Profile()
+        else:
+            self.kind = "pyinstrument"
+            self._profiler = Profiler(interval=interval, async_mode=async_mode)
+
+    def start(self) -> None:
+        if self.kind == "pyinstrument":
+            self._profiler.start()
+        else:
+            self._profiler.enable()
+
+    def stop(self) -> None:
+        if self.kind == "pyinstrument":
+            self._profiler.stop()
+        else:
+            self._profiler.disable()
+
+    def artifacts(self, prefix: str = "") -> dict[str, bytes]:
+        if self.kind == "pyinstrument":
+            return {
+                f"{prefix}profile.html": (
+                    self._profiler.output_html().encode("utf-8")
+                ),
+                f"{prefix}profile.txt": self._profiler.output_text(
+                    unicode=True, color=False
+                ).encode("utf-8"),
+            }
+
+        text = io.StringIO()
+        stats = pstats.Stats(self._profiler, stream=text)
+        stats.sort_stats("cumulative").print_stats(60)
+        self._profiler.create_stats()
+        return {
+            f"{prefix}profile.txt": text.getvalue().encode("utf-8"),
+            f"{prefix}profile.prof": marshal.dumps(self._profiler.stats),
+        }
+
+
+def _run_in_loop(loop: asyncio.AbstractEventLoop, func: Any) -> None:
+    """Executa ``func()`` na thread do loop e espera terminar."""
+
+    async def call() -> None:
+        func()
+
+    asyncio.run_coroutine_threadsafe(call(), loop).result(timeout=5)
+
+
+def _tracemalloc_start(frames: int) -> None:
+    global _tracemalloc_users
+    with _tracemalloc_lock:
+        if _tracemalloc_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+        _tracemalloc_users += 1
+
+
+def _tracemalloc_stop() -> None:
+    global _tracemalloc_users
+    with _tracemalloc_lock:
+        _tracemalloc_users -= 1
+        if _tracemalloc_users == 0:
+            tracemalloc.stop()
+
+
+def _memory_report(
+    before: tracemalloc.Snapshot,
+    after: tracemalloc.Snapshot,
+    peak: int,
+    top: int = 25,
+) -> bytes:
+    """Top de alocações (linha) entre os snapshots, mais o pico."""
+    ignore = (
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        tracemalloc.Filter(False, __file__),
+    )
+    diff = after.filter_traces(ignore).compare_to(
+        before.filter_traces(ignore), "lineno"
+    )
+    lines = [
+        f"Pico de memória rastreada: {peak / 1024**2:.1f} MiB",
+        f"Top {top} diferenças de alocação (fim - início):",
+        "",
+    ]
+    lines += [str(stat) for stat in diff[:top]]
+    return "\n".join(lines).encode("utf-8")
+
+
+@contextmanager
+def profile_execution(
+    label: str,
+    kind: str = "http",
+    attributes: dict[str, Any] | None = None,
+    async_mode: str = "disabled",
+    bridge: bool = False,
+    store: ProfileStore | None = None,
+    profile_id: str | None = None,
+) -> Iterator[ProfileRun]:
+    """
+    Perfila o bloco (CPU + memória) e grava o resultado no store.
+
+    Falhas ao gerar ou gravar o profile são só logadas: a execução
+    perfilada nunca falha por causa do profiling.
+
+    Args:
+        label: Descrição da execução ("POST /internal/eto/calculate")
+        kind: "http" ou "celery"
+        attributes: Contexto (lat, lon, fontes, task_id...)
+        async_mode: "enabled" para seguir a task asyncio corrente
+        bridge: Perfilar também a thread do loop do async_bridge
+        store: Destino (padrão: get_profile_store())
+        profile_id: Id pré-gerado (ex.: devolvido antes ao cliente)
+
+    Yields:
+        ProfileRun; ``profile_id`` já vale dentro do bloco
+    """
+    settings = get_settings().profiling
+    if profile_id and not PROFILE_ID_PATTERN.match(profile_id):
+        profile_id = None
+    run = ProfileRun(
+        profile_id=profile_id or new_profile_id(),
+        label=label,
+        kind=kind,
+        attributes=dict(attributes or {}),
+        started_at=datetime.now(timezone.utc).isoformat(),
+    )
+
+    profilers: list[tuple[str, _ThreadProfiler, Any]] = []
+    main = _ThreadProfiler(settings.SAMPLE_INTERVAL, async_mode)
+    profilers.append(("", main, None))
+    # cProfile no 3.12+ (sys.monitoring) já vê todas as threads e só
+    # admite um profiler ativo por processo
+    if bridge and not (
+        main.kind == "cprofile" and sys.version_info >= (3, 12)
+    ):
+        from backend.api.services.async_bridge import get_bridge_loop
+
+        loop = get_bridge_loop()
+        profilers.append(
+            ("bridge-", _ThreadProfiler(settings.SAMPLE_INTERVAL), loop)
+        )
+    run.profiler = main.kind
+
+    _tracemalloc_start(settings.TRACEMALLOC_FRAMES)
+    tracemalloc.reset_peak()
+    before = tracemalloc.take_snapshot()
+    started = time.perf_counter()
+    active = []
+    for prefix, profiler, loop in profilers:
+        try:
+            if loop is None:
+                profiler.start()
+            else:
+                _run_in_loop(loop, profiler.start)
+        except Exception as e:
+            # Ex.: outro profile cProfile em andamento no processo
+            logger.warning(f"⚠️ Profiler {prefix or 'main'} indisponível: {e}")
+        else:
+            active.append((prefix, profiler, loop))
+
+    try:
+        yield run
+    finally:
+        for _, profiler, loop in reversed(active):
+            if loop is None:
+                profiler.stop()
+            else:
+                _run_in_loop(loop, profiler.stop)
+        run.duration_s = time.perf_counter() - started
+        after = tracemalloc.take_snapshot()
+        run.peak_memory_bytes = tracemalloc.get_traced_memory()[1]
+        _tracemalloc_stop()
+
+        try:
+            for prefix, profiler, _ in active:
+                run.artifacts.update(profiler.artifacts(prefix))
+            run.artifacts["memory.txt"] = _memory_report(
+                before, after, run.peak_memory_bytes
+            )
+            (store or get_profile_store()).save(run)
+            logger.info(
+                f"🔬 Profile {run.profile_id} gravado: {label} "
+                f"({run.duration_s:.2f}s, pico "
+                f"{run.peak_memory_bytes / 1024**2:.1f} MiB)"
+            )
+        except Exception as e:
+            logger.error(f"❌ Falha ao gravar profile {run.profile_id}: {e}")
@@ -0,0 +1,544 @@
+"""
+Tracing por spans do pipeline ETo, compatível com OpenTelemetry.
+
+Cada etapa (download por fonte, elevação, pré-processamento, fusão, ETo,
+anomalias, banco, recomendações) abre um span. O span corrente vive num
+ContextVar, então a hierarquia acompanha o código sem passar parâmetros:
+tasks asyncio herdam o contexto, e run_sync (async_bridge) também, pois
+call_soon_threadsafe copia o contexto da thread chamadora.
+
+    with tracing.span("eto.download", source="nasa_power"):
+        df, warnings = await download_weather_data(...)
+
+    @tracing.traced("eto.fusion")
+    async def _fuse_data(...): ...
+
+Propagação entre processos usa o header W3C ``traceparent``:
+TracingMiddleware continua o trace da requisição HTTP, o sinal
+before_task_publish injeta o header na mensagem Celery e
+MonitoredProgressTask continua o trace no worker.
+
+Spans finalizados vão para uma thread de exportação em lotes, sem
+serviço externo obrigatório (settings.tracing, TRACING_*):
+
+- file: uma linha OTLP/JSON por lote em TRACING_FILE_PATH
+  (importável por qualquer collector com o receiver otlpjsonfile)
+- otlp: POST OTLP/HTTP (JSON) em TRACING_OTLP_ENDPOINT
+- none: só as métricas
+
+Independente do exporter, todo span com ``metric=True`` alimenta o
+histograma Prometheus eto_pipeline_stage_duration_seconds.
+"""
+
+import atexit
+import functools
+import inspect
+import json
+import os
+import queue
+import random
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator, Mapping, NamedTuple
+
+from loguru import logger
+
+from backend.api.middleware.prometheus_metrics import PIPELINE_STAGE_DURATION
+from config.settings.app_config import get_settings
+
+# Códigos OTLP (opentelemetry/proto/trace/v1/trace.proto)
+SPAN_KINDS = {
+    "internal": 1,
+    "server": 2,
+    "client": 3,
+    "producer": 4,
+    "consumer": 5,
+}
+STATUS_CODES = {"unset": 0, "ok": 1, "error": 2}
+
+
+class SpanContext(NamedTuple):
+    """Identificação de um span (local ou vindo de traceparent)."""
+
+    trace_id: str  # 32 hex
+    span_id: str  # 16 hex
+    sampled: bool = True
+
+
+@dataclass
+class Span:
+    """Span de tracing (subconjunto do modelo OpenTelemetry)."""
+
+    name: str
+    context: SpanContext
+    parent_id: str | None = None
+    kind: str = "internal"
+    attributes: dict[str, Any] = field(default_factory=dict)
+    metric: bool = True
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: int | None = None
+    status: str = "unset"
+    status_message: str = ""
+    events: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def duration(self) -> float:
+        """Duração em segundos (até agora, se ainda aberto)."""
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e9
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_status(self, status: str, message: str = "") -> None:
+        self.status = status
+        self.status_message = message
+
+    def record_exception(self, exc: BaseException) -> None:
+        """Marca o span como erro e registra o evento 'exception'."""
+        self.set_status("error", str(exc))
+        self.events.append(
+            {
+                "name": "exception",
+                "time_ns": time.time_ns(),
+                "attributes": {
+                    "exception.type": type(exc).__name__,
+                    "exception.message": str(exc),
+                },
+            }
+        )
+
+    def traceparent(self) -> str:
+        flags = "01" if self.context.sampled else "00"
+        return f"00-{self.context.trace_id}-{self.context.span_id}-{flags}"
+
+    def end(self) -> None:
+        """Finaliza o span (idempotente): métrica + exportação."""
+        if self.end_ns is not None:
+            return
+        self.end_ns = time.time_ns()
+        if self.metric:
+            PIPELINE_STAGE_DURATION.labels(
+                stage=self.name,
+                source=str(self.attributes.get("source", "")),
+                status="error" if self.status == "error" else "ok",
+            ).observe(self.duration)
+        if self.context.sampled:
+            _processor().submit(self)
+
+    def to_otlp(self) -> dict[str, Any]:
+        """Span no formato OTLP/JSON."""
+        span = {
+            "traceId": self.context.trace_id,
+            "spanId": self.context.span_id,
+            "name": self.name,
+            "kind": SPAN_KINDS.get(self.kind, 1),
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or time.time_ns()),
+            "attributes": _otlp_attributes(self.attributes),
+            "status": {"code": STATUS_CODES[self.status]},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        if self.status_message:
+            span["status"]["message"] = self.status_message
+        if self.events:
+            span["events"] = [
+                {
+                    "name": event["name"],
+                    "timeUnixNano": str(event["time_ns"]),
+                    "attributes": _otlp_attributes(event["attributes"]),
+                }
+                for event in self.events
+            ]
+        return span
+
+
+# Span corrente (ou contexto remoto vindo de traceparent)
+_current: ContextVar[Span | SpanContext | None] = ContextVar(
+    "current_span", default=None
+)
+
+
+def current_span() -> Span | None:
+    """Span ativo no contexto corrente (None fora de um span local)."""
+    active = _current.get()
+    return active if isinstance(active, Span) else None
+
+
+def _context_of(active: Span | SpanContext | None) -> SpanContext | None:
+    return active.context if isinstance(active, Span) else active
+
+
+def start_span(
+    name: str,
+    *,
+    parent: SpanContext | None = None,
+    kind: str = "internal",
+    metric: bool = True,
+    attributes: Mapping[str, Any] | None = None,
+    **attrs: Any,
+) -> Span:
+    """
+    Cria um span sem ativá-lo (use span() para a forma usual).
+
+    Args:
+        name: Nome do span (também o label 'stage' do histograma)
+        parent: Contexto pai explícito; padrão é o span corrente
+        kind: internal, server, client, producer ou consumer
+        metric: Se deve alimentar PIPELINE_STAGE_DURATION
+        attributes: Atributos com nomes que não são identificadores
+            Python (ex.: 'http.method')
+        **attrs: Demais atributos
+
+    Returns:
+        Span iniciado
+    """
+    parent_ctx = parent or _context_of(_current.get())
+    if parent_ctx is None:
+        ratio = get_settings().tracing.SAMPLE_RATIO
+        context = SpanContext(
+            secrets.token_hex(16),
+            secrets.token_hex(8),
+            random.random() < ratio,
+        )
+    else:
+        context = SpanContext(
+            parent_ctx.trace_id, secrets.token_hex(8), parent_ctx.sampled
+        )
+    return Span(
+        name=name,
+        context=context,
+        parent_id=parent_ctx.span_id if parent_ctx else None,
+        kind=kind,
+        attributes={**(attributes or {}), **attrs},
+        metric=metric,
+    )
+
+
+@contextmanager
+def span(name: str, **kwargs: Any) -> Iterator[Span]:
+    """
+    Abre um span filho do corrente e o ativa no contexto.
+
+    Funciona em código síncrono e dentro de coroutines. Exceções marcam
+    o span como erro e são propagadas.
+
+    Args:
+        name: Nome do span
+        **kwargs: Repassados a start_span
+
+    Yields:
+        Span ativo
+    """
+    active = start_span(name, **kwargs)
+    token = _current.set(active)
+    try:
+        yield active
+    except BaseException as e:
+        active.record_exception(e)
+        raise
+    finally:
+        _current.reset(token)
+        active.end()
+
+
+def traced(name: str | None = None, **attrs: Any) -> Callable:
+    """
+    Decorator que executa a função (sync ou async) dentro de um span.
+
+    Args:
+        name: Nome do span (padrão: nome qualificado da função)
+        **attrs: Atributos fixos do span
+
+    Example:
+        @traced("eto.db_save")
+        async def _save_to_database(self, ...): ...
+    """
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with span(span_name, **attrs):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(span_name, **attrs):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def inject(carrier: dict[str, Any]) -> dict[str, Any]:
+    """
+    Grava o traceparent do span corrente em um dict de headers.
+
+    Args:
+        carrier: Headers HTTP ou headers de mensagem Celery
+
+    Returns:
+        O próprio carrier
+    """
+    ctx = _context_of(_current.get())
+    if ctx is not None:
+        flags = "01" if ctx.sampled else "00"
+        carrier["traceparent"] = f"00-{ctx.trace_id}-{ctx.span_id}-{flags}"
+    return carrier
+
+
+def extract(carrier: Mapping[str, Any] | None) -> SpanContext | None:
+    """
+    Lê o contexto W3C traceparent de um dict de headers.
+
+    Returns:
+        SpanContext remoto ou None se ausente/inválido
+    """
+    if not carrier:
+        return None
+    value = carrier.get("traceparent")
+    if not isinstance(value, str):
+        return None
+    parts = value.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    _, trace_id, span_id, flags = parts
+    try:
+        int(trace_id, 16), int(span_id, 16)
+        sampled = bool(int(flags, 16) & 1)
+    except ValueError:
+        return None
+    if not int(trace_id, 16) or not int(span_id, 16):
+        return None
+    return SpanContext(trace_id.lower(), span_id.lower(), sampled)
+
+
+def _otlp_attributes(attributes: Mapping[str, Any]) -> list[dict]:
+    """Converte atributos para a lista KeyValue do OTLP/JSON."""
+    converted = []
+    for key, value in attributes.items():
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            typed = {"boolValue": value}
+        elif isinstance(value, int):
+            typed = {"intValue": str(value)}
+        elif isinstance(value, float):
+            typed = {"doubleValue": value}
+        else:
+            typed = {"stringValue": str(value)}
+        converted.append({"key": key, "value": typed})
+    return converted
+
+
+# ============================================================================
+# EXPORTAÇÃO
+# ============================================================================
+
+
+class FileSpanExporter:
+    """Grava cada lote como uma linha OTLP/JSON (ExportTraceRequest)."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+
+    def export(self, payload: dict[str, Any]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(payload, separators=(",", ":")) + "\n")
+
+    def shutdown(self) -> None:
+        pass
+
+
+class OTLPHTTPSpanExporter:
+    """Envia lotes para um collector OTLP/HTTP (encoding JSON)."""
+
+    def __init__(self, endpoint: str, timeout: float = 5.0):
+        import httpx
+
+        self.endpoint = endpoint
+        self.client = httpx.Client(timeout=timeout)
+
+    def export(self, payload: dict[str, Any]) -> None:
+        response = self.client.post(self.endpoint, json=payload)
+        response.raise_for_status()
+
+    def shutdown(self) -> None:
+        self.client.close()
+
+
+class BatchSpanProcessor:
+    """
+    Fila + thread daemon que exporta spans em lotes.
+
+    A fila é limitada: com o exporter lento ou fora do ar, spans
+    excedentes são descartados em vez de segurar o pipeline.
+    """
+
+    MAX_QUEUE = 2048
+    BATCH_SIZE = 256
+    FLUSH_SECONDS = 2.0
+
+    def __init__(self, exporter: Any, service_name: str):
+        self.exporter = exporter
+        self.resource = {
+            "attributes": _otlp_attributes(
+                {"service.name": service_name, "process.pid": os.getpid()}
+            )
+        }
+        self.queue: queue.Queue = queue.Queue(self.MAX_QUEUE)
+        self.dropped = 0
+        self._thread = threading.Thread(
+            target=self._run, name="span-exporter", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, span: Span) -> None:
+        try:
+            self.queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self) -> None:
+        while True:
+            batch: list[Span | threading.Event] = []
+            deadline = time.monotonic() + self.FLUSH_SECONDS
+            while len(batch) < self.BATCH_SIZE:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self.queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                batch.append(item)
+                if isinstance(item, threading.Event):
+                    break
+            spans = [s for s in batch if isinstance(s, Span)]
+            if spans:
+                self._export(spans)
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    item.set()
+
+    def _export(self, spans: list[Span]) -> None:
+        payload = {
+            "resourceSpans": [
+                {
+                    "resource": self.resource,
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": __name__},
+                            "spans": [s.to_otlp() for s in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+        try:
+            self.exporter.export(payload)
+        except Exception as e:
+            logger.warning(f"Falha ao exportar {len(spans)} spans: {e}")
+
+    def force_flush(self, timeout: float = 5.0) -> bool:
+        """Exporta o que está na fila; retorna False se estourar timeout."""
+        done = threading.Event()
+        try:
+            self.queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def shutdown(self) -> None:
+        self.force_flush()
+        self.exporter.shutdown()
+
+
+class _NoopProcessor:
+    def submit(self, span: Span) -> None:
+        pass
+
+    def force_flush(self, timeout: float = 5.0) -> bool:
+        return True
+
+    def shutdown(self) -> None:
+        pass
+
+
+_lock = threading.Lock()
+_processor_instance: BatchSpanProcessor | _NoopProcessor | None = None
+_processor_pid: int | None = None
+
+
+def _processor() -> BatchSpanProcessor | _NoopProcessor:
+    """Processor do processo corrente (recriado após fork do Celery)."""
+    global _processor_instance, _processor_pid
+
+    if _processor_instance is not None and _processor_pid == os.getpid():
+        return _processor_instance
+    with _lock:
+        if _processor_instance is None or _processor_pid != os.getpid():
+            config = get_settings().tracing
+            exporter: Any = None
+            if config.ENABLED and config.EXPORTER == "file":
+                exporter = FileSpanExporter(config.FILE_PATH)
+            elif config.ENABLED and config.EXPORTER == "otlp":
+                exporter = OTLPHTTPSpanExporter(config.OTLP_ENDPOINT)
+            _processor_instance = (
+                BatchSpanProcessor(exporter, config.SERVICE_NAME)
+                if exporter
+                else _NoopProcessor()
+            )
+            _processor_pid = os.getpid()
+            logger.debug(
+                f"🛰️ Tracing exporter: {config.EXPORTER} "
+                f"(pid={_processor_pid})"
+            )
+        return _processor_instance
+
+
+def configure(exporter: Any | None) -> None:
+    """
+    Troca o exporter do processo (testes, scripts de benchmark).
+
+    Args:
+        exporter: Objeto com export(payload) e shutdown(); None desliga
+            a exportação (métricas continuam)
+    """
+    global _processor_instance, _processor_pid
+
+    with _lock:
+        if _processor_instance is not None:
+            _processor_instance.shutdown()
+        _processor_instance = (
+            BatchSpanProcessor(exporter, get_settings().tracing.SERVICE_NAME)
+            if exporter
+            else _NoopProcessor()
+        )
+        _processor_pid = os.getpid()
+
+
+def force_flush(timeout: float = 5.0) -> bool:
+    """Aguarda a exportação dos spans já finalizados."""
+    if _processor_instance is None:
+        return True
+    return _processor_instance.force_flush(timeout)
+
+
+@atexit.register
+def _shutdown() -> None:
+    if _processor_instance is not None and _processor_pid == os.getpid():
+        _processor_instance.shutdown()
@@ -0,0 +1,276 @@
+"""
+Telemetria de memória por task e reciclagem dos processos do worker.
+
+Processos do pool prefork vivem por muitas tasks: listas que só crescem
+(KalmanState.history/timestamps), DataFrames em cache e clientes criados
+por task podem se acumular. Em vez de adivinhar --max-tasks-per-child,
+cada task registra (settings.worker_memory, WORKER_MEMORY_*):
+
+- RSS antes e depois (crescimento positivo acumulado por task em
+  celery_task_rss_growth_bytes_total: quem vaza aparece ali)
+- pico de alocações Python via tracemalloc, numa amostra das tasks
+  (TRACEMALLOC_SAMPLE_RATE), sem custo nas demais
+- tamanho dos DataFrames por etapa do pipeline (record_frame)
+
+    with worker_memory.track_task("calculate_eto_task"):
+        ...
+
+    worker_memory.record_frame("eto.preprocessing", df)
+
+RecyclePolicy decide, ao fim de cada task, se o processo deve ser
+reciclado: RSS acima de MAX_RSS_MB, ou crescimento sobre o baseline do
+processo (RSS após a primeira task) acima de GROWTH_LIMIT_MB em
+GROWTH_WINDOW tasks seguidas. O billiard já verifica a memória após
+cada task quando worker_max_memory_per_child está definido; install()
+troca a leitura dele (ru_maxrss, o pico histórico) pelo RSS atual e
+sinaliza o limite quando a política pede reciclagem. O processo sai
+depois de entregar o resultado, e o pool cria outro no lugar.
+"""
+
+import os
+import random
+import sys
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+from loguru import logger
+
+from backend.api.middleware.prometheus_metrics import (
+    CELERY_TASK_MEMORY_PEAK,
+    CELERY_TASK_RSS_GROWTH,
+    CELERY_WORKER_RECYCLES,
+    CELERY_WORKER_RSS,
+    PIPELINE_FRAME_BYTES,
+)
+from backend.infrastructure import tracing
+from config.settings.app_config import get_settings
+
+_MB = 1024 * 1024
+
+
+def rss_bytes() -> int:
+    """RSS atual do processo (Linux: /proc; demais: pico via rusage)."""
+    try:
+        with open("/proc/self/statm", "rb") as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss: bytes no macOS, KiB no Linux/BSD
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+@dataclass
+class TaskMemory:
+    """Memória de uma execução de task."""
+
+    task_name: str
+    rss_before: int
+    rss_after: int = 0
+    peak_traced: int | None = None
+    frames: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def growth(self) -> int:
+        return self.rss_after - self.rss_before
+
+
+class RecyclePolicy:
+    """
+    Decide se o processo do pool deve ser reciclado.
+
+    Crescimento "sustentado": as últimas ``window`` tasks terminaram
+    todas acima de baseline + ``growth_limit`` (um pico isolado, que o
+    alocador devolve depois, não recicla).
+    """
+
+    def __init__(self, max_rss: int, growth_limit: int, window: int):
+        """
+        Inicializa a política.
+
+        Args:
+            max_rss: RSS máximo ao fim de uma task (bytes)
+            growth_limit: Crescimento sobre o baseline (bytes)
+            window: Tasks seguidas acima do limite para reciclar
+        """
+        self.max_rss = max_rss
+        self.growth_limit = growth_limit
+        self.baseline: int | None = None
+        self.recent: deque[int] = deque(maxlen=window)
+        self.tasks = 0
+        self.reason: str | None = None
+
+    def observe(self, rss: int) -> str | None:
+        """
+        Registra o RSS ao fim de uma task.
+
+        Returns:
+            Motivo da reciclagem ("max_rss", "growth") ou None
+        """
+        self.tasks += 1
+        if self.baseline is None:
+            # Primeira task: imports e caches de warm-up entram no baseline
+            self.baseline = rss
+        self.recent.append(rss)
+
+        if rss > self.max_rss:
+            self.reason = "max_rss"
+        elif (
+            len(self.recent) == self.recent.maxlen
+            and min(self.recent) - self.baseline > self.growth_limit
+        ):
+            self.reason = "growth"
+        return self.reason
+
+
+_policy: RecyclePolicy | None = None
+_current: TaskMemory | None = None
+
+
+def install() -> bool:
+    """
+    Ativa telemetria e reciclagem no processo do pool (worker_process_init).
+
+    Returns:
+        True se a reciclagem ficou ligada ao check de memória do billiard
+    """
+    global _policy
+    settings = get_settings().worker_memory
+    if not settings.ENABLED:
+        return False
+    _policy = RecyclePolicy(
+        max_rss=settings.MAX_RSS_MB * _MB,
+        growth_limit=settings.GROWTH_LIMIT_MB * _MB,
+        window=settings.GROWTH_WINDOW,
+    )
+    try:
+        from billiard import pool
+    except ImportError:
+        return False
+    if not hasattr(pool, "mem_rss"):
+        logger.warning("⚠️ billiard sem mem_rss: reciclagem desativada")
+        return False
+    pool.mem_rss = _billiard_mem_rss
+    return True
+
+
+def _billiard_mem_rss() -> int:
+    """Memória lida pelo billiard após cada task (KiB)."""
+    if _policy is not None and _policy.reason is not None:
+        return sys.maxsize
+    return rss_bytes() // 1024
+
+
+@contextmanager
+def track_task(task_name: str, sample: bool = True) -> Iterator[Any]:
+    """
+    Mede a memória de uma task no processo do pool.
+
+    Fora do worker (sem install()) não faz nada. Re-entrante: uma task
+    chamada diretamente dentro de outra (ex.: preprocessing no pipeline
+    ETo) reaproveita a TaskMemory externa, sem medir nem reportar de novo.
+
+    Args:
+        task_name: Nome da task (label das métricas)
+        sample: Permite amostrar esta task com tracemalloc (desligue
+            quando a task já roda sob profiling)
+
+    Yields:
+        TaskMemory da execução (None fora do worker)
+    """
+    global _current
+    if _policy is None:
+        yield None
+        return
+    if _current is not None:
+        yield _current
+        return
+
+    rate = get_settings().worker_memory.TRACEMALLOC_SAMPLE_RATE
+    traced = sample and not tracemalloc.is_tracing() and random.random() < rate
+    if traced:
+        tracemalloc.start(1)
+
+    _current = memory = TaskMemory(task_name, rss_before=rss_bytes())
+    try:
+        yield memory
+    finally:
+        if traced:
+            memory.peak_traced = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        _current = None
+        memory.rss_after = rss_bytes()
+        _report(memory)
+
+
+def _report(memory: TaskMemory) -> None:
+    """Métricas, log e decisão de reciclagem ao fim da task."""
+    CELERY_WORKER_RSS.set(memory.rss_after)
+    if memory.growth > 0:
+        CELERY_TASK_RSS_GROWTH.labels(task_name=memory.task_name).inc(
+            memory.growth
+        )
+    if memory.peak_traced is not None:
+        CELERY_TASK_MEMORY_PEAK.labels(task_name=memory.task_name).observe(
+            memory.peak_traced
+        )
+
+    logger.debug(
+        "🧠 {}: RSS {:.1f} → {:.1f} MB ({:+.1f}), pico {}, frames {}",
+        memory.task_name,
+        memory.rss_before / _MB,
+        memory.rss_after / _MB,
+        memory.growth / _MB,
+        (
+            f"{memory.peak_traced / _MB:.1f} MB"
+            if memory.peak_traced is not None
+            else "-"
+        ),
+        {
+            stage: f"{size / _MB:.2f} MB"
+            for stage, size in memory.frames.items()
+        },
+    )
+
+    if _policy is None or _policy.reason is not None:
+        return
+    reason = _policy.observe(memory.rss_after)
+    if reason:
+        CELERY_WORKER_RECYCLES.labels(reason=reason).inc()
+        logger.warning(
+            f"♻️ Processo {os.getpid()} será reciclado ({reason}): RSS "
+            f"{memory.rss_after / _MB:.0f} MB, baseline "
+            f"{_policy.baseline / _MB:.0f} MB após {_policy.tasks} tasks "
+            f"(última: {memory.task_name})"
+        )
+
+
+def record_frame(stage: str, frame: Any) -> int:
+    """
+    Registra o tamanho em memória de um DataFrame ao fim de uma etapa.
+
+    Vai para o histograma eto_pipeline_frame_bytes, para o span corrente
+    (atributo frame.bytes) e, no worker, para a TaskMemory da task.
+
+    Args:
+        stage: Etapa do pipeline (ex.: "eto.preprocessing")
+        frame: pandas.DataFrame (None é ignorado: download sem dados)
+
+    Returns:
+        Tamanho em bytes (memory_usage com deep=True)
+    """
+    if frame is None:
+        return 0
+    size = int(frame.memory_usage(deep=True).sum())
+    PIPELINE_FRAME_BYTES.labels(stage=stage).observe(size)
+    span = tracing.current_span()
+    if span is not None:
+        span.set_attribute("frame.bytes", size)
+    if _current is not None:
+        _current.frames[stage] = max(_current.frames.get(stage, 0), size)
+    return size
@@ -1,16 +1,15 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from prometheus_fastapi_instrumentator import Instrumentator
 
 from backend.api.routes import api_router
 from backend.api.websocket.websocket_service import router as websocket_router
-from config.logging_config import get_logger, setup_logging
+from config.logging_config import get_logger, setup_logging_from_settings
 
 # from config.settings import get_settings
 from config.settings.app_config import get_legacy_settings
 
-# Configurar logging avançado
-setup_logging(log_level="INFO", log_dir="logs", json_logs=False)
+# Configurar logging avançado (LOG_*: nível, amostragem, limites)
+setup_logging_from_settings()
 logger = get_logger()
 
 # Carregar configurações
@@ -35,17 +34,25 @@ def create_application() -> FastAPI:
         allow_headers=["*"],
     )
 
-    # Adicionar middleware Prometheus
-    from backend.api.middleware.prometheus import PrometheusMiddleware
+    # Métricas Prometheus por template de rota (ASGI puro)
+    from backend.api.middleware.prometheus import (
+        PrometheusMiddleware,
+        metrics_endpoint,
+    )
 
     app.add_middleware(PrometheusMiddleware)
 
+    # Span raiz por requisição (traceparent → pipeline ETo → Celery)
+    from backend.api.middleware.tracing import TracingMiddleware
+
+    app.add_middleware(TracingMiddleware)
+
     # Montar rotas
     app.include_router(api_router, prefix=settings.API_V1_PREFIX)
     app.include_router(websocket_router)
 
-    # Configurar métricas Prometheus
-    Instrumentator().instrument(app).expose(app, endpoint="/metrics")
+    # Expor métricas Prometheus
+    app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
 
     # Servir arquivos estáticos do frontend
     from fastapi.staticfiles import StaticFiles
@@ -256,4 +256,10 @@ def cleanup_after_test():
     """Limpa recursos após cada teste"""
     yield
     # Cleanup code aqui se necessário
-    asyncio.get_event_loop().run_until_complete(asyncio.sleep(0))
+    # (pytest-asyncio remove o loop corrente após testes async)
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        return
+    if not loop.is_closed() and not loop.is_running():
+        loop.run_until_complete(asyncio.sleep(0))
@@ -4,7 +4,8 @@ API Response Builder
 Builder para criar respostas de API externas para testes.
 """
 
-from datetime import datetime
+import math
+from datetime import datetime, timedelta
 
 
 class APIResponseBuilder:
@@ -20,6 +21,9 @@ class APIResponseBuilder:
         """
         Cria resposta da NASA Power API.
 
+        Formato real da API (properties.parameter), um valor por dia
+        entre start_date e end_date, com variação sazonal determinística.
+
         Args:
             latitude: Latitude solicitada
             longitude: Longitude solicitada
@@ -29,54 +33,58 @@ class APIResponseBuilder:
         Returns:
             Dicionário simulando resposta da NASA Power
         """
+        start = datetime.strptime(start_date, "%Y%m%d")
+        end = datetime.strptime(end_date, "%Y%m%d")
+        days = [
+            start + timedelta(days=i) for i in range((end - start).days + 1)
+        ]
+
+        parameter = {
+            name: {}
+            for name in (
+                "T2M_MAX",
+                "T2M_MIN",
+                "T2M",
+                "RH2M",
+                "WS2M",
+                "ALLSKY_SFC_SW_DWN",
+                "PRECTOTCORR",
+            )
+        }
+        for day in days:
+            key = day.strftime("%Y%m%d")
+            season = math.cos(2 * math.pi * day.timetuple().tm_yday / 365)
+            parameter["T2M_MAX"][key] = round(30.0 + 3.0 * season, 2)
+            parameter["T2M_MIN"][key] = round(18.0 + 3.0 * season, 2)
+            parameter["T2M"][key] = round(24.0 + 3.0 * season, 2)
+            parameter["RH2M"][key] = round(65.0 + 10.0 * season, 2)
+            parameter["WS2M"][key] = 2.5
+            parameter["ALLSKY_SFC_SW_DWN"][key] = round(
+                20.0 + 4.0 * season, 2
+            )
+            parameter["PRECTOTCORR"][key] = 5.2 if day.day % 7 == 0 else 0.0
+
         return {
+            "type": "Feature",
+            "geometry": {
+                "type": "Point",
+                "coordinates": [longitude, latitude, 580.0],
+            },
+            "properties": {"parameter": parameter},
             "header": {
                 "title": "NASA/POWER CERES/MERRA2 Native Resolution Daily Data",
                 "api_version": "v2.5.4",
                 "fill_value": -999.0,
             },
             "messages": [],
-            "parameters": {
-                "T2M_MAX": {
-                    "20250701": 32.5,
-                    "20250702": 33.1,
-                    "20250703": 31.8,
-                },
-                "T2M_MIN": {
-                    "20250701": 18.2,
-                    "20250702": 19.1,
-                    "20250703": 17.5,
-                },
-                "RH2M": {
-                    "20250701": 65.0,
-                    "20250702": 68.5,
-                    "20250703": 62.3,
-                },
-                "WS2M": {
-                    "20250701": 2.5,
-                    "20250702": 3.1,
-                    "20250703": 2.2,
-                },
-                "ALLSKY_SFC_SW_DWN": {
-                    "20250701": 20.5,
-                    "20250702": 19.8,
-                    "20250703": 21.2,
-                },
-                "PRECTOTCORR": {
-                    "20250701": 0.0,
-                    "20250702": 5.2,
-                    "20250703": 0.0,
-                },
-            },
-            "geometry": {
-                "type": "Point",
-                "coordinates": [longitude, latitude],
-            },
         }
 
     @staticmethod
     def build_met_norway_response(
-        latitude: float = -22.25, longitude: float = -48.5
+        latitude: float = -22.25,
+        longitude: float = -48.5,
+        start: datetime | None = None,
+        hours: int = 1,
     ) -> dict:
         """
         Cria resposta da Met Norway API.
@@ -84,10 +92,44 @@ class APIResponseBuilder:
         Args:
             latitude: Latitude solicitada
             longitude: Longitude solicitada
+            start: Primeiro horário da série (padrão: 2025-07-01 00Z)
+            hours: Número de passos horários (ciclo diário determinístico)
 
         Returns:
             Dicionário simulando resposta da Met Norway
         """
+        start = start or datetime(2025, 7, 1)
+        timeseries = []
+        for hour in range(hours):
+            time = start + timedelta(hours=hour)
+            diurnal = math.sin(2 * math.pi * (time.hour - 9) / 24)
+            timeseries.append(
+                {
+                    "time": time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "data": {
+                        "instant": {
+                            "details": {
+                                "air_temperature": round(
+                                    25.4 + 6.0 * diurnal, 1
+                                ),
+                                "relative_humidity": round(
+                                    65.0 - 15.0 * diurnal, 1
+                                ),
+                                "wind_speed": 2.5,
+                            }
+                        },
+                        "next_1_hours": {
+                            "summary": {"symbol_code": "partlycloudy_day"},
+                            "details": {"precipitation_amount": 0.0},
+                        },
+                        "next_6_hours": {
+                            "summary": {"symbol_code": "partlycloudy_day"},
+                            "details": {"precipitation_amount": 0.0},
+                        },
+                    },
+                }
+            )
+
         return {
             "type": "Feature",
             "geometry": {
@@ -103,24 +145,7 @@ class APIResponseBuilder:
                         "wind_speed": "m/s",
                     },
                 },
-                "timeseries": [
-                    {
-                        "time": "2025-07-01T00:00:00Z",
-                        "data": {
-                            "instant": {
-                                "details": {
-                                    "air_temperature": 25.4,
-                                    "relative_humidity": 65.0,
-                                    "wind_speed": 2.5,
-                                }
-                            },
-                            "next_6_hours": {
-                                "summary": {"symbol_code": "partlycloudy_day"},
-                                "details": {"precipitation_amount": 0.0},
-                            },
-                        },
-                    }
-                ],
+                "timeseries": timeseries,
             },
         }
 
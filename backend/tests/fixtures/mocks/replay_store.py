@@ -0,0 +1,124 @@
+"""
+HTTP Replay Store
+
+Popula um FixtureStore (backend.infrastructure.http_replay) com as
+respostas do APIResponseBuilder, para replay sem nunca ter gravado:
+
+    python -m backend.tests.fixtures.mocks.replay_store .cache/http_replay
+    CLIMATE_HTTP_REPLAY_MODE=replay uvicorn backend.main:app
+
+No replay, uma gravação do mesmo path serve qualquer coordenada, então
+uma resposta por fonte basta. Open-Meteo (FlatBuffers) só tem replay a
+partir de gravações reais (CLIMATE_HTTP_REPLAY_MODE=record).
+"""
+
+from pathlib import Path
+
+from backend.tests.fixtures.builders.api_response_builder import (
+    APIResponseBuilder,
+)
+
+
+def seed_replay_store(
+    root: str | Path,
+    latitude: float = -22.25,
+    longitude: float = -48.5,
+    start_date: str = "20250701",
+    end_date: str = "20250928",
+) -> list[Path]:
+    """
+    Grava respostas sintéticas de NASA POWER, MET Norway e OpenTopoData.
+
+    A previsão MET Norway começa no dia da gravação: grave de novo para
+    replays em outros dias.
+
+    Args:
+        root: Diretório do store (CLIMATE_HTTP_REPLAY_DIR)
+        latitude: Latitude das requisições gravadas
+        longitude: Longitude das requisições gravadas
+        start_date: Data inicial NASA POWER (YYYYMMDD)
+        end_date: Data final NASA POWER (YYYYMMDD)
+
+    Returns:
+        Arquivos gravados
+    """
+    import json
+    from datetime import date, datetime
+
+    import httpx
+
+    from backend.api.services.met_norway.met_norway_client import (
+        METNorwayConfig,
+    )
+    from backend.api.services.nasa_power.nasa_power_client import (
+        NASA_POWER_VARIABLES,
+        NASAPowerConfig,
+    )
+    from backend.api.services.opentopo.opentopo_client import OpenTopoConfig
+    from backend.infrastructure.http_replay import FixtureStore, Recording
+
+    opentopo = OpenTopoConfig()
+    # Previsão MET Norway: hoje (00Z) até hoje+5d
+    today = datetime.combine(date.today(), datetime.min.time())
+    responses = {
+        "nasa_power": (
+            httpx.URL(
+                NASAPowerConfig().base_url,
+                params={
+                    "parameters": ",".join(NASA_POWER_VARIABLES),
+                    "community": "AG",
+                    "longitude": longitude,
+                    "latitude": latitude,
+                    "start": start_date,
+                    "end": end_date,
+                    "format": "JSON",
+                },
+            ),
+            APIResponseBuilder.build_nasa_power_response(
+                latitude, longitude, start_date, end_date
+            ),
+            900.0,
+        ),
+        "met_norway": (
+            httpx.URL(
+                f"{METNorwayConfig().base_url}/complete",
+                params={"lat": latitude, "lon": longitude},
+            ),
+            APIResponseBuilder.build_met_norway_response(
+                latitude, longitude, start=today, hours=6 * 24
+            ),
+            250.0,
+        ),
+        "opentopo": (
+            httpx.URL(
+                f"{opentopo.base_url}/{opentopo.default_dataset}",
+                params={"locations": f"{latitude},{longitude}"},
+            ),
+            APIResponseBuilder.build_opentopo_response(),
+            300.0,
+        ),
+    }
+
+    store = FixtureStore(root)
+    return [
+        store.save(
+            source,
+            Recording(
+                method="GET",
+                url=str(url),
+                status=200,
+                headers={"content-type": "application/json"},
+                body=json.dumps(payload).encode("utf-8"),
+                elapsed_ms=elapsed_ms,
+            ),
+        )
+        for source, (url, payload, elapsed_ms) in responses.items()
+    ]
+
+
+if __name__ == "__main__":
+    import sys
+
+    target = sys.argv[1] if len(sys.argv) > 1 else ".cache/http_replay"
+    for path in seed_replay_store(target):
+        print(path)
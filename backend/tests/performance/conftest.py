@@ -0,0 +1,215 @@
+"""
+Performance Tests Configuration
+
+Fixtures dos benchmarks (pytest-benchmark) com dados determinísticos do
+pacote de validação (EVAonline_validation_v1.0.0/data, Balsas-MA,
+1991-2020) e HTTP das APIs externas servido localmente.
+
+Executar:
+    pytest backend/tests/performance -m performance -p no:cacheprovider \\
+        --benchmark-json=.benchmarks/results.json
+
+Cada benchmark tem um orçamento (média máxima, em segundos) em
+budgets.json; estourar o orçamento falha o teste. Em máquinas de CI mais
+lentas, BENCHMARK_BUDGET_FACTOR multiplica todos os orçamentos. Para
+detectar regressões relativas contra uma execução salva
+(--benchmark-autosave), acrescente:
+    --benchmark-compare --benchmark-compare-fail=mean:25%
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[3]
+VALIDATION_DATA = ROOT / "EVAonline_validation_v1.0.0" / "data"
+BUDGETS_FILE = Path(__file__).with_name("budgets.json")
+
+# Estação INMET 82768 (Balsas-MA), cidade do estudo de validação
+CITY = "Balsas_MA"
+STATION_CODE = "82768"
+
+
+# ============================================================================
+# DADOS DE VALIDAÇÃO
+# ============================================================================
+
+
+@pytest.fixture(scope="session")
+def station():
+    """Coordenadas e altitude da estação de referência (cities_plot.csv)."""
+    import pandas as pd
+
+    cities = pd.read_csv(
+        VALIDATION_DATA / "map_data" / "cities_plot.csv",
+        sep=";",
+        dtype={"CODE_ST": str},
+    )
+    row = cities.loc[cities["CODE_ST"] == STATION_CODE].iloc[0]
+    return {
+        "latitude": round(float(row["LATITUDE"]), 4),
+        "longitude": round(float(row["LONGITUDE"]), 4),
+        "elevation": float(row["HEIGHT"]),
+    }
+
+
+@pytest.fixture(scope="session")
+def nasa_series():
+    """Série diária NASA POWER bruta, 1991-2020 (10.958 dias)."""
+    import pandas as pd
+
+    path = (
+        VALIDATION_DATA
+        / "nasa_power_raw"
+        / f"{CITY}_1991-01-01_2020-12-31_NASA_RAW.csv"
+    )
+    return pd.read_csv(path, index_col="date", parse_dates=True)
+
+
+@pytest.fixture(scope="session")
+def openmeteo_series():
+    """Série diária Open-Meteo bruta, 1991-2020 (colunas estilo NASA)."""
+    import pandas as pd
+
+    path = (
+        VALIDATION_DATA
+        / "open_meteo_raw"
+        / f"{CITY}_1991-01-01_2020-12-31_OpenMeteo_RAW.csv"
+    )
+    return pd.read_csv(path, index_col="date", parse_dates=True)
+
+
+@pytest.fixture(scope="session")
+def nasa_power_payload(nasa_series, station):
+    """
+    Monta respostas da NASA POWER (formato real da API) a partir da série.
+
+    Returns:
+        Função (start YYYYMMDD, end YYYYMMDD) -> dict JSON
+    """
+    import pandas as pd
+
+    def build(start: str, end: str) -> dict:
+        part = nasa_series.loc[pd.to_datetime(start) : pd.to_datetime(end)]
+        keys = part.index.strftime("%Y%m%d")
+        return {
+            "type": "Feature",
+            "geometry": {
+                "type": "Point",
+                "coordinates": [
+                    station["longitude"],
+                    station["latitude"],
+                    station["elevation"],
+                ],
+            },
+            "properties": {
+                "parameter": {
+                    column: dict(zip(keys, part[column].astype(float)))
+                    for column in part.columns
+                }
+            },
+            "header": {"fill_value": -999.0},
+        }
+
+    return build
+
+
+# ============================================================================
+# HTTP LOCAL
+# ============================================================================
+
+
+@pytest.fixture
+def stub_http(monkeypatch, nasa_power_payload, station):
+    """
+    Responde localmente às APIs externas usadas pelo pipeline.
+
+    Substitui o envio do httpx.AsyncHTTPTransport, então vale para
+    qualquer cliente (inclusive atrás dos transports de cache e circuit
+    breaker). NASA POWER é servida da série de validação e OpenTopoData
+    via APIResponseBuilder; outros hosts recebem 503.
+
+    Returns:
+        Lista com as URLs requisitadas
+    """
+    import httpx
+
+    from backend.tests.fixtures.builders.api_response_builder import (
+        APIResponseBuilder,
+    )
+
+    requested = []
+
+    async def handle_async_request(self, request):
+        requested.append(str(request.url))
+        host = request.url.host
+        if host == "power.larc.nasa.gov":
+            params = request.url.params
+            payload = nasa_power_payload(params["start"], params["end"])
+        elif "opentopodata" in host:
+            payload = APIResponseBuilder.build_opentopo_response(
+                station["elevation"]
+            )
+        else:
+            return httpx.Response(503, request=request)
+        return httpx.Response(200, json=payload, request=request)
+
+    monkeypatch.setattr(
+        httpx.AsyncHTTPTransport,
+        "handle_async_request",
+        handle_async_request,
+    )
+    return requested
+
+
+# ============================================================================
+# AMBIENTE E ORÇAMENTOS
+# ============================================================================
+
+
+@pytest.fixture(autouse=True)
+def quiet_pipeline():
+    """Desliga logs e exportação de spans (medir só o código)."""
+    from loguru import logger
+
+    from backend.infrastructure import tracing
+
+    tracing.configure(None)
+    logger.disable("backend")
+    yield
+    logger.enable("backend")
+
+
+@pytest.fixture(scope="session")
+def budgets():
+    """Orçamentos por benchmark (budgets.json)."""
+    data = json.loads(BUDGETS_FILE.read_text(encoding="utf-8"))
+    factor = float(os.getenv("BENCHMARK_BUDGET_FACTOR", "1.0"))
+    return {name: seconds * factor for name, seconds in data.items()}
+
+
+@pytest.fixture
+def within_budget(request, budgets):
+    """
+    Verifica a média do benchmark contra o orçamento do teste.
+
+    Example:
+        benchmark(calc.calculate_et0, measurements)
+        within_budget(benchmark)
+    """
+
+    def check(benchmark) -> None:
+        name = request.node.originalname
+        assert name in budgets, f"Sem orçamento em budgets.json: {name}"
+        if benchmark.stats is None:  # --benchmark-disable
+            return
+        mean = benchmark.stats.stats.mean
+        benchmark.extra_info["budget_seconds"] = budgets[name]
+        assert mean <= budgets[name], (
+            f"{name}: média {mean * 1000:.2f}ms acima do orçamento "
+            f"{budgets[name] * 1000:.2f}ms"
+        )
+
+    return check
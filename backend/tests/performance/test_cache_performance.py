@@ -0,0 +1,68 @@
+"""
+Performance Tests - Cache Serialization
+
+Tests: Benchmark de (de)serialização do ClimateCacheService
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+
+class _DictRedis:
+    """Redis em memória com a interface usada por ClimateCacheService."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.data[key] = value
+
+
+@pytest.mark.performance
+@pytest.mark.cache
+class TestCacheSerializationPerformance:
+    """Ida e volta de um ano de dados NASA pelo cache."""
+
+    def test_cache_roundtrip_year(
+        self, benchmark, within_budget, nasa_power_payload, station
+    ):
+        """set() + get() de ClimateColumns de 366 dias (pickle)."""
+        import asyncio
+        from datetime import datetime
+
+        from backend.api.services.nasa_power.nasa_power_client import (
+            NASAPowerClient,
+        )
+        from backend.infrastructure.cache.climate_cache import (
+            ClimateCacheService,
+        )
+
+        columns = NASAPowerClient()._parse_response(
+            nasa_power_payload("20200101", "20201231")
+        )
+        cache = ClimateCacheService(prefix="bench")
+        cache.redis = _DictRedis()
+        args = (
+            "nasa_power",
+            station["latitude"],
+            station["longitude"],
+            datetime(2020, 1, 1),
+            datetime(2020, 12, 31),
+        )
+
+        async def roundtrip():
+            await cache.set(*args, columns)
+            return await cache.get(*args)
+
+        loop = asyncio.new_event_loop()
+        try:
+            cached = benchmark(lambda: loop.run_until_complete(roundtrip()))
+        finally:
+            loop.close()
+
+        within_budget(benchmark)
+        assert len(cached) == len(columns) == 366
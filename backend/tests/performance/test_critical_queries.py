@@ -1,25 +1,108 @@
 """
 Performance Tests - Critical Queries
 
-Tests: Benchmark de queries críticas
+Tests: Benchmark das leituras por intervalo em climate_data
+
+Requer um PostgreSQL local descartável apontado por BENCHMARK_POSTGIS_URL
+(o mesmo de test_spatial_operations). Tudo roda numa transação desfeita
+ao final (tabela e 30 anos de dados de Balsas-MA).
+
+A consulta espacial (ST_DWithin com índice GIST) é medida em
+test_spatial_operations.py::test_station_finder_radius.
 """
 
+import os
+from contextlib import contextmanager
+
 import pytest
 
+pytest.importorskip("pytest_benchmark")
+
+# Alvo original: < 100ms para 1000 registros
+RANGE_DAYS = 1000
+
+
+@pytest.fixture(scope="module")
+def climate_session(nasa_series, station):
+    """Sessão com public.climate_data populada (série NASA 1991-2020)."""
+    url = os.getenv("BENCHMARK_POSTGIS_URL")
+    if not url:
+        pytest.skip("BENCHMARK_POSTGIS_URL não definido")
+
+    from sqlalchemy import create_engine, insert, text
+    from sqlalchemy.orm import Session
+
+    from backend.database.data_storage import extract_hot_columns
+    from backend.database.models import ClimateData
+
+    engine = create_engine(url)
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection)
+
+    ClimateData.__table__.create(connection)
+
+    rows = []
+    for day, values in nasa_series.iterrows():
+        # JSONB não aceita NaN
+        raw = {k: float(v) for k, v in values.items() if v == v}
+        rows.append(
+            {
+                "source_api": "nasa_power",
+                "latitude": station["latitude"],
+                "longitude": station["longitude"],
+                "elevation": station["elevation"],
+                "date": day.to_pydatetime(),
+                "raw_data": raw,
+                "harmonized_data": raw,
+                **extract_hot_columns(raw, raw),
+            }
+        )
+    session.execute(insert(ClimateData), rows)
+    session.execute(text("ANALYZE public.climate_data"))
+
+    yield session
+
+    session.close()
+    transaction.rollback()
+    connection.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def storage(monkeypatch, climate_session):
+    """data_storage lendo da sessão do benchmark."""
+    from backend.database import data_storage
+
+    @contextmanager
+    def session_context():
+        yield climate_session
+
+    monkeypatch.setattr(data_storage, "get_db_context", session_context)
+    return data_storage
+
 
 @pytest.mark.performance
-@pytest.mark.requires_postgres
+@pytest.mark.requires_db
 class TestCriticalQueries:
-    """Testa performance de queries críticas."""
-
-    def test_climate_data_query_performance(self, db_session):
-        """Testa performance de query de dados climáticos."""
-        # TODO: Benchmark de SELECT em climate_data
-        # Target: < 100ms para 1000 registros
-        assert True
-
-    def test_spatial_query_performance(self, db_session):
-        """Testa performance de query espacial."""
-        # TODO: Benchmark de ST_DWithin
-        # Target: < 50ms com índice GIST
-        assert True
+    """Benchmarks das leituras de série climática por intervalo."""
+
+    def test_climate_series_range_read(
+        self, benchmark, within_budget, storage, nasa_series, station
+    ):
+        """get_climate_series: 1000 dias só com as colunas tipadas."""
+        start = nasa_series.index[0].to_pydatetime()
+        end = nasa_series.index[RANGE_DAYS - 1].to_pydatetime()
+
+        series = benchmark(
+            storage.get_climate_series,
+            station["latitude"],
+            station["longitude"],
+            start,
+            end,
+            "nasa_power",
+        )
+
+        within_budget(benchmark)
+        assert len(series) == RANGE_DAYS
+        assert series[0]["temp_max_c"] is not None
@@ -0,0 +1,204 @@
+"""
+Performance Tests - ETo Pipeline
+
+Tests: Benchmark de cálculo ETo, pré-processamento, fusão Kalman e
+pipeline completo (process_location) com HTTP local
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+
+def _measurements(frame, station):
+    """Linhas do DataFrame no formato de EToCalculationService."""
+    rows = []
+    for day, row in frame.iterrows():
+        measurements = row.to_dict()
+        measurements["T2M_MEAN"] = measurements.pop("T2M")
+        measurements.update(
+            latitude=station["latitude"],
+            longitude=station["longitude"],
+            elevation_m=station["elevation"],
+            date=str(day.date()),
+        )
+        rows.append(measurements)
+    return rows
+
+
+@pytest.mark.performance
+class TestEToCalculationPerformance:
+    """Benchmarks do FAO-56 Penman-Monteith (sem I/O)."""
+
+    def test_calculate_et0_single_day(
+        self, benchmark, within_budget, nasa_series, station
+    ):
+        """Um dia (caminho do dashboard)."""
+        from backend.core.eto_calculation.eto_services import (
+            EToCalculationService,
+        )
+
+        calc = EToCalculationService()
+        (measurements,) = _measurements(
+            nasa_series.loc[["2020-07-15"]], station
+        )
+
+        result = benchmark(calc.calculate_et0, measurements)
+
+        within_budget(benchmark)
+        assert 3.0 < result["et0_mm_day"] < 9.0
+
+    def test_calculate_et0_batch_year(
+        self, benchmark, within_budget, nasa_series, station
+    ):
+        """365 dias com fatores de elevação pré-calculados."""
+        from backend.api.services.weather_utils import ElevationUtils
+        from backend.core.eto_calculation.eto_services import (
+            EToCalculationService,
+        )
+
+        calc = EToCalculationService()
+        days = _measurements(nasa_series.loc["2019"], station)
+        factors = ElevationUtils.get_elevation_correction_factor(
+            station["elevation"]
+        )
+
+        def run():
+            return [
+                calc.calculate_et0(day, elevation_factors=factors)
+                for day in days
+            ]
+
+        results = benchmark(run)
+
+        within_budget(benchmark)
+        assert len(results) == 365
+        assert all("error" not in r for r in results)
+
+
+@pytest.mark.performance
+class TestPreprocessingPerformance:
+    """Benchmarks do pré-processamento (limites, outliers, imputação)."""
+
+    def test_preprocessing_30_years(
+        self, benchmark, within_budget, nasa_series, station
+    ):
+        """Série completa 1991-2020 num único bloco."""
+        from backend.core.data_processing.data_preprocessing import (
+            preprocessing,
+        )
+
+        df, _ = benchmark(
+            lambda: preprocessing(nasa_series.copy(), station["latitude"])
+        )
+
+        within_budget(benchmark)
+        assert len(df) == len(nasa_series)
+
+    def test_preprocess_stream_30_years(
+        self, benchmark, within_budget, nasa_series, station
+    ):
+        """Mesma série em blocos anuais (preprocess_stream)."""
+        from backend.core.data_processing.data_preprocessing import (
+            preprocess_stream,
+        )
+
+        def run():
+            return sum(
+                len(chunk)
+                for chunk, _ in preprocess_stream(
+                    nasa_series, station["latitude"], chunk="year"
+                )
+            )
+
+        rows = benchmark(run)
+
+        within_budget(benchmark)
+        assert rows == len(nasa_series)
+
+
+@pytest.mark.performance
+class TestKalmanFusionPerformance:
+    """Benchmark da fusão Kalman de duas fontes por dia."""
+
+    def test_kalman_fusion_90_days(
+        self, benchmark, within_budget, nasa_series, openmeteo_series
+    ):
+        """NASA POWER + Open-Meteo, 90 dias (Kalman simples)."""
+        from backend.core.data_processing.kalman_ensemble import (
+            ClimateKalmanFusion,
+        )
+
+        period = slice("2020-01-01", "2020-03-30")
+        days = list(
+            zip(
+                nasa_series.loc[period].to_dict("records"),
+                openmeteo_series.loc[period].to_dict("records"),
+            )
+        )
+
+        def run():
+            fusion = ClimateKalmanFusion()
+            return [
+                fusion.fuse_multiple_stations(
+                    stations_data=list(sources), has_historical_data=False
+                )
+                for sources in days
+            ]
+
+        fused = benchmark(run)
+
+        within_budget(benchmark)
+        assert len(fused) == 90
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestProcessLocationPerformance:
+    """Pipeline completo download → elevação → fusão → ETo."""
+
+    def test_process_location_end_to_end(
+        self, benchmark, within_budget, stub_http, station, mocker
+    ):
+        """
+        90 dias NASA POWER com cache frio.
+
+        O cliente NASA é criado sem cache Redis para que cada rodada
+        percorra download, parse e pipeline (resultado independente de
+        haver Redis na máquina).
+        """
+        import asyncio
+
+        from backend.api.services.climate_factory import (
+            ClimateClientFactory,
+        )
+        from backend.api.services.nasa_power.nasa_power_client import (
+            NASAPowerClient,
+        )
+        from backend.core.eto_calculation.eto_services import (
+            EToProcessingService,
+        )
+
+        mocker.patch.object(
+            ClimateClientFactory, "create_nasa_power", NASAPowerClient
+        )
+        service = EToProcessingService()
+
+        def run():
+            return asyncio.run(
+                service.process_location(
+                    station["latitude"],
+                    station["longitude"],
+                    "2020-01-01",
+                    "2020-03-30",
+                    include_recomendations=True,
+                )
+            )
+
+        result = benchmark.pedantic(run, rounds=10, warmup_rounds=1)
+
+        within_budget(benchmark)
+        assert "error" not in result
+        assert result["summary"]["total_days"] == 90
+        assert result["summary"]["et0_mean_mm_day"] > 0
+        assert any("power.larc.nasa.gov" in url for url in stub_http)
@@ -0,0 +1,109 @@
+"""
+Import-Time Budget Tests
+
+Tempo de import (``python -X importtime``) da API e do registro de tasks
+do worker Celery, num interpretador novo. Cold start de instâncias
+autoescaladas e restart de workers dependem desse tempo.
+
+Além do orçamento (budgets.json, escalado por BENCHMARK_BUDGET_FACTOR),
+garante que dependências pesadas (pandas, numpy, scipy, ...) só são
+importadas no primeiro uso, e não ao subir o processo.
+
+Perfil dos módulos mais lentos:
+    python -m backend.tests.performance.test_import_time "import backend.main"
+"""
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[3]
+
+# Módulos que o boot da API e o registro de tasks não devem importar
+HEAVY_MODULES = (
+    "pandas",
+    "numpy",
+    "scipy",
+    "sklearn",
+    "geopandas",
+    "shapely",
+    "plotly",
+    "dash",
+    "requests_cache",
+    "openmeteo_requests",
+)
+
+API_IMPORT = "import backend.main"
+WORKER_IMPORT = (
+    "from backend.infrastructure.celery.celery_config import celery_app; "
+    "celery_app.loader.import_default_modules()"
+)
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def import_profile(code: str, cwd: Path | None = None) -> dict[str, float]:
+    """
+    Executa ``code`` com -X importtime num interpretador novo.
+
+    Args:
+        code: Código Python a executar
+        cwd: Diretório de trabalho (logs/ do setup_logging vão para lá)
+
+    Returns:
+        Tempo cumulativo (s) por módulo importado; "<total>" é a soma
+        dos imports de nível superior
+    """
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=cwd or ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules: dict[str, float] = {"<total>": 0.0}
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        cumulative = int(match.group(2)) / 1e6
+        modules.setdefault(match.group(4), cumulative)
+        if len(match.group(3)) == 1:
+            modules["<total>"] += cumulative
+    return modules
+
+
+@pytest.mark.performance
+class TestImportTime:
+    """Orçamentos de import da API e do worker."""
+
+    @pytest.mark.parametrize(
+        "name, code",
+        [
+            ("test_import_api", API_IMPORT),
+            ("test_import_worker_tasks", WORKER_IMPORT),
+        ],
+    )
+    def test_import_within_budget(self, name, code, budgets, tmp_path):
+        """Import total dentro do orçamento, sem dependências pesadas."""
+        modules = import_profile(code, cwd=tmp_path)
+
+        eager = sorted(set(HEAVY_MODULES) & set(modules))
+        assert not eager, f"Importados no boot (use import lazy): {eager}"
+        assert modules["<total>"] <= budgets[name], (
+            f"{name}: {modules['<total>']:.2f}s acima do orçamento "
+            f"{budgets[name]:.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    profile = import_profile(sys.argv[1] if len(sys.argv) > 1 else API_IMPORT)
+    slowest = sorted(profile.items(), key=lambda item: -item[1])[:40]
+    for module, seconds in slowest:
+        print(f"{seconds * 1000:9.1f} ms  {module}")
@@ -0,0 +1,160 @@
+"""
+Tests for download_weather_data (Unit)
+
+Tests: validação de datas e seleção de clientes por fonte
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+
+class _FakeForecastClient:
+    """Cliente Open-Meteo Forecast em memória."""
+
+    async def get_climate_columns(self, lat, lng, start_date, end_date):
+        from backend.api.services.climate_columns import ClimateColumns
+
+        dates = np.arange(
+            np.datetime64(start_date),
+            np.datetime64(end_date) + 1,
+            dtype="datetime64[D]",
+        )
+        return ClimateColumns(
+            source="openmeteo_forecast",
+            dates=dates,
+            variables={"temperature_2m_max": np.full(dates.size, 30.0)},
+        )
+
+    async def close(self):
+        pass
+
+
+@pytest.mark.unit
+class TestDownloadWeatherDataDates:
+    """Testa a validação de datas em download_weather_data."""
+
+    async def test_forecast_dates_accepted(self, monkeypatch):
+        """Datas até hoje+5d (dashboard_forecast) não são rejeitadas."""
+        from backend.api.services import data_download
+
+        monkeypatch.setattr(
+            data_download.ClimateClientFactory,
+            "create_openmeteo_forecast",
+            staticmethod(lambda: _FakeForecastClient()),
+        )
+        today = date.today()
+        end = today + timedelta(days=5)
+
+        df, _ = await data_download.download_weather_data(
+            "openmeteo_forecast",
+            today.isoformat(),
+            end.isoformat(),
+            longitude=-46.04,
+            latitude=-7.53,
+        )
+
+        assert df.index.max().date() == end
+
+    async def test_beyond_forecast_horizon_rejected(self):
+        """Datas além de hoje+5d continuam inválidas."""
+        from backend.api.services import data_download
+
+        today = date.today()
+        end = today + timedelta(days=6)
+
+        with pytest.raises(ValueError, match="Datas inválidas"):
+            await data_download.download_weather_data(
+                "openmeteo_forecast",
+                today.isoformat(),
+                end.isoformat(),
+                longitude=-46.04,
+                latitude=-7.53,
+            )
+
+
+class _FakeArchiveClient(_FakeForecastClient):
+    """Cliente Open-Meteo Archive em memória."""
+
+
+class _FakeNWSClient:
+    """Cliente NWS Forecast que devolve a previsão inteira (7 dias)."""
+
+    def __init__(self, first_day):
+        self.first_day = first_day
+
+    async def get_daily_forecast_data(self, lat, lon):
+        from types import SimpleNamespace
+
+        return [
+            SimpleNamespace(
+                date=self.first_day + timedelta(days=i),
+                temp_max_celsius=25.0,
+                temp_min_celsius=15.0,
+                temp_mean_celsius=20.0,
+                humidity_mean_percent=60.0,
+                wind_speed_mean_ms=2.0,
+                precip_total_mm=0.0,
+            )
+            for i in range(7)
+        ]
+
+    async def close(self):
+        pass
+
+
+@pytest.mark.unit
+class TestDownloadWeatherDataSources:
+    """Testa os ramos por fonte de download_weather_data."""
+
+    async def test_archive_client_from_factory(self, monkeypatch):
+        """Open-Meteo Archive é criado pela ClimateClientFactory."""
+        from backend.api.services import data_download
+
+        created = []
+
+        def create_openmeteo_archive():
+            created.append(True)
+            return _FakeArchiveClient()
+
+        monkeypatch.setattr(
+            data_download.ClimateClientFactory,
+            "create_openmeteo_archive",
+            staticmethod(create_openmeteo_archive),
+        )
+
+        df, _ = await data_download.download_weather_data(
+            "openmeteo_archive",
+            "2020-01-01",
+            "2020-01-31",
+            longitude=-46.04,
+            latitude=-7.53,
+        )
+
+        assert created == [True]
+        assert len(df) == 31
+
+    async def test_nws_forecast_filtered_to_period(self, monkeypatch):
+        """Só os dias do período pedido saem da previsão NWS."""
+        from backend.api.services import data_download
+
+        today = date.today()
+        monkeypatch.setattr(
+            data_download.ClimateClientFactory,
+            "create_nws",
+            staticmethod(lambda: _FakeNWSClient(today)),
+        )
+        end = today + timedelta(days=2)
+
+        df, _ = await data_download.download_weather_data(
+            "nws_forecast",
+            today.isoformat(),
+            end.isoformat(),
+            longitude=-95.37,
+            latitude=29.76,
+        )
+
+        assert len(df) == 3
+        assert df.index.min().date() == today
+        assert df.index.max().date() == end
@@ -97,3 +97,44 @@ class TestPrometheusMiddleware:
 
         # Deve ter labels com method
         assert 'method="GET"' in metrics or "method='GET'" in metrics
+
+    def test_prometheus_labels_use_route_template(self):
+        """IDs no path não viram séries: label é o template da rota."""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from prometheus_client import REGISTRY
+
+        from backend.api.middleware.prometheus import PrometheusMiddleware
+
+        app = FastAPI()
+        app.add_middleware(PrometheusMiddleware)
+
+        @app.get("/favorites/{favorite_id}")
+        def favorite(favorite_id: int):
+            return {"id": favorite_id}
+
+        def count(method, handler, status):
+            labels = {"method": method, "handler": handler, "status": status}
+            return REGISTRY.get_sample_value("http_requests_total", labels)
+
+        template = "/favorites/{favorite_id}"
+        before = count("GET", template, "2xx") or 0.0
+        client = TestClient(app)
+        for favorite_id in (1, 2, 3):
+            client.get(f"/favorites/{favorite_id}")
+        client.delete("/favorites/1")
+        client.request("PURGE", "/favorites/1")
+        client.get("/unknown/42")
+
+        assert count("GET", template, "2xx") == before + 3
+        assert count("DELETE", template, "4xx") >= 1
+        assert count("OTHER", template, "4xx") >= 1
+        assert count("GET", "none", "4xx") >= 1
+        assert count("GET", "/favorites/1", "2xx") is None
+        assert (
+            REGISTRY.get_sample_value(
+                "http_requests_in_progress",
+                {"method": "GET", "handler": template},
+            )
+            == 0.0
+        )
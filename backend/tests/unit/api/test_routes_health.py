@@ -70,7 +70,7 @@ class TestMetricsEndpoint:
         [
             "http_requests_total",
             "http_request_duration_seconds",
-            "api_requests_total",
+            "http_requests_in_progress",
         ],
     )
     def test_metrics_contains_standard_metrics(
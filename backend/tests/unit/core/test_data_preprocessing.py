@@ -0,0 +1,127 @@
+"""
+Tests for Data Preprocessing (Unit)
+
+Tests: Pipeline fundido (preprocess_block) vs etapas separadas
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def _weather_df(days=30):
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame(
+        {
+            "T2M_MAX": rng.normal(30, 2, days),
+            "T2M_MIN": rng.normal(18, 2, days),
+            "RH2M": rng.uniform(40, 90, days),
+            "WS2M": rng.uniform(1, 4, days),
+            "ALLSKY_SFC_SW_DWN": rng.uniform(12, 20, days),
+            "PRECTOTCORR": rng.exponential(2, days),
+            "custom": rng.normal(5, 1, days),
+        },
+        index=pd.date_range("2024-06-01", periods=days),
+    )
+    df.iloc[3, 0] = 80.0  # Acima do limite físico
+    df.iloc[5, 2] = 120.0  # Umidade > 100%
+    df.iloc[8, 4] = 0.1  # Radiação < 0.03 Ra
+    df.iloc[7, 6] = 50.0  # Outlier IQR
+    df.iloc[0, 3] = np.nan  # Já ausente
+    return df
+
+
+@pytest.mark.unit
+class TestPreprocessBlock:
+    """Testa preprocess_block e PreprocessingReport."""
+
+    def test_matches_staged_pipeline(self):
+        """Mesmos valores de validate → outliers → impute."""
+        from backend.core.data_processing.data_preprocessing import (
+            data_impute,
+            data_initial_validate,
+            detect_outliers_iqr,
+            preprocess_block,
+        )
+
+        df = _weather_df()
+        staged, _ = data_initial_validate(df, -22.7)
+        staged, _ = detect_outliers_iqr(staged)
+        staged, _ = data_impute(staged)
+
+        fused, report = preprocess_block(df, -22.7)
+
+        assert list(fused.columns) == list(staged.columns)
+        np.testing.assert_allclose(
+            fused[df.columns].to_numpy(), staged[df.columns].to_numpy()
+        )
+        np.testing.assert_allclose(fused["Ra"], staged["Ra"])
+        assert report.invalid == {
+            "T2M_MAX": 1,
+            "RH2M": 1,
+            "ALLSKY_SFC_SW_DWN": 1,
+        }
+        assert report.outliers == {"custom": 1}
+        assert report.imputed["WS2M"] == 1
+        assert report.totals() == {
+            "invalid": 3,
+            "outliers": 1,
+            "imputed": 5,
+            "unfilled": 0,
+        }
+
+    def test_radiation_in_joules_is_converted_before_limits(self):
+        """J/m²/dia vira MJ/m²/dia em vez de ser descartado."""
+        from backend.core.data_processing.data_preprocessing import (
+            preprocess_block,
+        )
+
+        df = _weather_df()
+        df["ALLSKY_SFC_SW_DWN"] = df["ALLSKY_SFC_SW_DWN"].clip(12) * 1e6
+        df = df.assign(empty=np.nan)
+
+        fused, report = preprocess_block(df, -22.7)
+
+        assert report.converted_radiation == ["ALLSKY_SFC_SW_DWN"]
+        assert "ALLSKY_SFC_SW_DWN" not in report.invalid
+        assert fused["ALLSKY_SFC_SW_DWN"].between(12, 20).all()
+        assert report.unfilled == {"empty": 30}
+        assert report.iqr_skipped == {"empty": "insufficient_data"}
+
+
+@pytest.mark.unit
+class TestPreprocessStream:
+    """Testa preprocess_stream em séries multi-década."""
+
+    def test_yearly_chunks_with_month_of_year_iqr(self):
+        """Série de 10 anos vira 10 chunks; outlier sazonal é detectado."""
+        from backend.core.data_processing.data_preprocessing import (
+            preprocess_stream,
+        )
+
+        index = pd.date_range("2001-01-01", "2010-12-31")
+        seasonal = 10 * np.cos(2 * np.pi * index.dayofyear / 365.25)
+        rng = np.random.default_rng(7)
+        df = pd.DataFrame(
+            {
+                "T2M_MAX": 28 + seasonal + rng.normal(0, 0.5, len(index)),
+                "custom": seasonal + rng.normal(0, 0.5, len(index)),
+            },
+            index=index,
+        )
+        # Dentro da faixa anual, mas muito abaixo do janeiro típico (~10)
+        df.loc["2005-01-15", "custom"] = 5.0
+        df.loc["2008-01-01":"2008-01-03", "T2M_MAX"] = np.nan
+
+        chunks = list(preprocess_stream(df, -22.7, chunk="year"))
+
+        assert len(chunks) == 10
+        assert [c.index[0].year for c, _ in chunks] == list(range(2001, 2011))
+        clean = pd.concat(c for c, _ in chunks)
+        assert clean.loc["2005-01-15", "custom"] > 8
+        assert chunks[4][1].outliers.get("custom", 0) >= 1
+        # Lacuna no início do ano interpola a partir de 31/12 anterior
+        assert chunks[7][1].imputed["T2M_MAX"] == 3
+        gap = clean.loc["2007-12-31":"2008-01-04", "T2M_MAX"].to_numpy()
+        np.testing.assert_allclose(np.diff(gap[:4]), np.diff(gap[:4])[0])
+        assert not clean[["T2M_MAX", "custom"]].isna().any().any()
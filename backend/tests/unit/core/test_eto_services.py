@@ -0,0 +1,271 @@
+"""
+Tests for ETo Processing Service (Unit)
+
+Tests: process_location com dados no formato NASA POWER
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def _nasa_power_df(days=10):
+    """Série diária com as colunas do NASA POWER (média em "T2M")."""
+    rng = np.random.default_rng(7)
+    t_max = rng.normal(32, 1.5, days)
+    t_min = rng.normal(20, 1.5, days)
+    return pd.DataFrame(
+        {
+            "T2M_MAX": t_max,
+            "T2M_MIN": t_min,
+            "T2M": (t_max + t_min) / 2,
+            "RH2M": rng.uniform(50, 80, days),
+            "WS2M": rng.uniform(1.5, 3.5, days),
+            "ALLSKY_SFC_SW_DWN": rng.uniform(16, 22, days),
+            "PRECTOTCORR": np.zeros(days),
+        },
+        index=pd.date_range("2024-09-01", periods=days, name="date"),
+    )
+
+
+@pytest.mark.unit
+class TestProcessLocationNasaPower:
+    """Testa process_location ponta a ponta com entrada NASA POWER."""
+
+    async def test_t2m_mapped_to_t2m_mean(self, monkeypatch):
+        """T2M (NASA) vira T2M_MEAN e o ET0 diário é positivo."""
+        from backend.core.eto_calculation import eto_services
+
+        async def fake_download(database, start, end, lon, lat):
+            return _nasa_power_df(), []
+
+        async def fake_fuse(weather_data, latitude, longitude):
+            return weather_data, []
+
+        async def fake_normal(latitude, longitude, date_str):
+            return None
+
+        monkeypatch.setattr(
+            eto_services, "download_weather_data", fake_download
+        )
+        service = eto_services.EToProcessingService()
+        monkeypatch.setattr(service, "_fuse_data", fake_fuse)
+        monkeypatch.setattr(service, "_get_historical_et0_normal", fake_normal)
+
+        result = await service.process_location(
+            latitude=-7.53,
+            longitude=-46.04,
+            start_date="2024-09-01",
+            end_date="2024-09-10",
+            elevation=250.0,
+            include_recomendations=False,
+            use_precise_elevation=False,
+        )
+
+        series = result["et0_series"]
+        assert len(series) == 10
+        assert all(day["et0_mm_day"] > 0 for day in series)
+
+    async def test_normal_lookups_outside_et0_span(self, monkeypatch):
+        """Normais históricas são buscadas no span eto.anomaly, não no et0."""
+        from backend.core.eto_calculation import eto_services
+        from backend.infrastructure import tracing
+
+        spans = []
+
+        async def fake_download(database, start, end, lon, lat):
+            return _nasa_power_df(days=3), []
+
+        async def fake_fuse(weather_data, latitude, longitude):
+            return weather_data, []
+
+        async def fake_normal(latitude, longitude, date_str):
+            spans.append(tracing.current_span().name)
+            return {"mean": 4.0, "std_dev": 1.0}
+
+        monkeypatch.setattr(
+            eto_services, "download_weather_data", fake_download
+        )
+        service = eto_services.EToProcessingService()
+        monkeypatch.setattr(service, "_fuse_data", fake_fuse)
+        monkeypatch.setattr(service, "_get_historical_et0_normal", fake_normal)
+
+        result = await service.process_location(
+            latitude=-7.53,
+            longitude=-46.04,
+            start_date="2024-09-01",
+            end_date="2024-09-03",
+            elevation=250.0,
+            include_recomendations=False,
+            use_precise_elevation=False,
+        )
+
+        assert spans == ["eto.anomaly"] * 3
+        assert [day["date"] for day in result["et0_series"]] == [
+            "2024-09-01",
+            "2024-09-02",
+            "2024-09-03",
+        ]
+
+
+class _FakeTopoClient:
+    """OpenTopoClient sem rede; ``elevation=None`` simula falha."""
+
+    def __init__(self, elevation=None):
+        self.elevation = elevation
+        self.closed = False
+
+    async def get_elevation(self, latitude, longitude):
+        if self.elevation is None:
+            return None
+        return type("Location", (), {"elevation": self.elevation})()
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.mark.unit
+class TestProcessLocationWithSourcesElevation:
+    """Testa a busca de elevação em process_location_with_sources."""
+
+    async def _run(self, monkeypatch, topo):
+        from backend.api.services import data_download
+        from backend.core.eto_calculation import eto_services
+
+        async def fake_download(source, start, end, lon, lat):
+            df = _nasa_power_df()
+            df.attrs["elevation"] = 250.0
+            return df, []
+
+        monkeypatch.setattr(
+            data_download, "download_weather_data", fake_download
+        )
+        monkeypatch.setattr(eto_services, "OpenTopoClient", lambda: topo)
+
+        service = eto_services.EToProcessingService()
+        return await service.process_location_with_sources(
+            latitude=-7.53,
+            longitude=-46.04,
+            start_date="2024-09-01",
+            end_date="2024-09-10",
+            sources=["nasa_power"],
+        )
+
+    async def test_uses_opentopo_elevation(self, monkeypatch):
+        """Sem elevação na requisição, usa o OpenTopo."""
+        topo = _FakeTopoClient(elevation=300.0)
+
+        result = await self._run(monkeypatch, topo)
+
+        assert topo.closed
+        series = result["data"]["et0_series"]
+        assert len(series) == 10
+        assert all(day["et0_mm_day"] > 0 for day in series)
+
+    async def test_falls_back_to_source_elevation(self, monkeypatch):
+        """Se o OpenTopo falha, usa a elevação da fonte (attrs)."""
+        topo = _FakeTopoClient(elevation=None)
+
+        result = await self._run(monkeypatch, topo)
+
+        assert topo.closed
+        series = result["data"]["et0_series"]
+        assert len(series) == 10
+        assert all(day["et0_mm_day"] > 0 for day in series)
+
+
+def _openmeteo_df(days=5, offset=0.0):
+    """Série diária com as colunas Open-Meteo usadas na fusão."""
+    return pd.DataFrame(
+        {
+            "temperature_2m_max": np.full(days, 32.0 + offset),
+            "temperature_2m_min": np.full(days, 20.0 + offset),
+            "temperature_2m_mean": np.full(days, 26.0 + offset),
+            "relative_humidity_2m_mean": np.full(days, 65.0),
+            "wind_speed_2m_mean": np.full(days, 2.5),
+            "shortwave_radiation_sum": np.full(days, 19.0),
+            "precipitation_sum": np.zeros(days),
+        },
+        index=pd.date_range("2024-09-01", periods=days, name="date"),
+    )
+
+
+@pytest.mark.unit
+class TestProcessLocationOnBridge:
+    """Pipeline executado via run_sync (como calculate_eto_task)."""
+
+    def test_sources_fused_when_run_on_bridge(self, monkeypatch):
+        """A fusão Kalman roda dentro do loop da ponte, sem fallback."""
+        from backend.api.services import data_download
+        from backend.api.services.async_bridge import run_sync
+        from backend.core.eto_calculation import eto_services
+
+        async def fake_download(source, start, end, lon, lat):
+            return _openmeteo_df(offset=len(source) % 3), []
+
+        async def no_history(latitude, longitude):
+            fused.append((latitude, longitude))
+            return False, None, None
+
+        fused = []
+        monkeypatch.setattr(
+            data_download, "download_weather_data", fake_download
+        )
+        service = eto_services.EToProcessingService()
+        monkeypatch.setattr(service.kalman, "_get_historical_data", no_history)
+
+        result = run_sync(
+            service.process_location_with_sources(
+                latitude=-7.53,
+                longitude=-46.04,
+                start_date="2024-09-01",
+                end_date="2024-09-05",
+                sources=["nasa_power", "openmeteo_archive"],
+                elevation=250.0,
+            )
+        )
+
+        assert len(fused) == 5
+        assert len(result["data"]["et0_series"]) == 5
+
+    def test_fusion_and_normals_when_run_on_bridge(self, monkeypatch):
+        """process_location via run_sync funde e busca normais."""
+        from backend.api.services.async_bridge import run_sync
+        from backend.core.eto_calculation import eto_services
+
+        async def fake_download(database, start, end, lon, lat):
+            return _nasa_power_df(days=3), []
+
+        async def no_history(latitude, longitude):
+            fused.append((latitude, longitude))
+            return False, None, None
+
+        async def fake_city(latitude, longitude, max_distance_km=10):
+            return {"monthly_data": {"month_9": {"mean_et0": 4.0}}}
+
+        fused = []
+        monkeypatch.setattr(
+            eto_services, "download_weather_data", fake_download
+        )
+        service = eto_services.EToProcessingService()
+        monkeypatch.setattr(service.kalman, "_get_historical_data", no_history)
+        monkeypatch.setattr(
+            service.station_finder, "find_studied_city", fake_city
+        )
+
+        result = run_sync(
+            service.process_location(
+                latitude=-7.53,
+                longitude=-46.04,
+                start_date="2024-09-01",
+                end_date="2024-09-03",
+                elevation=250.0,
+                include_recomendations=False,
+                use_precise_elevation=False,
+            )
+        )
+
+        assert len(fused) == 3
+        series = result["et0_series"]
+        assert len(series) == 3
+        assert all(day["anomaly"]["z_score"] is not None for day in series)
@@ -0,0 +1,422 @@
+"""
+Tests for Climate Data Storage (bulk ingestion)
+
+Tests: geração de linhas para COPY e montagem do merge ON CONFLICT
+"""
+
+from datetime import datetime
+
+import pytest
+
+
+@pytest.mark.unit
+class TestCopyMergeQuery:
+    """Testa a query de merge staging → tabela final."""
+
+    def test_merge_with_update_columns(self):
+        """Conflito atualiza apenas as colunas pedidas."""
+        from backend.database.bulk_ingestion import _build_merge_query
+
+        query = _build_merge_query(
+            "climate_history.monthly_climate_normals",
+            "_stg",
+            ["city_id", "period_key", "month", "eto_mm_day"],
+            ["city_id", "period_key", "month"],
+            ["eto_mm_day"],
+        ).as_string(None)
+
+        assert '"climate_history"."monthly_climate_normals"' in query
+        assert 'SELECT DISTINCT ON ("city_id", "period_key", "month")' in query
+        assert 'DO UPDATE SET "eto_mm_day" = EXCLUDED."eto_mm_day"' in query
+
+    def test_merge_without_update_columns(self):
+        """Sem colunas de update o conflito é ignorado."""
+        from backend.database.bulk_ingestion import _build_merge_query
+
+        query = _build_merge_query(
+            "climate_data", "_stg", ["a", "b"], ["a"], None
+        ).as_string(None)
+
+        assert query.endswith("DO NOTHING")
+
+    def test_adapt_value_converts_nan_and_json(self):
+        """NaN vira NULL e dict vira JSONB."""
+        from psycopg.types.json import Jsonb
+
+        from backend.database.bulk_ingestion import _adapt_value
+
+        assert _adapt_value(float("nan")) is None
+        assert isinstance(_adapt_value({"T2M_MAX": 28.5}), Jsonb)
+        assert _adapt_value(4.5) == 4.5
+
+    def test_merge_orders_by_staging_ordinal(self):
+        """DO UPDATE fica com a última linha; DO NOTHING, com a primeira."""
+        from backend.database.bulk_ingestion import _build_merge_query
+
+        update = _build_merge_query(
+            "climate_data", "_stg", ["a", "b"], ["a"], ["b"]
+        ).as_string(None)
+        nothing = _build_merge_query(
+            "climate_data", "_stg", ["a", "b"], ["a"], None
+        ).as_string(None)
+
+        assert 'FROM "_stg" ORDER BY "a", "_stg_ord" DESC ON CONFLICT' in (
+            update
+        )
+        assert 'ORDER BY "a", "_stg_ord" ASC' in nothing
+
+    def test_adapt_value_sanitizes_nested_nan(self):
+        """NaN dentro de raw_data vira null (JSON válido para o COPY)."""
+        import json
+
+        from backend.database.bulk_ingestion import _adapt_value
+
+        raw = {
+            "T2M": float("nan"),
+            "hourly": [1.0, float("nan")],
+            "meta": {"RH2M": float("inf"), "ok": 2.0},
+        }
+
+        adapted = _adapt_value(raw)
+
+        assert json.loads(json.dumps(adapted.obj, allow_nan=False)) == {
+            "T2M": None,
+            "hourly": [1.0, None],
+            "meta": {"RH2M": None, "ok": 2.0},
+        }
+        assert raw["T2M"] != raw["T2M"]  # Original intacto
+
+
+class _FakeCopy:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def write_row(self, row):
+        self.rows.append(list(row))
+
+
+class _FakeCursor:
+    """Cursor psycopg em memória: registra SQL e linhas do COPY."""
+
+    def __init__(self):
+        self.statements = []
+        self.rows = []
+        self.rowcount = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, stmt):
+        query = stmt.as_string(None)
+        self.statements.append(query)
+        if query.startswith("INSERT"):
+            self.rowcount = len(self.rows)
+
+    def copy(self, stmt):
+        self.statements.append(stmt.as_string(None))
+        return _FakeCopy(self.rows)
+
+
+@pytest.mark.unit
+class TestCopyMerge:
+    """Testa o fluxo de copy_merge com uma conexão em memória."""
+
+    def _session(self, cursor):
+        from types import SimpleNamespace
+
+        raw_conn = SimpleNamespace(cursor=lambda: cursor)
+        dbapi = SimpleNamespace(driver_connection=raw_conn)
+        return SimpleNamespace(
+            connection=lambda: SimpleNamespace(connection=dbapi)
+        )
+
+    def test_staging_recreated_with_ordinal(self):
+        """Staging é recriada a cada chamada e recebe o ordinal."""
+        from backend.database.bulk_ingestion import copy_merge
+
+        cursor = _FakeCursor()
+        merged = copy_merge(
+            self._session(cursor),
+            "climate_data",
+            ["a", "raw_data"],
+            [(1, {"T2M": float("nan")}), (1, {"T2M": 20.0})],
+            conflict_columns=["a"],
+            update_columns=["raw_data"],
+        )
+
+        assert merged == 2
+        assert cursor.statements[0] == (
+            'DROP TABLE IF EXISTS "_stg_climate_data"'
+        )
+        assert cursor.statements[1].startswith(
+            'CREATE TEMP TABLE "_stg_climate_data" ON COMMIT DROP AS '
+            'SELECT "a", "raw_data", 0::bigint AS "_stg_ord"'
+        )
+        assert [row[0] for row in cursor.rows] == [1, 1]
+        assert [row[-1] for row in cursor.rows] == [0, 1]
+        assert cursor.rows[0][1].obj == {"T2M": None}
+
+
+@pytest.mark.unit
+class TestClimateRowGenerator:
+    """Testa conversão de registros em tuplas para COPY."""
+
+    def test_rows_follow_copy_columns(self):
+        """Cada tupla segue a ordem de CLIMATE_DATA_COPY_COLUMNS."""
+        from backend.database.data_storage import (
+            CLIMATE_DATA_COPY_COLUMNS,
+            _iter_climate_rows,
+        )
+
+        records = (
+            {
+                "latitude": -22.72,
+                "longitude": -47.64,
+                "date": datetime(2020, 1, day),
+                "raw_data": {"T2M_MAX": 28.5},
+            }
+            for day in range(1, 4)
+        )
+
+        rows = list(
+            _iter_climate_rows(
+                records, "nasa_power", {"T2M_MAX": "temp_max_c"}
+            )
+        )
+
+        assert len(rows) == 3
+        row = dict(zip(CLIMATE_DATA_COPY_COLUMNS, rows[0]))
+        assert row["source_api"] == "nasa_power"
+        assert row["harmonized_data"] == {"temp_max_c": 28.5}
+        assert row["eto_method"] == "penman_monteith"
+
+    def test_rows_without_harmonization(self):
+        """Sem mapeamento, harmonized_data fica vazio."""
+        from backend.database.data_storage import _iter_climate_rows
+
+        rows = list(
+            _iter_climate_rows(
+                [
+                    {
+                        "latitude": 0.0,
+                        "longitude": 0.0,
+                        "date": datetime(2020, 1, 1),
+                        "raw_data": {"x": 1},
+                    }
+                ],
+                "nasa_power",
+                None,
+            )
+        )
+
+        assert rows[0][7] is None
+
+
+@pytest.mark.unit
+class TestHotColumns:
+    """Testa extração das colunas tipadas de ClimateData."""
+
+    def test_harmonized_has_priority_over_raw(self):
+        """Valor harmonizado vence o bruto para a mesma coluna."""
+        from backend.database.data_storage import extract_hot_columns
+
+        values = extract_hot_columns(
+            {"temp_max_c": 30.0}, {"T2M_MAX": 28.5, "RH2M": 65}
+        )
+
+        assert values["temp_max_c"] == 30.0
+        assert values["humidity_percent"] == 65.0
+
+    def test_missing_and_invalid_values_become_none(self):
+        """NaN, texto e booleanos não entram nas colunas numéricas."""
+        from backend.database.data_storage import (
+            HOT_COLUMNS,
+            extract_hot_columns,
+        )
+
+        values = extract_hot_columns(
+            None,
+            {"T2M_MIN": float("nan"), "WS2M": "n/a", "PRECTOTCORR": True},
+        )
+
+        assert set(values) == set(HOT_COLUMNS)
+        assert all(v is None for v in values.values())
+
+    def test_copy_rows_include_hot_columns(self):
+        """Linhas do COPY trazem as colunas tipadas preenchidas."""
+        from backend.database.data_storage import (
+            CLIMATE_DATA_COPY_COLUMNS,
+            _iter_climate_rows,
+        )
+
+        (row,) = _iter_climate_rows(
+            [
+                {
+                    "latitude": -22.72,
+                    "longitude": -47.64,
+                    "date": datetime(2020, 1, 1),
+                    "raw_data": {"ALLSKY_SFC_SW_DWN": 20.5, "WS2M": 3.2},
+                }
+            ],
+            "nasa_power",
+            None,
+        )
+        row = dict(zip(CLIMATE_DATA_COPY_COLUMNS, row))
+
+        assert row["solar_radiation_mjm2"] == 20.5
+        assert row["wind_speed_2m_ms"] == 3.2
+
+    def test_harmonized_wind_speed_ms_is_not_u2(self):
+        """wind_speed_ms (10 m/máxima em algumas fontes) não vira u2."""
+        from backend.database.data_storage import extract_hot_columns
+
+        values = extract_hot_columns({"wind_speed_ms": 2.4}, None)
+
+        assert values["wind_speed_2m_ms"] is None
+
+    def test_covering_index_matches_migration(self):
+        """Índice de cobertura do modelo: nome e colunas da migration 004."""
+        from backend.database.data_storage import HOT_COLUMNS
+        from backend.database.models import ClimateData
+
+        (index,) = [
+            i
+            for i in ClimateData.__table__.indexes
+            if i.name == "idx_climate_data_location_hot"
+        ]
+
+        assert [c.name for c in index.columns] == [
+            "latitude",
+            "longitude",
+            "date",
+        ]
+        assert index.dialect_options["postgresql"]["include"] == [
+            "source_api",
+            "eto_mm_day",
+            *HOT_COLUMNS,
+        ]
+
+    def test_range_query_filters_source_and_orders_by_date(self):
+        """Leituras por intervalo filtram a fonte e ordenam por data."""
+        from datetime import date
+
+        from sqlalchemy.orm import Session
+
+        from backend.database.data_storage import _climate_range_query
+        from backend.database.models import ClimateData
+
+        sql = str(
+            _climate_range_query(
+                Session().query(ClimateData.date),
+                -7.53,
+                -46.04,
+                date(2020, 1, 1),
+                date(2020, 12, 31),
+                "nasa_power",
+            )
+        )
+
+        assert "climate_data.source_api = :source_api_1" in sql
+        assert sql.rstrip().endswith("ORDER BY public.climate_data.date")
+
+
+@pytest.mark.unit
+class TestSeriesSplitByYear:
+    """Testa a divisão de séries diárias em arrays anuais."""
+
+    def test_arrays_aligned_to_day_of_year(self):
+        """Cada ano vira um array de 365/366 posições com NaN nos buracos."""
+        import numpy as np
+
+        from backend.database.series_storage import split_by_year
+
+        yearly = dict(
+            split_by_year(
+                ["2019-12-31", "2020-01-01", "2020-03-01"],
+                {"temp_max_c": [30.0, 31.0, 29.0], "ignored": [1, 2, 3]},
+            )
+        )
+
+        assert sorted(yearly) == [2019, 2020]
+        assert len(yearly[2019]["temp_max_c"]) == 365
+        assert len(yearly[2020]["temp_max_c"]) == 366
+        assert "ignored" not in yearly[2020]
+        assert yearly[2019]["temp_max_c"][364] == 30.0
+        assert yearly[2020]["temp_max_c"][60] == 29.0
+        assert np.isnan(yearly[2020]["temp_max_c"][1])
+
+
+@pytest.mark.unit
+class TestMonthlyNormalsRows:
+    """Testa as linhas de normais mensais do ClimateHistoryLoader."""
+
+    def test_rows_carry_timestamps(self):
+        """Cada linha segue as colunas e traz created_at/updated_at."""
+        from backend.infrastructure.loaders.climate_history_loader import (
+            ClimateHistoryLoader,
+        )
+
+        loader = ClimateHistoryLoader(db_session=None)
+        json_data = {
+            "reference_period_key": "1991-2020",
+            "climate_normals_all_periods": {
+                "1991-2020": {"monthly": {"1": {"normal": 4.2}, "x": {}}}
+            },
+        }
+
+        rows = list(loader.iter_monthly_normals(7, json_data))
+
+        assert len(rows) == 1
+        row = dict(zip(loader.MONTHLY_NORMALS_COLUMNS, rows[0]))
+        assert len(rows[0]) == len(loader.MONTHLY_NORMALS_COLUMNS)
+        assert row["month"] == 1
+        assert row["eto_normal"] == 4.2
+        assert isinstance(row["created_at"], datetime)
+        assert row["updated_at"] == row["created_at"]
+
+
+@pytest.mark.unit
+class TestClimateDataPartitions:
+    """Testa a criação de partições anuais sob demanda."""
+
+    def test_years_in_default_partition_get_their_own(self, monkeypatch):
+        """Anos na DEFAULT entram junto com o atual + years_ahead."""
+        from contextlib import contextmanager
+        from unittest.mock import MagicMock
+
+        from backend.database import data_storage
+
+        current = datetime.utcnow().year
+        ensured = []
+
+        def execute(statement, params=None):
+            result = MagicMock()
+            if params is None:
+                result.scalars.return_value = iter([1995, current])
+            else:
+                ensured.append(params["year"])
+                result.scalar.return_value = params["year"] != current
+            return result
+
+        db = MagicMock(execute=execute)
+
+        @contextmanager
+        def db_context():
+            yield db
+
+        monkeypatch.setattr(data_storage, "get_db_context", db_context)
+
+        created = data_storage.ensure_climate_data_partitions(years_ahead=1)
+
+        assert ensured == [1995, current, current + 1]
+        assert created == [1995, current + 1]
+        db.commit.assert_called_once()
@@ -14,3 +14,87 @@ class TestMetNorwayAdapter:
     def test_placeholder(self):
         """Placeholder - implementar testes reais."""
         assert True
+
+
+@pytest.mark.unit
+class TestMetNorwayVectorizedAggregation:
+    """Testa agregação horária → diária vetorizada (weather_utils)."""
+
+    def test_matches_legacy_aggregation(self):
+        """Caminho vetorizado gera os mesmos registros que o legado."""
+        from datetime import datetime, timedelta, timezone
+
+        from backend.api.services.weather_utils import (
+            METNorwayAggregationUtils,
+            WeatherConversionUtils,
+        )
+
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        timeseries = []
+        for hour in range(72):
+            data = {
+                "instant": {
+                    "details": {
+                        "air_temperature": None if hour == 5 else hour % 17,
+                        "relative_humidity": 60.0 + hour % 10,
+                        "wind_speed": 3.0,
+                    }
+                }
+            }
+            if hour < 24:
+                data["next_1_hours"] = {
+                    "details": {"precipitation_amount": 0.5}
+                }
+            elif hour % 6 == 0:
+                data["next_6_hours"] = {
+                    "details": {
+                        "precipitation_amount": hour / 10,
+                        "air_temperature_max": 30.0,
+                        "air_temperature_min": -2.0,
+                    }
+                }
+            timeseries.append(
+                {
+                    "time": (start + timedelta(hours=hour)).strftime(
+                        "%Y-%m-%dT%H:%M:%SZ"
+                    ),
+                    "data": data,
+                }
+            )
+
+        end = start + timedelta(days=3)
+        legacy = METNorwayAggregationUtils.calculate_daily_aggregations(
+            METNorwayAggregationUtils.aggregate_hourly_to_daily(
+                timeseries, start, end
+            ),
+            WeatherConversionUtils(),
+        )
+        vectorized = METNorwayAggregationUtils.aggregate_timeseries(
+            timeseries, start, end
+        )
+
+        assert len(vectorized) == len(legacy) == 3
+        for new, old in zip(vectorized, legacy):
+            assert new.keys() == old.keys()
+            for key, value in old.items():
+                if isinstance(value, float):
+                    assert new[key] == pytest.approx(value)
+                else:
+                    assert new[key] == value
+
+    def test_groups_by_local_date_of_timestamp(self):
+        """Data local vem do offset do próprio timestamp (NWS)."""
+        import numpy as np
+
+        from backend.api.services.weather_utils import (
+            WeatherAggregationUtils,
+        )
+
+        instants, dates = WeatherAggregationUtils.parse_hourly_times(
+            ["2024-01-15T22:00:00-05:00", "2024-01-16T01:00:00Z", "bad"]
+        )
+
+        assert instants[0] == np.datetime64("2024-01-16T03:00:00")
+        assert dates[0] == np.datetime64("2024-01-15")
+        assert dates[1] == np.datetime64("2024-01-16")
+        assert np.isnat(instants[2])
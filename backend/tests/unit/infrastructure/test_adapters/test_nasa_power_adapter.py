@@ -168,3 +168,113 @@ class TestFactoryBoyIntegration:
         # Dia chuvoso
         rainy = RainyDayFactory()
         assert rainy["precipitation"] >= 10.0
+
+
+@pytest.mark.unit
+class TestNASAPowerColumnarParse:
+    """Testa o parse colunar da resposta NASA POWER."""
+
+    PAYLOAD = {
+        "geometry": {"type": "Point", "coordinates": [-47.6, -22.7, 546]},
+        "properties": {
+            "parameter": {
+                "T2M_MAX": {"20250701": 32.5, "20250702": 30.1},
+                "T2M_MIN": {"20250702": 17.9, "20250701": 18.2},
+                "RH2M": {"20250701": 65.0},
+            }
+        },
+    }
+
+    def test_parse_response_builds_columns(self):
+        """Cada variável vira um array alinhado às datas."""
+        import numpy as np
+
+        from backend.api.services.nasa_power.nasa_power_client import (
+            NASAPowerClient,
+        )
+
+        columns = NASAPowerClient()._parse_response(self.PAYLOAD)
+        df = columns.to_dataframe()
+
+        assert len(columns) == 2
+        assert columns.metadata["elevation"] == 546
+        assert str(df.index[0].date()) == "2025-07-01"
+        assert df["T2M_MIN"].tolist() == [18.2, 17.9]
+        assert np.isnan(df.loc["2025-07-02", "RH2M"])
+        assert np.isnan(df["PRECTOTCORR"]).all()
+
+    def test_records_keep_legacy_model(self):
+        """get_daily_data continua devolvendo NASAPowerData."""
+        from backend.api.services.nasa_power.nasa_power_client import (
+            NASAPowerClient,
+        )
+
+        client = NASAPowerClient()
+        records = client._columns_to_records(
+            client._parse_response(self.PAYLOAD)
+        )
+
+        assert records[0].date == "2025-07-01"
+        assert records[0].temp_max == 32.5
+        assert records[1].humidity is None
+
+    def test_from_records_reads_attributes_by_column(self):
+        """Objetos por dia viram colunas sem dicts intermediários."""
+        from datetime import datetime
+        from types import SimpleNamespace
+
+        from backend.api.services.climate_columns import ClimateColumns
+
+        records = [
+            SimpleNamespace(date=datetime(2025, 7, 1, 12), temp_mean=20.0),
+            SimpleNamespace(date=datetime(2025, 7, 2, 12), temp_mean=None),
+        ]
+
+        df = ClimateColumns.from_records(
+            "nws_stations", records, {"temp_mean": "temp_celsius"}
+        ).to_dataframe()
+
+        assert list(df.columns) == ["temp_celsius"]
+        assert df["temp_celsius"].isna().tolist() == [False, True]
+
+    def test_from_records_reads_mapping_keys(self):
+        """Dicts por dia (MET Norway) são lidos por chave."""
+        import numpy as np
+
+        from backend.api.services.climate_columns import ClimateColumns
+
+        records = [
+            {"date": "2025-07-01", "temp_max": 24.5},
+            {"date": "2025-07-02", "temp_max": None},
+        ]
+
+        df = ClimateColumns.from_records(
+            "met_norway", records, {"temp_max": "T2M_MAX"}
+        ).to_dataframe()
+
+        assert str(df.index[0].date()) == "2025-07-01"
+        assert df["T2M_MAX"].iloc[0] == 24.5
+        assert np.isnan(df["T2M_MAX"].iloc[1])
+
+    def test_from_openmeteo_rejects_misaligned_variable(self, mocker):
+        """Array com tamanho diferente das datas é erro, não NaN."""
+        import numpy as np
+
+        from backend.api.services.climate_columns import ClimateColumns
+
+        daily = mocker.Mock()
+        daily.Time.return_value = 1_719_792_000  # 2024-07-01 UTC
+        daily.TimeEnd.return_value = 1_719_792_000 + 3 * 86400
+        daily.Interval.return_value = 86400
+        daily.Variables.side_effect = lambda i: mocker.Mock(
+            ValuesAsNumpy=mocker.Mock(return_value=np.ones(3 if i == 0 else 2))
+        )
+        response = mocker.Mock(UtcOffsetSeconds=mocker.Mock(return_value=0))
+        response.Daily.return_value = daily
+
+        with pytest.raises(ValueError, match="precipitation_sum.*2 .*3 "):
+            ClimateColumns.from_openmeteo(
+                "openmeteo_archive",
+                response,
+                ["temperature_2m_max", "precipitation_sum"],
+            )
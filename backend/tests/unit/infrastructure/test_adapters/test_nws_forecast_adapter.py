@@ -0,0 +1,82 @@
+"""
+Tests for NWS Forecast Adapter (Unit)
+
+Tests: Cache do mapeamento ponto → grid (mocked responses)
+"""
+
+import pytest
+
+
+class _MemoryGridCache:
+    """NWSGridCache em memória (mesma interface assíncrona)."""
+
+    def __init__(self):
+        from backend.infrastructure.cache.nws_grid_cache import NWSGridCache
+
+        self.quantize = NWSGridCache.quantize
+        self.grids = {}
+
+    async def get_grid(self, lat, lon):
+        return self.grids.get(self.quantize(lat, lon))
+
+    async def set_grid(self, lat, lon, metadata):
+        self.grids[self.quantize(lat, lon)] = metadata
+
+
+@pytest.mark.unit
+class TestNWSGridMetadataCache:
+    """Testa cache de /points no NWSForecastClient."""
+
+    async def test_points_called_once_per_quantized_location(self, mocker):
+        """Segunda consulta no mesmo ponto quantizado não chama /points."""
+        from backend.api.services.nws_forecast.nws_forecast_client import (
+            NWSForecastClient,
+        )
+
+        response = mocker.Mock()
+        response.raise_for_status.return_value = None
+        response.json.return_value = {
+            "properties": {
+                "gridId": "BOU",
+                "gridX": 62,
+                "gridY": 60,
+                "forecast": "https://api.weather.gov/gridpoints/BOU/62,60/"
+                "forecast",
+                "forecastHourly": "https://api.weather.gov/gridpoints/"
+                "BOU/62,60/forecast/hourly",
+            }
+        }
+
+        client = NWSForecastClient(grid_cache=_MemoryGridCache())
+        get = mocker.patch.object(
+            client.client, "get", mocker.AsyncMock(return_value=response)
+        )
+
+        first = await client._get_grid_metadata(39.73921, -104.99031)
+        second = await client._get_grid_metadata(39.7412, -104.9879)
+        await client.close()
+
+        assert first == second
+        assert first["gridId"] == "BOU"
+        get.assert_awaited_once_with("/points/39.7400,-104.9900")
+
+
+@pytest.mark.unit
+class TestNWSGridCacheRedis:
+    """Testa o cliente Redis real do NWSGridCache."""
+
+    async def test_redis_client_built_from_settings(self):
+        """O cliente usa settings.redis (sem conectar até o 1º comando)."""
+        from backend.infrastructure.cache.nws_grid_cache import NWSGridCache
+        from config.settings.app_config import get_settings
+
+        redis_settings = get_settings().redis
+        cache = NWSGridCache()
+        client = cache._redis()
+
+        assert client is not None
+        assert cache._redis() is client  # Um cliente por event loop
+        kwargs = client.connection_pool.connection_kwargs
+        assert kwargs["host"] == redis_settings.HOST
+        assert kwargs["port"] == redis_settings.PORT
+        await client.aclose()
@@ -0,0 +1,110 @@
+"""
+Tests for NWS Stations Adapter (Unit)
+
+Tests: Observações colunares e busca multi-estação (mocked responses)
+"""
+
+import pytest
+
+
+def _observation(timestamp, temp, wind=None):
+    return {
+        "properties": {
+            "timestamp": timestamp,
+            "temperature": {"unitCode": "wmoUnit:degC", "value": temp},
+            "windSpeed": {"unitCode": "wmoUnit:km_h-1", "value": wind},
+            "relativeHumidity": None,
+        }
+    }
+
+
+@pytest.mark.unit
+class TestNWSObservationColumns:
+    """Testa get_observation_columns e get_multi_station_observations."""
+
+    async def test_pages_are_merged_sorted_with_nan(self, mocker):
+        """Páginas seguidas por pagination.next viram colunas ordenadas."""
+        import numpy as np
+
+        from backend.api.services.nws_stations.nws_stations_client import (
+            NWSStationsClient,
+        )
+
+        first = mocker.Mock()
+        first.json.return_value = {
+            "features": [
+                _observation("2025-01-02T12:00:00+00:00", 5.0, 10.0),
+                _observation("2025-01-02T06:00:00-05:00", None),
+            ],
+            "pagination": {"next": "https://api.weather.gov/next"},
+        }
+        second = mocker.Mock()
+        second.json.return_value = {
+            "features": [_observation("2025-01-02T00:00:00Z", 1.0)]
+        }
+
+        client = NWSStationsClient()
+        get = mocker.patch.object(
+            client.client, "get", mocker.AsyncMock(side_effect=[first, second])
+        )
+        columns = await client.get_observation_columns("KDEN")
+        await client.close()
+
+        assert get.await_count == 2
+        assert get.await_args_list[1].args == ("https://api.weather.gov/next",)
+        np.testing.assert_array_equal(
+            columns["timestamp"],
+            np.array(
+                ["2025-01-02T00:00", "2025-01-02T11:00", "2025-01-02T12:00"],
+                dtype="datetime64[s]",
+            ),
+        )
+        np.testing.assert_array_equal(
+            columns["temp_celsius"], [1.0, np.nan, 5.0]
+        )
+        assert columns["wind_speed_2m_ms"][2] == pytest.approx(7.48)
+        assert np.isnan(columns["humidity_percent"]).all()
+
+    async def test_failed_station_is_skipped(self, mocker):
+        """Falha de uma estação não derruba as demais."""
+        import httpx
+        import numpy as np
+
+        from backend.api.services.nws_stations.nws_stations_client import (
+            NWSStation,
+            NWSStationsClient,
+        )
+
+        stations = [
+            NWSStation(
+                station_id=code, name=code, latitude=39.8, longitude=-105.0
+            )
+            for code in ("KDEN", "KBJC", "KAPA")
+        ]
+
+        async def observations(station_id, start_date, end_date):
+            if station_id == "KBJC":
+                raise httpx.ConnectError("boom")
+            return {"timestamp": np.array([], dtype="datetime64[s]")}
+
+        client = NWSStationsClient()
+        mocker.patch.object(
+            client,
+            "find_nearest_stations",
+            mocker.AsyncMock(return_value=stations),
+        )
+        mocker.patch.object(
+            client, "get_observation_columns", side_effect=observations
+        )
+        results = await client.get_multi_station_observations(
+            39.74, -104.99, n_stations=3, max_concurrency=2
+        )
+        await client.close()
+
+        assert [r["station"].station_id for r in results] == [
+            "KDEN",
+            "KAPA",
+        ]
+        assert results[0]["station"].distance_km == pytest.approx(
+            6.73, abs=0.01
+        )
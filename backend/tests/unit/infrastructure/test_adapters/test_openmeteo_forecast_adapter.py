@@ -0,0 +1,28 @@
+"""
+Tests for Open-Meteo Forecast Adapter (Unit)
+
+Tests: Ciclo de vida do cliente (sessão HTTP)
+"""
+
+import pytest
+
+
+@pytest.mark.unit
+class TestOpenMeteoForecastClientClose:
+    """Testa close() do OpenMeteoForecastClient."""
+
+    async def test_close_releases_session(self, tmp_path, monkeypatch):
+        """close() fecha a sessão requests_cache do cliente."""
+        from backend.api.services.openmeteo_forecast.openmeteo_forecast_client import (  # noqa: E501
+            OpenMeteoForecastClient,
+        )
+
+        client = OpenMeteoForecastClient(cache_dir=str(tmp_path / "cache"))
+        closed = []
+        monkeypatch.setattr(
+            client._session, "close", lambda: closed.append(True)
+        )
+
+        await client.close()
+
+        assert closed == [True]
@@ -0,0 +1,108 @@
+"""
+Tests for API Usage Tracker (Unit)
+
+Tests: Gravação em lote via pipeline, snapshot de quota e buffer
+mantido quando o Redis falha
+"""
+
+import pytest
+
+
+class _MemoryRedis:
+    """Redis em memória com os comandos de hash usados pelo recorder."""
+
+    def __init__(self):
+        self.hashes = {}
+        self.ttls = {}
+        self.executed = 0
+        self.down = False
+
+    def pipeline(self, transaction=True):
+        return _MemoryPipeline(self)
+
+
+class _MemoryPipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def hincrby(self, key, field, amount):
+        self.commands.append(("hincrby", key, field, amount))
+
+    def expire(self, key, ttl):
+        self.commands.append(("expire", key, ttl))
+
+    def hgetall(self, key):
+        self.commands.append(("hgetall", key))
+
+    def execute(self):
+        if self.redis.down:
+            raise ConnectionError("redis down")
+        self.redis.executed += 1
+        results = []
+        for name, key, *args in self.commands:
+            values = self.redis.hashes.setdefault(key, {})
+            if name == "hincrby":
+                field, amount = args
+                values[field] = str(int(values.get(field, 0)) + amount)
+                results.append(int(values[field]))
+            elif name == "expire":
+                self.redis.ttls[key] = args[0]
+                results.append(True)
+            else:
+                results.append(dict(values))
+        return results
+
+
+@pytest.mark.unit
+class TestUsageRecorder:
+    """Testa UsageRecorder com um Redis em memória."""
+
+    def test_flush_batches_rollups_and_updates_snapshot(self):
+        """Um pipeline por flush; minuto e dia em hashes por fonte."""
+        from backend.infrastructure.cache.api_usage_tracker import (
+            UsageRecorder,
+        )
+
+        redis = _MemoryRedis()
+        recorder = UsageRecorder(redis_factory=lambda: redis)
+        for _ in range(30):
+            recorder.record("nasa_power")
+        recorder.record("met_norway", 3)
+        assert recorder.pending("nasa_power") == 30
+
+        assert recorder.flush()
+
+        assert redis.executed == 1
+        assert recorder.pending("nasa_power") == 0
+        day = [key for key in redis.hashes if ":day:" in key]
+        minute = [key for key in redis.hashes if ":minute:" in key]
+        assert redis.hashes[day[0]] == {"nasa_power": "30", "met_norway": "3"}
+        assert redis.ttls[day[0]] == UsageRecorder.DAY_TTL
+        assert redis.ttls[minute[0]] == UsageRecorder.MINUTE_TTL
+
+        nasa = recorder.status()["nasa_power"]
+        assert nasa["requests_today"] == 30
+        assert nasa["remaining"] == 970
+        assert nasa["burn_rate_per_minute"] > 0
+        assert 0 < nasa["exhaustion_seconds"]
+        # Sem limite: ritmo sim, projeção não
+        assert recorder.status()["met_norway"]["exhaustion_seconds"] is None
+
+    def test_failed_flush_keeps_batch(self):
+        """Redis fora: nada se perde, o lote vai na próxima gravação."""
+        from backend.infrastructure.cache.api_usage_tracker import (
+            UsageRecorder,
+        )
+
+        redis = _MemoryRedis()
+        redis.down = True
+        recorder = UsageRecorder(redis_factory=lambda: redis)
+        recorder.record("openmeteo_archive", 5)
+
+        assert not recorder.flush()
+        assert recorder.pending("openmeteo_archive") == 5
+
+        redis.down = False
+        assert recorder.flush()
+        assert recorder.status()["openmeteo_archive"]["requests_today"] == 5
@@ -0,0 +1,54 @@
+"""
+Tests for async_bridge - event loop persistente dos sync adapters.
+"""
+
+import pytest
+
+
+@pytest.mark.unit
+class TestAsyncBridge:
+    """Testa run_sync e o loop compartilhado."""
+
+    def test_run_sync_returns_result_and_reuses_loop(self):
+        """Chamadas sucessivas rodam no mesmo loop."""
+        import asyncio
+
+        from backend.api.services.async_bridge import run_sync
+
+        async def current_loop():
+            await asyncio.sleep(0)
+            return asyncio.get_running_loop()
+
+        first = run_sync(current_loop())
+        second = run_sync(current_loop())
+
+        assert first is second
+        assert first.is_running()
+
+    def test_run_sync_propagates_exceptions(self):
+        """Exceções da coroutine chegam ao chamador."""
+        from backend.api.services.async_bridge import run_sync
+
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            run_sync(fail())
+
+    def test_run_sync_inside_running_loop(self):
+        """Funciona mesmo com loop rodando na thread chamadora."""
+        import asyncio
+
+        from backend.api.services.async_bridge import run_sync
+
+        async def double(x):
+            return x * 2
+
+        async def caller():
+            return run_sync(double(21))
+
+        loop = asyncio.new_event_loop()
+        try:
+            assert loop.run_until_complete(caller()) == 42
+        finally:
+            loop.close()
@@ -0,0 +1,149 @@
+"""
+Tests for Circuit Breaker (Unit)
+
+Tests: Transport com breaker, hedged GETs e troca de fonte no manager
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+
+class _MemoryBreaker:
+    """CircuitBreaker em memória (mesma interface usada pelo transport)."""
+
+    source = "met_norway"
+
+    def __init__(self, p95=None, open_=False):
+        self.p95 = p95
+        self.open = open_
+        self.records = []
+
+    async def before_call(self):
+        from backend.infrastructure.circuit_breaker import CircuitOpenError
+
+        if self.open:
+            raise CircuitOpenError(self.source, 30)
+        return False
+
+    async def record(self, success, elapsed, probe=False):
+        self.records.append(success)
+
+    async def latency_p95(self):
+        return self.p95
+
+
+@pytest.mark.unit
+class TestCircuitBreakerTransport:
+    """Testa CircuitBreakerTransport com httpx.MockTransport."""
+
+    async def test_server_errors_count_as_failures(self):
+        """5xx/429 são falhas da fonte; 404 é resposta válida."""
+        import httpx
+
+        from backend.infrastructure.circuit_breaker import (
+            CircuitBreakerTransport,
+            CircuitOpenError,
+        )
+
+        statuses = iter([503, 429, 404, 200])
+
+        def handler(request):
+            return httpx.Response(next(statuses))
+
+        breaker = _MemoryBreaker()
+        transport = CircuitBreakerTransport(
+            breaker, httpx.MockTransport(handler)
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            for _ in range(4):
+                await client.get("https://api.met.no/complete")
+
+            breaker.open = True
+            with pytest.raises(CircuitOpenError):
+                await client.get("https://api.met.no/complete")
+
+        assert breaker.records == [False, False, True, True]
+        assert not issubclass(CircuitOpenError, httpx.HTTPError)
+
+    async def test_slow_get_is_hedged(self):
+        """GET acima do p95 ganha cópia e a resposta mais rápida vence."""
+        import asyncio
+
+        import httpx
+
+        from backend.infrastructure.circuit_breaker import (
+            CircuitBreakerTransport,
+        )
+
+        calls = []
+
+        async def handler(request):
+            calls.append(request.url)
+            if len(calls) == 1:
+                await asyncio.sleep(5)
+                return httpx.Response(200, json={"from": "primary"})
+            return httpx.Response(200, json={"from": "hedge"})
+
+        transport = CircuitBreakerTransport(
+            _MemoryBreaker(p95=0.05), httpx.MockTransport(handler), hedge=True
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            response = await asyncio.wait_for(
+                client.get("https://api.met.no/complete"), timeout=2
+            )
+
+        assert len(calls) == 2
+        assert response.json() == {"from": "hedge"}
+
+
+@pytest.mark.unit
+class TestSourceRouting:
+    """Testa ClimateSourceManager com circuit breakers abertos."""
+
+    def test_open_preferred_source_is_replaced(self, mocker):
+        """Fonte preferida com circuito aberto vira a próxima disponível."""
+        from backend.api.services.climate_source_manager import (
+            ClimateSourceManager,
+        )
+
+        def breaker(source):
+            return mocker.Mock(
+                is_open=mocker.Mock(return_value=source == "met_norway")
+            )
+
+        mocker.patch(
+            "backend.api.services.climate_factory.get_circuit_breaker",
+            side_effect=breaker,
+        )
+        today = date.today()
+
+        result = ClimateSourceManager().get_sources_for_data_download(
+            lat=-22.7,
+            lon=-47.6,
+            start_date=today,
+            end_date=today + timedelta(days=5),
+            mode="dashboard_forecast",
+            preferred_sources=["met_norway"],
+        )
+
+        assert result["circuit_open"] == ["met_norway"]
+        assert result["sources"] == ["openmeteo_forecast"]
+        assert any("met_norway" in w for w in result["warnings"])
+
+    def test_is_open_caches_state_locally(self, mocker):
+        """is_open lê o Redis síncrono no máximo uma vez por janela."""
+        from backend.infrastructure.circuit_breaker import CircuitBreaker
+
+        client = mocker.Mock(pttl=mocker.Mock(return_value=-2))
+        mocker.patch("redis.Redis.from_url", return_value=client)
+        clock = mocker.patch("time.monotonic", return_value=100.0)
+        breaker = CircuitBreaker("met_norway")
+
+        assert not any(breaker.is_open() for _ in range(5))
+        assert client.pttl.call_count == 1
+
+        clock.return_value += CircuitBreaker.STATE_CACHE_SECONDS
+        client.pttl.return_value = 30_000
+        assert breaker.is_open() and breaker.is_open()
+        assert client.pttl.call_count == 2
@@ -0,0 +1,55 @@
+"""
+Tests for ClimateCacheService (Unit)
+
+Tests: TTL de forecast e stale-while-revalidate (Redis mockado)
+"""
+
+import pickle
+from datetime import datetime, timedelta
+
+import pytest
+
+
+@pytest.mark.unit
+class TestStaleWhileRevalidate:
+    """Testa janela de graça por fonte no ClimateCacheService."""
+
+    def test_period_ending_in_future_is_forecast(self):
+        """Período de hoje a hoje+5d usa TTL de forecast."""
+        from backend.infrastructure.cache.climate_cache import (
+            ClimateCacheService,
+        )
+
+        cache = ClimateCacheService(prefix="test")
+        today = datetime.now().replace(hour=0, minute=0, second=0)
+
+        ttl = cache._get_ttl(today, today + timedelta(days=5))
+
+        assert ttl == ClimateCacheService.TTL_FORECAST
+        assert cache._get_ttl(today, today) == cache.TTL_VERY_RECENT
+
+    async def test_expired_forecast_is_served_as_stale(self, mocker):
+        """Sem o marcador :fresh, fonte com graça retorna dado stale."""
+        from backend.infrastructure.cache.climate_cache import (
+            ClimateCacheService,
+        )
+
+        cache = ClimateCacheService(prefix="test")
+        cache.redis = mocker.Mock()
+        cache.redis.mget = mocker.AsyncMock(
+            return_value=[pickle.dumps({"et0": [4.1]}), None]
+        )
+        args = (-22.7, -47.6, datetime.now(), datetime.now())
+
+        data, is_stale = await cache.get_with_freshness(
+            "openmeteo_forecast", *args
+        )
+        assert data == {"et0": [4.1]}
+        assert is_stale is True
+
+        # get() não devolve dado stale
+        assert await cache.get("openmeteo_forecast", *args) is None
+
+        # Fonte sem graça: dado presente nunca é stale
+        _, is_stale = await cache.get_with_freshness("nasa_power", *args)
+        assert is_stale is False
@@ -0,0 +1,125 @@
+"""
+Tests for HTTP response cache (Unit)
+
+Tests: Validade, requisições condicionais e 304 (transport mockado)
+"""
+
+import pytest
+
+
+class _MemoryHTTPCache:
+    """HTTPResponseCache em memória (mesma interface de load/store)."""
+
+    def __init__(self):
+        from backend.infrastructure.cache.http_cache import HTTPResponseCache
+
+        self.entries = {}
+        self.make_key = HTTPResponseCache.make_key.__get__(self)
+        self.prefix = "http"
+
+    async def load(self, key):
+        return self.entries.get(key)
+
+    async def store(self, key, headers, fresh_until, body=None):
+        entry = self.entries.setdefault(key, {})
+        entry.update(headers=headers, fresh_until=fresh_until)
+        if body is not None:
+            entry["body"] = body
+
+
+@pytest.mark.unit
+class TestCachingTransport:
+    """Testa CachingTransport com httpx.MockTransport."""
+
+    async def test_expired_entry_is_revalidated_with_etag(self):
+        """Entrada expirada vai com If-None-Match e 304 usa o corpo salvo."""
+        import httpx
+
+        from backend.infrastructure.cache.http_cache import CachingTransport
+
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get("if-none-match"))
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304, headers={"ETag": '"v1"'})
+            return httpx.Response(
+                200,
+                headers={"ETag": '"v1"', "Cache-Control": "max-age=0"},
+                json={"forecast": [1, 2, 3]},
+            )
+
+        transport = CachingTransport(
+            _MemoryHTTPCache(), httpx.MockTransport(handler)
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            first = await client.get("https://api.weather.gov/f?x=1")
+            second = await client.get("https://api.weather.gov/f?x=1")
+
+        assert seen == [None, '"v1"']
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "REVALIDATED"
+        assert second.json() == {"forecast": [1, 2, 3]}
+
+    async def test_fresh_entry_skips_network(self):
+        """Entrada com max-age válido é servida sem requisição."""
+        import httpx
+
+        from backend.infrastructure.cache.http_cache import CachingTransport
+
+        calls = []
+
+        def handler(request):
+            calls.append(request.url)
+            return httpx.Response(
+                200,
+                headers={"Cache-Control": "public, max-age=600"},
+                content=b"{}",
+            )
+
+        transport = CachingTransport(
+            _MemoryHTTPCache(), httpx.MockTransport(handler)
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.get("https://api.met.no/complete?lat=60")
+            hit = await client.get("https://api.met.no/complete?lat=60")
+            await client.get("https://api.met.no/complete?lat=61")
+
+        assert len(calls) == 2
+        assert hit.headers["X-Cache"] == "HIT"
+
+    def test_response_expires_prefers_max_age(self):
+        """max-age (menos Age) tem precedência sobre Expires."""
+        from datetime import datetime, timezone
+
+        from backend.api.services.weather_utils import CacheUtils
+
+        expires = CacheUtils.response_expires(
+            {
+                "cache-control": "max-age=120",
+                "age": "20",
+                "expires": "Tue, 16 Jun 2020 12:13:49 GMT",
+            }
+        )
+        remaining = (expires - datetime.now(timezone.utc)).total_seconds()
+        assert 95 < remaining <= 100
+
+
+@pytest.mark.unit
+class TestHTTPResponseCacheRedis:
+    """Testa o cliente Redis real do HTTPResponseCache."""
+
+    async def test_redis_client_built_from_settings(self):
+        """O cliente usa settings.redis e guarda corpos em bytes."""
+        from backend.infrastructure.cache.http_cache import HTTPResponseCache
+        from config.settings.app_config import get_settings
+
+        redis_settings = get_settings().redis
+        client = HTTPResponseCache()._redis()
+
+        assert client is not None
+        kwargs = client.connection_pool.connection_kwargs
+        assert kwargs["host"] == redis_settings.HOST
+        assert kwargs["port"] == redis_settings.PORT
+        assert kwargs["decode_responses"] is False
+        await client.aclose()
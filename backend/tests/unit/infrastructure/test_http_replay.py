@@ -0,0 +1,104 @@
+"""
+Tests for HTTP record/replay (Unit)
+
+Tests: Gravação, replay exato e por path, perfis de latência e erro
+"""
+
+import pytest
+
+
+@pytest.mark.unit
+class TestRecordReplayTransport:
+    """Testa RecordReplayTransport com httpx.MockTransport."""
+
+    async def test_record_then_replay_offline(self, tmp_path):
+        """Resposta gravada volta no replay, sem transport de rede."""
+        import httpx
+
+        from backend.infrastructure.http_replay import (
+            FixtureStore,
+            RecordReplayTransport,
+        )
+
+        def api(request):
+            return httpx.Response(
+                200,
+                json={"lat": request.url.params["lat"]},
+                headers={"etag": '"v1"'},
+            )
+
+        recorder = httpx.AsyncClient(
+            transport=RecordReplayTransport(
+                "met_norway",
+                FixtureStore(tmp_path),
+                mode="record",
+                transport=httpx.MockTransport(api),
+            )
+        )
+        url = "https://api.met.no/weatherapi/complete"
+        await recorder.get(url, params={"lat": 60.1, "lon": 10.7})
+        await recorder.aclose()
+
+        replay = httpx.AsyncClient(
+            transport=RecordReplayTransport(
+                "met_norway", FixtureStore(tmp_path), mode="replay"
+            )
+        )
+        exact = await replay.get(url, params={"lon": 10.7, "lat": 60.1})
+        other = await replay.get(url, params={"lat": -7.5, "lon": -46.0})
+
+        assert exact.json() == {"lat": "60.1"}
+        assert exact.headers["etag"] == '"v1"'
+        assert exact.headers["x-replay"] == "hit"
+        assert other.json() == {"lat": "60.1"}
+        assert other.headers["x-replay"] == "fallback"
+        with pytest.raises(httpx.TransportError):
+            await replay.get("https://api.met.no/other")
+
+    async def test_profile_is_deterministic(self, tmp_path):
+        """Mesma seed, mesmos erros; latência acima do timeout vira timeout."""
+        import httpx
+
+        from backend.infrastructure.http_replay import (
+            FixtureStore,
+            LatencyProfile,
+            RecordReplayTransport,
+            Recording,
+            ReplayProfile,
+        )
+
+        store = FixtureStore(tmp_path)
+        url = "https://power.larc.nasa.gov/api/temporal/daily/point"
+        store.save(
+            "nasa_power",
+            Recording("GET", url, 200, {}, b"{}", elapsed_ms=1.0),
+        )
+
+        async def statuses(seed):
+            profile = ReplayProfile(
+                seed=seed,
+                sources={"nasa_power": LatencyProfile(error_rate=0.5)},
+            )
+            client = httpx.AsyncClient(
+                transport=RecordReplayTransport(
+                    "nasa_power", store, profile=profile
+                )
+            )
+            result = [(await client.get(url)).status_code for _ in range(20)]
+            await client.aclose()
+            return result
+
+        first = await statuses(seed=7)
+        assert first == await statuses(seed=7)
+        assert set(first) == {200, 503}
+
+        slow = ReplayProfile(
+            sources={"nasa_power": LatencyProfile(latency_p50_ms=500)}
+        )
+        client = httpx.AsyncClient(
+            transport=RecordReplayTransport("nasa_power", store, profile=slow),
+            timeout=httpx.Timeout(0.01),
+        )
+        with pytest.raises(httpx.ReadTimeout):
+            await client.get(url)
+        await client.aclose()
@@ -0,0 +1,61 @@
+"""
+Tests for logging configuration (Unit)
+
+Tests: Amostragem e limite de taxa por módulo (LogSampler)
+"""
+
+import pytest
+
+
+@pytest.mark.unit
+class TestLogSampler:
+    """Testa LogSampler isolado e como patcher do loguru."""
+
+    def test_sampling_and_rate_limit(self):
+        """Amostragem por prefixo, limite por segundo, WARNING passa."""
+        from config.logging_config import LogSampler, parse_log_rules
+
+        sampler = LogSampler(
+            sampling=parse_log_rules("backend.core=0.25"),
+            rate_limits=parse_log_rules("backend.api=3", int),
+        )
+        kalman = "backend.core.data_processing.kalman_ensemble"
+
+        kept = [sampler.keep(kalman, 10, 0.0) for _ in range(100)]
+        assert sum(kept) == 25
+        assert sampler.keep(kalman, 30, 0.0)  # WARNING
+
+        api = "backend.api.services.data_download"
+        first = [sampler.keep(api, 20, 100.2) for _ in range(5)]
+        assert first == [True, True, True, False, False]
+        assert sampler.keep(api, 20, 101.0)  # nova janela
+        assert sampler.keep("backend.apix", 20, 100.5)  # outro módulo
+        assert sampler.dropped == {"backend.core": 75, "backend.api": 2}
+
+        with pytest.raises(ValueError):
+            parse_log_rules("backend.core")
+
+    def test_sinks_skip_unsampled_records(self):
+        """Registros descartados pelo patcher não chegam ao sink."""
+        from loguru import logger
+
+        from config.logging_config import LogSampler, _sampled
+
+        messages = []
+        logger.configure(
+            patcher=LogSampler(sampling={__name__: 0.5}, max_level="INFO")
+        )
+        handler = logger.add(messages.append, level="DEBUG", filter=_sampled)
+        try:
+            for i in range(4):
+                logger.info("linha {}", i)
+            logger.warning("aviso")
+        finally:
+            logger.remove(handler)
+            logger.configure(patcher=None)
+
+        assert [m.record["message"] for m in messages] == [
+            "linha 0",
+            "linha 2",
+            "aviso",
+        ]
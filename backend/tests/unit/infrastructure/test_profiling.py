@@ -0,0 +1,67 @@
+"""
+Tests for on-demand profiling (Unit)
+
+Tests: Artefatos gravados, ponte async, ids inválidos e poda do store
+"""
+
+import pytest
+
+
+@pytest.mark.unit
+class TestProfileExecution:
+    """Testa profile_execution com um ProfileStore temporário."""
+
+    def test_profile_is_saved_with_artifacts(self, tmp_path):
+        """CPU (thread e ponte) e memória vão para o store."""
+        from backend.api.services.async_bridge import run_sync
+        from backend.infrastructure.profiling import (
+            ProfileStore,
+            profile_execution,
+        )
+
+        async def work():
+            return sum(i * i for i in range(10_000))
+
+        store = ProfileStore(tmp_path)
+        with profile_execution(
+            "celery test", kind="celery", bridge=True, store=store
+        ) as run:
+            data = [bytearray(1024) for _ in range(100)]
+            run_sync(work())
+
+        meta = store.get_meta(run.profile_id)
+        assert meta["label"] == "celery test"
+        assert meta["peak_memory_bytes"] >= len(data) * 1024
+        assert "memory.txt" in meta["artifacts"]
+        profiles = [
+            store.artifact_path(run.profile_id, name).read_text("utf-8")
+            for name in meta["artifacts"]
+            if name.endswith("profile.txt")
+        ]
+        # A corrotina roda na thread da ponte e aparece no profile
+        assert any("work" in text for text in profiles)
+        assert store.recent()[0]["profile_id"] == run.profile_id
+
+    def test_store_rejects_unknown_paths_and_prunes(self, tmp_path):
+        """Ids/artefatos fora do padrão não resolvem; excesso é podado."""
+        from backend.infrastructure.profiling import (
+            ProfileRun,
+            ProfileStore,
+        )
+
+        store = ProfileStore(tmp_path, max_profiles=2)
+        for second in range(3):
+            store.save(
+                ProfileRun(
+                    profile_id=f"20250101T12000{second}-0000000{second}",
+                    label="x",
+                    kind="http",
+                    artifacts={"memory.txt": b"-"},
+                )
+            )
+
+        ids = [meta["profile_id"] for meta in store.recent()]
+        assert ids == ["20250101T120002-00000002", "20250101T120001-00000001"]
+        assert store.artifact_path(ids[0], "memory.txt").exists()
+        assert store.artifact_path(ids[0], "meta.json") is None
+        assert store.artifact_path("../../etc", "passwd") is None
@@ -0,0 +1,137 @@
+"""
+Tests for Tracing (Unit)
+
+Tests: Hierarquia de spans, propagação traceparent e exportação OTLP/JSON
+"""
+
+import pytest
+
+
+class _MemoryExporter:
+    """Exporter em memória (mesma interface dos exporters do módulo)."""
+
+    def __init__(self):
+        self.spans = []
+
+    def export(self, payload):
+        for resource in payload["resourceSpans"]:
+            for scope in resource["scopeSpans"]:
+                self.spans.extend(scope["spans"])
+
+    def shutdown(self):
+        pass
+
+
+@pytest.fixture
+def exporter():
+    from backend.infrastructure import tracing
+
+    memory = _MemoryExporter()
+    tracing.configure(memory)
+    yield memory
+    tracing.configure(None)
+
+
+@pytest.mark.unit
+class TestTracing:
+    """Testa spans, contexto e exportação."""
+
+    async def test_nested_spans_share_trace(self, exporter):
+        """Spans aninhados (sync e async) formam uma árvore exportada."""
+        import asyncio
+
+        from backend.infrastructure import tracing
+
+        @tracing.traced("eto.fusion")
+        async def fuse():
+            await asyncio.sleep(0)
+            with tracing.span("eto.anomaly_lookup"):
+                pass
+
+        with tracing.span("eto.process_location") as root:
+            with tracing.span("eto.download", source="nasa_power"):
+                pass
+            await asyncio.create_task(fuse())
+
+        assert tracing.current_span() is None
+        assert tracing.force_flush()
+
+        by_name = {s["name"]: s for s in exporter.spans}
+        assert set(by_name) == {
+            "eto.process_location",
+            "eto.download",
+            "eto.fusion",
+            "eto.anomaly_lookup",
+        }
+        assert {s["traceId"] for s in exporter.spans} == {
+            root.context.trace_id
+        }
+        assert "parentSpanId" not in by_name["eto.process_location"]
+        assert (
+            by_name["eto.anomaly_lookup"]["parentSpanId"]
+            == by_name["eto.fusion"]["spanId"]
+        )
+        assert {"key": "source", "value": {"stringValue": "nasa_power"}} in (
+            by_name["eto.download"]["attributes"]
+        )
+
+    def test_traceparent_roundtrip_and_errors(self, exporter):
+        """inject/extract continuam o trace; exceções marcam erro."""
+        from backend.api.middleware.prometheus_metrics import (
+            PIPELINE_STAGE_DURATION,
+        )
+        from backend.infrastructure import tracing
+
+        with tracing.span("celery.publish", metric=False) as parent:
+            headers = tracing.inject({})
+
+        remote = tracing.extract(headers)
+        assert remote == parent.context
+        assert tracing.extract({"traceparent": "00-zz-1-01"}) is None
+
+        with pytest.raises(ValueError):
+            with tracing.span("eto.et0", parent=remote):
+                raise ValueError("sem dados")
+
+        tracing.force_flush()
+        failed = next(s for s in exporter.spans if s["name"] == "eto.et0")
+        assert failed["parentSpanId"] == parent.context.span_id
+        assert failed["status"] == {"code": 2, "message": "sem dados"}
+
+        observed = PIPELINE_STAGE_DURATION.labels(
+            stage="eto.et0", source="", status="error"
+        )._sum.get()
+        assert observed > 0
+
+    async def test_middleware_names_span_by_route(self, exporter):
+        """TracingMiddleware usa o template da rota e o traceparent."""
+        import httpx
+        from fastapi import FastAPI
+
+        from backend.api.middleware.tracing import TracingMiddleware
+
+        app = FastAPI()
+        app.add_middleware(TracingMiddleware)
+
+        @app.get("/eto/{task_id}")
+        async def status(task_id: str):
+            return {"task_id": task_id}
+
+        trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            response = await client.get(
+                "/eto/abc",
+                headers={"traceparent": f"00-{trace_id}-00f067aa0ba902b7-01"},
+            )
+
+        from backend.infrastructure import tracing
+
+        tracing.force_flush()
+        assert response.headers["x-trace-id"] == trace_id
+        (server,) = exporter.spans
+        assert server["name"] == "GET /eto/{task_id}"
+        assert server["traceId"] == trace_id
+        assert server["parentSpanId"] == "00f067aa0ba902b7"
@@ -0,0 +1,93 @@
+"""
+Tests for Worker Memory (Unit)
+
+Tests: Política de reciclagem (pico vs. crescimento sustentado) e
+medição de task com DataFrames por etapa
+"""
+
+import pytest
+
+MB = 1024 * 1024
+
+
+@pytest.mark.unit
+class TestRecyclePolicy:
+    """Testa RecyclePolicy com RSS sintéticos."""
+
+    def test_spike_does_not_recycle_but_sustained_growth_does(self):
+        """Só recicla quando toda a janela fica acima do limite."""
+        from backend.infrastructure.worker_memory import RecyclePolicy
+
+        policy = RecyclePolicy(
+            max_rss=2000 * MB, growth_limit=100 * MB, window=3
+        )
+        assert policy.observe(300 * MB) is None  # baseline
+        assert policy.observe(900 * MB) is None  # pico isolado
+        assert policy.observe(310 * MB) is None
+        assert policy.observe(450 * MB) is None
+        assert policy.observe(460 * MB) is None
+        assert policy.observe(470 * MB) == "growth"
+        assert policy.baseline == 300 * MB
+
+    def test_max_rss_recycles_immediately(self):
+        """RSS acima do teto recicla já na task que o ultrapassou."""
+        from backend.infrastructure.worker_memory import RecyclePolicy
+
+        policy = RecyclePolicy(max_rss=500 * MB, growth_limit=MB, window=50)
+        assert policy.observe(501 * MB) == "max_rss"
+
+
+@pytest.mark.unit
+class TestTrackTask:
+    """Testa track_task/record_frame com a política instalada."""
+
+    def test_task_records_rss_frames_and_signals_billiard(self, monkeypatch):
+        """Frames por etapa entram na task; reciclagem chega ao billiard."""
+        import pandas as pd
+
+        from backend.infrastructure import worker_memory
+
+        policy = worker_memory.RecyclePolicy(
+            max_rss=0, growth_limit=MB, window=1
+        )
+        monkeypatch.setattr(worker_memory, "_policy", policy)
+
+        frame = pd.DataFrame({"T2M": range(1000)})
+        with worker_memory.track_task("eto_test") as memory:
+            worker_memory.record_frame("eto.preprocessing", frame)
+            worker_memory.record_frame("eto.download", None)
+
+        assert memory.rss_before > 0 and memory.rss_after > 0
+        assert memory.frames == {
+            "eto.preprocessing": int(frame.memory_usage(deep=True).sum())
+        }
+        # max_rss=0: a primeira task já pede reciclagem
+        assert policy.reason == "max_rss"
+        assert worker_memory._billiard_mem_rss() > 10**12
+
+    def test_nested_task_reuses_outer_memory(self, monkeypatch):
+        """Task chamada dentro de outra não zera frames nem conta 2x."""
+        import pandas as pd
+
+        from backend.infrastructure import worker_memory
+
+        policy = worker_memory.RecyclePolicy(
+            max_rss=10**15, growth_limit=10**15, window=5
+        )
+        monkeypatch.setattr(worker_memory, "_policy", policy)
+
+        frame = pd.DataFrame({"T2M": range(1000)})
+        with worker_memory.track_task("calculate_eto") as outer:
+            worker_memory.record_frame("eto.download", frame)
+            with worker_memory.track_task("preprocessing") as inner:
+                worker_memory.record_frame("eto.preprocessing", frame)
+            worker_memory.record_frame("eto.et0", frame)
+
+        assert inner is outer
+        assert set(outer.frames) == {
+            "eto.download",
+            "eto.preprocessing",
+            "eto.et0",
+        }
+        assert policy.tasks == 1
+        assert worker_memory._current is None
@@ -3,15 +3,160 @@
 LOGGING CONFIGURATION - EVAonline
 ===========================================
 Configuração centralizada de logging usando Loguru.
+
+Todos os sinks usam enqueue=True: a formatação e a escrita em disco
+rodam numa thread do loguru, não no caminho da requisição. O
+LogSampler descarta DEBUG/INFO de módulos ruidosos (amostragem e limite
+por segundo) antes de qualquer sink.
+
+Em loops quentes, prefira argumentos posicionais ou lazy=True, que só
+formatam a mensagem se algum sink aceitar o nível:
+
+    logger.debug("Filtro {} criado (std={:.2f})", variable, std)
+    logger.opt(lazy=True).debug("Pesos: {}", lambda: weights.tolist())
 """
 
+import math
 import sys
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 from loguru import logger
 
 
+class LogSampler:
+    """
+    Amostragem e limite de taxa de logs por módulo.
+
+    Roda como patcher do loguru (uma vez por registro, antes dos sinks)
+    e marca ``record["extra"]["sampled"]``; os sinks descartam registros
+    marcados como False. As regras casam pelo prefixo mais longo do nome
+    do módulo ("backend.core" vale para "backend.core.eto_calculation").
+    WARNING ou acima nunca é descartado.
+
+    Example:
+        sampler = LogSampler(
+            sampling={"backend.core.data_processing": 0.1},
+            rate_limits={"backend.api.services": 50},
+        )
+    """
+
+    def __init__(
+        self,
+        sampling: Optional[Mapping[str, float]] = None,
+        rate_limits: Optional[Mapping[str, int]] = None,
+        max_level: str = "INFO",
+    ) -> None:
+        """
+        Args:
+            sampling: {prefixo do módulo: fração mantida (0-1)}
+            rate_limits: {prefixo do módulo: registros por segundo}
+            max_level: Nível mais alto sujeito a descarte
+        """
+        self.sampling = dict(sampling or {})
+        self.rate_limits = dict(rate_limits or {})
+        self.max_level_no = logger.level(max_level).no
+        self.dropped: Dict[str, int] = {}
+        self._rules: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        self._counters: Dict[str, int] = {}
+        self._windows: Dict[str, Tuple[int, int]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def active(self) -> bool:
+        """Se há alguma regra configurada."""
+        return bool(self.sampling or self.rate_limits)
+
+    @staticmethod
+    def _prefix(rules: Mapping[str, Any], name: str) -> Optional[str]:
+        """Prefixo mais longo de ``rules`` que casa com ``name``."""
+        matches = [
+            prefix
+            for prefix in rules
+            if name == prefix or name.startswith(prefix + ".")
+        ]
+        return max(matches, key=len) if matches else None
+
+    def keep(self, name: str, level_no: int, timestamp: float) -> bool:
+        """Decide se um registro do módulo ``name`` é mantido."""
+        if level_no > self.max_level_no:
+            return True
+
+        rules = self._rules.get(name)
+        if rules is None:
+            rules = (
+                self._prefix(self.sampling, name),
+                self._prefix(self.rate_limits, name),
+            )
+            self._rules[name] = rules
+        sample_prefix, limit_prefix = rules
+
+        with self._lock:
+            if sample_prefix is not None:
+                # Determinístico: mantém o 1º de cada 1/fração registros
+                ratio = self.sampling[sample_prefix]
+                n = self._counters.get(sample_prefix, 0)
+                self._counters[sample_prefix] = n + 1
+                if math.ceil((n + 1) * ratio) == math.ceil(n * ratio):
+                    self._drop(sample_prefix)
+                    return False
+
+            if limit_prefix is not None:
+                second = int(timestamp)
+                window, count = self._windows.get(limit_prefix, (second, 0))
+                if window != second:
+                    window, count = second, 0
+                if count >= self.rate_limits[limit_prefix]:
+                    self._drop(limit_prefix)
+                    return False
+                self._windows[limit_prefix] = (window, count + 1)
+
+        return True
+
+    def _drop(self, prefix: str) -> None:
+        self.dropped[prefix] = self.dropped.get(prefix, 0) + 1
+
+    def __call__(self, record: Dict[str, Any]) -> None:
+        """Patcher do loguru."""
+        record["extra"]["sampled"] = self.keep(
+            record["name"] or "",
+            record["level"].no,
+            record["time"].timestamp(),
+        )
+
+
+def parse_log_rules(value: str, cast: Any = float) -> Dict[str, Any]:
+    """
+    Converte "modulo=valor,modulo=valor" num dict.
+
+    Args:
+        value: Regras separadas por vírgula (ex.: LOG_SAMPLING)
+        cast: Tipo do valor (float para amostragem, int para limite)
+
+    Returns:
+        {módulo: valor}
+
+    Raises:
+        ValueError: Regra sem "=" ou valor inválido
+    """
+    rules: Dict[str, Any] = {}
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        module, sep, raw = item.partition("=")
+        if not sep or not module.strip():
+            raise ValueError(f"Regra de log inválida: {item!r}")
+        rules[module.strip()] = cast(raw.strip())
+    return rules
+
+
+def _sampled(record: Dict[str, Any]) -> bool:
+    """Filtro dos sinks: descarta o que o LogSampler marcou."""
+    return record["extra"].get("sampled", True)
+
+
 class LoggingConfig:
     """Configuração centralizada de logging para a aplicação."""
 
@@ -23,6 +168,9 @@ class LoggingConfig:
         retention: str = "30 days",
         compression: str = "zip",
         json_logs: bool = False,
+        enqueue: bool = True,
+        sampling: Optional[Mapping[str, float]] = None,
+        rate_limits: Optional[Mapping[str, int]] = None,
     ) -> None:
         """
         Inicializa a configuração de logging.
@@ -34,6 +182,10 @@ class LoggingConfig:
             retention: Quanto tempo manter logs antigos
             compression: Formato de compressão para logs antigos
             json_logs: Se True, gera logs em formato JSON
+            enqueue: Formatar e escrever numa thread do loguru (inclusive
+                o console), fora do caminho da requisição
+            sampling: {módulo: fração mantida} para DEBUG/INFO
+            rate_limits: {módulo: registros/s} para DEBUG/INFO
         """
         self.log_level = log_level
         self.log_dir = Path(log_dir)
@@ -41,6 +193,8 @@ class LoggingConfig:
         self.retention = retention
         self.compression = compression
         self.json_logs = json_logs
+        self.enqueue = enqueue
+        self.sampler = LogSampler(sampling, rate_limits)
 
         # Criar diretório de logs se não existir
         self.log_dir.mkdir(parents=True, exist_ok=True)
@@ -49,6 +203,9 @@ class LoggingConfig:
         """Configura o logger com as definições especificadas."""
         # Remover handlers padrão
         logger.remove()
+        logger.configure(
+            patcher=self.sampler if self.sampler.active else None
+        )
 
         # Configurar formato de log
         if self.json_logs:
@@ -64,6 +221,8 @@ class LoggingConfig:
             colorize=not self.json_logs,
             backtrace=True,
             diagnose=True,
+            filter=_sampled,
+            enqueue=self.enqueue,
         )
 
         # Handler para arquivo geral
@@ -76,7 +235,8 @@ class LoggingConfig:
             compression=self.compression,
             backtrace=True,
             diagnose=True,
-            enqueue=True,  # Thread-safe
+            filter=_sampled,
+            enqueue=self.enqueue,  # Thread-safe
         )
 
         # Handler para erros (separado)
@@ -89,7 +249,7 @@ class LoggingConfig:
             compression=self.compression,
             backtrace=True,
             diagnose=True,
-            enqueue=True,
+            enqueue=self.enqueue,
         )
 
         # Handler para API requests (opcional)
@@ -100,8 +260,10 @@ class LoggingConfig:
             rotation=self.rotation,
             retention=self.retention,
             compression=self.compression,
-            filter=lambda record: "api" in record["extra"],
-            enqueue=True,
+            filter=lambda record: (
+                "api" in record["extra"] and _sampled(record)
+            ),
+            enqueue=self.enqueue,
         )
 
         # Handler para Celery tasks (opcional)
@@ -112,8 +274,27 @@ class LoggingConfig:
             rotation=self.rotation,
             retention=self.retention,
             compression=self.compression,
-            filter=lambda record: "celery" in record["extra"],
-            enqueue=True,
+            filter=lambda record: (
+                "celery" in record["extra"] and _sampled(record)
+            ),
+            enqueue=self.enqueue,
+        )
+
+        # Handler para o cálculo ETo (antes um sink síncrono adicionado
+        # no import de eto_calculation.py)
+        logger.add(
+            self.log_dir / "eto_calculator.log",
+            format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}",
+            level="INFO",
+            rotation="10 MB",
+            retention="10 days",
+            filter=lambda record: (
+                (record["name"] or "").startswith(
+                    "backend.core.eto_calculation"
+                )
+                and _sampled(record)
+            ),
+            enqueue=self.enqueue,
         )
 
         logger.info(f"Logging configurado - Nível: {self.log_level}, Diretório: {self.log_dir}")
@@ -213,6 +394,9 @@ def setup_logging(
     log_level: str = "INFO",
     log_dir: str = "logs",
     json_logs: bool = False,
+    enqueue: bool = True,
+    sampling: Optional[Mapping[str, float]] = None,
+    rate_limits: Optional[Mapping[str, int]] = None,
 ) -> None:
     """
     Configura o logging da aplicação.
@@ -221,11 +405,36 @@ def setup_logging(
         log_level: Nível de log
         log_dir: Diretório de logs
         json_logs: Usar formato JSON
+        enqueue: Sinks assíncronos (thread do loguru)
+        sampling: {módulo: fração mantida} para DEBUG/INFO
+        rate_limits: {módulo: registros/s} para DEBUG/INFO
     """
     config = LoggingConfig(
         log_level=log_level,
         log_dir=log_dir,
         json_logs=json_logs,
+        enqueue=enqueue,
+        sampling=sampling,
+        rate_limits=rate_limits,
+    )
+    config.setup()
+
+
+def setup_logging_from_settings() -> None:
+    """Configura o logging a partir de LoggingSettings (variáveis LOG_*)."""
+    from config.settings.app_config import get_settings
+
+    settings = get_settings().logging
+    config = LoggingConfig(
+        log_level=settings.LEVEL,
+        log_dir=settings.DIR,
+        rotation=settings.ROTATION,
+        retention=settings.RETENTION,
+        compression=settings.COMPRESSION,
+        json_logs=settings.JSON,
+        enqueue=settings.ENQUEUE,
+        sampling=parse_log_rules(settings.SAMPLING, float),
+        rate_limits=parse_log_rules(settings.RATE_LIMIT, int),
     )
     config.setup()
 
@@ -244,14 +453,21 @@ def log_execution_time(func: Any) -> Any:
     """
     Decorator para logar tempo de execução de funções.
 
+    Funções assíncronas são delegadas a log_async_execution_time (o
+    wrapper síncrono só mediria a criação da coroutine).
+
     Example:
         @log_execution_time
         def calculate_something():
             pass
     """
     import functools
+    import inspect
     import time
 
+    if inspect.iscoroutinefunction(func):
+        return log_async_execution_time(func)
+
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
         start_time = time.time()
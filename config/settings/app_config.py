@@ -36,6 +36,12 @@ class DatabaseSettings(BaseSettings):
         default=3600, description="Connection recycle time in seconds"
     )
 
+    # Retenção de climate_data (partições anuais, migration 003)
+    CLIMATE_DATA_RETENTION_YEARS: int = Field(
+        default=0,
+        description="Years of climate_data partitions kept (0 = keep all)",
+    )
+
     @property
     def database_url(self) -> str:
         """Retorna a URL de conexão ao banco de dados."""
@@ -211,6 +217,75 @@ class ClimateAPISettings(BaseSettings):
     CACHE_EXPIRE: int = Field(
         default=3600, description="Cache expiration in seconds"
     )
+    FORECAST_STALE_GRACE: Dict[str, int] = Field(
+        default={
+            "openmeteo_forecast": 1800,
+            "met_norway": 3600,
+            "nws_forecast": 1800,
+        },
+        description=(
+            "Seconds an expired forecast may still be served while it is "
+            "refreshed in background, per source (JSON)"
+        ),
+    )
+
+    # Circuit breakers (estado compartilhado no Redis)
+    CIRCUIT_FAILURE_RATE: float = Field(
+        default=0.5,
+        description="Failure rate that opens a source circuit (0-1)",
+    )
+    CIRCUIT_MIN_CALLS: int = Field(
+        default=5,
+        description="Minimum calls in the window before the circuit opens",
+    )
+    CIRCUIT_OPEN_SECONDS: int = Field(
+        default=60,
+        description="Seconds a circuit stays open before a test call",
+    )
+    CIRCUIT_SLOW_CALL_SECONDS: Dict[str, float] = Field(
+        default={
+            "nasa_power": 25.0,
+            "openmeteo_archive": 20.0,
+            "openmeteo_forecast": 15.0,
+            "met_norway": 15.0,
+            "nws_forecast": 20.0,
+            "nws_stations": 20.0,
+        },
+        description=(
+            "Latency above which a call counts as a failure, per source "
+            "(JSON)"
+        ),
+    )
+    HEDGED_REQUESTS: bool = Field(
+        default=False,
+        description="Send a second GET when a call exceeds the source p95",
+    )
+
+    # Gravação/replay HTTP (testes de carga offline)
+    HTTP_REPLAY_MODE: str = Field(
+        default="off",
+        description="Climate API HTTP mode (off, record, replay)",
+    )
+    HTTP_REPLAY_DIR: str = Field(
+        default=".cache/http_replay",
+        description="Directory of recorded climate API responses",
+    )
+    HTTP_REPLAY_PROFILE: str = Field(
+        default="",
+        description="JSON latency/error profile applied on replay",
+    )
+
+    @field_validator("HTTP_REPLAY_MODE")
+    @classmethod
+    def validate_http_replay_mode(cls, v: str) -> str:
+        """Valida o modo de gravação/replay."""
+        valid_modes = ["off", "record", "replay"]
+        if v.lower() not in valid_modes:
+            raise ValueError(
+                "CLIMATE_HTTP_REPLAY_MODE deve ser um de: "
+                f"{', '.join(valid_modes)}"
+            )
+        return v.lower()
 
 
 class LoggingSettings(BaseSettings):
@@ -228,6 +303,24 @@ class LoggingSettings(BaseSettings):
     COMPRESSION: str = Field(
         default="zip", description="Log compression format"
     )
+    ENQUEUE: bool = Field(
+        default=True,
+        description="Format and write logs on a background thread",
+    )
+    SAMPLING: str = Field(
+        default="",
+        description=(
+            "DEBUG/INFO sampling per module, e.g. "
+            "'backend.core.data_processing=0.1'"
+        ),
+    )
+    RATE_LIMIT: str = Field(
+        default="",
+        description=(
+            "DEBUG/INFO records per second per module, e.g. "
+            "'backend.api.services=50'"
+        ),
+    )
 
     @field_validator("LEVEL")
     @classmethod
@@ -240,6 +333,104 @@ class LoggingSettings(BaseSettings):
             )
         return v.upper()
 
+    @field_validator("SAMPLING", "RATE_LIMIT")
+    @classmethod
+    def validate_log_rules(cls, v: str) -> str:
+        """Valida regras "modulo=valor,modulo=valor"."""
+        from config.logging_config import parse_log_rules
+
+        parse_log_rules(v)
+        return v
+
+
+class TracingSettings(BaseSettings):
+    """Configurações de tracing (spans do pipeline ETo)."""
+
+    model_config = SettingsConfigDict(env_prefix="TRACING_")
+
+    ENABLED: bool = Field(default=True, description="Enable span tracing")
+    EXPORTER: str = Field(
+        default="file", description="Span exporter (file, otlp, none)"
+    )
+    FILE_PATH: str = Field(
+        default="logs/traces.jsonl",
+        description="OTLP/JSON lines file used by the file exporter",
+    )
+    OTLP_ENDPOINT: str = Field(
+        default="http://localhost:4318/v1/traces",
+        description="OTLP/HTTP traces endpoint (JSON encoding)",
+    )
+    SERVICE_NAME: str = Field(
+        default="evaonline", description="service.name resource attribute"
+    )
+    SAMPLE_RATIO: float = Field(
+        default=1.0, description="Fraction of new traces exported (0-1)"
+    )
+
+    @field_validator("EXPORTER")
+    @classmethod
+    def validate_exporter(cls, v: str) -> str:
+        """Valida o exporter."""
+        valid_exporters = ["file", "otlp", "none"]
+        if v.lower() not in valid_exporters:
+            raise ValueError(
+                "TRACING_EXPORTER deve ser um de: "
+                f"{', '.join(valid_exporters)}"
+            )
+        return v.lower()
+
+
+class ProfilingSettings(BaseSettings):
+    """Configurações do profiling sob demanda (admin)."""
+
+    model_config = SettingsConfigDict(env_prefix="PROFILING_")
+
+    ENABLED: bool = Field(
+        default=True, description="Allow on-demand profiling by admins"
+    )
+    DIR: str = Field(
+        default="logs/profiles",
+        description="Profile directory (shared by API and workers)",
+    )
+    TTL_SECONDS: int = Field(
+        default=7 * 86400, description="How long profiles are kept"
+    )
+    MAX_PROFILES: int = Field(
+        default=50, description="Profiles kept on disk (oldest dropped)"
+    )
+    SAMPLE_INTERVAL: float = Field(
+        default=0.001, description="pyinstrument sampling interval (s)"
+    )
+    TRACEMALLOC_FRAMES: int = Field(
+        default=10, description="Frames kept per tracemalloc allocation"
+    )
+
+
+class WorkerMemorySettings(BaseSettings):
+    """Telemetria de memória e reciclagem dos processos do worker Celery."""
+
+    model_config = SettingsConfigDict(env_prefix="WORKER_MEMORY_")
+
+    ENABLED: bool = Field(
+        default=True, description="Per-task memory telemetry and recycling"
+    )
+    MAX_RSS_MB: int = Field(
+        default=1536,
+        description="Recycle a child whose RSS ends a task above this",
+    )
+    GROWTH_LIMIT_MB: int = Field(
+        default=256,
+        description="RSS growth over the child baseline considered a leak",
+    )
+    GROWTH_WINDOW: int = Field(
+        default=20,
+        description="Consecutive tasks the growth must persist to recycle",
+    )
+    TRACEMALLOC_SAMPLE_RATE: float = Field(
+        default=0.05,
+        description="Fraction of tasks traced for peak Python allocations",
+    )
+
 
 class Settings(BaseSettings):
     """Configurações principais da aplicação."""
@@ -285,6 +476,9 @@ class Settings(BaseSettings):
     dash: DashSettings = DashSettings()
     climate_apis: ClimateAPISettings = ClimateAPISettings()
     logging: LoggingSettings = LoggingSettings()
+    tracing: TracingSettings = TracingSettings()
+    profiling: ProfilingSettings = ProfilingSettings()
+    worker_memory: WorkerMemorySettings = WorkerMemorySettings()
 
     def __init__(self, **kwargs: Any) -> None:
         """Inicializa as configurações."""
@@ -16,7 +16,7 @@ import io
 import json
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 from sqlalchemy import text
 
@@ -306,31 +306,30 @@ def insert_statistics(
 
 
 def insert_monthly_normals(
-    conn, city_id: int, period_key: str, normals: list
-):  # noqa: E501
-    """Insere normais mensais."""
-    query = text(
-        """
-        INSERT INTO climate_history.monthly_climate_normals
-        (city_id, period_key, month, eto_mm_day, precipitation_mm)
-        VALUES
-        (:city_id, :period, :month, :eto, :precip)
-        ON CONFLICT (city_id, period_key, month)
-        DO UPDATE SET
-            eto_mm_day = EXCLUDED.eto_mm_day,
-            precipitation_mm = EXCLUDED.precipitation_mm
-    """
+    conn, city_id: int, period_key: str, normals: Iterable[dict]
+) -> int:
+    """Insere normais mensais (COPY em staging + upsert em um lote)."""
+    from backend.database.bulk_ingestion import copy_merge
+
+    rows = (
+        (
+            city_id,
+            period_key,
+            normal["month"],
+            normal.get("eto_mm_day"),
+            normal.get("precipitation_mm"),
+        )
+        for normal in normals
     )
 
-    for normal in normals:
-        params = {
-            "city_id": city_id,
-            "period": period_key,
-            "month": normal["month"],
-            "eto": normal.get("eto_mm_day"),
-            "precip": normal.get("precipitation_mm"),
-        }
-        conn.execute(query, params)
+    return copy_merge(
+        conn,
+        "climate_history.monthly_climate_normals",
+        ["city_id", "period_key", "month", "eto_mm_day", "precipitation_mm"],
+        rows,
+        conflict_columns=["city_id", "period_key", "month"],
+        update_columns=["eto_mm_day", "precipitation_mm"],
+    )
 
 
 def main():
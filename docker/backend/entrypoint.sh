@@ -202,6 +202,9 @@ start_api() {
     fi
 }
 
+# Reciclagem dos processos do pool: por memória (WORKER_MEMORY_*, ver
+# backend/infrastructure/worker_memory.py); max-tasks-per-child é só
+# um limite de segurança
 start_worker() {
     log "🔧 Iniciando Celery Worker..."
     wait_for_service "${REDIS_HOST:-redis}" "6379" "Redis"
@@ -213,7 +216,7 @@ start_worker() {
         --loglevel="$LOG_LEVEL" \
         --concurrency="${CELERY_WORKER_CONCURRENCY:-4}" \
         --prefetch-multiplier="${CELERY_WORKER_PREFETCH_MULTIPLIER:-4}" \
-        --max-tasks-per-child=100
+        --max-tasks-per-child="${CELERY_MAX_TASKS_PER_CHILD:-1000}"
 }
 
 start_worker_eto() {
@@ -229,7 +232,7 @@ start_worker_eto() {
         --queues=eto \
         --concurrency="${CELERY_CONCURRENCY:-2}" \
         --prefetch-multiplier="${CELERY_PREFETCH_MULTIPLIER:-1}" \
-        --max-tasks-per-child=50 \
+        --max-tasks-per-child="${CELERY_MAX_TASKS_PER_CHILD:-1000}" \
         --pool=prefork
 }
 
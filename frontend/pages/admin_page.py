@@ -1,6 +1,8 @@
 import dash_bootstrap_components as dbc
 import requests
-from dash import Input, Output, callback, dcc, html
+from dash import Input, Output, State, callback, dcc, html
+
+PROFILES_API_URL = "http://localhost:8000/api/v1/admin/profiles"
 
 
 def create_admin_page():
@@ -13,6 +15,7 @@ def create_admin_page():
     - Acesso Prometheus (embed)
     - Gerenciamento de usuários
     - Logs de aplicação
+    - Profiles sob demanda (download)
     """
 
     return dbc.Container(
@@ -80,6 +83,71 @@ def create_admin_page():
                             )
                         ],
                     ),
+                    # Tab 4: Profiles (X-Profile: 1 em /internal/eto/calculate)
+                    dcc.Tab(
+                        label="🔬 Profiles",
+                        value="profiles",
+                        children=[
+                            dbc.Row(
+                                [
+                                    dbc.Col(
+                                        [
+                                            dbc.Input(
+                                                id="profiles-admin-token",
+                                                type="password",
+                                                placeholder="X-Admin-Token",
+                                            )
+                                        ],
+                                        width=6,
+                                    ),
+                                    dbc.Col(
+                                        [
+                                            dbc.Button(
+                                                "Atualizar",
+                                                id="profiles-refresh",
+                                            )
+                                        ],
+                                        width=2,
+                                    ),
+                                ],
+                                className="mt-3",
+                            ),
+                            dbc.Row(
+                                [
+                                    dbc.Col(
+                                        [
+                                            dbc.Table(
+                                                id="profiles-table",
+                                                striped=True,
+                                                hover=True,
+                                            )
+                                        ],
+                                        width=12,
+                                    )
+                                ],
+                                className="mt-3",
+                            ),
+                            dbc.Row(
+                                [
+                                    dbc.Col(
+                                        [dcc.Dropdown(id="profiles-artifact")],
+                                        width=6,
+                                    ),
+                                    dbc.Col(
+                                        [
+                                            dbc.Button(
+                                                "Baixar",
+                                                id="profiles-download-button",
+                                            )
+                                        ],
+                                        width=2,
+                                    ),
+                                    dcc.Download(id="profiles-download"),
+                                ],
+                                className="mt-3",
+                            ),
+                        ],
+                    ),
                 ],
                 className="mt-4",
             ),
@@ -102,3 +170,69 @@ def load_logs(tab_value):
         )
     except Exception:
         return "Erro carregando logs"
+
+
+@callback(
+    Output("profiles-table", "children"),
+    Output("profiles-artifact", "options"),
+    Input("profiles-refresh", "n_clicks"),
+    Input("admin-tabs", "value"),
+    State("profiles-admin-token", "value"),
+)
+def load_profiles(n_clicks, tab_value, token):
+    if tab_value != "profiles" or not token:
+        return [], []
+
+    try:
+        response = requests.get(
+            PROFILES_API_URL, headers={"X-Admin-Token": token}, timeout=10
+        )
+        response.raise_for_status()
+        profiles = response.json()
+    except Exception:
+        error = html.Tr([html.Td("Erro carregando profiles")])
+        return [html.Tbody([error])], []
+
+    columns = ("Id", "Execução", "Duração (s)", "Pico (MiB)")
+    header = html.Thead(html.Tr([html.Th(col) for col in columns]))
+    rows = [
+        html.Tr(
+            [
+                html.Td(profile["profile_id"]),
+                html.Td(profile["label"]),
+                html.Td(profile["duration_s"]),
+                html.Td(f"{profile['peak_memory_bytes'] / 1024**2:.1f}"),
+            ]
+        )
+        for profile in profiles
+    ]
+    options = [
+        {
+            "label": f"{profile['profile_id']} · {artifact}",
+            "value": f"{profile['profile_id']}/{artifact}",
+        }
+        for profile in profiles
+        for artifact in profile["artifacts"]
+    ]
+    return [header, html.Tbody(rows)], options
+
+
+@callback(
+    Output("profiles-download", "data"),
+    Input("profiles-download-button", "n_clicks"),
+    State("profiles-artifact", "value"),
+    State("profiles-admin-token", "value"),
+    prevent_initial_call=True,
+)
+def download_profile(n_clicks, artifact, token):
+    if not artifact or not token:
+        return None
+
+    response = requests.get(
+        f"{PROFILES_API_URL}/{artifact}",
+        headers={"X-Admin-Token": token},
+        timeout=30,
+    )
+    if response.status_code != 200:
+        return None
+    return dcc.send_bytes(response.content, artifact.replace("/", "-"))
@@ -0,0 +1,588 @@
+"""
+Load Generator – carga open-loop no pipeline ETo (capacity planning)
+
+Evolução do user_request_simulator: em vez de disparar N cidades com
+semáforo + gather (closed-loop: a carga cai quando o sistema fica lento),
+as chegadas seguem um processo de Poisson com taxa fixa por estágio, e a
+latência de cada requisição é medida a partir do instante AGENDADO (fila
+incluída). Assim p95/p99, vazão e taxa de erro refletem o que um usuário
+veria com aquela taxa de chegada.
+
+Alvos:
+- inprocess: EToProcessingService no próprio processo, com a mesma
+  seleção de fontes da task Celery. --workers limita execuções
+  simultâneas (modelo de N workers; a espera entra na latência).
+- http: POST /internal/eto/calculate → Celery → WebSocket
+  /task_status/{task_id} até SUCCESS/FAILURE (requer websockets).
+
+Sem rede, use os stand-ins gravados (backend.infrastructure.http_replay):
+--replay DIR liga CLIMATE_HTTP_REPLAY_MODE=replay no alvo inprocess; no
+alvo http, suba API e workers com as mesmas variáveis.
+
+Exemplos (da raiz do repositório):
+    python -m backend.tests.fixtures.mocks.replay_store .cache/http_replay
+    python -m validation.load_generator --target inprocess \\
+        --replay .cache/http_replay \\
+        --profile backend/tests/fixtures/mocks/replay_profile_tail.json \\
+        --rates 1,2,4 --stage-seconds 60 --workers 4
+    python -m validation.load_generator --target http \\
+        --base-url http://localhost:8000 --rates 5 --stage-seconds 300 \\
+        --json validation/results/load_http.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from dataclasses import asdict, dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from loguru import logger
+
+CITIES_FILE = (
+    Path(__file__).parent / "data_validation" / "data" / "info_cities.csv"
+)
+
+# Mix padrão entre os três modos de operação (pesos relativos)
+DEFAULT_MIX = {
+    "dashboard_current": 0.6,
+    "dashboard_forecast": 0.3,
+    "historical_email": 0.1,
+}
+
+# Períodos aceitos por ClimateValidationService.detect_mode_from_dates
+DASHBOARD_PERIODS = (7, 14, 21, 30)
+HISTORICAL_MAX_DAYS = 90
+HISTORICAL_FIRST_YEAR = 1991
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+# ============================================================================
+# REQUISIÇÕES E MIX DE TRÁFEGO
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class LoadRequest:
+    """Uma requisição de cálculo ETo gerada pelo mix."""
+
+    mode: str
+    city: str
+    lat: float
+    lon: float
+    elevation: Optional[float]
+    start_date: str
+    end_date: str
+
+
+@dataclass
+class Outcome:
+    """Resultado de uma requisição (tempos em segundos desde o início)."""
+
+    mode: str
+    city: str
+    stage_rate: float
+    scheduled: float
+    started: float = 0.0
+    finished: float = 0.0
+    ok: bool = False
+    dropped: bool = False
+    error: Optional[str] = None
+
+    @property
+    def latency(self) -> float:
+        """Do instante agendado ao fim (inclui fila e atraso do gerador)."""
+        return self.finished - self.scheduled
+
+    @property
+    def queue(self) -> float:
+        return self.started - self.scheduled
+
+
+def load_cities(path: Path = CITIES_FILE) -> List[Dict[str, Any]]:
+    """Cidades do estudo de validação (info_cities.csv)."""
+    import pandas as pd
+
+    cities = pd.read_csv(path)
+    return cities[["city", "lat", "lon", "alt"]].to_dict("records")
+
+
+class TrafficMix:
+    """Sorteia modo, cidade e período de cada requisição."""
+
+    def __init__(
+        self,
+        cities: List[Dict[str, Any]],
+        weights: Optional[Dict[str, float]] = None,
+        today: Optional[date] = None,
+        use_city_elevation: bool = False,
+    ):
+        self.cities = cities
+        self.weights = weights or DEFAULT_MIX
+        self.today = today or date.today()
+        self.use_city_elevation = use_city_elevation
+
+    def draw(self, rng: random.Random) -> LoadRequest:
+        mode = rng.choices(
+            list(self.weights), weights=list(self.weights.values())
+        )[0]
+        city = rng.choice(self.cities)
+
+        if mode == "dashboard_forecast":
+            start = self.today
+            end = self.today + timedelta(days=5)
+        elif mode == "dashboard_current":
+            end = self.today
+            start = end - timedelta(days=rng.choice(DASHBOARD_PERIODS) - 1)
+        elif mode == "historical_email":
+            period = rng.randint(1, HISTORICAL_MAX_DAYS)
+            first_end = date(HISTORICAL_FIRST_YEAR, 1, 1) + timedelta(
+                days=period - 1
+            )
+            latest_end = self.today - timedelta(days=30)
+            end = first_end + timedelta(
+                days=rng.randint(0, (latest_end - first_end).days)
+            )
+            start = end - timedelta(days=period - 1)
+        else:
+            raise ValueError(f"Modo desconhecido no mix: {mode}")
+
+        return LoadRequest(
+            mode=mode,
+            city=city["city"],
+            lat=round(float(city["lat"]), 4),
+            lon=round(float(city["lon"]), 4),
+            elevation=(
+                float(city["alt"]) if self.use_city_elevation else None
+            ),
+            start_date=start.isoformat(),
+            end_date=end.isoformat(),
+        )
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """Pesos do mix a partir de "dashboard_current=6,historical_email=1"."""
+    weights = {}
+    for item in text.split(","):
+        name, _, weight = item.partition("=")
+        weights[name.strip()] = float(weight or 1)
+    unknown = set(weights) - set(DEFAULT_MIX)
+    if unknown:
+        raise ValueError(f"Modos desconhecidos no mix: {sorted(unknown)}")
+    return weights
+
+
+# ============================================================================
+# ALVOS
+# ============================================================================
+
+
+class InProcessTarget:
+    """
+    EToProcessingService neste processo (mesma sequência da task Celery:
+    seleção de fontes → process_location_with_sources).
+    """
+
+    def __init__(self, workers: int = 4):
+        from backend.api.services.climate_source_manager import (
+            ClimateSourceManager,
+        )
+        from backend.core.eto_calculation.eto_services import (
+            EToProcessingService,
+        )
+
+        self.manager = ClimateSourceManager()
+        self.service = EToProcessingService()
+        self.slots = asyncio.Semaphore(workers)
+
+    async def __call__(self, request: LoadRequest, outcome: Outcome) -> None:
+        from datetime import datetime
+
+        async with self.slots:
+            outcome.started = _now()
+            info = self.manager.get_sources_for_data_download(
+                lat=request.lat,
+                lon=request.lon,
+                start_date=datetime.fromisoformat(request.start_date),
+                end_date=datetime.fromisoformat(request.end_date),
+                mode=request.mode,
+            )
+            if not info.get("sources"):
+                raise RuntimeError("nenhuma fonte disponível")
+            await self.service.process_location_with_sources(
+                latitude=request.lat,
+                longitude=request.lon,
+                start_date=request.start_date,
+                end_date=request.end_date,
+                sources=info["sources"],
+                elevation=request.elevation,
+            )
+
+    async def aclose(self) -> None:
+        from backend.api.services.climate_factory import ClimateClientFactory
+
+        close_all = getattr(ClimateClientFactory, "close_all", None)
+        if close_all is not None:
+            await close_all()
+
+
+class HTTPTarget:
+    """
+    API HTTP + Celery + WebSocket: latência até o SUCCESS da task.
+
+    dashboard_forecast em cache responde "completed" direto no POST.
+    """
+
+    FINAL_STATES = ("SUCCESS", "FAILURE", "ERROR", "TIMEOUT")
+
+    def __init__(
+        self,
+        base_url: str,
+        api_prefix: str = "/api/v1",
+        timeout: float = 300.0,
+    ):
+        import httpx
+
+        try:
+            import websockets  # noqa: F401
+        except ImportError as e:
+            raise RuntimeError(
+                "Alvo http requer o pacote websockets "
+                "(incluído em uvicorn[standard])"
+            ) from e
+
+        self.calculate_url = f"{api_prefix}/internal/eto/calculate"
+        self.ws_base = base_url.replace("http", "ws", 1).rstrip("/")
+        self.timeout = timeout
+        self.client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=1000),
+        )
+
+    async def __call__(self, request: LoadRequest, outcome: Outcome) -> None:
+        import websockets
+
+        outcome.started = _now()
+        response = await self.client.post(
+            self.calculate_url,
+            json={
+                "lat": request.lat,
+                "lng": request.lon,
+                "start_date": request.start_date,
+                "end_date": request.end_date,
+                "period_type": request.mode,
+                "elevation": request.elevation,
+                "cidade": request.city,
+            },
+        )
+        if response.status_code != 200:
+            raise RuntimeError(f"HTTP {response.status_code}")
+        body = response.json()
+        if body.get("status") == "completed":
+            return
+
+        url = f"{self.ws_base}/task_status/{body['task_id']}"
+        async with asyncio.timeout(self.timeout):
+            async with websockets.connect(url) as ws:
+                async for raw in ws:
+                    status = json.loads(raw).get("status")
+                    if status == "SUCCESS":
+                        return
+                    if status in self.FINAL_STATES:
+                        raise RuntimeError(f"task {status}")
+        raise RuntimeError("WebSocket fechado sem estado final")
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+# ============================================================================
+# GERADOR OPEN-LOOP
+# ============================================================================
+
+_T0 = time.perf_counter()
+
+
+def _now() -> float:
+    return time.perf_counter() - _T0
+
+
+async def _execute(target, request: LoadRequest, outcome: Outcome) -> None:
+    try:
+        await target(request, outcome)
+        outcome.ok = True
+    except Exception as e:
+        outcome.error = f"{type(e).__name__}: {e}"[:200]
+    finally:
+        outcome.started = outcome.started or _now()
+        outcome.finished = _now()
+
+
+async def run_load(
+    target,
+    mix: TrafficMix,
+    rates: List[float],
+    stage_seconds: float,
+    seed: int = 42,
+    max_in_flight: int = 2000,
+) -> List[Outcome]:
+    """
+    Dispara chegadas de Poisson, estágio por estágio.
+
+    Chegadas não esperam respostas (open-loop). Com max_in_flight
+    requisições pendentes, novas chegadas são descartadas e contadas
+    como dropped (o gerador não vira gargalo silencioso).
+
+    Args:
+        target: Alvo (InProcessTarget ou HTTPTarget)
+        mix: Mix de tráfego
+        rates: Taxas de chegada (req/s), um estágio cada
+        stage_seconds: Duração de cada estágio
+        seed: Seed das chegadas e do mix (execuções comparáveis)
+        max_in_flight: Limite de requisições pendentes
+    """
+    rng = random.Random(seed)
+    outcomes: List[Outcome] = []
+    pending: set[asyncio.Task] = set()
+    start = _now()
+
+    for stage, rate in enumerate(rates):
+        stage_end = start + (stage + 1) * stage_seconds
+        next_arrival = start + stage * stage_seconds
+        logger.info(f"🚦 Estágio {stage + 1}/{len(rates)}: {rate} req/s")
+        while True:
+            next_arrival += rng.expovariate(rate)
+            if next_arrival >= stage_end:
+                break
+            await asyncio.sleep(max(0.0, next_arrival - _now()))
+
+            request = mix.draw(rng)
+            outcome = Outcome(
+                mode=request.mode,
+                city=request.city,
+                stage_rate=rate,
+                scheduled=next_arrival,
+            )
+            outcomes.append(outcome)
+            if len(pending) >= max_in_flight:
+                outcome.dropped = True
+                outcome.started = outcome.finished = _now()
+                continue
+            task = asyncio.create_task(_execute(target, request, outcome))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+
+    if pending:
+        logger.info(f"⏳ Aguardando {len(pending)} requisições pendentes")
+        await asyncio.gather(*pending)
+    return outcomes
+
+
+# ============================================================================
+# RELATÓRIO
+# ============================================================================
+
+
+def _stats(outcomes: List[Outcome], seconds: float) -> Dict[str, Any]:
+    sent = [o for o in outcomes if not o.dropped]
+    ok = [o for o in sent if o.ok]
+    errors: Dict[str, int] = {}
+    for o in sent:
+        if not o.ok:
+            kind = (o.error or "unknown").split(":")[0]
+            errors[kind] = errors.get(kind, 0) + 1
+
+    stats: Dict[str, Any] = {
+        "requests": len(outcomes),
+        "ok": len(ok),
+        "errors": len(sent) - len(ok),
+        "dropped": len(outcomes) - len(sent),
+        "error_rate": (
+            round((len(sent) - len(ok)) / len(sent), 4) if sent else 0.0
+        ),
+        "offered_rps": round(len(outcomes) / seconds, 3),
+        "throughput_rps": round(len(ok) / seconds, 3),
+        "errors_by_type": errors,
+    }
+    if ok:
+        latency = np.array([o.latency for o in ok])
+        queue = np.array([o.queue for o in ok])
+        stats["latency_s"] = {
+            **{
+                f"p{p}": round(float(np.percentile(latency, p)), 3)
+                for p in PERCENTILES
+            },
+            "mean": round(float(latency.mean()), 3),
+            "max": round(float(latency.max()), 3),
+        }
+        stats["queue_p95_s"] = round(float(np.percentile(queue, 95)), 3)
+    return stats
+
+
+def summarize(
+    outcomes: List[Outcome], rates: List[float], stage_seconds: float
+) -> Dict[str, Any]:
+    """Resumo por estágio (taxa) e por modo dentro de cada estágio."""
+    stages = []
+    for rate in dict.fromkeys(rates):
+        in_stage = [o for o in outcomes if o.stage_rate == rate]
+        seconds = stage_seconds * rates.count(rate)
+        stages.append(
+            {
+                "rate_rps": rate,
+                **_stats(in_stage, seconds),
+                "by_mode": {
+                    mode: _stats(
+                        [o for o in in_stage if o.mode == mode], seconds
+                    )
+                    for mode in sorted({o.mode for o in in_stage})
+                },
+            }
+        )
+    return {"stages": stages}
+
+
+def print_report(summary: Dict[str, Any]) -> None:
+    header = (
+        f"{'rate':>6} {'mode':<20} {'n':>6} {'ok':>6} {'err%':>6} "
+        f"{'drop':>5} {'tput':>7} "
+        + " ".join(f"{'p' + str(p):>7}" for p in PERCENTILES)
+    )
+    print(header)
+    print("-" * len(header))
+    for stage in summary["stages"]:
+        rows = [("ALL", stage)] + list(stage["by_mode"].items())
+        for mode, stats in rows:
+            latency = stats.get("latency_s", {})
+            print(
+                f"{stage['rate_rps']:>6g} {mode:<20} {stats['requests']:>6} "
+                f"{stats['ok']:>6} {stats['error_rate'] * 100:>5.1f}% "
+                f"{stats['dropped']:>5} {stats['throughput_rps']:>7.2f} "
+                + " ".join(
+                    f"{latency.get(f'p{p}', float('nan')):>7.2f}"
+                    for p in PERCENTILES
+                )
+            )
+        if stage["errors_by_type"]:
+            print(f"{'':>6} erros: {stage['errors_by_type']}")
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Carga open-loop (Poisson) no pipeline ETo"
+    )
+    parser.add_argument(
+        "--target", choices=("inprocess", "http"), default="inprocess"
+    )
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--api-prefix", default="/api/v1")
+    parser.add_argument(
+        "--rates",
+        default="1",
+        help="Taxas de chegada (req/s) por estágio, ex.: 1,2,4",
+    )
+    parser.add_argument("--stage-seconds", type=float, default=60.0)
+    parser.add_argument(
+        "--mix",
+        default=None,
+        help="Pesos por modo, ex.: dashboard_current=6,historical_email=1",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Execuções simultâneas no alvo inprocess",
+    )
+    parser.add_argument("--max-in-flight", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--city-elevation",
+        action="store_true",
+        help="Envia a altitude de info_cities.csv (sem OpenTopoData)",
+    )
+    parser.add_argument(
+        "--replay", default=None, help="Diretório de gravações HTTP"
+    )
+    parser.add_argument(
+        "--profile", default=None, help="Perfil JSON de latência/erros"
+    )
+    parser.add_argument("--json", default=None, help="Salva o resumo")
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Mantém os logs do backend (custam CPU durante a carga)",
+    )
+    return parser.parse_args(argv)
+
+
+async def _main(args: argparse.Namespace) -> Dict[str, Any]:
+    rates = [float(r) for r in args.rates.split(",")]
+    mix = TrafficMix(
+        load_cities(),
+        weights=parse_mix(args.mix) if args.mix else None,
+        use_city_elevation=args.city_elevation,
+    )
+    if args.target == "http":
+        target = HTTPTarget(args.base_url, args.api_prefix)
+    else:
+        target = InProcessTarget(workers=args.workers)
+
+    try:
+        outcomes = await run_load(
+            target,
+            mix,
+            rates,
+            args.stage_seconds,
+            seed=args.seed,
+            max_in_flight=args.max_in_flight,
+        )
+    finally:
+        await target.aclose()
+
+    summary = summarize(outcomes, rates, args.stage_seconds)
+    summary["config"] = {
+        key: value
+        for key, value in vars(args).items()
+        if key not in ("json", "verbose")
+    }
+    summary["requests"] = [
+        {**asdict(o), "latency": round(o.latency, 4)} for o in outcomes
+    ]
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = _parse_args(argv)
+    if args.replay:
+        # Antes de qualquer import de backend (settings são cacheadas)
+        os.environ["CLIMATE_HTTP_REPLAY_MODE"] = "replay"
+        os.environ["CLIMATE_HTTP_REPLAY_DIR"] = args.replay
+        if args.profile:
+            os.environ["CLIMATE_HTTP_REPLAY_PROFILE"] = args.profile
+    if not args.verbose:
+        logger.disable("backend")
+        logger.disable("config")
+
+    summary = asyncio.run(_main(args))
+    print_report(summary)
+    if args.json:
+        path = Path(args.json)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(summary, indent=2, default=str))
+        logger.success(f"Resumo salvo em {path}")
+
+
+if __name__ == "__main__":
+    main()